@@ -11,14 +11,22 @@ from pathlib import Path
 from fastapi import FastAPI, status
 from fastapi.responses import StreamingResponse, RedirectResponse
 
+from aos.bus.codec import get_codec
 from aos.bus.dispatcher import EventDispatcher
+from aos.bus.durability import Durability
 from aos.bus.event_store import EventStore
 from aos.bus.events import Event
+from aos.bus.journal import JournalStore
+from aos.bus.retention import RetentionService
 from aos.core.config import Settings
 from aos.core.health import HealthStatus, check_db_health, get_disk_space, get_uptime
-from aos.db.engine import connect
+from aos.core.resource.scheduler import TaskPriority
+from aos.db.async_engine import AsyncDatabase
+from aos.db.cache import RepositoryCache
+from aos.db.engine import ConnectionPool
+from aos.db.maintenance import MaintenanceService
 from aos.db.migrations import MigrationManager
-from aos.db.migrations.registry import MIGRATIONS
+from aos.db.migrations.registry import MIGRATIONS, SNAPSHOT
 
 from aos.api.state import core_state, mesh_state, agri_state, resource_state, transport_state, community_state, event_stream
 
@@ -39,9 +47,22 @@ def reset_globals() -> None:
             core_state.db_conn.close()
         except: pass
     core_state.db_conn = None
+    if core_state.db_pool:
+        core_state.db_pool.close()
+    core_state.db_pool = None
+    if core_state.database:
+        core_state.database.close()
+    core_state.database = None
     core_state.boot_time = None
     core_state.event_store = None
     core_state.event_dispatcher = None
+    core_state.recovery_task = None
+    core_state.retry_task = None
+    core_state.retention_service = None
+    core_state.retention_task = None
+    core_state.maintenance_service = None
+    core_state.maintenance_task = None
+    core_state.repo_cache = None
     core_state.encryptor = None
 
     # Clear other managers too
@@ -62,11 +83,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Auto-create directories
     Path(settings.sqlite_path).parent.mkdir(parents=True, exist_ok=True)
 
-    core_state.db_conn = connect(settings.sqlite_path)
+    # Writer connection shared by modules, plus read-only connections for routers
+    core_state.db_pool = ConnectionPool(settings.sqlite_path, readers=settings.db_pool_readers)
+    core_state.db_conn = core_state.db_pool.conn
 
     # Run migrations
     mgr = MigrationManager(core_state.db_conn)
-    mgr.apply_migrations(MIGRATIONS)
+    mgr.apply_migrations(MIGRATIONS, snapshot=SNAPSHOT)
 
     # Power-safe Uptime Merge
     try:
@@ -90,18 +113,56 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         print(f"[A-OS] Warning: Uptime merge failed: {e}")
 
+    # Async facade: event journaling runs on its writer/reader threads
+    core_state.database = AsyncDatabase(settings.sqlite_path, readers=settings.db_reader_threads)
+    core_state.database.start()
+
     # Initialize Event Bus
-    core_state.event_store = EventStore(settings.sqlite_path)
+    if settings.event_backend == "journal":
+        core_state.event_store = JournalStore(
+            settings.event_journal_dir,
+            segment_size=settings.event_journal_segment_kb * 1024,
+            max_batch_size=settings.event_max_batch_size,
+            best_effort_window=settings.event_best_effort_window_ms / 1000,
+            max_attempts=settings.event_retry_max_attempts,
+            retry_base_delay=settings.event_retry_base_delay,
+            retry_max_delay=settings.event_retry_max_delay,
+        )
+    else:
+        core_state.event_store = EventStore(
+            settings.sqlite_path,
+            ttl_seconds=int(settings.event_retention_ttl_hours * 3600),
+            group_commit=settings.event_group_commit,
+            commit_window=settings.event_commit_window_ms / 1000,
+            max_batch_size=settings.event_max_batch_size,
+            database=core_state.database,
+            best_effort_window=settings.event_best_effort_window_ms / 1000,
+            max_attempts=settings.event_retry_max_attempts,
+            retry_base_delay=settings.event_retry_base_delay,
+            retry_max_delay=settings.event_retry_max_delay,
+            codec=get_codec(settings.event_codec),
+        )
     await core_state.event_store.initialize()
 
-    core_state.event_dispatcher = EventDispatcher(core_state.event_store)
+    core_state.event_dispatcher = EventDispatcher(
+        core_state.event_store,
+        queue_size=settings.event_queue_size or None,
+        workers=settings.event_queue_workers,
+        overflow=settings.event_overflow_policy,
+        max_spill=settings.event_max_spill or None,
+        max_in_flight=settings.event_max_in_flight or None,
+    )
+    # SSE-only telemetry: streamed to the dashboard, never replayed
+    core_state.event_dispatcher.set_durability("resource.power_profile_changed", Durability.EPHEMERAL)
+    for event_name, durability in settings.event_durability.items():
+        core_state.event_dispatcher.set_durability(event_name, durability)
     
     # Connect SSE stream to all events
     async def broadcast_to_sse(event: Event) -> None:
         """Broadcast events to SSE stream for Live Kernel Log."""
         await event_stream.broadcast(event)
     
-    core_state.event_dispatcher.subscribe_all(broadcast_to_sse)
+    core_state.event_dispatcher.subscribe_all(broadcast_to_sse, priority=TaskPriority.BACKGROUND)
 
     # Initialize Security Engine (Phase 6.1)
     from aos.core.security.encryption import SymmetricEncryption
@@ -118,7 +179,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     core_state.encryptor = SymmetricEncryption(master_key)
     
     # Hook up the Stream
-    core_state.event_dispatcher.subscribe_all(event_stream.broadcast)
+    core_state.event_dispatcher.subscribe_all(event_stream.broadcast, priority=TaskPriority.BACKGROUND)
 
     # Initialize Mesh System (Batch 5)
     from aos.adapters.remote_node import RemoteNodeAdapter
@@ -150,6 +211,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         check_interval=settings.resource_check_interval
     )
     await resource_state.manager.start()
+    # Lower priority lanes are throttled when the node is on battery
+    core_state.event_dispatcher.resource_manager = resource_state.manager
 
     # Initialize Modules with ResourceManager (Phase 5/6/7) - Power-aware
     agri_state.module = AgriModule(core_state.event_dispatcher, core_state.db_conn, resource_state.manager, core_state.encryptor)
@@ -196,6 +259,17 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         dispatcher=core_state.event_dispatcher,
         plugins=plugins  # NEW: Pass plugins to service
     )
+
+    # Code, vehicle and member lookups run on every inbound message
+    if settings.repo_cache_enabled:
+        core_state.repo_cache = RepositoryCache(
+            ttl=settings.repo_cache_ttl_s,
+            miss_ttl=settings.repo_cache_miss_ttl_s,
+            max_bytes=settings.repo_cache_table_kb * 1024,
+        )
+        core_state.repo_cache.subscribe(core_state.event_dispatcher)
+        community_state.module.attach_cache(core_state.repo_cache)
+        institution_state.service.attach_cache(core_state.repo_cache)
     
     # Initialize Message Resilience (Prompt 14)
     from aos.core.vehicles.manager import OutboundMessageManager
@@ -234,6 +308,57 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     
     institution_state.router = router
 
+    # Replay events journaled before the last shutdown/power cut. Runs in the
+    # background, throttled, once every module has subscribed.
+    async def recover_events() -> None:
+        started = time.monotonic()
+        last_reported = 0
+
+        def report(recovered: int, total: int) -> None:
+            nonlocal last_reported
+            percent = recovered * 100 // total
+            if percent >= last_reported + 10 or recovered == total:
+                last_reported = percent
+                print(f"[A-OS] Event recovery: {recovered}/{total} ({percent}%)")
+
+        try:
+            count = await core_state.event_dispatcher.recover_pending_events(
+                batch_size=settings.event_recovery_batch_size,
+                rate=settings.event_recovery_rate or None,
+                progress=report,
+            )
+        except Exception as e:
+            print(f"[A-OS] Warning: Event recovery failed: {e}")
+            return
+        if count:
+            print(f"[A-OS] Recovered {count} events in {time.monotonic() - started:.2f}s")
+
+    core_state.recovery_task = asyncio.create_task(recover_events())
+    core_state.retry_task = asyncio.create_task(core_state.event_dispatcher.run_retry_worker())
+
+    # Journal segments delete themselves; the events table needs a sweeper
+    if isinstance(core_state.event_store, EventStore):
+        core_state.retention_service = RetentionService(
+            core_state.event_store,
+            resource_manager=resource_state.manager,
+            interval=settings.event_retention_interval_s,
+            batch_size=settings.event_retention_batch_size,
+            max_run_time=settings.event_retention_max_run_ms / 1000,
+            archive_after=settings.event_archive_after_days * 86400,
+            archive_dir=str(Path(settings.data_dir) / "archive"),
+        )
+        core_state.retention_task = asyncio.create_task(core_state.retention_service.run())
+
+    core_state.maintenance_service = MaintenanceService(
+        core_state.database,
+        resource_manager=resource_state.manager,
+        interval=settings.db_maintenance_interval_s,
+        wal_threshold=int(settings.db_wal_checkpoint_mb * 1024 * 1024),
+        vacuum_pages=settings.db_vacuum_pages,
+        integrity_max_run_time=settings.db_integrity_max_run_ms / 1000,
+    )
+    core_state.maintenance_task = asyncio.create_task(core_state.maintenance_service.run())
+
     print(f"[A-OS] Started - DB: {settings.sqlite_path}")
 
     try:
@@ -244,12 +369,27 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             await resource_state.manager.stop()
         if community_state.module:
             await community_state.module.shutdown()
+        background = [
+            task for task in (
+                core_state.recovery_task, core_state.retry_task,
+                core_state.retention_task, core_state.maintenance_task,
+            )
+            if task is not None
+        ]
+        for task in background:
+            task.cancel()
+        # Let them unwind before the store and database they use are closed
+        await asyncio.gather(*background, return_exceptions=True)
+        if core_state.event_dispatcher:
+            await core_state.event_dispatcher.shutdown()
         if core_state.event_store:
             await core_state.event_store.shutdown()
+        if core_state.database:
+            core_state.database.close()
         if mesh_state.manager:
             await mesh_state.manager.stop()
-        if core_state.db_conn:
-            core_state.db_conn.close()
+        if core_state.db_pool:
+            core_state.db_pool.close()
             print("[A-OS] Shutdown complete")
 
 
@@ -311,11 +451,20 @@ def create_app() -> FastAPI:
 
     @app.post("/sys/ping")
     async def sys_ping(current_user: dict = Depends(get_current_operator)) -> dict:
-        """Trigger a system ping event (Protected)."""
+        """Send a system ping and wait briefly for the pong (Protected)."""
         if core_state.event_dispatcher:
             event = Event(name="system.ping", payload={"nonce": int(time.time()), "source": current_user["username"]})
-            await core_state.event_dispatcher.dispatch(event)
-            return {"status": "ping_sent", "id": event.id}
+            start = time.monotonic()
+            try:
+                pong = await core_state.event_dispatcher.request(event, timeout=2.0)
+            except TimeoutError:
+                return {"status": "ping_sent", "id": event.id}
+            return {
+                "status": "pong",
+                "id": event.id,
+                "source": pong.payload.get("source"),
+                "latency_ms": round((time.monotonic() - start) * 1000, 2),
+            }
         return {"status": "error"}
     
     @app.get("/favicon.ico", include_in_schema=False)
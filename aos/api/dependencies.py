@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator
+
 from aos.api.state import core_state
+from aos.db.engine import ConnectionPool
 
 def get_db() -> sqlite3.Connection:
     """Get the global database connection from core state."""
@@ -9,3 +12,26 @@ def get_db() -> sqlite3.Connection:
     if db is None:
         raise RuntimeError("Database not initialized")
     return db
+
+def get_pool() -> ConnectionPool:
+    """Get the global connection pool from core state."""
+    pool = core_state.db_pool
+    if pool is None:
+        raise RuntimeError("Database not initialized")
+    return pool
+
+def get_read_db() -> Iterator[sqlite3.Connection]:
+    """
+    Lend a read-only pool connection for the duration of a request.
+
+    A pool without readers would lend the writer under its lock, which a sync
+    dependency would hold for the whole request and release from another
+    threadpool worker. Such a request reads through the shared writer
+    connection instead, like the modules do, without taking the lock.
+    """
+    pool = get_pool()
+    if not pool.readers:
+        yield pool.conn
+        return
+    with pool.reader() as conn:
+        yield conn
@@ -21,7 +21,8 @@ async def agri_root(request: Request, current_user: dict = Depends(get_current_o
     if not agri_state.module:
         return HTMLResponse("AgriModule not initialized", status_code=500)
 
-    farmers = agri_state.module.list_all_farmers()
+    # The dashboard shows only the count: nothing is decrypted
+    farmers = agri_state.module.list_all_farmers(reveal=())
     crops = agri_state.module.list_crops()
 
     return templates.TemplateResponse(
@@ -40,7 +41,7 @@ async def agri_portal(request: Request, current_user: dict = Depends(get_current
     if not agri_state.module:
         return HTMLResponse("AgriModule not initialized", status_code=500)
 
-    farmers = agri_state.module.list_all_farmers()
+    farmers = agri_state.module.list_all_farmers(reveal=("location",))
     return templates.TemplateResponse(
         "farmer_portal.html",
         {
@@ -75,7 +76,7 @@ async def register_farmer(
     # For now, let's refresh the page via HTMX header or return a simple fragment
     return templates.TemplateResponse(
         "partials/farmer_list.html",
-        {"request": request, "farmers": agri_state.module.list_all_farmers()}
+        {"request": request, "farmers": agri_state.module.list_all_farmers(reveal=("location", "contact"))}
     )
 
 @router.get("/farmer/new", response_class=HTMLResponse)
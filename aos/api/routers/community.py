@@ -3,19 +3,31 @@ from __future__ import annotations
 import csv
 import io
 import sqlite3
+from collections.abc import Iterator
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
-from aos.api.state import community_state
+from aos.api.state import community_state, core_state
 from aos.core.config import settings
 from aos.core.security.auth import get_current_operator, AosRole, requires_community_access
+from aos.modules.community import CommunityModule
 
 router = APIRouter(prefix="/community", tags=["community"])
 templates = Jinja2Templates(directory="aos/api/templates")
 
+def get_community_reader() -> Iterator[CommunityModule | None]:
+    """The community module bound to a pool reader for one request."""
+    pool = core_state.db_pool
+    # Without readers the module's own writer connection serves (see get_read_db)
+    if community_state.module is None or pool is None or not pool.readers:
+        yield community_state.module
+        return
+    with pool.reader() as conn:
+        yield community_state.module.with_connection(conn)
+
 @router.get("/", response_class=HTMLResponse)
 async def community_dashboard(
     request: Request,
@@ -23,20 +35,21 @@ async def community_dashboard(
     search: str = None,
     type: str = None,
     trust: str = None,
-    operator=Depends(get_current_operator)
+    operator=Depends(get_current_operator),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     # RBAC: Redirect community admin to their specific group
     if operator.get("role") == AosRole.COMMUNITY_ADMIN.value:
         comm_id = operator.get("community_id")
         if comm_id:
             return RedirectResponse(url=f"/community/{comm_id}", status_code=status.HTTP_303_SEE_OTHER)
-    pagination_data = community_state.module.list_groups(
+    pagination_data = community.list_groups(
         page=page,
         per_page=10,
         search_query=search,
         group_type=type,
         trust_level=trust
-    ) if community_state.module else {
+    ) if community else {
         "groups": [],
         "total": 0,
         "page": 1,
@@ -46,19 +59,19 @@ async def community_dashboard(
 
     # Get all unique group types for filter dropdown
     group_types = []
-    if community_state.module:
-        group_types = community_state.module.get_group_types()
+    if community:
+        group_types = community.get_group_types()
 
     # Broadcast Status Metrics (FAANG Dashboard Requirement)
     broadcast_stats = {"pending": 0, "sent": 0, "failed": 0, "total": 0}
-    if community_state.module:
+    if community:
         # Count actual broadcasts from the queue table
-        res = community_state.module._db.execute("SELECT COUNT(*) FROM broadcasts").fetchone()
+        res = community._db.execute("SELECT COUNT(*) FROM broadcasts").fetchone()
         broadcasts_count = res[0] if res else 0
         broadcast_stats["total"] = broadcasts_count
         
         # Get delivery status breakdown
-        status_res = community_state.module._db.execute("""
+        status_res = community._db.execute("""
             SELECT status, COUNT(*) 
             FROM broadcast_deliveries 
             GROUP BY status
@@ -124,12 +137,13 @@ async def register_community_group(
 async def edit_group_form(
     request: Request,
     group_id: str,
-    operator=Depends(requires_community_access())
+    operator=Depends(requires_community_access()),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     """Show edit form for a group."""
     group = None
-    if community_state.module:
-        group = community_state.module.get_group(group_id)
+    if community:
+        group = community.get_group(group_id)
 
     return templates.TemplateResponse("partials/community_group_edit.html", {
         "request": request,
@@ -203,7 +217,8 @@ async def members_dashboard(
     group_id: str = None,
     channel: str = None,
     search: str = None,
-    operator=Depends(get_current_operator)
+    operator=Depends(get_current_operator),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     # RBAC: Enforce community isolation
     if operator.get("role") == AosRole.COMMUNITY_ADMIN.value:
@@ -217,13 +232,13 @@ async def members_dashboard(
         if group_id != user_comm_id:
             raise HTTPException(403, "Access denied: You do not manage this community.")
     """Dedicated member management dashboard."""
-    data = community_state.module.list_all_members(
+    data = community.list_all_members(
         page=page,
         per_page=50,
         group_id=group_id,
         channel=channel,
         search_query=search
-    ) if community_state.module else {
+    ) if community else {
         "members": [],
         "total": 0,
         "page": 1,
@@ -233,8 +248,8 @@ async def members_dashboard(
 
     # Get all groups for filter dropdown
     all_groups = []
-    if community_state.module:
-        all_groups = [g for g in community_state.module._groups.list_all() if g.active]
+    if community:
+        all_groups = community._groups.find({"active": True})
 
     # If HTMX request, return only the table partial
     if request.headers.get("hx-request") == "true":
@@ -264,7 +279,8 @@ async def export_members(
     group_id: str = None,
     channel: str = None,
     search: str = None,
-    operator=Depends(get_current_operator)
+    operator=Depends(get_current_operator),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     # RBAC: Community isolation handled by requires_community_access if group_id provided
     # For isolated roles, enforce group_id requirement
@@ -273,13 +289,13 @@ async def export_members(
         if not group_id or group_id != user_comm_id:
             raise HTTPException(403, "Access denied: You must export from your own community.")
     """Export members as CSV."""
-    data = community_state.module.list_all_members(
+    data = community.list_all_members(
         page=1,
         per_page=1000000, # All members
         group_id=group_id,
         channel=channel,
         search_query=search
-    ) if community_state.module else {"members": []}
+    ) if community else {"members": []}
 
     output = io.StringIO()
     writer = csv.writer(output)
@@ -305,12 +321,13 @@ async def export_members(
 async def edit_member_form(
     request: Request,
     member_id: str,
-    operator=Depends(get_current_operator)
+    operator=Depends(get_current_operator),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     """Fetch member edit modal content."""
     member = None
-    if community_state.module:
-        res = community_state.module._db.execute(
+    if community:
+        res = community._db.execute(
             "SELECT m.id, m.community_id, m.user_id, m.channel, g.name as group_name FROM community_members m JOIN community_groups g ON m.community_id = g.id WHERE m.id = ?",
             (member_id,)
         ).fetchone()
@@ -369,23 +386,24 @@ async def update_member_details(
 
     # Return the refreshed table partial for the Member Directory
     # We use default pagination (page 1) for the refresh
-    return await members_dashboard(request, operator=operator)
+    return await members_dashboard(request, operator=operator, community=community_state.module)
 
 @router.get("/{group_id}/members", response_class=HTMLResponse)
 async def list_group_members(
     request: Request,
     group_id: str,
-    operator=Depends(requires_community_access())
+    operator=Depends(requires_community_access()),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     """List all members of a community group."""
     members = []
     group = None
 
-    if community_state.module:
-        group = community_state.module.get_group(group_id)
+    if community:
+        group = community.get_group(group_id)
         if group:
             # Use list_all_members to get dictionaries with user_id, channel, etc.
-            result = community_state.module.list_all_members(group_id=group_id, per_page=1000)
+            result = community.list_all_members(group_id=group_id, per_page=1000)
             members = result.get("members", [])
 
     return templates.TemplateResponse("partials/community_members.html", {
@@ -412,7 +430,7 @@ async def add_group_member(
             actor_id=operator.get("sub")
         )
     # Return the refreshed member list partial directly
-    return await list_group_members(request, group_id, operator)
+    return await list_group_members(request, group_id, operator, community_state.module)
 
 @router.delete("/{group_id}/members/{user_id}")
 async def remove_group_member(
@@ -440,7 +458,8 @@ async def remove_group_member(
 async def add_member_form(
     request: Request,
     group_id: str,
-    operator=Depends(get_current_operator)
+    operator=Depends(get_current_operator),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     """Show add member form - REUSES existing member management UI"""
     # RBAC: Enforce community isolation for COMMUNITY_ADMIN and OPERATOR
@@ -449,16 +468,16 @@ async def add_member_form(
         if not group_id or group_id != user_comm_id:
             raise HTTPException(403, "Access denied: You can only add members to your own community.")
     
-    if not community_state.module:
+    if not community:
         raise HTTPException(500, "Community module not initialized")
     
     # Get group details
-    group = community_state.module.get_group(group_id)
+    group = community.get_group(group_id)
     if not group:
         raise HTTPException(404, "Group not found")
     
     # Get existing members
-    members = community_state.module.get_community_members(group_id)
+    members = community.get_community_members(group_id)
     
     # REUSE existing template that already has add member form
     return templates.TemplateResponse("partials/community_members.html", {
@@ -512,24 +531,25 @@ async def add_member_to_group(
 async def community_detail(
     group_id: str,
     request: Request,
-    operator=Depends(requires_community_access())
+    operator=Depends(requires_community_access()),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     """Community detail page with broadcast UI."""
-    if not community_state.module:
+    if not community:
         raise HTTPException(500, "Community module not initialized")
     
     # Get group
-    group = community_state.module.get_group(group_id)
+    group = community.get_group(group_id)
     if not group:
         raise HTTPException(404, "Group not found")
     
     # Get member count
-    members = community_state.module.get_community_members(group_id)
+    members = community.get_community_members(group_id)
     member_count = len(members)
     
     # Get broadcast stats for this group
     broadcast_stats = {"pending": 0, "sent": 0, "failed": 0}
-    status_res = community_state.module._db.execute("""
+    status_res = community._db.execute("""
         SELECT d.status, COUNT(*) 
         FROM broadcast_deliveries d
         JOIN broadcasts b ON d.broadcast_id = b.id
@@ -542,7 +562,7 @@ async def community_detail(
             broadcast_stats[status] = count
     
     # Get recent broadcasts
-    recent_broadcasts_raw = community_state.module._db.execute("""
+    recent_broadcasts_raw = community._db.execute("""
         SELECT id, message, status, sent_count, failed_count, created_at
         FROM broadcasts
         WHERE community_id = ?
@@ -672,14 +692,15 @@ async def confirm_broadcast(
 async def get_broadcast_history(
     group_id: str,
     request: Request,
-    operator=Depends(requires_community_access())
+    operator=Depends(requires_community_access()),
+    community: CommunityModule | None = Depends(get_community_reader)
 ):
     """Fetch broadcast history for HTMX refresh."""
-    if not community_state.module:
+    if not community:
         raise HTTPException(500, "Community module not initialized")
     
     # Get recent broadcasts
-    recent_broadcasts_raw = community_state.module._db.execute("""
+    recent_broadcasts_raw = community._db.execute("""
         SELECT id, message, status, sent_count, failed_count, created_at
         FROM broadcasts
         WHERE community_id = ?
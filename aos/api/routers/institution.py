@@ -2,9 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response
 from fastapi.templating import Jinja2Templates
 import os
+from collections.abc import Iterator
 from typing import List, Optional
 from datetime import datetime
 
+from aos.api.state import core_state
 from aos.db.models import InstitutionMemberDTO, InstitutionGroupDTO, PrayerRequestDTO
 from aos.core.institution.service import InstitutionService
 from aos.core.security.auth import get_current_operator, AosRole, requires_community_access
@@ -18,6 +20,17 @@ def get_institution_service() -> InstitutionService:
         raise HTTPException(status_code=500, detail="Institution Service not initialized")
     return institution_state.service
 
+def get_institution_reader() -> Iterator[InstitutionService]:
+    """The institution service bound to a pool reader for one request."""
+    service = get_institution_service()
+    pool = core_state.db_pool
+    # Without readers the service's own writer connection serves (see get_read_db)
+    if pool is None or not pool.readers:
+        yield service
+        return
+    with pool.reader() as conn:
+        yield service.with_connection(conn)
+
 def resolve_community_context(request: Request, operator: dict) -> Optional[str]:
     """
     Robustly resolves community_id from:
@@ -48,11 +61,10 @@ def resolve_community_context(request: Request, operator: dict) -> Optional[str]
 @router.get("/members", response_model=List[InstitutionMemberDTO])
 async def get_members(
     community_id: str,
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """List all members for the Secretary/Admin."""
-    all_members = service.members.list_all()
-    return [m for m in all_members if m.community_id == community_id]
+    return service.list_members(community_id)
 
 @router.post("/broadcast")
 async def send_broadcast(
@@ -149,9 +161,10 @@ async def add_institution_member(
             active=True
         )
         service.members.save(member)
-        return {"status": "success", "member_id": member.id}
     except Exception as e:
         raise HTTPException(400, f"Failed to add to institution: {str(e)}")
+    await service.publish_member_event("INSTITUTION_MEMBER_REGISTERED", member)
+    return {"status": "success", "member_id": member.id}
 
 @router.post("/members/update")
 async def update_institution_member(
@@ -163,8 +176,7 @@ async def update_institution_member(
 ):
     """Update member details."""
     # Find member by ID
-    all_members = service.members.list_all()
-    member = next((m for m in all_members if m.id == member_id), None)
+    member = service.members.get_by_id(member_id)
     
     if not member:
         raise HTTPException(404, "Member not found")
@@ -172,6 +184,7 @@ async def update_institution_member(
     member.full_name = full_name
     member.role_id = role_id
     service.members.save(member)
+    await service.publish_member_event("INSTITUTION_MEMBER_UPDATED", member)
     return {"status": "success"}
 
 @router.post("/members/deactivate")
@@ -181,12 +194,12 @@ async def deactivate_institution_member(
     service: InstitutionService = Depends(get_institution_service)
 ):
     """Deactivate member (soft delete)."""
-    all_members = service.members.list_all()
-    member = next((m for m in all_members if m.id == member_id), None)
+    member = service.members.get_by_id(member_id)
     if not member:
         raise HTTPException(404, "Member not found")
     member.active = False
     service.members.save(member)
+    await service.publish_member_event("INSTITUTION_MEMBER_UPDATED", member)
     return {"status": "success"}
 
 @router.post("/members/delete")
@@ -196,24 +209,24 @@ async def delete_institution_member(
     service: InstitutionService = Depends(get_institution_service)
 ):
     """Permanently delete member (hard delete)."""
-    all_members = service.members.list_all()
-    member = next((m for m in all_members if m.id == member_id), None)
+    member = service.members.get_by_id(member_id)
     if not member:
         raise HTTPException(404, "Member not found")
     service.members.delete(member.id)
+    await service.publish_member_event("INSTITUTION_MEMBER_REMOVED", member)
     return {"status": "success"}
 
 @router.get("/analytics/trends")
 async def get_trends(
     community_id: str,
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     return service.get_attendance_trends(community_id)
 
 @router.get("/finances")
 async def get_finances(
     community_id: str,
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     return service.get_financial_summary(community_id)
 
@@ -245,7 +258,7 @@ async def export_data(
     data_type: str,
     request: Request,
     operator=Depends(get_current_operator),
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """Export institutional data to CSV."""
     from aos.core.institution.export import InstitutionalExporter
@@ -255,16 +268,16 @@ async def export_data(
         raise HTTPException(400, "Community context required")
     
     if data_type == "members":
-        data = [m for m in service.members.list_all() if m.community_id == community_id]
+        data = service.list_members(community_id)
         content = InstitutionalExporter.members_to_csv(data)
     elif data_type == "attendance":
-        data = [r for r in service.attendance.list_all() if r.community_id == community_id]
+        data = service.attendance.find({"community_id": community_id})
         content = InstitutionalExporter.attendance_to_csv(data)
     elif data_type == "finances":
-        data = [e for e in service.finance.list_all() if e.community_id == community_id]
+        data = service.finance.find({"community_id": community_id})
         content = InstitutionalExporter.finances_to_csv(data)
     elif data_type == "prayers":
-        data = [p for p in service.prayers.list_all() if p.community_id == community_id]
+        data = service.prayers.find({"community_id": community_id})
         content = InstitutionalExporter.prayers_to_csv(data)
     else:
         raise HTTPException(status_code=400, detail="Invalid data type")
@@ -292,7 +305,7 @@ async def members_ui(
     request: Request,
     institution_type: str = "faith",
     operator=Depends(get_current_operator),
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """Institutional Member Registry UI."""
     community_id = resolve_community_context(request, operator)
@@ -339,8 +352,8 @@ async def members_ui(
     response_context = {
         "request": request,
         "user": operator,
-        "members": [m for m in service.members.list_all() if m.community_id == community_id and (not m.institution_type or m.institution_type == institution_type)],
-        "groups": [g for g in service.groups.list_all() if g.community_id == community_id and (not g.institution_type or g.institution_type == institution_type)],
+        "members": service.list_members(community_id, institution_type),
+        "groups": service.groups.find({"community_id": community_id, "institution_type__in": [institution_type, "", None]}),
         "community_id": community_id,
         "institution_type": institution_type,
         "labels": (service.get_plugin(institution_type).get_context_labels() if service.get_plugin(institution_type) else {}),
@@ -360,7 +373,7 @@ async def attendance_ui(
     request: Request,
     institution_type: str = "faith",
     operator=Depends(get_current_operator),
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """Attendance Tracking UI."""
     community_id = resolve_community_context(request, operator)
@@ -384,7 +397,7 @@ async def attendance_ui(
         "request": request,
         "user": operator,
         "trends": service.get_attendance_trends(community_id),
-        "members": [m for m in service.members.list_all() if m.community_id == community_id and (not m.institution_type or m.institution_type == institution_type)],
+        "members": service.list_members(community_id, institution_type),
         "community_id": community_id,
         "institution_type": institution_type,
         "labels": (plugin.get_context_labels() if plugin else {}),
@@ -403,7 +416,7 @@ async def finances_ui(
     request: Request,
     institution_type: str = "faith",
     operator=Depends(get_current_operator),
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """Financial Ledger UI."""
     community_id = resolve_community_context(request, operator)
@@ -423,15 +436,14 @@ async def finances_ui(
         raise HTTPException(400, "Community context required")
         
     plugin = service.get_plugin(institution_type)
-    recent_entries = [e for e in service.finance.list_all() if e.community_id == community_id][-50:]
-    recent_entries.reverse()
+    recent_entries = service.finance.find({"community_id": community_id}, order_by="-rowid", limit=50)
 
     response_context = {
         "request": request,
         "user": operator,
         "summary": service.get_financial_summary(community_id),
         "entries": recent_entries,
-        "members": [m for m in service.members.list_all() if m.community_id == community_id and (not m.institution_type or m.institution_type == institution_type)],
+        "members": service.list_members(community_id, institution_type),
         "community_id": community_id,
         "institution_type": institution_type,
         "labels": (plugin.get_context_labels() if plugin else {}),
@@ -449,7 +461,7 @@ async def prayers_ui(
     request: Request,
     institution_type: str = "faith",
     operator=Depends(get_current_operator),
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """Prayer Request Review UI."""
     community_id = resolve_community_context(request, operator)
@@ -487,7 +499,7 @@ async def prayers_ui(
 async def get_weekly_report(
     request: Request,
     operator=Depends(get_current_operator),
-    service: InstitutionService = Depends(get_institution_service)
+    service: InstitutionService = Depends(get_institution_reader)
 ):
     """Generate and download the weekly PDF report."""
     community_id = resolve_community_context(request, operator)
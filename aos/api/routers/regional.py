@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
-from aos.api.dependencies import get_db
+from aos.api.dependencies import get_read_db
 from aos.core.security.auth import get_current_operator
 from aos.core.aggregation import RegionalAggregator
 
@@ -19,7 +19,7 @@ templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templa
 @router.get("/dashboard", response_class=HTMLResponse)
 async def regional_dashboard(
     request: Request,
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_read_db),
     operator = Depends(get_current_operator)
 ):
     """Regional manager dashboard."""
@@ -43,7 +43,7 @@ async def regional_dashboard(
 
 @router.get("/api/summary")
 async def get_summary(
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_read_db),
     operator = Depends(get_current_operator)
 ):
     """Get regional summary statistics."""
@@ -53,7 +53,7 @@ async def get_summary(
 @router.get("/api/harvests")
 async def get_harvests(
     days: int = 30,
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_read_db),
     operator = Depends(get_current_operator)
 ):
     """Get aggregated harvest data."""
@@ -63,7 +63,7 @@ async def get_harvests(
 @router.get("/api/transport")
 async def get_transport(
     days: int = 7,
-    db: sqlite3.Connection = Depends(get_db),
+    db: sqlite3.Connection = Depends(get_read_db),
     operator = Depends(get_current_operator)
 ):
     """Get aggregated transport data."""
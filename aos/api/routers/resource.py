@@ -5,13 +5,20 @@ Endpoints for monitoring system resources and power profiles.
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
 
-from aos.api.state import resource_state
+from aos.api.state import core_state, resource_state
 from aos.core.resource import PowerProfile
 from aos.core.security.auth import get_current_operator
 
 router = APIRouter(prefix="/sys/resource", tags=["resource"])
 
+class DeadLetterSelection(BaseModel):
+    """Bulk selection of dead-lettered events (no fields = all)."""
+    ids: list[str] | None = None
+    event_name: str | None = None
+    before: float | None = None
+
 @router.get("/status")
 async def get_resource_status(current_user: dict = Depends(get_current_operator)):
     """Get current resource levels and power profile."""
@@ -118,3 +125,93 @@ async def get_deferred_tasks(current_user: dict = Depends(get_current_operator))
             for task in tasks
         ]
     }
+
+@router.get("/bus/queues")
+async def get_bus_queues(current_user: dict = Depends(get_current_operator)):
+    """Get per-subscriber event queue depth, overflow counters and priority lanes."""
+    if not core_state.event_dispatcher:
+        raise HTTPException(status_code=500, detail="EventDispatcher not initialized")
+
+    queues = core_state.event_dispatcher.get_queue_stats()
+
+    return {
+        "bounded": core_state.event_dispatcher.queue_size is not None,
+        "total_depth": sum(q["depth"] for q in queues),
+        "queues": queues,
+        "lanes": core_state.event_dispatcher.get_lane_stats()
+    }
+
+@router.get("/bus/retention")
+async def get_retention_stats(current_user: dict = Depends(get_current_operator)):
+    """Rows and bytes reclaimed by the event retention service."""
+    if not core_state.retention_service:
+        raise HTTPException(status_code=503, detail="Retention service not running")
+    return core_state.retention_service.get_stats()
+
+@router.get("/db/maintenance")
+async def get_maintenance_stats(current_user: dict = Depends(get_current_operator)):
+    """Duration and effect of the database maintenance jobs."""
+    if not core_state.maintenance_service:
+        raise HTTPException(status_code=503, detail="Maintenance service not running")
+    return core_state.maintenance_service.get_stats()
+
+@router.get("/db/cache")
+async def get_cache_stats(current_user: dict = Depends(get_current_operator)):
+    """Hit and miss counters of the repository cache."""
+    if not core_state.repo_cache:
+        raise HTTPException(status_code=503, detail="Repository cache disabled")
+    return core_state.repo_cache.get_stats()
+
+def _require_event_store():
+    if not core_state.event_store:
+        raise HTTPException(status_code=500, detail="EventStore not initialized")
+    return core_state.event_store
+
+@router.get("/bus/dead-letters")
+async def list_dead_letters(
+    event_name: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    current_user: dict = Depends(get_current_operator)
+):
+    """Inspect events that exhausted their retries."""
+    store = _require_event_store()
+    entries = await store.list_dead_letters(event_name=event_name, limit=limit, offset=offset)
+
+    return {
+        "total": await store.count_dead_letters(event_name),
+        "events": [
+            {
+                "id": entry["event"].id,
+                "name": entry["event"].name,
+                "payload": entry["event"].payload,
+                "timestamp": entry["event"].timestamp.isoformat(),
+                "retry_count": entry["retry_count"],
+                "error_message": entry["error_message"],
+                "dead_at": entry["dead_at"]
+            }
+            for entry in entries
+        ]
+    }
+
+@router.post("/bus/dead-letters/redrive")
+async def redrive_dead_letters(
+    selection: DeadLetterSelection,
+    current_user: dict = Depends(get_current_operator)
+):
+    """Move dead-lettered events back into the retry queue."""
+    store = _require_event_store()
+    count = await store.redrive_dead_letters(ids=selection.ids, event_name=selection.event_name)
+    return {"status": "success", "redriven": count}
+
+@router.post("/bus/dead-letters/purge")
+async def purge_dead_letters(
+    selection: DeadLetterSelection,
+    current_user: dict = Depends(get_current_operator)
+):
+    """Permanently delete dead-lettered events."""
+    store = _require_event_store()
+    count = await store.purge_dead_letters(
+        ids=selection.ids, event_name=selection.event_name, before=selection.before
+    )
+    return {"status": "success", "purged": count}
@@ -7,6 +7,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from aos.bus.dispatcher import EventDispatcher
     from aos.bus.event_store import EventStore
+    from aos.bus.journal import JournalStore
+    from aos.bus.retention import RetentionService
+    from aos.db.async_engine import AsyncDatabase
+    from aos.db.cache import RepositoryCache
+    from aos.db.engine import ConnectionPool
+    from aos.db.maintenance import MaintenanceService
     from aos.core.mesh.manager import MeshSyncManager
     from aos.core.resource.manager import ResourceManager
     from aos.core.security.encryption import SymmetricEncryption
@@ -18,10 +24,19 @@ if TYPE_CHECKING:
     from aos.core.vehicles.router import CommandRouter
 
 class CoreState:
-    db_conn: sqlite3.Connection | None = None
+    db_conn: sqlite3.Connection | None = None  # The pool's writer connection
+    db_pool: ConnectionPool | None = None
+    database: AsyncDatabase | None = None
     boot_time: float | None = None
-    event_store: EventStore | None = None
+    event_store: EventStore | JournalStore | None = None
     event_dispatcher: EventDispatcher | None = None
+    recovery_task: asyncio.Task | None = None
+    retry_task: asyncio.Task | None = None
+    retention_service: RetentionService | None = None
+    retention_task: asyncio.Task | None = None
+    maintenance_service: MaintenanceService | None = None
+    maintenance_task: asyncio.Task | None = None
+    repo_cache: RepositoryCache | None = None
     encryptor: SymmetricEncryption | None = None
 
 class MeshState:
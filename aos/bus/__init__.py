@@ -1,7 +1,14 @@
 """Event Bus & Messaging components."""
+from aos.bus.codec import BinaryCodec, EventCodec, JsonCodec
 from aos.bus.dispatcher import EventDispatcher
+from aos.bus.durability import Durability
 from aos.bus.event_store import EventStore
 from aos.bus.events import Event
-from aos.bus.scheduler import EventScheduler
+from aos.bus.journal import JournalStore
+from aos.bus.scheduler import CoalescePolicy, EventScheduler
+from aos.bus.subscription import OverflowPolicy
 
-__all__ = ["Event", "EventDispatcher", "EventStore", "EventScheduler"]
+__all__ = [
+    "BinaryCodec", "CoalescePolicy", "Durability", "Event", "EventCodec", "EventDispatcher",
+    "EventStore", "EventScheduler", "JournalStore", "JsonCodec", "OverflowPolicy",
+]
@@ -0,0 +1,296 @@
+"""
+Event Codecs - how EventStore serializes payloads, metadata and timestamps.
+
+JsonCodec is the original text format. BinaryCodec writes a compact binary
+encoding behind a schema header, with optional zlib compression for large
+values and integer epoch timestamps. Decoding inspects the stored value
+rather than the configured codec, so a store switched to binary keeps
+reading the JSON rows it wrote before.
+
+Binary schema 2 body: one value, each a tag byte followed by its data.
+Lengths and counts are unsigned LEB128 varints.
+
+    0x00 null     0x01 false     0x02 true
+    0x03 int      zigzag varint (any size)
+    0x04 float    IEEE 754 binary64, big-endian
+    0x05 string   varint byte length, UTF-8
+    0x06 array    varint count, values
+    0x07 object   varint count, (varint key length, UTF-8 key, value) pairs
+
+Schema 1 never shipped; any other version byte is rejected.
+"""
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aos.bus.events import Event
+
+# Header: magic byte, schema version, flags
+MAGIC = 0xAE
+SCHEMA_VERSION = 2
+FLAG_ZLIB = 0x01
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class CodecError(ValueError):
+    """Raised for values a codec cannot encode or decode."""
+
+
+class EventCodec:
+    """Base codec: JSON text values and ISO-8601 timestamps."""
+
+    name = "json"
+
+    def encode(self, value: Mapping[str, Any]) -> str | bytes:
+        """Serialize a payload or metadata mapping for storage."""
+        return json.dumps(dict(value))
+
+    def encode_timestamp(self, value: datetime) -> str | int:
+        """Serialize an event timestamp for storage."""
+        return value.isoformat()
+
+    def encode_event_timestamp(self, event: Event) -> str | int:
+        """Serialize an event's timestamp for storage."""
+        return self.encode_timestamp(event.timestamp)
+
+    @staticmethod
+    def decode(raw: str | bytes) -> dict[str, Any]:
+        """Deserialize a stored value written by any codec."""
+        if isinstance(raw, str):
+            return json.loads(raw)
+        return _decode_binary(raw)
+
+    @staticmethod
+    def decode_timestamp(raw: str | int) -> datetime:
+        """Deserialize a stored timestamp written by any codec."""
+        if isinstance(raw, int):
+            micros = raw
+        elif raw.isdigit():
+            # Integer epoch micros, returned as text by the TEXT column
+            micros = int(raw)
+        else:
+            return datetime.fromisoformat(raw)
+        return _EPOCH + timedelta(microseconds=micros)
+
+    @staticmethod
+    def decode_event_time(raw: str | int) -> datetime | int:
+        """
+        Deserialize a stored timestamp for Event's constructor.
+
+        Integer timestamps come back as epoch nanoseconds, so the Event
+        builds its datetime only if it is read.
+        """
+        if isinstance(raw, int):
+            return raw * 1000
+        if raw.isdigit():
+            return int(raw) * 1000
+        return datetime.fromisoformat(raw)
+
+
+class JsonCodec(EventCodec):
+    """The original JSON/ISO text format."""
+
+
+class BinaryCodec(EventCodec):
+    """
+    Compact binary values and integer epoch-microsecond timestamps.
+
+    Plain JSON types are written as-is; anything else (tuples, str enums,
+    subclasses, non-str keys) is first normalised through JSON, so both
+    codecs accept the same payloads, decode them to the same values and
+    raise the same TypeError for the rest. Values larger than
+    ``compress_threshold`` bytes are zlib-compressed when that makes them
+    smaller.
+    """
+
+    name = "binary"
+
+    def __init__(self, compress_threshold: int = 512, level: int = 6) -> None:
+        self.compress_threshold = compress_threshold
+        self.level = level
+
+    def encode(self, value: Mapping[str, Any]) -> bytes:
+        if not value:
+            return _EMPTY
+
+        out = bytearray()
+        try:
+            _write(out, dict(value))
+        except _NotPlain:
+            out.clear()
+            _write(out, json.loads(json.dumps(dict(value))))
+        body = bytes(out)
+
+        flags = 0
+        if self.compress_threshold and len(body) > self.compress_threshold:
+            packed = zlib.compress(body, self.level)
+            if len(packed) < len(body):
+                body, flags = packed, FLAG_ZLIB
+
+        return bytes((MAGIC, SCHEMA_VERSION, flags)) + body
+
+    def encode_timestamp(self, value: datetime) -> int:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        delta = value - _EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    def encode_event_timestamp(self, event: Event) -> int:
+        # Straight from the event's integer clock, without building a datetime
+        return event.timestamp_ns // 1000
+
+
+CODECS: dict[str, type[EventCodec]] = {
+    JsonCodec.name: JsonCodec,
+    BinaryCodec.name: BinaryCodec,
+}
+
+
+def get_codec(name: str) -> EventCodec:
+    """Instantiate a codec by name ("json" or "binary")."""
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise CodecError(f"Unknown event codec: {name}") from None
+
+
+# --- Binary encoding ---
+
+# An empty mapping is stored as a bare header
+_EMPTY = bytes((MAGIC, SCHEMA_VERSION, 0))
+
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _ARRAY, _OBJECT = range(8)
+_F64 = struct.Struct(">d")
+
+
+class _NotPlain(Exception):
+    """A value that must be normalised through JSON before it is written."""
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _write(out: bytearray, value: object) -> None:
+    kind = type(value)
+    if kind is str:
+        data = value.encode("utf-8")
+        out.append(_STR)
+        _write_varint(out, len(data))
+        out += data
+    elif kind is int:
+        out.append(_INT)
+        _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+    elif kind is dict:
+        out.append(_OBJECT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            if type(key) is not str:
+                raise _NotPlain
+            data = key.encode("utf-8")
+            _write_varint(out, len(data))
+            out += data
+            _write(out, item)
+    elif kind is list:
+        out.append(_ARRAY)
+        _write_varint(out, len(value))
+        for item in value:
+            _write(out, item)
+    elif value is None:
+        out.append(_NULL)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif kind is float:
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    else:
+        raise _NotPlain
+
+
+def _read_varint(body: bytes, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = body[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _read_str(body: bytes, pos: int) -> tuple[str, int]:
+    size = body[pos]
+    if size < 0x80:
+        pos += 1
+    else:
+        size, pos = _read_varint(body, pos)
+    end = pos + size
+    if end > len(body):
+        raise IndexError("string runs past the end")
+    return body[pos:end].decode("utf-8"), end
+
+
+def _read(body: bytes, pos: int) -> tuple[Any, int]:
+    tag = body[pos]
+    pos += 1
+    if tag == _STR:
+        return _read_str(body, pos)
+    if tag == _INT:
+        z, pos = _read_varint(body, pos)
+        return (z >> 1 if not z & 1 else -((z + 1) >> 1)), pos
+    if tag == _OBJECT:
+        count, pos = _read_varint(body, pos)
+        obj = {}
+        for _ in range(count):
+            key, pos = _read_str(body, pos)
+            obj[key], pos = _read(body, pos)
+        return obj, pos
+    if tag == _ARRAY:
+        count, pos = _read_varint(body, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _read(body, pos)
+            items.append(item)
+        return items, pos
+    if tag == _NULL:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _FLOAT:
+        return _F64.unpack_from(body, pos)[0], pos + 8
+    raise ValueError(f"unknown tag 0x{tag:02x}")
+
+
+def _decode_binary(raw: bytes) -> dict[str, Any]:
+    if len(raw) < 3 or raw[0] != MAGIC:
+        raise CodecError("Not a binary event value")
+    if raw[1] != SCHEMA_VERSION:
+        raise CodecError(f"Unsupported binary schema version {raw[1]} (expected {SCHEMA_VERSION})")
+    if len(raw) == 3:
+        return {}
+
+    body = raw[3:]
+    if raw[2] & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    try:
+        value, end = _read(body, 0)
+    except (ValueError, TypeError, IndexError, struct.error) as e:
+        raise CodecError(f"Corrupt binary event value: {e}") from None
+    if end != len(body) or type(value) is not dict:
+        raise CodecError("Corrupt binary event value: not a single object")
+    return value
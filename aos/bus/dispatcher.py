@@ -2,82 +2,458 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable, Coroutine
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from aos.bus.durability import Durability
 from aos.bus.event_store import EventStore
 from aos.bus.events import Event
+from aos.bus.journal import JournalStore
+from aos.bus.lanes import PriorityLanes
+from aos.bus.routing import GLOBAL_PATTERNS, Route, RoutingTable
+from aos.bus.subscription import DeliveryCallback, OverflowPolicy, Subscription
+from aos.core.resource.scheduler import TaskPriority
+
+if TYPE_CHECKING:
+    from aos.core.resource.manager import ResourceManager
+    from aos.core.resource.profiles import PowerProfile
 
 logger = logging.getLogger(__name__)
 
 # Type alias for event handlers
 EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
 
+
+class _Delivery:
+    """Tracks one event across all of its bounded subscriptions."""
+
+    __slots__ = ("event", "remaining", "errors", "journaled")
+
+    def __init__(self, event: Event, remaining: int, journaled: bool) -> None:
+        self.event = event
+        self.remaining = remaining
+        self.journaled = journaled
+        self.errors: list[Exception] = []
+
+
 class EventDispatcher:
     """
     Async event dispatcher for A-OS kernel communication.
-    
+
     Supports optional persistent journaling via EventStore.
     If a store is provided, events are persisted before dispatch
     and can be recovered after process restarts.
+
+    By default every handler invocation runs as its own background task.
+    Passing ``queue_size`` switches to bounded mode: each subscription gets
+    a queue of that size drained by ``workers`` consumer tasks, and a full
+    queue applies its ``overflow`` policy to the publisher.
+
+    Event names can be given a Durability tier with ``set_durability``;
+    unregistered events are DURABLE.
+
+    With ``max_in_flight`` set, handler invocations are queued in priority
+    lanes (see PriorityLanes) and at most that many run at once. A route's
+    lane is its subscription priority if one was given, else the priority
+    passed to ``dispatch``, else NORMAL.
+
+    ``request`` publishes an event and waits for the first event whose
+    ``correlation_id`` is the request's id. Such replies are still routed
+    to subscribers but are never journaled.
     """
 
-    def __init__(self, store: EventStore | None = None):
+    def __init__(
+        self,
+        store: EventStore | JournalStore | None = None,
+        queue_size: int | None = None,
+        workers: int = 1,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        max_in_flight: int | None = None,
+        resource_manager: ResourceManager | None = None,
+        max_spill: int | None = None,
+    ):
         """
         Initialize EventDispatcher.
-        
+
         Args:
-            store: Optional EventStore for persistent journaling.
+            store: Optional EventStore (or JournalStore) for persistent journaling.
+            queue_size: Per-subscription queue bound (None = unbounded tasks).
+            workers: Default consumer workers per subscription in bounded mode.
+            overflow: Default policy when a subscription queue is full.
+            max_in_flight: Handler invocations running at once across all
+                priority lanes (None = no lanes, start every handler at once).
+            resource_manager: Optional ResourceManager; lower lanes are
+                throttled when it reports POWER_SAVER or CRITICAL.
+            max_spill: Events a SPILL subscription parks in memory before
+                publishers wait (None = SPILL_QUEUES times its queue size).
         """
         self._subscribers: dict[str, list[EventHandler]] = {}
+        # Registration-ordered (pattern, handler) list and the table compiled from it
+        self._registrations: list[Route] = []
+        self._routes = RoutingTable()
         self._store = store
         self._lock = asyncio.Lock()
 
-    def subscribe(self, event_name: str, handler: EventHandler) -> None:
-        """Register an async handler for a specific event name."""
+        self.queue_size = queue_size
+        self.workers = workers
+        self.overflow = OverflowPolicy(overflow)
+        self.max_spill = max_spill
+        self._subscriptions: dict[tuple[str, EventHandler], Subscription] = {}
+
+        # Durability tiers by event name or pattern, and resolved lookups
+        self._durability: dict[str, Durability] = {}
+        self._durability_routes = RoutingTable()
+        self._durability_cache: dict[str, Durability] = {}
+
+        # Futures of in-flight requests, by request event id
+        self._pending_replies: dict[str, asyncio.Future[Event]] = {}
+
+        if queue_size is not None:
+            self._validate_overflow(self.overflow)
+
+        # Priority lanes (only used when max_in_flight is set)
+        self.resource_manager = resource_manager
+        self.max_in_flight = max_in_flight
+        self._route_priority: dict[Route, TaskPriority] = {}
+        self._lanes: PriorityLanes | None = None
+        self._lane_server: asyncio.Task | None = None
+        self._lane_slots: asyncio.Semaphore | None = None
+        self._lane_unfinished = 0
+        self._lanes_idle = asyncio.Event()
+        self._lanes_idle.set()
+        if max_in_flight is not None:
+            if max_in_flight < 1:
+                raise ValueError("max_in_flight must be at least 1")
+            self._lanes = PriorityLanes(profile=self._current_profile)
+
+    def subscribe(
+        self,
+        event_name: str,
+        handler: EventHandler,
+        queue_size: int | None = None,
+        workers: int | None = None,
+        overflow: OverflowPolicy | str | None = None,
+        priority: TaskPriority | None = None,
+    ) -> None:
+        """
+        Register an async handler for an event name or pattern.
+
+        Patterns may use "*" for one segment, or a trailing "*" for any
+        suffix (e.g. "agri.*", "community.broadcast.*").
+
+        The optional arguments override the dispatcher defaults for this
+        subscription; passing ``queue_size`` makes it bounded even if the
+        dispatcher itself is not. ``priority`` pins the subscription to a
+        lane regardless of the priority events are dispatched with.
+        """
         if event_name not in self._subscribers:
             self._subscribers[event_name] = []
 
         if handler not in self._subscribers[event_name]:
             self._subscribers[event_name].append(handler)
+            self._register_subscription(event_name, handler, queue_size, workers, overflow)
+            if priority is not None:
+                self._route_priority[(event_name, handler)] = TaskPriority(priority)
+            self._add_route((event_name, handler))
             logger.debug(f"Subscribed handler to {event_name}")
 
-    def subscribe_all(self, handler: EventHandler) -> None:
+    def subscribe_all(self, handler: EventHandler, priority: TaskPriority | None = None) -> None:
         """Register a handler for ALL events (e.g. logging, streaming)."""
         if "all" not in self._subscribers:
             self._subscribers["all"] = []
 
         if handler not in self._subscribers["all"]:
             self._subscribers["all"].append(handler)
+            self._register_subscription("all", handler, None, None, None)
+            if priority is not None:
+                self._route_priority[("all", handler)] = TaskPriority(priority)
+            self._add_route(("all", handler))
             logger.debug("Subscribed global handler")
 
-    async def dispatch(self, event: Event) -> None:
+    def _add_route(self, route: Route) -> None:
+        """Copy-on-write: compile a new routing table and swap it in."""
+        self._registrations.append(route)
+        self._routes = RoutingTable(self._registrations)
+
+    def set_durability(self, event_name: str, durability: Durability | str) -> None:
+        """
+        Set the durability tier for an event name or pattern.
+
+        Exact names take precedence over patterns; among patterns the most
+        recently registered match wins.
+        """
+        durability = Durability(durability)
+        self._durability.pop(event_name, None)
+        self._durability[event_name] = durability
+        if RoutingTable.is_pattern(event_name):
+            self._durability_routes = RoutingTable(
+                (name, tier) for name, tier in self._durability.items()
+                if RoutingTable.is_pattern(name)
+            )
+        self._durability_cache = {}
+        logger.debug(f"Durability for {event_name} set to {durability.value}")
+
+    def get_durability(self, event_name: str) -> Durability:
+        """Resolve the durability tier for an event name."""
+        durability = self._durability_cache.get(event_name)
+        if durability is not None:
+            return durability
+
+        durability = self._durability.get(event_name)
+        if durability is None:
+            matches = self._durability_routes.match(event_name)
+            durability = matches[-1][1] if matches else Durability.DURABLE
+        self._durability_cache[event_name] = durability
+        return durability
+
+    def _register_subscription(
+        self,
+        event_name: str,
+        handler: EventHandler,
+        queue_size: int | None,
+        workers: int | None,
+        overflow: OverflowPolicy | str | None,
+    ) -> None:
+        """Create the bounded queue for a handler when bounded mode applies."""
+        size = queue_size if queue_size is not None else self.queue_size
+        if size is None:
+            return
+
+        policy = OverflowPolicy(overflow) if overflow is not None else self.overflow
+        self._validate_overflow(policy)
+        self._subscriptions[(event_name, handler)] = Subscription(
+            event_name,
+            handler,
+            execute=self._safe_execute_tracked,
+            max_queue=size,
+            workers=workers if workers is not None else self.workers,
+            overflow=policy,
+            max_spill=self.max_spill,
+        )
+
+    def _validate_overflow(self, policy: OverflowPolicy) -> None:
+        if policy == OverflowPolicy.SPILL and self._store is None:
+            raise ValueError("OverflowPolicy.SPILL requires an EventStore to spill into")
+
+    async def dispatch(self, event: Event, priority: TaskPriority | None = None) -> None:
         """
         Dispatch an event to all registered subscribers.
-        
-        If a store is present, events are persisted before dispatch.
-        Subscribers are executed concurrently as background tasks.
+
+        ``priority`` selects the lane for subscriptions without their own
+        priority; it is ignored unless priority lanes are enabled.
+
+        If a store is present, durable events are persisted before dispatch
+        and best-effort events are buffered for a batched insert; ephemeral
+        events and replies to pending requests are never journaled.
+        Subscribers are executed concurrently as background tasks,
+        or queued on their bounded subscriptions.
         """
-        if self._store:
-            await self._store.enqueue(event)
+        journaled = False
+        # A reply only matters to its waiting requester: it is never journaled
+        is_reply = event.correlation_id in self._pending_replies and self._resolve_reply(event)
+        if self._store and not is_reply:
+            durability = self.get_durability(event.name)
+            if durability == Durability.DURABLE:
+                await self._store.enqueue(event)
+                journaled = True
+            elif durability == Durability.BEST_EFFORT:
+                self._store.enqueue_deferred(event)
+                journaled = True
 
-        handlers = self._subscribers.get(event.name, [])
-        # Add global handlers
-        handlers.extend(self._subscribers.get("all", []))
+        # Immutable lookup: specific and wildcard routes, then global handlers
+        routes = self._routes.match(event.name)
 
-        if not handlers:
+        if not routes:
             # If no handlers and stored, we can consider it completed
-            if self._store:
+            if journaled:
                 await self._store.mark_completed(event.id)
             return
 
-        # Execute handlers as independent tasks
-        # We wrap them to mark completion in the store after execution
-        if self._store:
-            asyncio.create_task(self._execute_with_tracking(handlers, event))
+        await self._deliver(event, routes, journaled, priority)
+
+    async def request(
+        self,
+        event: Event,
+        timeout: float | None = 5.0,
+        priority: TaskPriority | None = None,
+    ) -> Event:
+        """
+        Dispatch an event and wait for its reply.
+
+        The reply is the first event dispatched with ``correlation_id``
+        equal to ``event.id``.
+
+        Args:
+            event: Request event, dispatched like any other
+            timeout: Seconds to wait for the reply (None = wait forever)
+            priority: Lane for the request, as for ``dispatch``
+
+        Returns:
+            The reply event
+
+        Raises:
+            TimeoutError: If no reply arrives within ``timeout``
+        """
+        request_id = event.id
+        future: asyncio.Future[Event] = asyncio.get_running_loop().create_future()
+        # Registered before dispatch: a handler may reply before dispatch returns
+        self._pending_replies[request_id] = future
+        try:
+            await self.dispatch(event, priority)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if self._pending_replies.get(request_id) is future:
+                del self._pending_replies[request_id]
+
+    def _resolve_reply(self, event: Event) -> bool:
+        """Complete the request an event replies to; False if none is waiting."""
+        future = self._pending_replies.pop(event.correlation_id, None)
+        if future is None:
+            return False
+        if not future.done():
+            future.set_result(event)
+        return True
+
+    async def _deliver(
+        self,
+        event: Event,
+        routes: tuple[Route, ...],
+        journaled: bool = True,
+        priority: TaskPriority | None = None,
+    ) -> None:
+        """Hand an event to its handlers, via bounded queues where configured."""
+        if self._lanes is not None:
+            self._enqueue_lanes(event, routes, journaled, priority)
+            return
+
+        bounded = [self._subscriptions[r] for r in routes if r in self._subscriptions]
+        unbounded = [h for (name, h) in routes if (name, h) not in self._subscriptions]
+
+        if not bounded:
+            # Execute handlers as independent tasks
+            # We wrap them to mark completion in the store after execution
+            if journaled and self._store:
+                asyncio.create_task(self._execute_with_tracking(unbounded, event))
+            else:
+                for handler in unbounded:
+                    asyncio.create_task(self._safe_execute(handler, event))
+            return
+
+        delivery = _Delivery(event, remaining=len(routes), journaled=journaled and self._store is not None)
+
+        async def done(error: Exception | None) -> None:
+            await self._settle(delivery, error)
+
+        for handler in unbounded:
+            asyncio.create_task(self._execute_and_settle(handler, event, done))
+
+        for subscription in bounded:
+            await subscription.offer(event, done, delivery.journaled)
+
+    def _enqueue_lanes(
+        self,
+        event: Event,
+        routes: tuple[Route, ...],
+        journaled: bool,
+        priority: TaskPriority | None,
+    ) -> None:
+        """Queue one lane item per route; the delivery settles once all report."""
+        delivery = _Delivery(event, remaining=len(routes), journaled=journaled and self._store is not None)
+
+        async def done(error: Exception | None) -> None:
+            await self._settle(delivery, error)
+
+        default = TaskPriority.NORMAL if priority is None else priority
+        for route in routes:
+            self._lanes.put(self._route_priority.get(route, default), (route, delivery, done))
+        self._lane_unfinished += len(routes)
+        self._lanes_idle.clear()
+
+        if self._lane_server is None or self._lane_server.done():
+            self._lane_slots = asyncio.Semaphore(self.max_in_flight)
+            self._lane_server = asyncio.create_task(self._serve_lanes())
+
+    async def _serve_lanes(self) -> None:
+        """Start lane items in weighted priority order within the in-flight budget."""
+        while True:
+            await self._lane_slots.acquire()
+            route, delivery, done = await self._lanes.get()
+            asyncio.create_task(self._run_lane_item(route, delivery, done))
+
+    async def _run_lane_item(self, route: Route, delivery: _Delivery, done: DeliveryCallback) -> None:
+        """Run (or queue, for bounded subscriptions) one handler from a lane."""
+        event = delivery.event
+        try:
+            subscription = self._subscriptions.get(route)
+            if subscription is not None:
+                await subscription.offer(event, done, delivery.journaled)
+            else:
+                error = await self._safe_execute_tracked(route[1], event)
+                await done(error)
+        except Exception as e:
+            logger.error(f"Lane delivery failed for {event.name}: {e}", exc_info=True)
+        finally:
+            self._lane_slots.release()
+            self._lane_unfinished -= 1
+            if self._lane_unfinished == 0:
+                self._lanes_idle.set()
+
+    def _current_profile(self) -> PowerProfile | None:
+        """Current power profile for lane throttling (None without a manager)."""
+        if self.resource_manager is None:
+            return None
+        return self.resource_manager.get_current_profile()
+
+    async def _execute_and_settle(self, handler: EventHandler, event: Event, done: DeliveryCallback) -> None:
+        """Run an unbounded handler that shares a delivery with bounded ones."""
+        error = await self._safe_execute_tracked(handler, event)
+        await done(error)
+
+    async def _settle(self, delivery: _Delivery, error: Exception | None) -> None:
+        """Record one subscription's outcome; finalize the store once all report."""
+        if error is not None:
+            delivery.errors.append(error)
+
+        delivery.remaining -= 1
+        if delivery.remaining > 0 or not delivery.journaled:
+            return
+
+        if delivery.errors:
+            errmsg = "; ".join(str(e) for e in delivery.errors)
+            await self._store.mark_failed(delivery.event.id, errmsg)
         else:
-            for handler in handlers:
-                asyncio.create_task(self._safe_execute(handler, event))
+            await self._store.mark_completed(delivery.event.id)
+
+    def get_queue_stats(self) -> list[dict[str, Any]]:
+        """Per-subscriber queue depth and counters for monitoring."""
+        return [s.stats() for s in self._subscriptions.values()]
+
+    def get_lane_stats(self) -> dict[str, Any] | None:
+        """Per-lane depth, throttling and served counts (None without lanes)."""
+        if self._lanes is None:
+            return None
+        return {
+            "max_in_flight": self.max_in_flight,
+            "queued": len(self._lanes),
+            "unfinished": self._lane_unfinished,
+            "lanes": self._lanes.stats(),
+        }
+
+    async def drain(self) -> None:
+        """Wait until the priority lanes and every bounded subscription queue are empty."""
+        await self._lanes_idle.wait()
+        for subscription in list(self._subscriptions.values()):
+            await subscription.join()
+
+    async def shutdown(self) -> None:
+        """Stop the lane server and all subscription workers."""
+        if self._lane_server is not None:
+            self._lane_server.cancel()
+            await asyncio.gather(self._lane_server, return_exceptions=True)
+            self._lane_server = None
+        for subscription in self._subscriptions.values():
+            await subscription.stop()
 
     async def _execute_with_tracking(self, handlers: list[EventHandler], event: Event) -> None:
         """Execute multiple handlers and track overall success in storage."""
@@ -112,31 +488,97 @@ class EventDispatcher:
         except Exception as e:
             logger.error(f"Error in event handler for {event.name}: {e}", exc_info=True)
 
-    async def recover_pending_events(self) -> int:
+    async def recover_pending_events(
+        self,
+        batch_size: int = 100,
+        rate: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> int:
         """
         Recover and replay pending events from the store.
-        
+
+        The whole backlog is streamed from the store in pages, so memory use
+        does not depend on its size. Only events journaled before recovery
+        started are replayed; live traffic is dispatched normally meanwhile.
+
+        Args:
+            batch_size: Events read from the store per page.
+            rate: Maximum events replayed per second (None = unthrottled).
+            progress: Called as progress(recovered, total) after every page.
+
         Returns:
             Number of events recovered and dispatched.
         """
         if not self._store:
             return 0
 
-        pending_events = await self._store.get_pending_events()
+        until = time.time()
+        total = await self._store.count_pending_events(until)
+        if total == 0:
+            return 0
+
+        start = time.monotonic()
         count = 0
-        for event in pending_events:
-            # Re-dispatch without re-enqueueing (we'll update dispatch to handle this)
-            # Actually, we can just call an internal dispatch method
+        async for event in self._store.iter_pending_events(batch_size, until):
             await self._dispatch_recovered(event)
             count += 1
 
+            if rate:
+                # Pace replay so live traffic keeps its share of the loop
+                delay = start + count / rate - time.monotonic()
+                await asyncio.sleep(delay if delay > 0 else 0)
+            elif count % batch_size == 0:
+                await asyncio.sleep(0)
+
+            if progress and count % batch_size == 0:
+                progress(count, total)
+
+        if progress and count % batch_size:
+            progress(count, total)
+
+        logger.info(f"Recovered {count} pending events in {time.monotonic() - start:.2f}s")
         return count
 
+    async def process_retries(self, batch_size: int = 100) -> int:
+        """
+        Re-dispatch failed events whose backoff has elapsed.
+
+        Returns:
+            Number of events re-dispatched.
+        """
+        if not self._store:
+            return 0
+
+        events = await self._store.claim_due_retries(batch_size)
+        for event in events:
+            await self._dispatch_recovered(event)
+        return len(events)
+
+    async def run_retry_worker(self, batch_size: int = 100, max_sleep: float = 30.0) -> None:
+        """
+        Retry failed events forever, sleeping until the next retry is due.
+
+        ``max_sleep`` bounds how late a retry scheduled while the worker was
+        asleep can be picked up.
+        """
+        while True:
+            try:
+                if await self.process_retries(batch_size) >= batch_size:
+                    await asyncio.sleep(0)
+                    continue
+                next_at = await self._store.next_retry_at()
+            except Exception as e:
+                logger.error(f"Error in retry worker: {e}", exc_info=True)
+                next_at = None
+
+            delay = max_sleep if next_at is None else next_at - time.time()
+            await asyncio.sleep(min(max(delay, 0.0), max_sleep))
+
     async def _dispatch_recovered(self, event: Event) -> None:
         """Internal dispatch for recovered events (skips enqueue)."""
-        handlers = self._subscribers.get(event.name, [])
-        if not handlers:
+        routes = tuple(r for r in self._routes.match(event.name) if r[0] not in GLOBAL_PATTERNS)
+        if not routes:
             await self._store.mark_completed(event.id)
             return
 
-        asyncio.create_task(self._execute_with_tracking(handlers, event))
+        await self._deliver(event, routes)
@@ -0,0 +1,17 @@
+"""
+Durability Tiers - how much of the journal an event type pays for.
+
+Events default to DURABLE. Chatty, replaceable events (pongs, delivery
+confirmations, SSE-only telemetry) can be registered with the dispatcher
+as EPHEMERAL or BEST_EFFORT to take them off the synchronous write path.
+"""
+from __future__ import annotations
+
+from enum import Enum
+
+
+class Durability(str, Enum):
+    """Persistence guarantee for an event type."""
+    DURABLE = "durable"          # Journaled before dispatch; replayed after a crash
+    EPHEMERAL = "ephemeral"      # Memory only; never touches SQLite
+    BEST_EFFORT = "best_effort"  # Journaled asynchronously in batches; may be lost on a crash
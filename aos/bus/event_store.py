@@ -5,41 +5,128 @@ Provides crash recovery and event replay capabilities.
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
+import random
 import sqlite3
 import time
-from datetime import datetime
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from aos.bus.codec import EventCodec, JsonCodec
 from aos.bus.events import Event
 
+if TYPE_CHECKING:
+    from aos.db.async_engine import AsyncDatabase
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Column order of a buffered best-effort row (see enqueue_deferred)
+_DEFERRED_COLUMNS = (
+    "id, event_name, payload, correlation_id, timestamp, source_node, "
+    "created_at, status, error_message, retry_count, metadata"
+)
+_STATUS = 7
+_DEFERRED_INSERT = (
+    f"INSERT OR IGNORE INTO events ({_DEFERRED_COLUMNS}) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Columns shared by events and dead_letter_events
+_DEAD_LETTER_COLUMNS = (
+    "id, event_name, payload, correlation_id, timestamp, source_node, "
+    "metadata, created_at, retry_count, error_message"
+)
+
+# A statement group executed (and committed) together
+Statements = list[tuple[str, tuple[Any, ...]]]
+
 
 class EventStore:
     """SQLite-backed persistent event queue with crash recovery."""
 
-    def __init__(self, db_path: str, ttl_seconds: int = 86400) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: int = 86400,
+        group_commit: bool = False,
+        commit_window: float = 0.005,
+        max_batch_size: int = 256,
+        database: AsyncDatabase | None = None,
+        best_effort_window: float = 1.0,
+        best_effort_batch_size: int = 512,
+        max_attempts: int = 5,
+        retry_base_delay: float = 5.0,
+        retry_max_delay: float = 3600.0,
+        codec: EventCodec | None = None,
+    ) -> None:
         """
         Initialize EventStore.
-        
+
         Args:
             db_path: Path to SQLite database file
             ttl_seconds: Time-to-live for completed events (default: 24 hours)
+            group_commit: Batch writes from concurrent callers into one transaction
+            commit_window: Seconds to collect writes before a group commit
+            max_batch_size: Flush immediately once this many writes are pending
+            database: Optional AsyncDatabase; when given, all SQLite work runs
+                on its writer/reader threads instead of the event loop
+            best_effort_window: Seconds best-effort events are buffered before insert
+            best_effort_batch_size: Insert immediately once this many are buffered
+            max_attempts: Failed attempts before an event is dead-lettered
+            retry_base_delay: Backoff before the first retry, in seconds
+            retry_max_delay: Upper bound on the backoff between retries
+            codec: Serialization for new rows (default: JSON). Rows written
+                by any codec can always be read back.
         """
         self.db_path = db_path
         self.ttl_seconds = ttl_seconds
+        self.group_commit = group_commit
+        self.commit_window = commit_window
+        self.max_batch_size = max_batch_size
+        self.best_effort_window = best_effort_window
+        self.best_effort_batch_size = best_effort_batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.codec = codec or JsonCodec()
+        self._database = database
         self._conn: sqlite3.Connection | None = None
         self._lock = asyncio.Lock()
 
+        # Group-commit state: pending statements and the futures awaiting them
+        self._pending: list[Statements] = []
+        self._waiters: list[asyncio.Future[None]] = []
+        self._window_task: asyncio.Task | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+        # Best-effort rows not yet written, keyed by event id
+        self._deferred: dict[str, list[Any]] = {}
+        self._deferred_task: asyncio.Task | None = None
+
     async def initialize(self) -> None:
         """Initialize database schema."""
         # Create parent directory if needed
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        if self._database:
+            self._database.start()
+            await self._database.run_write(self._create_schema)
+            return
+
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Only takes effect on a new database (see reclaim_space)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
         self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._create_schema(self._conn)
+        self._conn.commit()
 
-        # Create events table
-        self._conn.execute("""
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """Create the events table and its indexes."""
+        conn.execute("""
             CREATE TABLE IF NOT EXISTS events (
                 id TEXT PRIMARY KEY,
                 event_name TEXT NOT NULL,
@@ -56,54 +143,140 @@ class EventStore:
         """)
 
         # Create index for efficient queries
-        self._conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_status_created 
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_status_created
             ON events(status, created_at)
         """)
 
-        self._conn.commit()
+        # Keyset cursor for crash recovery; holds only unfinished events
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_events_unfinished
+            ON events(created_at, id) WHERE status IN ('pending', 'processing')
+        """)
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(events)")}
+        if "next_attempt_at" not in columns:
+            conn.execute("ALTER TABLE events ADD COLUMN next_attempt_at REAL")
+
+        # Retry scans only ever touch failed rows that are waiting for a retry
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_events_retry
+            ON events(next_attempt_at) WHERE status = 'failed'
+        """)
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dead_letter_events (
+                id TEXT PRIMARY KEY,
+                event_name TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                correlation_id TEXT,
+                timestamp TEXT NOT NULL,
+                source_node TEXT,
+                metadata TEXT DEFAULT '{}',
+                created_at REAL NOT NULL,
+                retry_count INTEGER NOT NULL,
+                error_message TEXT,
+                dead_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_dead_letter_name
+            ON dead_letter_events(event_name, dead_at)
+        """)
+
+        # Progress of named replays (see aos.bus.replay)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS replay_checkpoints (
+                name TEXT PRIMARY KEY,
+                params TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                replayed INTEGER NOT NULL,
+                completed INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+        """)
 
     async def shutdown(self) -> None:
-        """Close database connection."""
+        """Flush pending writes and close database connection."""
+        if self._window_task:
+            self._window_task.cancel()
+            self._window_task = None
+        if self._deferred_task:
+            self._deferred_task.cancel()
+            self._deferred_task = None
+        if self._conn or self._database:
+            await self.flush()
         if self._conn:
             self._conn.close()
             self._conn = None
+        # A shared AsyncDatabase is owned (and closed) by whoever created it
 
     async def enqueue(self, event: Event) -> None:
         """
         Persist event to queue.
-        
+
         Args:
             event: Event to persist
         """
-        async with self._lock:
-            self._conn.execute("""
-                INSERT INTO events (
-                    id, event_name, payload, correlation_id, 
-                    timestamp, source_node, created_at, status, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', ?)
-            """, (
-                event.id,
-                event.name,
-                json.dumps(event.payload),
-                event.correlation_id,
-                event.timestamp.isoformat(),
-                event.source_node,
-                time.time(),
-                json.dumps(event.metadata)
-            ))
-            self._conn.commit()
+        await self._write("""
+            INSERT INTO events (
+                id, event_name, payload, correlation_id,
+                timestamp, source_node, created_at, status, metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', ?)
+        """, (
+            event.id,
+            event.name,
+            self.codec.encode(event.payload),
+            event.correlation_id,
+            self.codec.encode_event_timestamp(event),
+            event.source_node,
+            time.time(),
+            self.codec.encode(event.metadata)
+        ))
+
+    def enqueue_deferred(self, event: Event) -> None:
+        """
+        Buffer an event for a batched insert (best-effort durability).
+
+        Returns without touching SQLite. Buffered events are inserted together
+        after ``best_effort_window`` seconds, and status changes made before
+        then are applied to the buffered row, so an event handled quickly
+        costs one row in a shared INSERT instead of two writes.
+
+        Args:
+            event: Event to persist
+        """
+        self._deferred[event.id] = [
+            event.id,
+            event.name,
+            self.codec.encode(event.payload),
+            event.correlation_id,
+            self.codec.encode_event_timestamp(event),
+            event.source_node,
+            time.time(),
+            'pending',
+            None,
+            0,
+            self.codec.encode(event.metadata),
+        ]
+
+        if len(self._deferred) >= self.best_effort_batch_size:
+            task = asyncio.create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        elif self._deferred_task is None:
+            self._deferred_task = asyncio.create_task(self._flush_deferred_after_window())
 
     async def dequeue(self) -> Event | None:
         """
         Dequeue next pending event (atomic operation).
-        
+
         Returns:
             Next pending event or None if queue is empty
         """
-        async with self._lock:
+        def claim_next(conn: sqlite3.Connection) -> tuple | None:
             # Get oldest pending event
-            cursor = self._conn.execute("""
+            cursor = conn.execute("""
                 SELECT id, event_name, payload, correlation_id, timestamp, source_node, metadata
                 FROM events
                 WHERE status = 'pending'
@@ -116,109 +289,663 @@ class EventStore:
                 return None
 
             # Mark as processing
-            event_id = row[0]
-            self._conn.execute("""
-                UPDATE events 
+            conn.execute("""
+                UPDATE events
                 SET status = 'processing'
                 WHERE id = ?
-            """, (event_id,))
-            self._conn.commit()
+            """, (row[0],))
+            return tuple(row)
 
-            # Reconstruct event (use object.__setattr__ for frozen dataclass)
-            event = Event(
-                name=row[1],
-                payload=json.loads(row[2]),
-                correlation_id=row[3],
-                metadata=json.loads(row[6])
-            )
-            # Manually set the id and timestamp fields
-            object.__setattr__(event, 'id', row[0])
-            object.__setattr__(event, 'timestamp', datetime.fromisoformat(row[4]))
-            object.__setattr__(event, 'source_node', row[5])
+        async with self._lock:
+            await self._flush_locked()
+            row = await self._run_write(claim_next)
 
-            return event
+        return self._row_to_event(row) if row else None
 
     async def mark_completed(self, event_id: str) -> None:
         """Mark event as successfully completed."""
-        async with self._lock:
-            self._conn.execute("""
-                UPDATE events 
-                SET status = 'completed'
-                WHERE id = ?
-            """, (event_id,))
-            self._conn.commit()
+        row = self._deferred.get(event_id)
+        if row is not None:
+            row[_STATUS] = 'completed'
+            return
+
+        await self._write("""
+            UPDATE events
+            SET status = 'completed'
+            WHERE id = ?
+        """, (event_id,))
 
     async def mark_failed(self, event_id: str, error_message: str) -> None:
-        """Mark event as failed."""
+        """
+        Mark event as failed and schedule its retry.
+
+        The retry is due after an exponential backoff with jitter. Once an
+        event has failed ``max_attempts`` times it is moved to the
+        dead-letter table instead.
+        """
+        statements: Statements = []
+
+        # Failures are rare: write a buffered best-effort row out on its own
+        row = self._deferred.pop(event_id, None)
+        if row is not None:
+            statements.append((_DEFERRED_INSERT, tuple(row)))
+
+        # Backoff doubles per attempt already made: base * 2^retry_count
+        jitter = random.uniform(0.5, 1.0)
+        statements.append(("""
+            UPDATE events
+            SET status = 'failed', error_message = ?, retry_count = retry_count + 1,
+                next_attempt_at = ? + MIN(?, ? * (1 << MIN(retry_count, 30))) * ?
+            WHERE id = ?
+        """, (
+            error_message, time.time(), self.retry_max_delay, self.retry_base_delay, jitter, event_id
+        )))
+        statements.append((f"""
+            INSERT OR REPLACE INTO dead_letter_events ({_DEAD_LETTER_COLUMNS}, dead_at)
+            SELECT {_DEAD_LETTER_COLUMNS}, ? FROM events
+            WHERE id = ? AND retry_count >= ?
+        """, (time.time(), event_id, self.max_attempts)))
+        statements.append(("""
+            DELETE FROM events WHERE id = ? AND retry_count >= ?
+        """, (event_id, self.max_attempts)))
+
+        await self._write_all(statements)
+
+    async def claim_due_retries(self, limit: int = 100, now: float | None = None) -> list[Event]:
+        """
+        Claim failed events whose retry is due, oldest due first.
+
+        Claimed events are set back to 'processing', so concurrent workers
+        never claim the same row and a crash leaves them to recovery.
+
+        Returns:
+            Events to re-dispatch
+        """
+        now = time.time() if now is None else now
+
+        def claim(conn: sqlite3.Connection) -> list[tuple]:
+            rows = conn.execute("""
+                SELECT id, event_name, payload, correlation_id, timestamp, source_node, metadata
+                FROM events INDEXED BY idx_events_retry
+                WHERE status = 'failed' AND next_attempt_at <= ?
+                ORDER BY next_attempt_at
+                LIMIT ?
+            """, (now, limit)).fetchall()
+            conn.executemany("""
+                UPDATE events SET status = 'processing', next_attempt_at = NULL WHERE id = ?
+            """, [(row[0],) for row in rows])
+            return [tuple(row) for row in rows]
+
         async with self._lock:
-            self._conn.execute("""
-                UPDATE events 
-                SET status = 'failed', error_message = ?, retry_count = retry_count + 1
-                WHERE id = ?
-            """, (error_message, event_id))
-            self._conn.commit()
+            await self._flush_locked()
+            rows = await self._run_write(claim)
+
+        return [self._row_to_event(row) for row in rows]
+
+    async def next_retry_at(self) -> float | None:
+        """Epoch time the earliest waiting retry is due (None if there are none)."""
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_read(lambda conn: conn.execute("""
+                SELECT MIN(next_attempt_at) FROM events INDEXED BY idx_events_retry
+                WHERE status = 'failed'
+            """).fetchone()[0])
+
+    # --- Dead letters ---
+
+    @staticmethod
+    def _dead_letter_filter(
+        ids: list[str] | None, event_name: str | None, before: float | None
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause shared by the bulk dead-letter operations."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if ids is not None:
+            clauses.append(f"id IN ({', '.join('?' for _ in ids)})")
+            params.extend(ids)
+        if event_name is not None:
+            clauses.append("event_name = ?")
+            params.append(event_name)
+        if before is not None:
+            clauses.append("dead_at < ?")
+            params.append(before)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    async def list_dead_letters(
+        self,
+        event_name: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        before: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Inspect dead-lettered events, most recent first.
+
+        Args:
+            event_name: Only events with this name
+            before: Only events dead-lettered before this epoch time
+
+        Returns:
+            Dicts with the event and its failure details
+        """
+        where, params = self._dead_letter_filter(None, event_name, before)
+        async with self._lock:
+            await self._flush_locked()
+            rows = await self._run_read(lambda conn: conn.execute(f"""
+                SELECT id, event_name, payload, correlation_id, timestamp, source_node,
+                       metadata, retry_count, error_message, dead_at
+                FROM dead_letter_events{where}
+                ORDER BY dead_at DESC
+                LIMIT ? OFFSET ?
+            """, (*params, limit, offset)).fetchall())
+
+        return [
+            {
+                "event": self._row_to_event(row),
+                "retry_count": row[7],
+                "error_message": row[8],
+                "dead_at": row[9],
+            }
+            for row in rows
+        ]
+
+    async def count_dead_letters(self, event_name: str | None = None) -> int:
+        """Get number of dead-lettered events."""
+        where, params = self._dead_letter_filter(None, event_name, None)
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_read(lambda conn: conn.execute(
+                f"SELECT COUNT(*) FROM dead_letter_events{where}", params
+            ).fetchone()[0])
+
+    async def redrive_dead_letters(
+        self, ids: list[str] | None = None, event_name: str | None = None
+    ) -> int:
+        """
+        Move dead-lettered events back into the retry queue with a fresh budget.
+
+        With no filters every dead letter is re-driven.
+
+        Returns:
+            Number of events re-driven
+        """
+        where, params = self._dead_letter_filter(ids, event_name, None)
+
+        def redrive(conn: sqlite3.Connection) -> int:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO events (
+                    {_DEAD_LETTER_COLUMNS}, status, next_attempt_at
+                )
+                SELECT id, event_name, payload, correlation_id, timestamp, source_node,
+                       metadata, created_at, 0, error_message, 'failed', ?
+                FROM dead_letter_events{where}
+            """, (time.time(), *params))
+            return conn.execute(f"DELETE FROM dead_letter_events{where}", params).rowcount
+
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_write(redrive)
+
+    async def purge_dead_letters(
+        self,
+        ids: list[str] | None = None,
+        event_name: str | None = None,
+        before: float | None = None,
+    ) -> int:
+        """
+        Permanently delete dead-lettered events.
+
+        Args:
+            ids: Only these event ids
+            event_name: Only events with this name
+            before: Only events dead-lettered before this epoch time
+
+        Returns:
+            Number of events purged
+        """
+        where, params = self._dead_letter_filter(ids, event_name, before)
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_write(lambda conn: conn.execute(
+                f"DELETE FROM dead_letter_events{where}", params
+            ).rowcount)
+
+    async def flush(self) -> int:
+        """
+        Commit all pending group-commit writes in a single transaction.
+
+        Buffered best-effort events are written first.
+
+        Returns:
+            Number of statements flushed
+        """
+        async with self._lock:
+            return await self._flush_locked()
 
     async def get_pending_events(self, limit: int = 100) -> list[Event]:
         """
         Get all pending events (for replay after crash).
-        
+
         Returns:
             List of pending events
         """
         async with self._lock:
-            cursor = self._conn.execute("""
+            await self._flush_locked()
+            rows = await self._run_read(lambda conn: conn.execute("""
                 SELECT id, event_name, payload, correlation_id, timestamp, source_node, metadata
                 FROM events
                 WHERE status IN ('pending', 'processing')
                 ORDER BY created_at ASC
                 LIMIT ?
-            """, (limit,))
-
-            events = []
-            for row in cursor.fetchall():
-                event = Event(
-                    name=row[1],
-                    payload=json.loads(row[2]),
-                    correlation_id=row[3],
-                    metadata=json.loads(row[6])
+            """, (limit,)).fetchall())
+
+        return [self._row_to_event(row) for row in rows]
+
+    async def iter_pending_events(
+        self, batch_size: int = 100, until: float | None = None
+    ) -> AsyncIterator[Event]:
+        """
+        Stream every pending event, oldest first, one page at a time.
+
+        Pages are read with a keyset cursor on (created_at, id), so memory
+        stays bounded by ``batch_size`` however large the backlog is, and
+        events that change status while the stream is open are not skipped
+        or repeated.
+
+        Args:
+            batch_size: Rows fetched per query
+            until: Only include events created at or before this epoch time,
+                so events published while recovery runs are not replayed
+
+        Yields:
+            Pending events in creation order
+        """
+        until = time.time() if until is None else until
+        cursor: tuple[float, str] = (float("-inf"), "")
+
+        while True:
+            async with self._lock:
+                await self._flush_locked()
+                rows = await self._run_read(lambda conn: conn.execute("""
+                    SELECT id, event_name, payload, correlation_id, timestamp,
+                           source_node, metadata, created_at
+                    FROM events INDEXED BY idx_events_unfinished
+                    WHERE status IN ('pending', 'processing')
+                      AND created_at <= ?
+                      AND (created_at, id) > (?, ?)
+                    ORDER BY created_at, id
+                    LIMIT ?
+                """, (until, cursor[0], cursor[1], batch_size)).fetchall())
+
+            if not rows:
+                return
+
+            cursor = (rows[-1][7], rows[-1][0])
+            for row in rows:
+                yield self._row_to_event(row)
+
+            if len(rows) < batch_size:
+                return
+
+    async def iter_events(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        names: list[str] | None = None,
+        after: int = 0,
+        batch_size: int = 500,
+    ) -> AsyncIterator[tuple[int, Event]]:
+        """
+        Stream journaled events of any status in journal (insertion) order.
+
+        Pages are read with a keyset cursor on the rowid, so no index beyond
+        the table itself is needed and memory stays bounded by ``batch_size``.
+        Only events still in the table can be streamed: completed events
+        are removed once past the retention TTL.
+
+        Args:
+            start: Only events journaled at or after this epoch time
+            end: Only events journaled before this epoch time
+            names: Only events with one of these names
+            after: Resume after this position (as yielded by a previous stream)
+            batch_size: Rows fetched per query
+
+        Yields:
+            (position, event) pairs
+        """
+        clauses, params = ["rowid > ?"], []
+        if start is not None:
+            clauses.append("created_at >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("created_at < ?")
+            params.append(end)
+        if names:
+            clauses.append(f"event_name IN ({', '.join('?' for _ in names)})")
+            params.extend(names)
+        sql = f"""
+            SELECT rowid, id, event_name, payload, correlation_id, timestamp, source_node, metadata
+            FROM events WHERE {' AND '.join(clauses)}
+            ORDER BY rowid
+            LIMIT ?
+        """
+
+        position = after
+        while True:
+            async with self._lock:
+                await self._flush_locked()
+                rows = await self._run_read(
+                    lambda conn, position=position: conn.execute(
+                        sql, (position, *params, batch_size)
+                    ).fetchall()
                 )
-                object.__setattr__(event, 'id', row[0])
-                object.__setattr__(event, 'timestamp', datetime.fromisoformat(row[4]))
-                object.__setattr__(event, 'source_node', row[5])
-                events.append(event)
 
-            return events
+            if not rows:
+                return
+
+            for row in rows:
+                yield row[0], self._row_to_event(tuple(row)[1:])
+            position = rows[-1][0]
+
+            if len(rows) < batch_size:
+                return
+
+    async def get_replay_checkpoint(self, name: str) -> dict[str, Any] | None:
+        """Load a named replay's saved progress (None if it never ran)."""
+        async with self._lock:
+            await self._flush_locked()
+            row = await self._run_read(lambda conn: conn.execute("""
+                SELECT params, position, replayed, completed, updated_at
+                FROM replay_checkpoints WHERE name = ?
+            """, (name,)).fetchone())
+
+        if row is None:
+            return None
+        return {
+            "params": row[0],
+            "position": row[1],
+            "replayed": row[2],
+            "completed": bool(row[3]),
+            "updated_at": row[4],
+        }
+
+    async def save_replay_checkpoint(
+        self, name: str, params: str, position: int, replayed: int, completed: bool = False
+    ) -> None:
+        """Record how far a named replay has got."""
+        await self._write("""
+            INSERT OR REPLACE INTO replay_checkpoints
+                (name, params, position, replayed, completed, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (name, params, position, replayed, int(completed), time.time()))
+
+    async def delete_replay_checkpoint(self, name: str) -> None:
+        """Forget a named replay's progress."""
+        await self._write("DELETE FROM replay_checkpoints WHERE name = ?", (name,))
+
+    async def count_pending_events(self, until: float | None = None) -> int:
+        """Get number of pending or processing events created at or before ``until``."""
+        until = time.time() if until is None else until
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_read(lambda conn: conn.execute("""
+                SELECT COUNT(*) FROM events INDEXED BY idx_events_unfinished
+                WHERE status IN ('pending', 'processing') AND created_at <= ?
+            """, (until,)).fetchone()[0])
 
     async def cleanup_old_events(self) -> int:
         """
         Delete old completed events based on TTL.
-        
+
         Returns:
             Number of events deleted
         """
-        async with self._lock:
-            cutoff_time = time.time() - self.ttl_seconds
+        cutoff_time = time.time() - self.ttl_seconds
 
-            cursor = self._conn.execute("""
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_write(lambda conn: conn.execute("""
                 DELETE FROM events
                 WHERE status = 'completed' AND created_at < ?
-            """, (cutoff_time,))
+            """, (cutoff_time,)).rowcount)
 
-            self._conn.commit()
-            return cursor.rowcount
+    async def purge_completed(self, before: float, limit: int = 500) -> int:
+        """
+        Delete one batch of completed events created before ``before``.
+
+        Small batches keep each write transaction (and the time the writer
+        is held) short; call repeatedly until it returns less than ``limit``.
+
+        Returns:
+            Number of events deleted
+        """
+        async with self._lock:
+            await self._flush_locked()
+            return await self._run_write(lambda conn: conn.execute("""
+                DELETE FROM events WHERE rowid IN (
+                    SELECT rowid FROM events
+                    WHERE status = 'completed' AND created_at < ?
+                    LIMIT ?
+                )
+            """, (before, limit)).rowcount)
+
+    async def reclaim_space(
+        self, max_pages: int = 2000, checkpoint: bool = True, convert: bool = False
+    ) -> dict[str, int]:
+        """
+        Return free database pages to the filesystem and checkpoint the WAL.
+
+        Free pages are released with ``PRAGMA incremental_vacuum``, which
+        needs ``auto_vacuum=INCREMENTAL``. New databases get that mode at
+        creation; an existing database keeps ``auto_vacuum=NONE`` until it
+        is converted, which rewrites the whole file with a VACUUM and so is
+        only done when ``convert`` is set.
+
+        Args:
+            max_pages: Most free pages released per call
+            checkpoint: Also checkpoint and truncate the WAL file
+            convert: Switch a NONE database to incremental mode
+
+        Returns:
+            Bytes released from the database file and from the WAL, bytes
+            still free inside the database, and whether it is incremental
+        """
+        wal_path = Path(f"{self.db_path}-wal")
+
+        def reclaim(conn: sqlite3.Connection) -> dict[str, int]:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            pages_before = conn.execute("PRAGMA page_count").fetchone()[0]
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+            if mode != 2 and convert:
+                conn.commit()
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                mode = 2
+            elif mode == 2 and max_pages > 0:
+                # The pragma frees one page per step and returns no columns,
+                # so execute() would stop after one; executescript runs it out
+                conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+
+            pages_after = conn.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            return {
+                "db_bytes": (pages_before - pages_after) * page_size,
+                "free_bytes": free_pages * page_size,
+                "incremental": int(mode == 2),
+            }
+
+        def truncate_wal(conn: sqlite3.Connection) -> None:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+        wal_before = wal_path.stat().st_size if wal_path.exists() else 0
+        async with self._lock:
+            await self._flush_locked()
+            result = await self._run_write(reclaim)
+            if checkpoint:
+                await self._run_write(truncate_wal)
+        wal_after = wal_path.stat().st_size if wal_path.exists() else 0
+
+        result["wal_bytes"] = max(wal_before - wal_after, 0)
+        return result
 
     async def get_queue_depth(self) -> int:
         """Get number of pending events."""
         async with self._lock:
-            cursor = self._conn.execute("""
+            await self._flush_locked()
+            return await self._run_read(lambda conn: conn.execute("""
                 SELECT COUNT(*) FROM events WHERE status = 'pending'
-            """)
-            return cursor.fetchone()[0]
+            """).fetchone()[0])
 
     async def get_failed_count(self) -> int:
         """Get number of failed events."""
         async with self._lock:
-            cursor = self._conn.execute("""
+            await self._flush_locked()
+            return await self._run_read(lambda conn: conn.execute("""
                 SELECT COUNT(*) FROM events WHERE status = 'failed'
-            """)
-            return cursor.fetchone()[0]
+            """).fetchone()[0])
+
+    @staticmethod
+    def _row_to_event(row: tuple | sqlite3.Row) -> Event:
+        """Reconstruct an Event from an events row written by any codec."""
+        return Event(
+            row[1],
+            EventCodec.decode(row[2]),
+            row[0],
+            row[3],
+            EventCodec.decode_event_time(row[4]),
+            row[5],
+            EventCodec.decode(row[6]) or None,
+        )
+
+    async def _run_write(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """Run fn(conn) as a committed write. Caller must hold ``self._lock``."""
+        if self._database:
+            return await self._database.run_write(fn)
+
+        try:
+            result = fn(self._conn)
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        return result
+
+    async def _run_read(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """Run fn(conn) as a read. Caller must hold ``self._lock``."""
+        if self._database:
+            return await self._database.run_read(fn)
+        return fn(self._conn)
+
+    async def _write(self, sql: str, params: tuple[Any, ...]) -> None:
+        """Execute a single write statement (see _write_all)."""
+        await self._write_all([(sql, params)])
+
+    async def _write_all(self, statements: Statements) -> None:
+        """
+        Execute a group of write statements atomically.
+
+        Without group commit every group is its own transaction. With group
+        commit the group joins the current batch and the caller resumes
+        only once that batch has been committed.
+        """
+        if not self.group_commit:
+            async with self._lock:
+                await self._run_write(lambda conn: self._execute_group(conn, statements))
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append(statements)
+        self._waiters.append(waiter)
+
+        if len(self._pending) >= self.max_batch_size:
+            # Batch is full: commit now instead of waiting for the window
+            if self._window_task:
+                self._window_task.cancel()
+                self._window_task = None
+            task = asyncio.create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        elif self._window_task is None:
+            self._window_task = asyncio.create_task(self._flush_after_window())
+
+        await waiter
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the commit window to elapse, then flush the batch."""
+        await asyncio.sleep(self.commit_window)
+        self._window_task = None
+        await self.flush()
+
+    async def _flush_deferred_after_window(self) -> None:
+        """Wait for the best-effort window to elapse, then write the buffer."""
+        await asyncio.sleep(self.best_effort_window)
+        self._deferred_task = None
+        await self.flush()
+
+    async def _flush_deferred_locked(self) -> int:
+        """Insert buffered best-effort rows. Caller must hold ``self._lock``."""
+        if not self._deferred:
+            return 0
+
+        rows = list(self._deferred.values())
+        self._deferred = {}
+
+        try:
+            await self._run_write(lambda conn: conn.executemany(_DEFERRED_INSERT, rows))
+        except Exception as e:
+            # Best effort by definition: losing the batch must not break dispatch
+            logger.warning(f"Dropped {len(rows)} best-effort events: {e}")
+            return 0
+        return len(rows)
+
+    async def _flush_locked(self) -> int:
+        """Commit the pending batch. Caller must hold ``self._lock``."""
+        await self._flush_deferred_locked()
+        if not self._pending:
+            return 0
+
+        batch, waiters = self._pending, self._waiters
+        self._pending, self._waiters = [], []
+
+        results = await self._run_write(lambda conn: self._apply_batch(conn, batch))
+
+        for waiter, error in zip(waiters, results):
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
+
+        return len(batch)
+
+    @staticmethod
+    def _execute_group(conn: sqlite3.Connection, statements: Statements) -> None:
+        for sql, params in statements:
+            conn.execute(sql, params)
+
+    @classmethod
+    def _apply_batch(
+        cls, conn: sqlite3.Connection, batch: list[Statements]
+    ) -> list[Exception | None]:
+        """Apply a batch in one transaction, returning a per-group error list."""
+        try:
+            for statements in batch:
+                cls._execute_group(conn, statements)
+            # The caller commits the whole batch
+            return [None] * len(batch)
+        except Exception:
+            conn.rollback()
+
+        # One bad group must not fail its neighbours: replay individually
+        results: list[Exception | None] = []
+        for statements in batch:
+            try:
+                cls._execute_group(conn, statements)
+                conn.commit()
+                results.append(None)
+            except Exception as e:
+                conn.rollback()
+                results.append(e)
+        return results
@@ -1,16 +1,177 @@
-import uuid
+"""
+Event - the immutable message carried by the bus.
+
+Events are created on every publish, so the type is slotted and defers
+work until a field is read. The id is a node-prefixed monotonic counter
+that is formatted as a string only when first read. The creation time is
+kept as integer epoch nanoseconds, and the ``timestamp`` datetime is built
+on first access. Events created without metadata get their empty dict only
+when ``metadata`` is first read. The constructor, attributes, equality and
+immutability match the original frozen dataclass.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import time
 from collections.abc import Mapping
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _node_prefix() -> str:
+    """Process-unique id prefix: start time in ms plus random bits."""
+    return f"{time.time_ns() // 1_000_000:011x}{os.urandom(4).hex()}"
+
+
+_node = _node_prefix()
+_sequence = itertools.count()
+
+
+def _reseed() -> None:
+    # A forked child must not reuse its parent's ids
+    global _node, _sequence
+    _node = _node_prefix()
+    _sequence = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def _to_ns(value: datetime) -> int:
+    """Epoch nanoseconds of a datetime (naive values are taken as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    delta = value - _EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+
+
+class _EventSlots:
+    __slots__ = ("name", "payload", "_id", "correlation_id", "_ns", "_timestamp", "source_node", "_metadata")
+
+
+# Slot setters bypass Event.__setattr__, which rejects all writes
+(_set_name, _set_payload, _set_id, _set_correlation_id,
+ _set_ns, _set_timestamp, _set_source_node, _set_metadata) = (
+    getattr(_EventSlots, slot).__set__ for slot in _EventSlots.__slots__
+)
+
+
+class Event(_EventSlots):
+    """
+    An immutable bus message.
+
+    Args:
+        name: Event name, used for routing
+        payload: Event data
+        id: Unique id (default: next id from this process's sequence)
+        correlation_id: Id of the event this one responds to
+        timestamp: Creation time; a datetime, or integer epoch nanoseconds
+            (default: now)
+        source_node: Node that published the event
+        metadata: Delivery hints such as the lane (default: empty)
+    """
+
+    __slots__ = ()
+    __match_args__ = ("name", "payload", "id", "correlation_id", "timestamp", "source_node", "metadata")
 
-@dataclass(frozen=True)
-class Event:
     name: str
     payload: Mapping[str, Any]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    correlation_id: str | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
-    source_node: str | None = None
-    metadata: Mapping[str, Any] = field(default_factory=dict)
+    correlation_id: str | None
+    source_node: str | None
+
+    def __init__(
+        self,
+        name: str,
+        payload: Mapping[str, Any],
+        id: str | None = None,  # noqa: A002 - matches the public field name
+        correlation_id: str | None = None,
+        timestamp: datetime | int | None = None,
+        source_node: str | None = None,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
+        _set_name(self, name)
+        _set_payload(self, payload)
+        _set_id(self, next(_sequence) if id is None else id)
+        _set_correlation_id(self, correlation_id)
+        if timestamp is None:
+            _set_ns(self, time.time_ns())
+            _set_timestamp(self, None)
+        elif isinstance(timestamp, int):
+            _set_ns(self, timestamp)
+            _set_timestamp(self, None)
+        else:
+            _set_ns(self, None)
+            _set_timestamp(self, timestamp)
+        _set_source_node(self, source_node)
+        _set_metadata(self, metadata)
+
+    @property
+    def id(self) -> str:
+        """Unique event id."""
+        value = self._id
+        if value.__class__ is int:
+            value = f"{_node}-{value:010x}"
+            _set_id(self, value)
+        return value
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as an aware datetime."""
+        value = self._timestamp
+        if value is None:
+            value = _EPOCH + timedelta(microseconds=self._ns // 1000)
+            _set_timestamp(self, value)
+        return value
+
+    @property
+    def timestamp_ns(self) -> int:
+        """Creation time as integer epoch nanoseconds."""
+        value = self._ns
+        if value is None:
+            value = _to_ns(self._timestamp)
+            _set_ns(self, value)
+        return value
+
+    @property
+    def metadata(self) -> Mapping[str, Any]:
+        """Delivery hints; a new dict on first read when the event was created without any."""
+        value = self._metadata
+        if value is None:
+            value = {}
+            _set_metadata(self, value)
+        return value
+
+    def _fields(self) -> tuple:
+        return (self.name, self.payload, self.id, self.correlation_id,
+                self.timestamp, self.source_node, self.metadata)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(name={self.name!r}, payload={self.payload!r}, id={self.id!r}, "
+            f"correlation_id={self.correlation_id!r}, timestamp={self.timestamp!r}, "
+            f"source_node={self.source_node!r}, metadata={self.metadata!r})"
+        )
+
+    def __reduce__(self) -> tuple:
+        timestamp = self._timestamp if self._ns is None else self._ns
+        return (Event, (self.name, self.payload, self.id, self.correlation_id,
+                        timestamp, self.source_node, self._metadata))
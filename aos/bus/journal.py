@@ -0,0 +1,767 @@
+"""
+Journal Store - append-only segment-file backend for the event bus.
+
+An alternative to the SQLite EventStore with the same interface. Events
+are appended to fixed-size segment files; status changes are appended as
+small acknowledgement records instead of being updated in place. Writes
+are fsync-batched, reads go through a memory map of each segment, and a
+segment file is deleted as soon as every event in it has completed, so
+there is no DELETE sweep and no VACUUM.
+
+Record layout (little endian):
+    length u32 | crc32 u32 | kind u8 | body
+
+    EVENT body: created_at f64 | id_len u16 | name_len u16 | id | name | codec-encoded fields
+    ACK body:   status u8 | retry_count u16 | when f64 | id_len u16 | id | error
+
+Unfinished events are indexed in memory, rebuilt by scanning the segments
+at startup. A drained segment may still hold the latest ACK of a live
+event stored in an older segment; that ACK is appended again before the
+segment is deleted. Acknowledgements are not waited on: a crash before they reach
+disk replays the event, the same at-least-once guarantee as a crash
+while its handler runs.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import mmap
+import os
+import random
+import struct
+import time
+import zlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from aos.bus.codec import MAGIC, BinaryCodec, EventCodec
+from aos.bus.events import Event
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<IIB")
+_EVENT_PREFIX = struct.Struct("<dHH")
+_ACK = struct.Struct("<BHdH")
+
+# Record kinds
+_EVENT = 1
+_ACK_KIND = 2
+
+# Event states
+_PENDING, _PROCESSING, _COMPLETED, _FAILED, _DEAD = range(5)
+_UNFINISHED = (_PENDING, _PROCESSING)
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+
+_fsync = getattr(os, "fdatasync", os.fsync)
+
+
+class _Entry:
+    """In-memory index entry for an event that has not completed."""
+
+    __slots__ = (
+        "name", "segment", "offset", "created_at", "status",
+        "retry_count", "next_attempt_at", "error_message", "ack_segment",
+    )
+
+    def __init__(self, name: str, segment: int, offset: int, created_at: float) -> None:
+        self.name = name
+        self.segment = segment
+        self.offset = offset
+        self.created_at = created_at
+        self.status = _PENDING
+        self.retry_count = 0
+        self.next_attempt_at: float | None = None  # dead_at for dead letters
+        self.error_message: str | None = None
+        self.ack_segment: int | None = None  # Segment holding the latest ACK
+
+
+class _Segment:
+    __slots__ = ("seq", "path", "map", "events", "live")
+
+    def __init__(self, seq: int, path: Path, map: mmap.mmap | None = None) -> None:
+        self.seq = seq
+        self.path = path
+        self.map = map
+        self.events = 0  # EVENT records written to this segment
+        self.live = 0    # ...of which are not yet completed
+
+
+class JournalStore:
+    """Append-only segmented event journal with crash recovery."""
+
+    def __init__(
+        self,
+        path: str,
+        segment_size: int = 4 * 1024 * 1024,
+        commit_window: float = 0.0,
+        max_batch_size: int = 256,
+        best_effort_window: float = 1.0,
+        max_attempts: int = 5,
+        retry_base_delay: float = 5.0,
+        retry_max_delay: float = 3600.0,
+        compact_ratio: float = 0.125,
+        codec: EventCodec | None = None,
+        sync_in_thread: bool = True,
+    ) -> None:
+        """
+        Initialize JournalStore.
+
+        Args:
+            path: Directory holding the segment files
+            segment_size: Size of each segment file in bytes
+            commit_window: Seconds durable writes wait to share an fsync
+            max_batch_size: Sync immediately once this many writes are waiting
+            best_effort_window: Seconds best-effort events and acknowledgements
+                may stay unsynced
+            max_attempts: Failed attempts before an event is dead-lettered
+            retry_base_delay: Backoff before the first retry, in seconds
+            retry_max_delay: Upper bound on the backoff between retries
+            compact_ratio: cleanup_old_events moves the remaining events out
+                of a sealed segment once at most this share of it is live
+            codec: Serialization for event records (default: binary)
+            sync_in_thread: fsync on a worker thread so the event loop keeps
+                running while slow flash storage syncs
+        """
+        self.path = Path(path)
+        self.segment_size = segment_size
+        self.commit_window = commit_window
+        self.max_batch_size = max_batch_size
+        self.best_effort_window = best_effort_window
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.compact_ratio = compact_ratio
+        self.codec = codec or BinaryCodec()
+        self.sync_in_thread = sync_in_thread
+
+        self._entries: dict[str, _Entry] = {}
+        self._segments: dict[int, _Segment] = {}
+        self._active: _Segment | None = None
+        self._fd: int | None = None
+        self._offset = 0
+
+        # Sync state: descriptors of sealed segments not yet synced, records
+        # written since the last sync and the durable writers awaiting it
+        self._sealed_fds: list[int] = []
+        # Drained segments whose carried-forward ACKs are not yet synced
+        self._retired: list[_Segment] = []
+        self._unsynced = 0
+        self._waiters: list[asyncio.Future[None]] = []
+        self._sync_lock = asyncio.Lock()
+        self._window_task: asyncio.Task | None = None
+        self._deferred_task: asyncio.Task | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def initialize(self) -> None:
+        """Open the journal, rebuilding the index from existing segments."""
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        paths = sorted(self.path.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"))
+        for path in paths:
+            seq = int(path.name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+            if path.stat().st_size == 0:
+                # Crashed between creating and preallocating the file
+                path.unlink()
+                continue
+            with open(path, "rb") as f:
+                segment = _Segment(seq, path, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            self._segments[seq] = segment
+            self._offset = self._scan(segment)
+
+        if self._segments:
+            last = self._segments[max(self._segments)]
+            self._open_active(last.seq)
+            for segment in list(self._segments.values()):
+                if segment is not last and segment.live == 0:
+                    self._remove_segment(segment)
+        else:
+            self._open_active(1)
+
+        logger.info(
+            f"Journal opened: {len(self._segments)} segments, {len(self._entries)} unfinished events"
+        )
+
+    async def shutdown(self) -> None:
+        """Sync outstanding writes and close every segment."""
+        for task in (self._window_task, self._deferred_task):
+            if task:
+                task.cancel()
+        self._window_task = self._deferred_task = None
+        if self._fd is None:
+            return
+
+        await self.flush()
+        os.close(self._fd)
+        self._fd = None
+        for segment in self._segments.values():
+            segment.map.close()
+        self._segments.clear()
+        self._active = None
+
+    # --- Writes ---
+
+    async def enqueue(self, event: Event) -> None:
+        """
+        Persist event to the journal and wait until it is on disk.
+
+        Args:
+            event: Event to persist
+        """
+        self._append_event(event)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        if len(self._waiters) >= self.max_batch_size:
+            self._spawn_flush()
+        elif self._window_task is None:
+            self._window_task = asyncio.create_task(self._flush_after(self.commit_window, "_window_task"))
+
+        await waiter
+
+    def enqueue_deferred(self, event: Event) -> None:
+        """
+        Append an event without waiting for it to be synced (best-effort).
+
+        The record is synced with the next durable write, or after
+        ``best_effort_window`` seconds at the latest.
+        """
+        self._append_event(event)
+        self._schedule_deferred_sync()
+
+    async def mark_completed(self, event_id: str) -> None:
+        """Mark event as successfully completed."""
+        entry = self._entries.pop(event_id, None)
+        if entry is None:
+            return
+
+        self._append_ack(event_id, _COMPLETED)
+        self._release(entry.segment)
+
+    async def mark_failed(self, event_id: str, error_message: str) -> None:
+        """
+        Mark event as failed and schedule its retry.
+
+        The retry is due after an exponential backoff with jitter. Once an
+        event has failed ``max_attempts`` times it becomes a dead letter.
+        """
+        entry = self._entries.get(event_id)
+        if entry is None:
+            return
+
+        now = time.time()
+        # Backoff doubles per attempt already made: base * 2^retry_count
+        backoff = min(self.retry_max_delay, self.retry_base_delay * (1 << min(entry.retry_count, 30)))
+        entry.retry_count += 1
+        entry.error_message = error_message
+        if entry.retry_count >= self.max_attempts:
+            entry.status = _DEAD
+            entry.next_attempt_at = now
+        else:
+            entry.status = _FAILED
+            entry.next_attempt_at = now + backoff * random.uniform(0.5, 1.0)
+
+        self._append_ack(event_id, entry.status, entry)
+
+    async def dequeue(self) -> Event | None:
+        """
+        Dequeue next pending event.
+
+        Returns:
+            Next pending event or None if queue is empty
+        """
+        for event_id, entry in self._entries.items():
+            if entry.status == _PENDING:
+                self._set_status(event_id, entry, _PROCESSING)
+                return self._read_event(entry)
+        return None
+
+    async def claim_due_retries(self, limit: int = 100, now: float | None = None) -> list[Event]:
+        """
+        Claim failed events whose retry is due, oldest due first.
+
+        Returns:
+            Events to re-dispatch
+        """
+        now = time.time() if now is None else now
+        due = sorted(
+            (
+                (entry.next_attempt_at, event_id, entry)
+                for event_id, entry in self._entries.items()
+                if entry.status == _FAILED and entry.next_attempt_at <= now
+            ),
+            key=lambda item: item[0],
+        )[:limit]
+
+        events = []
+        for _, event_id, entry in due:
+            entry.next_attempt_at = None
+            self._set_status(event_id, entry, _PROCESSING)
+            events.append(self._read_event(entry))
+        return events
+
+    async def next_retry_at(self) -> float | None:
+        """Epoch time the earliest waiting retry is due (None if there are none)."""
+        return min(
+            (entry.next_attempt_at for entry in self._entries.values() if entry.status == _FAILED),
+            default=None,
+        )
+
+    async def flush(self) -> int:
+        """
+        Sync every record written so far to disk.
+
+        Returns:
+            Number of records synced
+        """
+        async with self._sync_lock:
+            if self._fd is None:
+                return 0
+
+            count, waiters, sealed = self._unsynced, self._waiters, self._sealed_fds
+            retired = self._retired
+            self._unsynced, self._waiters, self._sealed_fds, self._retired = 0, [], [], []
+            fds = [*sealed, self._fd]
+
+            error: Exception | None = None
+            try:
+                if self.sync_in_thread:
+                    await asyncio.get_running_loop().run_in_executor(None, self._sync_fds, fds)
+                else:
+                    self._sync_fds(fds)
+            except OSError as e:
+                error = e
+                logger.error(f"Journal sync failed: {e}")
+            finally:
+                for fd in sealed:
+                    os.close(fd)
+
+            if error is None:
+                for segment in retired:
+                    self._delete_segment(segment)
+            else:
+                self._retired[:0] = retired
+
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(error)
+            return count
+
+    # --- Reads ---
+
+    async def get_pending_events(self, limit: int = 100) -> list[Event]:
+        """
+        Get pending events (for replay after crash).
+
+        Returns:
+            List of pending events, oldest first
+        """
+        unfinished = [entry for entry in self._entries.values() if entry.status in _UNFINISHED]
+        unfinished.sort(key=lambda entry: entry.created_at)
+        return [self._read_event(entry) for entry in unfinished[:limit]]
+
+    async def iter_pending_events(
+        self, batch_size: int = 100, until: float | None = None
+    ) -> AsyncIterator[Event]:
+        """
+        Stream every pending event, oldest first, one page at a time.
+
+        Args:
+            batch_size: Events decoded per page
+            until: Only include events created at or before this epoch time
+
+        Yields:
+            Pending events in creation order
+        """
+        until = time.time() if until is None else until
+        keys = sorted(
+            (entry.created_at, event_id)
+            for event_id, entry in self._entries.items()
+            if entry.status in _UNFINISHED and entry.created_at <= until
+        )
+
+        for start in range(0, len(keys), batch_size):
+            for _, event_id in keys[start:start + batch_size]:
+                # Skip events that finished while the stream was open
+                entry = self._entries.get(event_id)
+                if entry is not None and entry.status in _UNFINISHED:
+                    yield self._read_event(entry)
+            await asyncio.sleep(0)
+
+    async def count_pending_events(self, until: float | None = None) -> int:
+        """Get number of pending or processing events created at or before ``until``."""
+        until = time.time() if until is None else until
+        return sum(
+            1 for entry in self._entries.values()
+            if entry.status in _UNFINISHED and entry.created_at <= until
+        )
+
+    async def get_queue_depth(self) -> int:
+        """Get number of pending events."""
+        return sum(1 for entry in self._entries.values() if entry.status == _PENDING)
+
+    async def get_failed_count(self) -> int:
+        """Get number of failed events."""
+        return sum(1 for entry in self._entries.values() if entry.status == _FAILED)
+
+    async def cleanup_old_events(self) -> int:
+        """
+        Compact sparsely used segments.
+
+        Completed segments are deleted as they drain, so this only handles
+        sealed segments held open by a few long-lived events (dead letters,
+        slow retries): those events are copied forward to the active
+        segment and the old file is deleted.
+
+        Returns:
+            Number of segments removed
+        """
+        sparse = [
+            segment for segment in self._segments.values()
+            if segment is not self._active and segment.live <= segment.events * self.compact_ratio
+        ]
+        if not sparse:
+            return 0
+
+        seqs = {segment.seq for segment in sparse}
+        for event_id, entry in list(self._entries.items()):
+            if entry.segment in seqs:
+                self._relocate(event_id, entry)
+
+        # The copies must be on disk before the originals go
+        await self.flush()
+        for segment in sparse:
+            self._remove_segment(segment)
+        return len(sparse)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Segment and index statistics."""
+        return {
+            "segments": len(self._segments),
+            "segment_size": self.segment_size,
+            "unfinished": len(self._entries),
+            "unsynced_records": self._unsynced,
+        }
+
+    # --- Dead letters ---
+
+    def _dead_letters(
+        self, ids: list[str] | None, event_name: str | None, before: float | None
+    ) -> list[tuple[str, _Entry]]:
+        wanted = set(ids) if ids is not None else None
+        return [
+            (event_id, entry) for event_id, entry in self._entries.items()
+            if entry.status == _DEAD
+            and (wanted is None or event_id in wanted)
+            and (event_name is None or entry.name == event_name)
+            and (before is None or entry.next_attempt_at < before)
+        ]
+
+    async def list_dead_letters(
+        self,
+        event_name: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        before: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Inspect dead-lettered events, most recent first.
+
+        Returns:
+            Dicts with the event and its failure details
+        """
+        dead = self._dead_letters(None, event_name, before)
+        dead.sort(key=lambda item: item[1].next_attempt_at, reverse=True)
+        return [
+            {
+                "event": self._read_event(entry),
+                "retry_count": entry.retry_count,
+                "error_message": entry.error_message,
+                "dead_at": entry.next_attempt_at,
+            }
+            for _, entry in dead[offset:offset + limit]
+        ]
+
+    async def count_dead_letters(self, event_name: str | None = None) -> int:
+        """Get number of dead-lettered events."""
+        return len(self._dead_letters(None, event_name, None))
+
+    async def redrive_dead_letters(
+        self, ids: list[str] | None = None, event_name: str | None = None
+    ) -> int:
+        """
+        Move dead-lettered events back into the retry queue with a fresh budget.
+
+        Returns:
+            Number of events re-driven
+        """
+        dead = self._dead_letters(ids, event_name, None)
+        now = time.time()
+        for event_id, entry in dead:
+            entry.status = _FAILED
+            entry.retry_count = 0
+            entry.next_attempt_at = now
+            self._append_ack(event_id, _FAILED, entry)
+        return len(dead)
+
+    async def purge_dead_letters(
+        self,
+        ids: list[str] | None = None,
+        event_name: str | None = None,
+        before: float | None = None,
+    ) -> int:
+        """
+        Permanently delete dead-lettered events.
+
+        Returns:
+            Number of events purged
+        """
+        dead = self._dead_letters(ids, event_name, before)
+        for event_id, _ in dead:
+            await self.mark_completed(event_id)
+        return len(dead)
+
+    # --- Internals ---
+
+    @staticmethod
+    def _segment_name(seq: int) -> str:
+        return f"{_SEGMENT_PREFIX}{seq:08d}{_SEGMENT_SUFFIX}"
+
+    def _open_active(self, seq: int) -> None:
+        """Open (creating and preallocating if needed) the segment appended to."""
+        path = self.path / self._segment_name(seq)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+
+        segment = self._segments.get(seq)
+        if segment is None:
+            segment = self._segments[seq] = _Segment(seq, path)
+            self._offset = 0
+        else:
+            # Reopening after a restart: zero whatever follows the last good
+            # record, so a torn write can never reappear behind a new one
+            segment.map.close()
+            os.ftruncate(fd, self._offset)
+        os.ftruncate(fd, max(self.segment_size, self._offset))
+        segment.map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+
+        os.lseek(fd, self._offset, os.SEEK_SET)
+        self._fd = fd
+        self._active = segment
+
+    def _rotate(self) -> None:
+        """Seal the active segment and start the next one."""
+        sealed = self._active
+        self._sealed_fds.append(self._fd)
+        self._open_active(sealed.seq + 1)
+        if sealed.live == 0:
+            self._remove_segment(sealed)
+
+    def _remove_segment(self, segment: _Segment) -> None:
+        """Delete a drained segment, first carrying forward the ACKs it holds."""
+        self._segments.pop(segment.seq, None)
+        carried = [
+            (event_id, entry) for event_id, entry in self._entries.items()
+            if entry.ack_segment == segment.seq
+        ]
+        for event_id, entry in carried:
+            self._append_ack(event_id, entry.status, entry)
+        if carried:
+            # The copies must be on disk before the originals go
+            self._retired.append(segment)
+            return
+        self._delete_segment(segment)
+
+    def _delete_segment(self, segment: _Segment) -> None:
+        segment.map.close()
+        try:
+            os.remove(segment.path)
+        except OSError as e:
+            logger.warning(f"Could not remove journal segment {segment.path.name}: {e}")
+
+    def _append(self, kind: int, body: bytes) -> tuple[_Segment, int]:
+        """Write one record to the active segment; returns where it landed."""
+        crc = zlib.crc32(body, kind)
+        record = _HEADER.pack(len(body), crc, kind) + body
+        if len(record) > self.segment_size:
+            raise ValueError(f"Journal record of {len(record)} bytes exceeds the segment size")
+        if self._offset + len(record) > self.segment_size:
+            self._rotate()
+
+        offset = self._offset
+        os.write(self._fd, record)
+        self._offset += len(record)
+        self._unsynced += 1
+        return self._active, offset
+
+    def _append_event(self, event: Event) -> None:
+        created_at = time.time()
+        encoded = self.codec.encode({
+            "payload": event.payload,
+            "correlation_id": event.correlation_id,
+            "timestamp": self.codec.encode_event_timestamp(event),
+            "source_node": event.source_node,
+            "metadata": dict(event.metadata),
+        })
+        if isinstance(encoded, str):
+            encoded = encoded.encode("utf-8")
+
+        event_id, name = event.id.encode("utf-8"), event.name.encode("utf-8")
+        prefix = _EVENT_PREFIX.pack(created_at, len(event_id), len(name)) + event_id + name
+        segment, offset = self._append(_EVENT, prefix + encoded)
+        self._track(event.id, _Entry(event.name, segment.seq, offset, created_at))
+
+    def _append_ack(self, event_id: str, status: int, entry: _Entry | None = None) -> None:
+        key = event_id.encode("utf-8")
+        body = _ACK.pack(
+            status,
+            min(entry.retry_count, 0xFFFF) if entry else 0,
+            (entry.next_attempt_at or 0.0) if entry else 0.0,
+            len(key),
+        ) + key
+        if entry and entry.error_message:
+            body += entry.error_message.encode("utf-8")
+        segment, _ = self._append(_ACK_KIND, body)
+        if entry:
+            entry.ack_segment = segment.seq
+        self._schedule_deferred_sync()
+
+    def _set_status(self, event_id: str, entry: _Entry, status: int) -> None:
+        entry.status = status
+        self._append_ack(event_id, status, entry)
+
+    def _track(self, event_id: str, entry: _Entry) -> None:
+        """Index an event record, replacing an older copy of the same event."""
+        previous = self._entries.get(event_id)
+        if previous is not None:
+            self._segments[previous.segment].live -= 1
+        self._entries[event_id] = entry
+        segment = self._segments[entry.segment]
+        segment.events += 1
+        segment.live += 1
+
+    def _release(self, seq: int) -> None:
+        """Drop one live event from a segment, deleting it once drained."""
+        segment = self._segments.get(seq)
+        if segment is None:
+            return
+        segment.live -= 1
+        if segment.live == 0 and segment is not self._active:
+            self._remove_segment(segment)
+
+    def _relocate(self, event_id: str, entry: _Entry) -> None:
+        """Copy an event record (and its state) to the active segment."""
+        old = self._segments[entry.segment]
+        length = _HEADER.unpack_from(old.map, entry.offset)[0]
+        kind_body = old.map[entry.offset + _HEADER.size - 1:entry.offset + _HEADER.size + length]
+
+        segment, offset = self._append(kind_body[0], bytes(kind_body[1:]))
+        old.live -= 1
+        entry.segment, entry.offset = segment.seq, offset
+        segment.events += 1
+        segment.live += 1
+        if entry.status != _PENDING:
+            self._append_ack(event_id, entry.status, entry)
+        else:
+            entry.ack_segment = None
+
+    def _read_event(self, entry: _Entry) -> Event:
+        """Decode the event record an index entry points at."""
+        segment = self._segments[entry.segment]
+        length = _HEADER.unpack_from(segment.map, entry.offset)[0]
+        start = entry.offset + _HEADER.size
+        return self._decode_event(segment.map[start:start + length])
+
+    @staticmethod
+    def _decode_event(body: bytes) -> Event:
+        _, id_len, name_len = _EVENT_PREFIX.unpack_from(body)
+        start = _EVENT_PREFIX.size + id_len + name_len
+        raw = body[start:]
+        fields = EventCodec.decode(raw if raw[0] == MAGIC else raw.decode("utf-8"))
+        return Event(
+            body[_EVENT_PREFIX.size + id_len:start].decode("utf-8"),
+            fields["payload"],
+            body[_EVENT_PREFIX.size:_EVENT_PREFIX.size + id_len].decode("utf-8"),
+            fields["correlation_id"],
+            EventCodec.decode_event_time(fields["timestamp"]),
+            fields["source_node"],
+            fields["metadata"] or None,
+        )
+
+    def _scan(self, segment: _Segment) -> int:
+        """Replay a segment's records into the index; returns its end offset."""
+        data, offset, end = segment.map, 0, len(segment.map)
+
+        while offset + _HEADER.size <= end:
+            length, crc, kind = _HEADER.unpack_from(data, offset)
+            body_start = offset + _HEADER.size
+            if length == 0 or body_start + length > end:
+                break
+            body = data[body_start:body_start + length]
+            if zlib.crc32(body, kind) != crc:
+                logger.warning(f"Journal segment {segment.path.name}: torn record at {offset}")
+                break
+
+            if kind == _EVENT:
+                # Only the fixed prefix is read; payloads are decoded on demand
+                created_at, id_len, name_len = _EVENT_PREFIX.unpack_from(body)
+                start = _EVENT_PREFIX.size
+                event_id = body[start:start + id_len].decode("utf-8")
+                name = body[start + id_len:start + id_len + name_len].decode("utf-8")
+                self._track(event_id, _Entry(name, segment.seq, offset, created_at))
+            elif kind == _ACK_KIND:
+                self._apply_ack(body, segment.seq)
+
+            offset = body_start + length
+
+        return offset
+
+    def _apply_ack(self, body: bytes, seq: int) -> None:
+        """Apply an acknowledgement record found while scanning."""
+        status, retry_count, when, id_len = _ACK.unpack_from(body)
+        event_id = body[_ACK.size:_ACK.size + id_len].decode("utf-8")
+        entry = self._entries.get(event_id)
+        if entry is None:
+            return
+
+        if status == _COMPLETED:
+            # Drained segments are removed once the scan is complete
+            del self._entries[event_id]
+            self._segments[entry.segment].live -= 1
+            return
+
+        entry.status = status
+        entry.ack_segment = seq
+        entry.retry_count = retry_count
+        entry.next_attempt_at = when or None
+        entry.error_message = body[_ACK.size + id_len:].decode("utf-8") or None
+
+    def _schedule_deferred_sync(self) -> None:
+        if self._deferred_task is None:
+            self._deferred_task = asyncio.create_task(
+                self._flush_after(self.best_effort_window, "_deferred_task")
+            )
+
+    def _spawn_flush(self) -> None:
+        if self._window_task:
+            self._window_task.cancel()
+            self._window_task = None
+        task = asyncio.create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_after(self, delay: float, slot: str) -> None:
+        """Wait ``delay`` seconds, then sync; ``slot`` names the timer attribute."""
+        await asyncio.sleep(delay)
+        setattr(self, slot, None)
+        await self.flush()
+
+    @staticmethod
+    def _sync_fds(fds: list[int]) -> None:
+        for fd in fds:
+            _fsync(fd)
@@ -0,0 +1,149 @@
+"""
+Priority Lanes - weighted scheduling of handler work by TaskPriority.
+
+Handler invocations wait in one lane per TaskPriority and are started under
+a shared in-flight budget. CRITICAL work is always started first; the other
+lanes share the remaining capacity by weight, so a broadcast fan-out in a low
+lane cannot hold up an interactive USSD session.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from aos.core.resource.profiles import PowerProfile
+from aos.core.resource.scheduler import TaskPriority
+
+# Relative share of dispatch capacity for the non-CRITICAL lanes
+DEFAULT_WEIGHTS: dict[TaskPriority, int] = {
+    TaskPriority.HIGH: 8,
+    TaskPriority.NORMAL: 4,
+    TaskPriority.LOW: 2,
+    TaskPriority.BACKGROUND: 1,
+}
+
+# Lanes with a priority above this level are throttled under the profile.
+# On battery only LOW and BACKGROUND work (fan-outs, telemetry) is slowed;
+# events dispatched without a priority, USSD and sessions among them, run
+# in NORMAL and keep their pace until the battery is critical.
+THROTTLE_ABOVE: dict[PowerProfile, TaskPriority] = {
+    PowerProfile.POWER_SAVER: TaskPriority.NORMAL,
+    PowerProfile.CRITICAL: TaskPriority.CRITICAL,
+}
+
+
+class PriorityLanes:
+    """
+    FIFO lanes keyed by TaskPriority with weighted selection.
+
+    Selection uses smooth weighted round-robin, so lanes are interleaved in
+    proportion to their weight rather than served in long runs. Throttled
+    lanes together start at most one item per ``throttle_interval``.
+    """
+
+    def __init__(
+        self,
+        weights: dict[TaskPriority, int] | None = None,
+        throttle_interval: float = 0.5,
+        profile: Callable[[], PowerProfile | None] | None = None,
+    ) -> None:
+        """
+        Initialize PriorityLanes.
+
+        Args:
+            weights: Per-lane weights for HIGH..BACKGROUND (CRITICAL is strict).
+            throttle_interval: Minimum seconds between items from throttled lanes.
+            profile: Returns the current power profile (None = never throttle).
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.throttle_interval = throttle_interval
+        self.profile = profile
+
+        self._lanes: dict[TaskPriority, deque[Any]] = {p: deque() for p in TaskPriority}
+        self._credit: dict[TaskPriority, int] = dict.fromkeys(TaskPriority, 0)
+        self._next_throttled = 0.0
+        self._ready = asyncio.Event()
+
+        # Monitoring counters
+        self.served: dict[TaskPriority, int] = dict.fromkeys(TaskPriority, 0)
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def put(self, priority: TaskPriority, item: Any) -> None:
+        """Append an item to its lane."""
+        self._lanes[TaskPriority(priority)].append(item)
+        self._ready.set()
+
+    def is_throttled(self, priority: TaskPriority) -> bool:
+        """True if the lane is throttled under the current power profile."""
+        if priority == TaskPriority.CRITICAL or self.profile is None:
+            return False
+        limit = THROTTLE_ABOVE.get(self.profile())
+        return limit is not None and priority > limit
+
+    async def get(self) -> Any:
+        """Wait for and remove the next item according to lane weights."""
+        while True:
+            now = time.monotonic()
+            priority, wait = self._select(now)
+            if priority is not None:
+                self.served[priority] += 1
+                return self._lanes[priority].popleft()
+
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=wait)
+            except TimeoutError:
+                pass
+
+    def _select(self, now: float) -> tuple[TaskPriority | None, float | None]:
+        """
+        Pick the lane to serve next.
+
+        Returns:
+            (lane, None) when an item is available, otherwise (None, seconds
+            until a throttled lane may be served, or None to wait for a put).
+        """
+        if self._lanes[TaskPriority.CRITICAL]:
+            return TaskPriority.CRITICAL, None
+
+        eligible: list[TaskPriority] = []
+        throttled_waiting = False
+        throttled_open = now >= self._next_throttled
+        for priority in self.weights:
+            if not self._lanes[priority]:
+                continue
+            if self.is_throttled(priority) and not throttled_open:
+                throttled_waiting = True
+                continue
+            eligible.append(priority)
+
+        if not eligible:
+            return None, (self._next_throttled - now) if throttled_waiting else None
+
+        total = 0
+        for priority in eligible:
+            self._credit[priority] += self.weights[priority]
+            total += self.weights[priority]
+        chosen = max(eligible, key=lambda p: (self._credit[p], -p))
+        self._credit[chosen] -= total
+
+        if self.is_throttled(chosen):
+            self._next_throttled = now + self.throttle_interval
+        return chosen, None
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of lane depths, throttling and served counts for monitoring."""
+        return {
+            p.name.lower(): {
+                "depth": len(self._lanes[p]),
+                "weight": self.weights.get(p),
+                "throttled": self.is_throttled(p),
+                "served": self.served[p],
+            }
+            for p in TaskPriority
+        }
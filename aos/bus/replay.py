@@ -0,0 +1,129 @@
+"""
+Event Replay - re-run journaled events through a handler.
+
+Used to rebuild derived tables (projections) after a schema change: the
+matching history is streamed from the EventStore page by page, paced to
+a target rate, and a named checkpoint records progress so a replay that
+crashed or was cancelled resumes where it stopped.
+
+Delivery is at-least-once: events handled after the last saved
+checkpoint are handled again on resume, so handlers should be idempotent
+(upserts rather than inserts).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from aos.bus.event_store import EventStore
+from aos.bus.journal import JournalStore
+from aos.bus.routing import EventHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay_events call."""
+    name: str
+    replayed: int      # Events handled by this call
+    total: int         # Events handled across all runs of this replay
+    position: int      # Journal position of the last handled event
+    resumed: bool      # Continued from a saved checkpoint
+    duration: float
+
+
+async def replay_events(
+    store: EventStore,
+    handler: EventHandler,
+    name: str,
+    start: float | None = None,
+    end: float | None = None,
+    event_names: list[str] | None = None,
+    rate: float | None = None,
+    batch_size: int = 500,
+    checkpoint_every: int | None = None,
+    restart: bool = False,
+) -> ReplayResult:
+    """
+    Replay journaled events in journal order through ``handler``.
+
+    A replay that already ran to the end is not repeated unless
+    ``restart`` is set.
+
+    Args:
+        store: EventStore holding the history
+        handler: Coroutine called once per event; an exception stops the
+            replay, leaving the checkpoint just before the failing event
+        name: Checkpoint name; a later call with the same name resumes
+        start: Only events journaled at or after this epoch time
+        end: Only events journaled before this epoch time
+        event_names: Only events with one of these names
+        rate: Maximum events replayed per second (None = unthrottled)
+        batch_size: Events read from the store per page
+        checkpoint_every: Events between checkpoint saves (default: batch_size)
+        restart: Discard any saved progress and start from the beginning
+
+    Returns:
+        Counts and position for this run
+
+    Raises:
+        TypeError: If ``store`` is a JournalStore, which keeps no history
+        ValueError: If a saved checkpoint was made for a different range
+            or set of names (pass ``restart=True`` to start over)
+    """
+    if isinstance(store, JournalStore):
+        raise TypeError(
+            "Replay needs an EventStore: JournalStore drops completed events "
+            "and deletes segments as they drain, so it keeps no history to replay"
+        )
+
+    params = json.dumps(
+        {"start": start, "end": end, "names": sorted(event_names) if event_names else None}
+    )
+    checkpoint_every = checkpoint_every or batch_size
+
+    checkpoint = None if restart else await store.get_replay_checkpoint(name)
+    if checkpoint and checkpoint["params"] != params:
+        raise ValueError(
+            f"Replay '{name}' has a checkpoint for {checkpoint['params']}; "
+            "use restart=True to replay a different selection"
+        )
+
+    position = checkpoint["position"] if checkpoint else 0
+    total = checkpoint["replayed"] if checkpoint else 0
+    result = ReplayResult(name, 0, total, position, resumed=bool(checkpoint), duration=0.0)
+    if checkpoint and checkpoint["completed"]:
+        return result
+
+    began = time.monotonic()
+    count = 0
+    try:
+        async for at, event in store.iter_events(start, end, event_names, position, batch_size):
+            await handler(event)
+            count += 1
+            result.position = at
+
+            if count % checkpoint_every == 0:
+                await store.save_replay_checkpoint(name, params, at, total + count)
+
+            if rate:
+                delay = began + count / rate - time.monotonic()
+                await asyncio.sleep(delay if delay > 0 else 0)
+            elif count % batch_size == 0:
+                await asyncio.sleep(0)
+    except BaseException:
+        # Keep the progress made by handlers that did finish
+        await store.save_replay_checkpoint(name, params, result.position, total + count)
+        raise
+
+    await store.save_replay_checkpoint(name, params, result.position, total + count, completed=True)
+
+    result.replayed = count
+    result.total = total + count
+    result.duration = time.monotonic() - began
+    logger.info(f"Replay '{name}': {count} events in {result.duration:.2f}s")
+    return result
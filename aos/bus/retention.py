@@ -0,0 +1,236 @@
+"""
+Retention Service - keeps the events table from growing without bound.
+
+Each run deletes completed events past the store's TTL in small batches
+under a time budget, archives old dead letters to gzip JSON-lines files,
+returns freed pages with incremental_vacuum and truncates the WAL. Runs
+are stretched out, trimmed or skipped as the power profile drops.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aos.bus.event_store import EventStore
+from aos.core.resource.profiles import PowerProfile
+
+if TYPE_CHECKING:
+    from aos.core.resource.manager import ResourceManager
+
+logger = logging.getLogger(__name__)
+
+# Interval multiplier per power profile (None = skip the run)
+BACKOFF: dict[PowerProfile, float | None] = {
+    PowerProfile.FULL_POWER: 1.0,
+    PowerProfile.BALANCED: 1.0,
+    PowerProfile.POWER_SAVER: 4.0,
+    PowerProfile.CRITICAL: None,
+}
+
+
+@dataclass
+class RetentionReport:
+    """What a single retention run did."""
+    started_at: float
+    profile: str
+    rows_deleted: int = 0
+    rows_archived: int = 0
+    bytes_reclaimed: int = 0
+    duration: float = 0.0
+    skipped: bool = False
+    budget_exhausted: bool = False
+
+
+class RetentionService:
+    """Periodic, power-aware cleanup of an EventStore."""
+
+    def __init__(
+        self,
+        store: EventStore,
+        resource_manager: ResourceManager | None = None,
+        interval: float = 3600.0,
+        batch_size: int = 500,
+        max_run_time: float = 2.0,
+        archive_after: float = 7 * 86400,
+        archive_dir: str | None = None,
+        vacuum_pages: int = 2000,
+        convert_free_ratio: float = 0.25,
+    ) -> None:
+        """
+        Initialize RetentionService.
+
+        Args:
+            store: EventStore to clean up; completed events older than its
+                ``ttl_seconds`` are deleted
+            resource_manager: Source of the power profile (None = always full power)
+            interval: Seconds between runs at full power
+            batch_size: Rows deleted per transaction
+            max_run_time: Time budget for the delete batches of one run, in seconds
+            archive_after: Seconds after which dead letters are archived
+                (requires ``archive_dir``)
+            archive_dir: Directory for dead-letter archives (None = keep them)
+            vacuum_pages: Most free pages returned to the filesystem per run
+            convert_free_ratio: On full power, VACUUM a database without
+                incremental auto-vacuum once this share of it is free
+        """
+        self.store = store
+        self.resource_manager = resource_manager
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_run_time = max_run_time
+        self.archive_after = archive_after
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.vacuum_pages = vacuum_pages
+        self.convert_free_ratio = convert_free_ratio
+
+        self.last_report: RetentionReport | None = None
+        self.totals = {"runs": 0, "rows_deleted": 0, "rows_archived": 0, "bytes_reclaimed": 0, "duration": 0.0}
+
+    def _profile(self) -> PowerProfile:
+        if self.resource_manager is None:
+            return PowerProfile.FULL_POWER
+        return self.resource_manager.get_current_profile()
+
+    async def run(self) -> None:
+        """Run forever, spacing runs by the interval for the current power profile."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Retention run failed: {e}", exc_info=True)
+
+            # Skipped profiles are re-checked at the slowest running interval
+            backoff = BACKOFF[self._profile()] or BACKOFF[PowerProfile.POWER_SAVER]
+            await asyncio.sleep(self.interval * backoff)
+
+    async def run_once(self) -> RetentionReport:
+        """
+        Perform one retention pass.
+
+        Returns:
+            Report of rows and bytes reclaimed and time spent
+        """
+        profile = self._profile()
+        report = RetentionReport(started_at=time.time(), profile=profile.value)
+        start = time.monotonic()
+
+        if BACKOFF[profile] is None:
+            report.skipped = True
+            logger.info(f"Retention skipped on {profile.value} power")
+            return self._record(report, start)
+
+        # Less time per run when saving power; the backlog waits for the charger
+        budget = self.max_run_time / (BACKOFF[profile] or 1.0)
+        deadline = start + budget
+
+        cutoff = time.time() - self.store.ttl_seconds
+        while True:
+            deleted = await self.store.purge_completed(cutoff, self.batch_size)
+            report.rows_deleted += deleted
+            if deleted < self.batch_size:
+                break
+            if time.monotonic() >= deadline:
+                report.budget_exhausted = True
+                break
+            await asyncio.sleep(0)  # Let dispatch in between batches
+
+        if self.archive_dir and time.monotonic() < deadline:
+            report.rows_archived = await self._archive_dead_letters(deadline)
+
+        # Page reclamation and checkpoints cost I/O: only when not saving power
+        if profile in (PowerProfile.FULL_POWER, PowerProfile.BALANCED):
+            reclaimed = await self.store.reclaim_space(max_pages=self.vacuum_pages)
+            report.bytes_reclaimed = reclaimed["db_bytes"] + reclaimed["wal_bytes"]
+
+            if profile == PowerProfile.FULL_POWER and self.convert_free_ratio:
+                report.bytes_reclaimed += await self._maybe_convert(reclaimed)
+
+        return self._record(report, start)
+
+    async def _archive_dead_letters(self, deadline: float) -> int:
+        """Move dead letters older than ``archive_after`` to the archive file."""
+        before = time.time() - self.archive_after
+        archived = 0
+
+        while time.monotonic() < deadline:
+            entries = await self.store.list_dead_letters(limit=self.batch_size, before=before)
+            if not entries:
+                break
+
+            records = [self._archive_record(entry) for entry in entries]
+            await asyncio.to_thread(self._append_archive, records)
+            # Only delete once the archive write has succeeded
+            archived += await self.store.purge_dead_letters(ids=[r["id"] for r in records])
+            if len(entries) < self.batch_size:
+                break
+
+        return archived
+
+    @staticmethod
+    def _archive_record(entry: dict[str, Any]) -> dict[str, Any]:
+        event = entry["event"]
+        return {
+            "id": event.id,
+            "name": event.name,
+            "payload": dict(event.payload),
+            "correlation_id": event.correlation_id,
+            "timestamp": event.timestamp.isoformat(),
+            "source_node": event.source_node,
+            "metadata": dict(event.metadata),
+            "retry_count": entry["retry_count"],
+            "error_message": entry["error_message"],
+            "dead_at": entry["dead_at"],
+        }
+
+    def _append_archive(self, records: list[dict[str, Any]]) -> None:
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        day = datetime.now(UTC).strftime("%Y-%m-%d")
+        # Appending adds a gzip member; gzip.open reads them back as one stream
+        with gzip.open(self.archive_dir / f"dead-letters-{day}.jsonl.gz", "at", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+
+    async def _maybe_convert(self, reclaimed: dict[str, int]) -> int:
+        """VACUUM into incremental mode when a NONE database is mostly free pages."""
+        if reclaimed["incremental"]:
+            return 0
+
+        free = reclaimed["free_bytes"]
+        size = Path(self.store.db_path).stat().st_size if Path(self.store.db_path).exists() else 0
+        if not size or free < size * self.convert_free_ratio:
+            return 0
+
+        logger.info(f"Converting {self.store.db_path} to incremental auto-vacuum ({free} bytes free)")
+        result = await self.store.reclaim_space(max_pages=0, checkpoint=True, convert=True)
+        return result["db_bytes"] + result["wal_bytes"]
+
+    def _record(self, report: RetentionReport, start: float) -> RetentionReport:
+        report.duration = time.monotonic() - start
+        self.last_report = report
+
+        self.totals["runs"] += 1
+        self.totals["rows_deleted"] += report.rows_deleted
+        self.totals["rows_archived"] += report.rows_archived
+        self.totals["bytes_reclaimed"] += report.bytes_reclaimed
+        self.totals["duration"] += report.duration
+
+        if not report.skipped:
+            logger.info(
+                f"Retention: deleted {report.rows_deleted}, archived {report.rows_archived}, "
+                f"reclaimed {report.bytes_reclaimed} bytes in {report.duration:.2f}s"
+            )
+        return report
+
+    def get_stats(self) -> dict[str, Any]:
+        """Totals across runs plus the last run's report."""
+        return {
+            "totals": dict(self.totals),
+            "last_run": asdict(self.last_report) if self.last_report else None,
+        }
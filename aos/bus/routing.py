@@ -0,0 +1,118 @@
+"""
+Routing Table - precompiled, immutable event-name to handler routing.
+
+Subscriptions are compiled into a segment trie whenever the subscriber set
+changes; dispatch only ever reads the current table, so lookups never
+mutate shared state and their cost does not grow with the handler count.
+
+Pattern syntax (segments are separated by "."):
+    agri.harvest_recorded    exact match
+    community.*.created      "*" in the middle matches exactly one segment
+    agri.*                   a trailing "*" matches one or more segments
+    all / *                  matches every event
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any
+
+from aos.bus.events import Event
+
+EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
+
+# (pattern, handler) as registered with the dispatcher
+Route = tuple[str, EventHandler]
+
+WILDCARD = "*"
+GLOBAL_PATTERNS = frozenset({"all", WILDCARD})
+
+
+class _Node:
+    __slots__ = ("children", "exact", "tail")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.exact: list[tuple[int, Route]] = []  # Patterns ending at this node
+        self.tail: list[tuple[int, Route]] = []   # Patterns ending in ".*" here
+
+
+class RoutingTable:
+    """
+    Immutable routing table compiled from (pattern, handler) subscriptions.
+
+    Match results are memoised per event name in a bounded cache, so the
+    steady-state cost of a lookup is a single dict hit.
+    """
+
+    def __init__(self, routes: Iterable[Route] = (), cache_size: int = 4096) -> None:
+        self._root = _Node()
+        self._globals: list[tuple[int, Route]] = []
+        self._cache: dict[str, tuple[Route, ...]] = {}
+        self._cache_size = cache_size
+        self._size = 0
+
+        for seq, route in enumerate(routes):
+            self._insert(seq, route)
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def is_pattern(name: str) -> bool:
+        """True if a subscription name contains wildcards."""
+        return name in GLOBAL_PATTERNS or WILDCARD in name.split(".")
+
+    def _insert(self, seq: int, route: Route) -> None:
+        pattern = route[0]
+        if pattern in GLOBAL_PATTERNS:
+            self._globals.append((seq, route))
+            return
+
+        node = self._root
+        segments = pattern.split(".")
+        for i, segment in enumerate(segments):
+            if segment == WILDCARD and i == len(segments) - 1:
+                node.tail.append((seq, route))
+                return
+            node = node.children.setdefault(segment, _Node())
+        node.exact.append((seq, route))
+
+    def match(self, event_name: str) -> tuple[Route, ...]:
+        """
+        Return the routes for an event name.
+
+        Specific and wildcard routes come first in subscription order,
+        followed by global ("all") routes, matching the legacy ordering.
+        """
+        cached = self._cache.get(event_name)
+        if cached is not None:
+            return cached
+
+        found: list[tuple[int, Route]] = []
+        self._collect(self._root, event_name.split("."), 0, found)
+        found.sort(key=lambda item: item[0])
+        routes = tuple(route for _, route in found)
+        routes += tuple(route for _, route in self._globals)
+
+        if len(self._cache) >= self._cache_size:
+            # Event names are normally a small fixed set; if they are not,
+            # start over rather than grow without bound.
+            self._cache.clear()
+        self._cache[event_name] = routes
+        return routes
+
+    def _collect(
+        self, node: _Node, segments: list[str], depth: int, found: list[tuple[int, Route]]
+    ) -> None:
+        if depth == len(segments):
+            found.extend(node.exact)
+            return
+
+        found.extend(node.tail)
+        child = node.children.get(segments[depth])
+        if child is not None:
+            self._collect(child, segments, depth + 1, found)
+        wildcard = node.children.get(WILDCARD)
+        if wildcard is not None:
+            self._collect(wildcard, segments, depth + 1, found)
@@ -1,15 +1,21 @@
 """
 Event Scheduler - Persistent time-based event emission.
 Supports delayed one-off events and recurring intervals.
+
+Due times are kept in an in-memory min-heap mirrored from SQLite, so the loop
+sleeps until the next task is due instead of polling the database.
 """
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
 import sqlite3
 import time
 import uuid
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 
 from aos.bus.dispatcher import EventDispatcher
@@ -17,29 +23,69 @@ from aos.bus.events import Event
 
 logger = logging.getLogger(__name__)
 
+
+class CoalescePolicy(str, Enum):
+    """How a recurring task handles runs missed while the node was down."""
+    ONCE = "once"  # Fire a single catch-up run, then resume the schedule
+    SKIP = "skip"  # Drop missed runs and wait for the next scheduled slot
+    ALL = "all"    # Fire every missed run (up to MAX_CATCH_UP_RUNS)
+
+
+# Upper bound on catch-up runs fired at once under CoalescePolicy.ALL
+MAX_CATCH_UP_RUNS = 100
+
+# Seconds before a task whose event could not be dispatched is tried again
+RETRY_DELAY = 5.0
+
+
+@dataclass
+class _Task:
+    """In-memory mirror of a scheduled_tasks row."""
+    id: str
+    event_name: str
+    payload: str
+    scheduled_at: float
+    interval: float | None
+    coalesce: CoalescePolicy
+    retry_at: float | None = None  # Set after a failed dispatch; the schedule itself is kept
+
+    @property
+    def due(self) -> float:
+        """When the task next leaves the heap."""
+        return self.scheduled_at if self.retry_at is None else self.retry_at
+
+
 class EventScheduler:
     """
     SQLite-backed event scheduler.
-    
+
     Ensures that events can be emitted at specific times or intervals,
     even after system restarts.
     """
 
-    def __init__(self, db_path: str, dispatcher: EventDispatcher) -> None:
+    def __init__(self, db_path: str, dispatcher: EventDispatcher, max_sleep: float = 300.0) -> None:
         """
         Initialize EventScheduler.
-        
+
         Args:
             db_path: Path to SQLite database.
             dispatcher: EventDispatcher to emit events through.
+            max_sleep: Longest single sleep in seconds. Bounds the error if the
+                wall clock is adjusted (e.g. NTP sync on a node without an RTC).
         """
         self.db_path = db_path
         self.dispatcher = dispatcher
+        self.max_sleep = max_sleep
         self._conn: sqlite3.Connection | None = None
         self._running = False
         self._loop_task: asyncio.Task | None = None
         self._lock = asyncio.Lock()
 
+        # Min-heap of (due, task_id); stale entries are skipped lazily
+        self._heap: list[tuple[float, str]] = []
+        self._tasks: dict[str, _Task] = {}
+        self._wakeup = asyncio.Event()
+
     async def initialize(self) -> None:
         """Initialize scheduler database schema."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -53,54 +99,81 @@ class EventScheduler:
                 payload TEXT NOT NULL,
                 scheduled_at REAL NOT NULL,
                 interval_seconds REAL,
-                status TEXT DEFAULT 'pending'
+                status TEXT DEFAULT 'pending',
+                coalesce TEXT DEFAULT 'once'
             )
         """)
 
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(scheduled_tasks)")}
+        if "coalesce" not in columns:
+            self._conn.execute("ALTER TABLE scheduled_tasks ADD COLUMN coalesce TEXT DEFAULT 'once'")
+
         # Index for efficient time-based retrieval
         self._conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_status_time 
+            CREATE INDEX IF NOT EXISTS idx_status_time
             ON scheduled_tasks(status, scheduled_at)
         """)
 
         self._conn.commit()
+        self._load_tasks()
 
     async def schedule_after(self, delay_seconds: float, event: Event) -> str:
         """
         Schedule a one-off event after a delay.
-        
+
         Returns:
             task_id: Unique identifier for the scheduled task.
         """
         scheduled_at = time.time() + delay_seconds
         return await self._store_task(event, scheduled_at)
 
-    async def schedule_recurring(self, interval_seconds: float, event: Event) -> str:
+    async def schedule_recurring(
+        self,
+        interval_seconds: float,
+        event: Event,
+        coalesce: CoalescePolicy | str = CoalescePolicy.ONCE,
+    ) -> str:
         """
         Schedule a recurring event.
-        
+
+        Args:
+            interval_seconds: Time between runs.
+            event: Event to emit on every run.
+            coalesce: How runs missed during downtime are handled.
+
         Returns:
             task_id: Unique identifier for the scheduled task.
         """
         scheduled_at = time.time() + interval_seconds
-        return await self._store_task(event, scheduled_at, interval=interval_seconds)
+        return await self._store_task(
+            event, scheduled_at, interval=interval_seconds, coalesce=CoalescePolicy(coalesce)
+        )
 
-    async def _store_task(self, event: Event, scheduled_at: float, interval: float | None = None) -> str:
+    async def _store_task(
+        self,
+        event: Event,
+        scheduled_at: float,
+        interval: float | None = None,
+        coalesce: CoalescePolicy = CoalescePolicy.ONCE,
+    ) -> str:
         """Persist task to database."""
         task_id = str(uuid.uuid4())
+        payload = json.dumps(event.payload)
         async with self._lock:
             self._conn.execute("""
                 INSERT INTO scheduled_tasks (
-                    id, event_name, payload, scheduled_at, interval_seconds
-                ) VALUES (?, ?, ?, ?, ?)
+                    id, event_name, payload, scheduled_at, interval_seconds, coalesce
+                ) VALUES (?, ?, ?, ?, ?, ?)
             """, (
                 task_id,
                 event.name,
-                json.dumps(event.payload),
+                payload,
                 scheduled_at,
-                interval
+                interval,
+                coalesce.value
             ))
             self._conn.commit()
+        self._push(_Task(task_id, event.name, payload, scheduled_at, interval, coalesce))
         return task_id
 
     async def cancel_task(self, task_id: str) -> None:
@@ -108,10 +181,13 @@ class EventScheduler:
         async with self._lock:
             self._conn.execute("DELETE FROM scheduled_tasks WHERE id = ?", (task_id,))
             self._conn.commit()
+        # Its heap entry is discarded when it reaches the top
+        self._tasks.pop(task_id, None)
 
     async def run(self) -> None:
         """Start the scheduler processing loop."""
         self._running = True
+        self._load_tasks()
         logger.info("Scheduler loop started")
 
         while self._running:
@@ -121,50 +197,137 @@ class EventScheduler:
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}", exc_info=True)
 
-            # Sleep until next check or interrup
-            # For simplicity, poll every 0.1s for test responsiveness.
-            # In production, this can be optimized to sleep until the next task time.
-            await asyncio.sleep(0.1)
+            # Sleep until the next task is due, or until an earlier one is added
+            self._wakeup.clear()
+            delay = self._next_delay()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except TimeoutError:
+                pass
 
     async def stop(self) -> None:
         """Stop the scheduler loop."""
         self._running = False
+        self._wakeup.set()
         if self._conn:
             self._conn.close()
             self._conn = None
         logger.info("Scheduler loop stopped")
 
-    async def _process_ready_tasks(self, now: float) -> None:
-        """Check for and execute tasks that are due."""
-        async with self._lock:
-            cursor = self._conn.execute("""
-                SELECT id, event_name, payload, interval_seconds
-                FROM scheduled_tasks
-                WHERE status = 'pending' AND scheduled_at <= ?
-            """, (now,))
+    def _load_tasks(self) -> None:
+        """Rebuild the in-memory heap from scheduled_tasks."""
+        rows = self._conn.execute("""
+            SELECT id, event_name, payload, scheduled_at, interval_seconds, coalesce
+            FROM scheduled_tasks
+            WHERE status = 'pending'
+        """).fetchall()
+
+        self._tasks = {}
+        for task_id, name, payload, scheduled_at, interval, coalesce in rows:
+            try:
+                policy = CoalescePolicy(coalesce or CoalescePolicy.ONCE)
+            except ValueError:
+                logger.warning(f"Unknown coalesce policy {coalesce!r} for task {task_id}; using 'once'")
+                policy = CoalescePolicy.ONCE
+            self._tasks[task_id] = _Task(task_id, name, payload, scheduled_at, interval, policy)
+
+        self._heap = [(task.due, task.id) for task in self._tasks.values()]
+        heapq.heapify(self._heap)
 
-            tasks = cursor.fetchall()
+    def _push(self, task: _Task) -> None:
+        """Add or reschedule a task, waking the loop if it is now the earliest."""
+        self._tasks[task.id] = task
+        heapq.heappush(self._heap, (task.due, task.id))
+        if self._heap[0][1] == task.id:
+            self._wakeup.set()
+
+    def _next_delay(self) -> float | None:
+        """Seconds until the earliest live task is due (None if there are none)."""
+        while self._heap:
+            due, task_id = self._heap[0]
+            task = self._tasks.get(task_id)
+            if task is None or task.due != due:
+                heapq.heappop(self._heap)  # Cancelled or rescheduled
+                continue
+            delay = max(0.0, due - time.time())
+            return min(delay, self.max_sleep) if self.max_sleep else delay
+        return self.max_sleep or None
+
+    def _pop_due(self, now: float) -> list[_Task]:
+        """Remove and return every live task due at or before now."""
+        due: list[_Task] = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, task_id = heapq.heappop(self._heap)
+            task = self._tasks.get(task_id)
+            if task is not None and task.due == due_at:
+                due.append(task)
+        return due
+
+    async def _process_ready_tasks(self, now: float) -> None:
+        """Execute tasks that are due."""
+        tasks = self._pop_due(now)
+        if not tasks:
+            return
 
+        async with self._lock:
             for task in tasks:
-                task_id, name, payload_str, interval = task
-
-                # Emit event
-                event = Event(name=name, payload=json.loads(payload_str))
-                await self.dispatcher.dispatch(event)
-
-                if interval is not None:
-                    # Update next execution time for recurring task
-                    next_time = now + interval
-                    self._conn.execute("""
-                        UPDATE scheduled_tasks 
-                        SET scheduled_at = ?
-                        WHERE id = ?
-                    """, (next_time, task_id))
-                else:
-                    # Mark one-off as completed (or just delete)
-                    self._conn.execute("""
-                        DELETE FROM scheduled_tasks 
-                        WHERE id = ?
-                    """, (task_id,))
+                try:
+                    await self._run_task(task, now)
+                except Exception as e:
+                    if self._tasks.get(task.id) is not task:
+                        continue  # Cancelled while its event was being dispatched
+                    # Popped from the heap but still in the table: put it back
+                    # rather than losing it until the next restart
+                    logger.error(
+                        f"Failed to emit {task.event_name} for task {task.id}, "
+                        f"retrying in {RETRY_DELAY}s: {e}",
+                        exc_info=True,
+                    )
+                    task.retry_at = now + RETRY_DELAY
+                    self._push(task)
 
             self._conn.commit()
+
+    async def _run_task(self, task: _Task, now: float) -> None:
+        """Emit one due task, then delete it (one-off) or advance its schedule."""
+        if task.interval is None:
+            await self._emit(task, missed=1)
+            # Mark one-off as completed (or just delete)
+            self._conn.execute("""
+                DELETE FROM scheduled_tasks
+                WHERE id = ?
+            """, (task.id,))
+            self._tasks.pop(task.id, None)
+            return
+
+        # Runs due between the scheduled time and now, inclusive
+        missed = 1
+        if task.interval > 0:
+            missed = int((now - task.scheduled_at) // task.interval) + 1
+
+        if task.coalesce == CoalescePolicy.ALL:
+            for _ in range(min(missed, MAX_CATCH_UP_RUNS)):
+                await self._emit(task, missed=1)
+        elif task.coalesce == CoalescePolicy.ONCE or missed == 1:
+            await self._emit(task, missed=missed)
+        else:
+            logger.info(f"Skipped {missed - 1} missed runs of {task.event_name}")
+
+        if self._tasks.get(task.id) is not task:
+            return  # Cancelled while its event was being dispatched
+
+        # Stay on the original cadence rather than drifting from now
+        task.scheduled_at += missed * task.interval
+        task.retry_at = None
+        self._conn.execute("""
+            UPDATE scheduled_tasks
+            SET scheduled_at = ?
+            WHERE id = ?
+        """, (task.scheduled_at, task.id))
+        self._push(task)
+
+    async def _emit(self, task: _Task, missed: int) -> None:
+        """Dispatch a task's event, noting coalesced runs in its metadata."""
+        metadata = {"missed_runs": missed} if missed > 1 else {}
+        event = Event(name=task.event_name, payload=json.loads(task.payload), metadata=metadata)
+        await self.dispatcher.dispatch(event)
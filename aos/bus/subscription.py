@@ -0,0 +1,203 @@
+"""
+Bounded Subscriptions - per-subscriber queues with dedicated worker pools.
+Caps the number of in-flight events per handler so a large broadcast cannot
+turn into tens of thousands of pending asyncio tasks.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from enum import Enum
+from typing import Any
+
+from aos.bus.events import Event
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
+
+# Called once per queued event with the handler error (if any)
+DeliveryCallback = Callable[[Exception | None], Awaitable[None]]
+
+# Default spill limit, in queue sizes
+SPILL_QUEUES = 4
+
+
+class OverflowPolicy(str, Enum):
+    """What a publisher experiences when a subscriber queue is full."""
+    BLOCK = "block"              # Backpressure: publisher waits for space
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event (recorded as failed)
+    SPILL = "spill"              # Park journaled events; redrive them to this subscription as room frees
+
+
+class QueueOverflowError(Exception):
+    """Recorded against an event evicted by the DROP_OLDEST policy."""
+
+
+class Subscription:
+    """
+    A handler with its own bounded queue and a fixed pool of consumer workers.
+
+    Note: with OverflowPolicy.BLOCK a handler must not publish to its own
+    subscription synchronously, or it can wait on itself once the queue fills.
+
+    With OverflowPolicy.SPILL a journaled event that finds the queue full
+    is parked outside it (it stays pending in the store meanwhile) and moved
+    into the queue as workers free room, so only this subscription sees it
+    again. At most ``max_spill`` events are parked; beyond that publishers
+    wait, as with BLOCK, so a slow consumer cannot hold a whole fan-out in
+    memory. An event that is not journaled would be lost with the process,
+    so it always gets backpressure instead.
+    """
+
+    def __init__(
+        self,
+        event_name: str,
+        handler: EventHandler,
+        execute: Callable[[EventHandler, Event], Awaitable[Exception | None]],
+        max_queue: int,
+        workers: int = 1,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        max_spill: int | None = None,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_spill is not None and max_spill < 1:
+            raise ValueError("max_spill must be at least 1")
+
+        self.event_name = event_name
+        self.handler = handler
+        self.max_queue = max_queue
+        self.workers = workers
+        self.overflow = OverflowPolicy(overflow)
+        self.max_spill = max_spill if max_spill is not None else SPILL_QUEUES * max_queue
+        self._execute = execute
+
+        self._queue: asyncio.Queue[tuple[Event, DeliveryCallback]] | None = None
+        self._tasks: list[asyncio.Task] = []
+        # Spilled events waiting for room in the queue
+        self._spill: deque[tuple[Event, DeliveryCallback]] = deque()
+        self._spill_room = asyncio.Event()
+
+        # Monitoring counters
+        self.processed = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.redriven = 0
+
+    @property
+    def name(self) -> str:
+        """Stable identifier for monitoring output."""
+        return f"{self.event_name}:{getattr(self.handler, '__qualname__', repr(self.handler))}"
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting in this subscriber's queue."""
+        return self._queue.qsize() if self._queue else 0
+
+    def _ensure_started(self) -> asyncio.Queue[tuple[Event, DeliveryCallback]]:
+        """Create the queue and workers lazily, inside the running loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+        return self._queue
+
+    async def offer(self, event: Event, done: DeliveryCallback, journaled: bool = True) -> None:
+        """
+        Queue an event, applying the overflow policy if the queue is full.
+
+        ``journaled`` says whether the event is pending in a store; SPILL
+        applies backpressure to events that are not.
+        """
+        queue = self._ensure_started()
+
+        if self.overflow == OverflowPolicy.SPILL and journaled:
+            if len(self._spill) >= self.max_spill:
+                logger.warning(f"Spill full for {self.name}; event {event.id} waits for room")
+                while len(self._spill) >= self.max_spill:
+                    self._spill_room.clear()
+                    await self._spill_room.wait()
+            if self._spill or queue.full():
+                # Behind earlier spills, so the subscription keeps publish order
+                self._spill.append((event, done))
+                self.spilled += 1
+                logger.warning(f"Queue full for {self.name}; spilled event {event.id} until there is room")
+                return
+        elif self.overflow == OverflowPolicy.SPILL and queue.full():
+            logger.warning(f"Queue full for {self.name}; event {event.id} is not journaled, waiting for room")
+
+        if not queue.full() or self.overflow != OverflowPolicy.DROP_OLDEST:
+            await queue.put((event, done))
+            return
+
+        old_event, old_done = queue.get_nowait()
+        queue.task_done()
+        self.dropped += 1
+        logger.warning(f"Queue full for {self.name}; dropped event {old_event.id}")
+        queue.put_nowait((event, done))
+        await old_done(QueueOverflowError(f"Dropped by full queue on {self.name}"))
+
+    async def _worker(self) -> None:
+        """Consume queued events one at a time."""
+        assert self._queue is not None
+        while True:
+            event, done = await self._queue.get()
+            try:
+                error = await self._execute(self.handler, event)
+                self.processed += 1
+                await done(error)
+            except Exception as e:
+                logger.error(f"Delivery callback failed for {self.name}: {e}", exc_info=True)
+            finally:
+                # Refill before task_done, so join() never sees an empty queue
+                # while spilled events are still waiting
+                self._redrive()
+                self._queue.task_done()
+
+    def _redrive(self) -> None:
+        """Move spilled events into the queue while it has room."""
+        while self._spill and not self._queue.full():
+            self._queue.put_nowait(self._spill.popleft())
+            self.redriven += 1
+            self._spill_room.set()
+
+    async def join(self) -> None:
+        """Wait until every queued event has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """
+        Cancel the worker pool. Queued and spilled events are left
+        unprocessed (journaled ones stay pending for recovery).
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._spill.clear()
+        self._spill_room.set()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of queue depth and counters for monitoring."""
+        return {
+            "subscription": self.name,
+            "event": self.event_name,
+            "depth": self.depth,
+            "capacity": self.max_queue,
+            "workers": self.workers,
+            "overflow": self.overflow.value,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "spill_backlog": len(self._spill),
+            "spill_capacity": self.max_spill,
+            "redriven": self.redriven,
+        }
@@ -49,6 +49,48 @@ class Settings(BaseSettings):
     master_secret: str = "change-this-in-production-use-aos-master-secret"
     kdf_iterations: int = 100000  # PBKDF2 iterations for key derivation
 
+    # Async database facade (writer thread + reader pool)
+    db_reader_threads: int = 2
+    # Read-only connections lent to request handlers (ConnectionPool)
+    db_pool_readers: int = 4
+
+    # Event bus configuration
+    event_group_commit: bool = False  # Batch EventStore writes into group commits
+    event_commit_window_ms: int = 5   # Max time a write waits for its batch
+    event_max_batch_size: int = 256
+    event_queue_size: int = 0         # Per-subscriber queue bound (0 = unbounded tasks)
+    event_queue_workers: int = 1      # Consumer workers per subscriber queue
+    event_overflow_policy: str = "block"  # block, drop_oldest or spill
+    event_max_spill: int = 0          # Events a spill queue parks in memory (0 = 4x the queue size)
+    event_max_in_flight: int = 64     # Handlers running at once across priority lanes (0 = no lanes)
+    event_best_effort_window_ms: int = 1000  # Buffering time for best_effort events
+    # Extra per-event durability tiers, e.g. AOS_EVENT_DURABILITY='{"agri.*": "best_effort"}'
+    event_durability: dict[str, str] = {}
+    event_recovery_batch_size: int = 200   # Pending events read per page at boot
+    event_recovery_rate: float = 200.0     # Max replayed events per second (0 = unthrottled)
+    event_retry_max_attempts: int = 5      # Failed attempts before an event is dead-lettered
+    event_retry_base_delay: float = 5.0    # Backoff before the first retry (seconds, doubles per attempt)
+    event_retry_max_delay: float = 3600.0  # Backoff cap
+    event_codec: str = "json"            # Row encoding for new events: json or binary
+    event_backend: str = "sqlite"        # Event journal: sqlite (events table) or journal (segment files)
+    event_journal_dir: str = "data/journal"
+    event_journal_segment_kb: int = 4096
+    event_retention_ttl_hours: float = 24.0     # Completed events are kept this long
+    event_retention_interval_s: float = 3600.0  # Time between retention runs at full power
+    event_retention_batch_size: int = 500       # Rows deleted per transaction
+    event_retention_max_run_ms: int = 2000      # Delete time budget per run
+    event_archive_after_days: float = 7.0       # Dead letters are then archived to data_dir/archive
+
+    # Database maintenance
+    db_maintenance_interval_s: float = 300.0   # Time between maintenance passes at full power
+    db_wal_checkpoint_mb: float = 16.0         # WAL size that triggers a truncating checkpoint
+    db_vacuum_pages: int = 2000                # Free pages returned per vacuum run
+    db_integrity_max_run_ms: int = 500         # Integrity check time budget per run
+    repo_cache_enabled: bool = True            # Cache hot repository lookups in memory
+    repo_cache_ttl_s: float = 300.0            # Seconds a cached lookup is served
+    repo_cache_miss_ttl_s: float = 5.0         # Seconds a cached miss is served
+    repo_cache_table_kb: int = 1024            # Memory limit per cached table
+
     # Resource configuration
     resource_check_interval: int = 30
 
@@ -39,7 +39,7 @@ class InstitutionalReportGenerator:
         elements.append(Spacer(1, 0.25 * inch))
 
         # 2. Member Statistics
-        members = [m for m in self.service.members.list_all() if m.community_id == community_id]
+        members = self.service.list_members(community_id)
         new_this_week = [m for m in members if (datetime.utcnow() - m.joined_at).days <= 7]
         
         elements.append(Paragraph("1. Member Statistics", self.styles['Heading2']))
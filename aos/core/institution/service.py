@@ -4,6 +4,7 @@ Handles institutional business rules, member management, and cross-channel commu
 """
 from __future__ import annotations
 
+import copy
 import logging
 import uuid
 import sqlite3
@@ -13,8 +14,9 @@ from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from aos.bus.dispatcher import EventDispatcher
-    from aos.bus.events import Event
+    from aos.db.cache import RepositoryCache
 
+from aos.bus.events import Event
 from aos.db.models import (
     InstitutionMemberDTO, InstitutionGroupDTO, InstitutionMessageLogDTO,
     PrayerRequestDTO, MemberVehicleMapDTO, InstitutionGroupMemberDTO,
@@ -40,6 +42,14 @@ class InstitutionService:
     Does not know about Telegram, SMS, or USSD (vehicle-agnostic).
     """
 
+    # Repository attributes rebound by with_connection
+    _REPOSITORIES = (
+        "members", "groups", "logs", "prayers", "vmaps", "communities",
+        "group_members", "attendance", "finance", "audit",
+    )
+    # Repositories on the per-message lookup path
+    _CACHED = ("members", "groups", "vmaps", "communities")
+
     def __init__(
         self,
         member_repo: InstitutionMemberRepository,
@@ -68,6 +78,35 @@ class InstitutionService:
         self.dispatcher = dispatcher
         self.plugins = plugins or {}  # NEW: Store registered plugins
 
+    def with_connection(self, connection: sqlite3.Connection) -> InstitutionService:
+        """
+        Shallow copy of this service whose repositories query another connection.
+
+        Used by read-only routes to query through a pool reader.
+        """
+        view = copy.copy(self)
+        for name in self._REPOSITORIES:
+            setattr(view, name, getattr(self, name)._with_connection(connection))
+        return view
+
+    def attach_cache(self, cache: RepositoryCache) -> None:
+        """Serve the member, vehicle, group and community lookups from a cache."""
+        for name in self._CACHED:
+            getattr(self, name).attach_cache(cache)
+
+    async def publish_member_event(self, name: str, member: InstitutionMemberDTO) -> None:
+        """
+        Announce a member or vehicle-map write on the bus.
+
+        Other nodes and repository instances without the cache flush their
+        member lookups on it (see aos.db.cache.INVALIDATION_EVENTS).
+        """
+        if self.dispatcher:
+            await self.dispatcher.dispatch(Event(
+                name=name,
+                payload={"member_id": member.id, "community_id": member.community_id}
+            ))
+
     def get_plugin(self, institution_type: str) -> Any | None:
         """Get plugin for specific institution type."""
         return self.plugins.get(institution_type)
@@ -107,12 +146,17 @@ class InstitutionService:
 
     def list_community_groups(self, community_id: str, institution_type: str | None = None) -> list[InstitutionGroupDTO]:
         """List groups within a community, optionally filtered by type."""
-        all_groups = self.groups.list_all()
-        return [
-            g for g in all_groups 
-            if g.community_id == community_id 
-            and (institution_type is None or g.institution_type == institution_type)
-        ]
+        where = {"community_id": community_id}
+        if institution_type is not None:
+            where["institution_type"] = institution_type
+        return self.groups.find(where)
+
+    def list_members(self, community_id: str, institution_type: str | None = None) -> list[InstitutionMemberDTO]:
+        """List members of a community; with a type, those of that type plus untyped members."""
+        where = {"community_id": community_id}
+        if institution_type is not None:
+            where["institution_type__in"] = [institution_type, "", None]
+        return self.members.find(where)
 
     def join_group(self, member_id: str, group_id: str) -> bool:
         """Join a member to a subgroup."""
@@ -136,8 +180,8 @@ class InstitutionService:
     def get_member_groups(self, member_id: str) -> list[InstitutionGroupDTO]:
         """Get all groups a member belongs to."""
         mappings = self.group_members.list_by_member(member_id)
-        group_ids = [m.group_id for m in mappings]
-        return [self.groups.get_by_id(gid) for gid in group_ids if self.groups.get_by_id(gid)]
+        groups = [self.groups.get_by_id(m.group_id) for m in mappings]
+        return [g for g in groups if g]
 
     # --- Prayer Request Review (PROMPT 8) ---
 
@@ -146,8 +190,7 @@ class InstitutionService:
         if not self.can_broadcast(requester_id): # Admin check
             return []
         
-        all_prayers = self.prayers.list_all()
-        return [p for p in all_prayers if p.community_id == community_id and p.status == "pending"]
+        return self.prayers.find({"community_id": community_id, "status": "pending"})
 
     def update_prayer_status(self, prayer_id: str, status: str, requester_id: str) -> bool:
         """Update prayer status (e.g. shared, answered)."""
@@ -280,7 +323,7 @@ class InstitutionService:
         Resolves a target string (e.g. 'ALL', 'GROUP:Youth') into a list of members.
         """
         if target.upper() == "ALL":
-            return [m for m in self.members.list_all() if m.community_id == community_id and (not m.institution_type or m.institution_type == institution_type)]
+            return self.list_members(community_id, institution_type)
         
         if target.startswith("GROUP:"):
             group_name = target.split(":", 1)[1]
@@ -309,8 +352,6 @@ class InstitutionService:
         Resolves targets and emits send events for each member/vehicle.
         Ensures 100% logging of every delivery attempt.
         """
-        from aos.bus.events import Event
-        
         targets = self.resolve_broadcast_targets(community_id, target, institution_type)
         track_ids = []
 
@@ -457,7 +498,7 @@ class InstitutionService:
         from datetime import timedelta
         cutoff = datetime.utcnow() - timedelta(days=days)
         
-        all_members = [m for m in self.members.list_all() if m.community_id == community_id and m.role_id != "ADMIN"]
+        all_members = [m for m in self.list_members(community_id) if m.role_id != "ADMIN"]
         
         inactive = []
         for member in all_members:
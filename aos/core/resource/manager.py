@@ -15,6 +15,7 @@ from aos.core.resource.monitor import ResourceMonitor, ResourceSnapshot
 from aos.core.resource.profiles import PowerProfile, PowerProfileManager
 from aos.core.resource.scheduler import ResourceAwareScheduler, Task, TaskPriority
 from aos.core.security.forensics import ForensicMonitor
+from aos.db.engine import write_transaction
 
 if TYPE_CHECKING:
     from aos.bus.dispatcher import EventDispatcher
@@ -122,11 +123,11 @@ class ResourceManager:
                 # Simplified for A-OS: just store full session.
                 # On next boot, we'll add this to 'accumulated_uptime' and reset session_uptime to 0.
                 uptime = get_uptime(self._boot_time)
-                self.db_conn.execute(
-                    "INSERT OR REPLACE INTO node_config (key, value, updated_at) VALUES ('session_uptime', ?, CURRENT_TIMESTAMP)",
-                    (str(uptime),)
-                )
-                self.db_conn.commit()
+                with write_transaction(self.db_conn):
+                    self.db_conn.execute(
+                        "INSERT OR REPLACE INTO node_config (key, value, updated_at) VALUES ('session_uptime', ?, CURRENT_TIMESTAMP)",
+                        (str(uptime),)
+                    )
             except Exception as e:
                 logger.error(f"Failed to persist uptime: {e}")
 
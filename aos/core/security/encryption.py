@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 
@@ -18,6 +24,7 @@ class SymmetricEncryption:
         if len(key) != 32:
             raise ValueError("Key must be 32 bytes (256 bits).")
         self.aead = ChaCha20Poly1305(key)
+        self._key = key
 
     @staticmethod
     def derive_key(salt: bytes, secret: str, iterations: int = 100000) -> bytes:
@@ -56,3 +63,127 @@ class SymmetricEncryption:
             return self.aead.decrypt(nonce, ciphertext, associated_data)
         except Exception:
             raise ValueError("Decryption failed (integrity check failed).")
+
+    def blind_index(self, purpose: str) -> BlindIndex:
+        """
+        Blind index keyed from this key, separately for each purpose
+        (e.g. "farmers.contact"), so equal values in different fields
+        do not produce equal digests.
+        """
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=f"aos.blind_index:{purpose}".encode(),
+            backend=default_backend()
+        )
+        return BlindIndex(hkdf.derive(self._key))
+
+
+class SealedValue:
+    """
+    Ciphertext of a text field, decrypted the first time it is read.
+
+    Not a str: callers that asked for sealed reads get fields typed
+    ``str | SealedValue`` and use str() or reveal() for the text. str(),
+    formatting, equality, hashing and len() open it; until then only the
+    ciphertext is held, so records listed without showing the field never
+    pay for AEAD. repr() never shows the plaintext.
+    """
+
+    __slots__ = ("ciphertext", "_encryptor", "_plaintext")
+
+    def __init__(self, ciphertext: bytes, encryptor: SymmetricEncryption):
+        self.ciphertext = ciphertext
+        self._encryptor = encryptor
+        self._plaintext: str | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._plaintext is not None
+
+    def reveal(self) -> str:
+        """The plaintext; raises ValueError if the ciphertext does not decrypt."""
+        if self._plaintext is None:
+            self._plaintext = self._encryptor.decrypt(self.ciphertext).decode()
+        return self._plaintext
+
+    def __str__(self) -> str:
+        return self.reveal()
+
+    def __repr__(self) -> str:
+        return f"<SealedValue {'open' if self.is_open else 'sealed'}>"
+
+    def __format__(self, spec: str) -> str:
+        return format(self.reveal(), spec)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SealedValue):
+            other = other.reveal()
+        return self.reveal() == other
+
+    def __hash__(self) -> int:
+        return hash(self.reveal())
+
+    def __len__(self) -> int:
+        return len(self.reveal())
+
+    def __bool__(self) -> bool:
+        return bool(self.ciphertext)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for str methods (upper, strip, ...): the slots are found first
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.reveal(), name)
+
+
+_reveal_pool: ThreadPoolExecutor | None = None
+
+
+def _reveal_batch(values: list[SealedValue]) -> None:
+    for value in values:
+        value.reveal()
+
+
+def reveal_all(values: Iterable[SealedValue], batch_size: int = 512, workers: int | None = None) -> None:
+    """
+    Open many sealed values, in batches on a shared thread pool.
+
+    Decryption runs in parallel only where the AEAD releases the GIL and
+    there is more than one core; otherwise, and for a single batch, the
+    values are opened on the calling thread.
+    """
+    global _reveal_pool
+    pending = [v for v in values if not v.is_open]
+    workers = workers or min(4, os.cpu_count() or 1)
+    if workers == 1 or len(pending) <= batch_size:
+        _reveal_batch(pending)
+        return
+
+    if _reveal_pool is None:
+        _reveal_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aos-reveal")
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    # list() re-raises the first decryption error
+    list(_reveal_pool.map(_reveal_batch, batches))
+
+
+class BlindIndex:
+    """
+    Keyed HMAC-SHA256 digests of plaintext values.
+
+    Encrypted columns use a random nonce, so equal values never have equal
+    ciphertext. A digest column next to them allows exact-match lookups
+    with an index instead of decrypting every row. Without the key the
+    digests reveal only which rows share a value.
+    """
+
+    def __init__(self, key: bytes, size: int = 16):
+        if len(key) < 32:
+            raise ValueError("Blind index key must be at least 32 bytes.")
+        self._key = key
+        self.size = size
+
+    def digest(self, value: str) -> bytes:
+        """Truncated HMAC of an already normalized value."""
+        return hmac.new(self._key, value.encode(), hashlib.sha256).digest()[:self.size]
@@ -4,6 +4,7 @@ import uuid
 from typing import Dict, Any
 from aos.bus.dispatcher import EventDispatcher
 from aos.bus.events import Event
+from aos.core.resource.scheduler import TaskPriority
 from aos.core.vehicles.interface import VehicleInterface
 from aos.db.repository import MessageRetryRepository
 from aos.db.models import MessageRetryDTO
@@ -22,7 +23,7 @@ class OutboundMessageManager:
         self.vehicles: Dict[str, VehicleInterface] = {}
         
         # Subscribe to outbound sending events
-        self.dispatcher.subscribe("outbound_send", self.handle_send_request)
+        self.dispatcher.subscribe("outbound_send", self.handle_send_request, priority=TaskPriority.HIGH)
 
     def register_vehicle(self, vehicle: VehicleInterface):
         """Register a communication channel (e.g., Telegram, SMS)."""
@@ -84,12 +84,13 @@ class CommandRouter:
 
         # 3. Register
         full_name = context.get("user_name", "Unknown Member")
-        self.service.register_member(
+        member = self.service.register_member(
             community.id, 
             full_name, 
             context.get("vehicle_type", "telegram"), 
             vehicle_identity
         )
+        await self.service.publish_member_event("INSTITUTION_MEMBER_REGISTERED", member)
         return f"Successfully joined {community.name}! Welcome."
 
     async def handle_myinfo(self, vehicle_identity: str, **context) -> str:
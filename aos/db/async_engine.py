@@ -0,0 +1,214 @@
+"""
+Async Database Facade - keeps SQLite I/O off the asyncio event loop.
+
+All writes are serialized through one dedicated writer thread fed by a
+request queue. Reads are served by a small pool of reader threads, each
+holding its own connection; WAL mode lets them run while the writer commits.
+A slow fsync on an SD card therefore stalls only the writer thread, not
+every coroutine on the node.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Sentinel that tells the writer thread to exit
+_STOP = object()
+
+
+def _open_connection(sqlite_path: str, read_only: bool = False) -> sqlite3.Connection:
+    """Open a connection with the same runtime pragmas as aos.db.engine.connect."""
+    if read_only and sqlite_path != ":memory:":
+        conn = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(sqlite_path, check_same_thread=False)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+        conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA foreign_keys=ON;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+class AsyncDatabase:
+    """
+    Coroutine API over SQLite backed by one writer thread and N reader threads.
+
+    Usage:
+        db = AsyncDatabase("aos.db", readers=2)
+        db.start()
+        await db.execute("INSERT INTO ...", (...))
+        rows = await db.fetchall("SELECT * FROM ...")
+        db.close()
+
+    Synchronous callers (scripts, tests) keep using aos.db.engine.connect
+    directly; the facade is purely additive.
+    """
+
+    def __init__(self, sqlite_path: str, readers: int = 2) -> None:
+        """
+        Initialize AsyncDatabase.
+
+        Args:
+            sqlite_path: Path to SQLite database file
+            readers: Number of reader threads (0 routes reads to the writer)
+        """
+        self.sqlite_path = sqlite_path
+        # An in-memory database is private to its connection, so readers
+        # would never see the writer's data.
+        self.readers = 0 if sqlite_path == ":memory:" else readers
+
+        self._requests: queue.Queue[Any] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_ready = threading.Event()
+        self._writer_error: BaseException | None = None
+        self._reader_pool: ThreadPoolExecutor | None = None
+        self._reader_local = threading.local()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._reader_conns_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._writer is not None and self._writer.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread and reader pool (idempotent)."""
+        if self.running:
+            return
+
+        self._writer_ready.clear()
+        self._writer_error = None
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="aos-db-writer", daemon=True
+        )
+        self._writer.start()
+        self._writer_ready.wait()
+        if self._writer_error:
+            raise RuntimeError(f"Failed to open writer connection: {self._writer_error}")
+
+        if self.readers:
+            self._reader_pool = ThreadPoolExecutor(
+                max_workers=self.readers, thread_name_prefix="aos-db-reader"
+            )
+
+    def close(self) -> None:
+        """Drain queued writes, stop all threads and close connections."""
+        if self._writer:
+            self._requests.put(_STOP)
+            self._writer.join()
+            self._writer = None
+
+        if self._reader_pool:
+            self._reader_pool.shutdown(wait=True)
+            self._reader_pool = None
+
+        with self._reader_conns_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+        self._reader_local = threading.local()
+
+    # --- Coroutine API ---
+
+    async def run_write(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """
+        Run fn(conn) on the writer thread inside a transaction.
+
+        The transaction is committed if fn returns and rolled back if it raises.
+        """
+        if not self.running:
+            raise RuntimeError("AsyncDatabase not started")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._requests.put((fn, loop, future))
+        return await future
+
+    async def run_read(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """Run fn(conn) on a reader thread (or the writer if no readers)."""
+        if not self._reader_pool:
+            return await self.run_write(fn)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reader_pool, self._read_call, fn)
+
+    async def execute(self, sql: str, params: Iterable[Any] = ()) -> int:
+        """Execute a write statement. Returns the affected row count."""
+        params = tuple(params)
+        return await self.run_write(lambda conn: conn.execute(sql, params).rowcount)
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> int:
+        """Execute a write statement for every parameter set in one transaction."""
+        rows = [tuple(p) for p in seq_of_params]
+        return await self.run_write(lambda conn: conn.executemany(sql, rows).rowcount)
+
+    async def fetchone(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Row | None:
+        """Run a query on a reader and return the first row."""
+        params = tuple(params)
+        return await self.run_read(lambda conn: conn.execute(sql, params).fetchone())
+
+    async def fetchall(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        """Run a query on a reader and return all rows."""
+        params = tuple(params)
+        return await self.run_read(lambda conn: conn.execute(sql, params).fetchall())
+
+    # --- Thread internals ---
+
+    def _writer_loop(self) -> None:
+        """Own the writer connection and apply queued requests in order."""
+        try:
+            conn = _open_connection(self.sqlite_path)
+        except BaseException as e:
+            self._writer_error = e
+            self._writer_ready.set()
+            return
+        self._writer_ready.set()
+
+        try:
+            while True:
+                item = self._requests.get()
+                if item is _STOP:
+                    break
+
+                fn, loop, future = item
+                try:
+                    result = fn(conn)
+                    conn.commit()
+                except BaseException as e:
+                    conn.rollback()
+                    loop.call_soon_threadsafe(_resolve, future, None, e)
+                else:
+                    loop.call_soon_threadsafe(_resolve, future, result, None)
+        finally:
+            conn.close()
+
+    def _read_call(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """Run fn with this reader thread's private connection."""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = _open_connection(self.sqlite_path, read_only=True)
+            self._reader_local.conn = conn
+            with self._reader_conns_lock:
+                self._reader_conns.append(conn)
+        return fn(conn)
+
+
+def _resolve(future: asyncio.Future[Any], result: Any, error: BaseException | None) -> None:
+    """Complete a future on its own loop, ignoring callers that gave up."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -0,0 +1,195 @@
+"""
+Repository Cache - read-through cache for hot repository lookups.
+
+Every inbound message resolves the same few records (a community code, a
+vehicle identity, a member) before doing any work. Repositories with a
+cache attached serve those lookups from a bounded LRU per table, with a
+TTL and a memory limit, and flush the table's entries on their own writes.
+Writes made elsewhere (raw SQL, another repository instance without the
+cache, a sync) are announced on the event bus; see INVALIDATION_EVENTS.
+Misses are kept only briefly, since a row written from another connection
+without an announcement would otherwise stay invisible for the full TTL.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from aos.bus.dispatcher import EventDispatcher
+    from aos.bus.events import Event
+
+# Generic event for writers that bypass the repositories:
+# payload {"table": "<name>"}, or {} to flush every table
+INVALIDATE_EVENT = "db.cache.invalidate"
+
+# Event name -> tables whose entries it makes stale
+INVALIDATION_EVENTS: dict[str, tuple[str, ...]] = {
+    "COMMUNITY_GROUP_REGISTERED": ("community_groups",),
+    "COMMUNITY_GROUP_DEACTIVATED": ("community_groups",),
+    "COMMUNITY_EVENT_PUBLISHED": ("community_events",),
+    "COMMUNITY_ANNOUNCEMENT_CREATED": ("community_announcements",),
+    "INSTITUTION_MEMBER_REGISTERED": ("institution_members", "member_vehicle_maps"),
+    "INSTITUTION_MEMBER_UPDATED": ("institution_members",),
+    "INSTITUTION_MEMBER_REMOVED": ("institution_members", "member_vehicle_maps"),
+}
+
+
+def _sizeof(value: Any) -> int:
+    """Approximate bytes held by a cached DTO, list of DTOs or None."""
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if isinstance(value, BaseModel):
+        fields = value.__dict__
+        return sys.getsizeof(fields) + sum(sys.getsizeof(v) for v in fields.values())
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _Table:
+    entries: OrderedDict[Hashable, tuple[Any, float, int]] = field(default_factory=OrderedDict)
+    bytes: int = 0
+    # Bumped by every flush; a load that straddles one is not stored
+    generation: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class RepositoryCache:
+    """
+    Bounded, TTL-limited LRU of repository results, partitioned by table.
+
+    Thread-safe: pool readers and AsyncDatabase reader threads share it
+    with the writer connection's repositories.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        miss_ttl: float = 5.0,
+        max_entries: int = 1024,
+        max_bytes: int = 1024 * 1024,
+        limits: Mapping[str, int] | None = None,
+    ) -> None:
+        """
+        Initialize RepositoryCache.
+
+        Args:
+            ttl: Seconds an entry is served before it is reloaded
+            miss_ttl: Seconds a miss (None or an empty list) is served
+            max_entries: Most entries kept per table
+            max_bytes: Approximate memory limit per table, in bytes
+            limits: Per-table overrides of ``max_bytes``
+        """
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.limits = dict(limits or {})
+        self._tables: dict[str, _Table] = {}
+        self._lock = threading.Lock()
+        self._events: dict[str, Sequence[str]] = {}
+
+    def _table(self, table: str) -> _Table:
+        state = self._tables.get(table)
+        if state is None:
+            state = self._tables[table] = _Table()
+        return state
+
+    def get_or_load(self, table: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        The cached result for key, or load() stored under it.
+
+        Misses (None or an empty list) are cached for ``miss_ttl`` only: a
+        lookup that keeps missing (an unknown code, an unregistered sender)
+        reaches SQLite at most once per window, and a row written elsewhere
+        shows up within it.
+        """
+        with self._lock:
+            state = self._table(table)
+            entry = state.entries.get(key)
+            if entry is not None:
+                value, expires_at, size = entry
+                if expires_at > time.monotonic():
+                    state.entries.move_to_end(key)
+                    state.hits += 1
+                    return value
+                del state.entries[key]
+                state.bytes -= size
+            state.misses += 1
+            generation = state.generation
+
+        value = load()
+        size = _sizeof(value)
+        ttl = self.miss_ttl if value is None or value == [] else self.ttl
+        limit = self.limits.get(table, self.max_bytes)
+
+        with self._lock:
+            state = self._table(table)
+            if state.generation != generation or size > limit:
+                return value
+            previous = state.entries.pop(key, None)
+            if previous is not None:
+                state.bytes -= previous[2]
+            state.entries[key] = (value, time.monotonic() + ttl, size)
+            state.bytes += size
+            while state.bytes > limit or len(state.entries) > self.max_entries:
+                _, (_, _, evicted) = state.entries.popitem(last=False)
+                state.bytes -= evicted
+                state.evictions += 1
+        return value
+
+    def invalidate(self, table: str | None = None) -> None:
+        """Drop every entry of a table (None = all tables)."""
+        with self._lock:
+            tables = self._tables.values() if table is None else [self._table(table)]
+            for state in tables:
+                state.entries.clear()
+                state.bytes = 0
+                state.generation += 1
+
+    def subscribe(
+        self, dispatcher: EventDispatcher, events: Mapping[str, Sequence[str]] = INVALIDATION_EVENTS
+    ) -> None:
+        """Flush tables when the events that change them are published."""
+        self._events = dict(events)
+        dispatcher.subscribe(INVALIDATE_EVENT, self._on_event)
+        for name in self._events:
+            dispatcher.subscribe(name, self._on_event)
+
+    async def _on_event(self, event: Event) -> None:
+        if event.name == INVALIDATE_EVENT:
+            self.invalidate(event.payload.get("table"))
+            return
+        for table in self._events.get(event.name, ()):
+            self.invalidate(table)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit and miss counters, entries and bytes per table."""
+        with self._lock:
+            tables = {
+                name: {
+                    "hits": state.hits,
+                    "misses": state.misses,
+                    "evictions": state.evictions,
+                    "entries": len(state.entries),
+                    "bytes": state.bytes,
+                }
+                for name, state in self._tables.items()
+            }
+        hits = sum(t["hits"] for t in tables.values())
+        misses = sum(t["misses"] for t in tables.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "tables": tables,
+        }
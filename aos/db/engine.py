@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
 
 
-def connect(sqlite_path: str) -> sqlite3.Connection:
+class WriterConnection(sqlite3.Connection):
+    """A ``connect`` connection that carries the lock serializing its writes."""
+
+    write_lock: threading.RLock | None = None
+
+
+def connect(sqlite_path: str, factory: type[sqlite3.Connection] = sqlite3.Connection) -> sqlite3.Connection:
     """
     Connect to SQLite with production-grade settings.
     
@@ -13,16 +24,22 @@ def connect(sqlite_path: str) -> sqlite3.Connection:
     - 64MB cache: Reduce disk I/O
     - MEMORY temp store: Faster temp operations
     """
-    conn = sqlite3.connect(sqlite_path, check_same_thread=False)
+    conn = sqlite3.connect(sqlite_path, check_same_thread=False, factory=factory)
+
+    # Lets retention return freed pages with incremental_vacuum. Only takes
+    # effect on a new database; existing ones are converted by a VACUUM.
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
     
     # CRITICAL: WAL mode for crash safety and concurrent reads
     conn.execute("PRAGMA journal_mode=WAL;")
     # Power failure hardening: NORMAL is faster than FULL but still very safe with WAL
     conn.execute("PRAGMA synchronous=NORMAL;")
     
-    # Run a quick integrity check on startup
+    # Run a quick integrity check on startup. quick_check skips the index
+    # cross-checks that make integrity_check grow with the database; the
+    # full check runs table by table in aos.db.maintenance.
     try:
-        cursor = conn.execute("PRAGMA integrity_check;")
+        cursor = conn.execute("PRAGMA quick_check;")
         result = cursor.fetchone()
         if result[0] != "ok":
             # In a real environment, we'd log this to the persistent system log
@@ -42,8 +59,6 @@ def connect(sqlite_path: str) -> sqlite3.Connection:
     
     return conn
 
-from contextlib import contextmanager
-
 
 @contextmanager
 def transaction(conn: sqlite3.Connection):
@@ -59,6 +74,153 @@ def transaction(conn: sqlite3.Connection):
         conn.rollback()
         raise
 
+
+@contextmanager
+def write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Write on ``conn`` and commit at the end of the block, rolling back if it raises.
+
+    When ``conn`` is a ConnectionPool writer the block holds the pool's write
+    lock, so a caller's commit never flushes another thread's half-finished
+    statements. Other connections are written without a lock. Blocks nest on
+    one thread, but the inner block commits at its own exit.
+    """
+    with getattr(conn, "write_lock", None) or nullcontext():
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
 def get_journal_mode(conn: sqlite3.Connection) -> str:
     row = conn.execute("PRAGMA journal_mode;").fetchone()
     return str(row[0]) if row else ""
+
+
+def connect_reader(sqlite_path: str) -> sqlite3.Connection:
+    """
+    Open a read-only connection to a WAL database created by ``connect``.
+
+    Readers read from a WAL snapshot and never take the write lock, so they
+    run alongside commits on the writer. Skips the startup integrity check.
+    """
+    uri = f"{Path(sqlite_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute("PRAGMA foreign_keys=ON;")
+    conn.execute("PRAGMA cache_size=-16000;")   # 16MB per reader
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;") # Shares the page cache with the writer's mapping
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+class ConnectionPool:
+    """
+    One serialized writer connection and up to N read-only reader connections.
+
+    The writer is a ``connect`` connection shared as ``pool.conn`` by the
+    modules and repositories. ``writer()`` holds it exclusively for a block
+    and commits (or rolls back) at the end; repositories and the community,
+    broadcast, transport and resource modules write through the same lock
+    with ``write_transaction``. ``reader()`` lends a WAL reader, opened on
+    first use, that a long query can hold without delaying writes.
+
+    Not covered by the lock:
+    - Raw ``conn.execute`` + ``commit`` on ``pool.conn`` outside those
+      modules (auth and operator routers, user service, sync engine,
+      Telegram state). They run without awaiting in between, so they only
+      interleave with writes from worker threads.
+    - AsyncDatabase's writer and EventScheduler's connection. They are
+      separate connections to the same file, serialized only by SQLite's
+      file lock and busy timeout.
+
+    Usage:
+        pool = ConnectionPool("aos.db", readers=4)
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO ...", (...))
+        with pool.reader() as conn:
+            rows = conn.execute("SELECT * FROM ...").fetchall()
+        pool.close()
+    """
+
+    def __init__(self, sqlite_path: str, readers: int = 4, timeout: float = 30.0) -> None:
+        """
+        Initialize ConnectionPool and open the writer connection.
+
+        Args:
+            sqlite_path: Path to SQLite database file
+            readers: Most reader connections open at once (0 lends the writer)
+            timeout: Seconds to wait for a free reader before TimeoutError
+        """
+        self.sqlite_path = sqlite_path
+        # An in-memory database is private to its connection, so readers
+        # would never see the writer's data.
+        self.readers = 0 if sqlite_path == ":memory:" else readers
+        self.timeout = timeout
+
+        self.conn = connect(sqlite_path, factory=WriterConnection)
+        self._write_lock = threading.RLock()
+        self.conn.write_lock = self._write_lock
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._open_lock = threading.Lock()
+
+    def writer(self) -> AbstractContextManager[sqlite3.Connection]:
+        """
+        Hold the writer connection for one transaction.
+
+        Commits when the block exits normally and rolls back if it raises.
+        Do not await inside the block: the lock is held by the thread.
+        """
+        return write_transaction(self.conn)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the duration of the block."""
+        if not self.readers:
+            with self._write_lock:
+                yield self.conn
+            return
+
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()  # Release the read snapshot before reuse
+            self._idle.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._open_lock:
+            if len(self._reader_conns) < self.readers:
+                conn = connect_reader(self.sqlite_path)
+                self._reader_conns.append(conn)
+                return conn
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No reader connection free after {self.timeout}s") from None
+
+    def get_stats(self) -> dict[str, int]:
+        """Reader connections opened and currently idle."""
+        return {
+            "readers_max": self.readers,
+            "readers_open": len(self._reader_conns),
+            "readers_idle": self._idle.qsize(),
+        }
+
+    def close(self) -> None:
+        """Close the writer and every reader connection."""
+        with self._open_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+        self._idle = queue.LifoQueue()
+        self.conn.close()
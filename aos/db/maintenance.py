@@ -0,0 +1,302 @@
+"""
+Maintenance Service - keeps a long-running SQLite database healthy.
+
+Boot only runs ``PRAGMA quick_check``; the full integrity check is spread
+over background runs, a few tables at a time. Alongside it the service
+refreshes planner statistics with ``PRAGMA optimize``, truncates the WAL
+once it passes a size threshold and returns free pages with
+``incremental_vacuum``. Each job runs on its own interval and only on the
+power profiles it is cheap enough for.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aos.core.resource.profiles import PowerProfile
+
+if TYPE_CHECKING:
+    from aos.core.resource.manager import ResourceManager
+    from aos.db.async_engine import AsyncDatabase
+
+logger = logging.getLogger(__name__)
+
+JOBS = ("checkpoint", "optimize", "vacuum", "integrity")
+
+# Profiles each job runs on; on the others it waits for the profile to recover
+JOB_PROFILES: dict[str, frozenset[PowerProfile]] = {
+    "checkpoint": frozenset({PowerProfile.FULL_POWER, PowerProfile.BALANCED, PowerProfile.POWER_SAVER}),
+    "optimize": frozenset({PowerProfile.FULL_POWER, PowerProfile.BALANCED}),
+    "vacuum": frozenset({PowerProfile.FULL_POWER, PowerProfile.BALANCED}),
+    "integrity": frozenset({PowerProfile.FULL_POWER}),
+}
+
+# Seconds between runs of each job at full power
+DEFAULT_INTERVALS: dict[str, float] = {
+    "checkpoint": 300.0,
+    "optimize": 6 * 3600.0,
+    "vacuum": 3600.0,
+    "integrity": 600.0,
+}
+
+# Interval multiplier per power profile (None = skip the pass)
+BACKOFF: dict[PowerProfile, float | None] = {
+    PowerProfile.FULL_POWER: 1.0,
+    PowerProfile.BALANCED: 1.0,
+    PowerProfile.POWER_SAVER: 4.0,
+    PowerProfile.CRITICAL: None,
+}
+
+
+@dataclass
+class MaintenanceReport:
+    """What a single maintenance job did."""
+    job: str
+    started_at: float
+    profile: str
+    duration: float = 0.0
+    skipped: bool = False
+    effect: dict[str, Any] = field(default_factory=dict)
+
+
+class MaintenanceService:
+    """Periodic, power-aware maintenance of one SQLite database."""
+
+    def __init__(
+        self,
+        database: AsyncDatabase,
+        resource_manager: ResourceManager | None = None,
+        interval: float = 300.0,
+        intervals: dict[str, float] | None = None,
+        wal_threshold: int = 16 * 1024 * 1024,
+        vacuum_pages: int = 2000,
+        analysis_limit: int = 400,
+        integrity_max_run_time: float = 0.5,
+    ) -> None:
+        """
+        Initialize MaintenanceService.
+
+        Args:
+            database: Database to maintain; writes go through its writer
+                thread, the integrity check through a reader
+            resource_manager: Source of the power profile (None = always full power)
+            interval: Seconds between passes at full power; a pass runs the
+                jobs that are due
+            intervals: Per-job intervals overriding ``DEFAULT_INTERVALS``
+            wal_threshold: WAL size in bytes above which it is checkpointed
+                and truncated
+            vacuum_pages: Most free pages returned to the filesystem per run
+            analysis_limit: Rows sampled per index by ANALYZE
+            integrity_max_run_time: Time budget for one integrity run, in
+                seconds; at least one table is checked per run
+        """
+        self.database = database
+        self.resource_manager = resource_manager
+        self.interval = interval
+        self.intervals = {**DEFAULT_INTERVALS, **(intervals or {})}
+        self.wal_threshold = wal_threshold
+        self.vacuum_pages = vacuum_pages
+        self.analysis_limit = analysis_limit
+        self.integrity_max_run_time = integrity_max_run_time
+
+        self._last_run: dict[str, float] = {}
+        # Tables after this one (by name) are next in the integrity cycle
+        self._integrity_after = ""
+        self.integrity_errors: list[str] = []
+        self.last_integrity_cycle: float | None = None
+
+        self.last_reports: dict[str, MaintenanceReport] = {}
+        self.totals = {job: {"runs": 0, "skipped": 0, "duration": 0.0} for job in JOBS}
+
+    def _profile(self) -> PowerProfile:
+        if self.resource_manager is None:
+            return PowerProfile.FULL_POWER
+        return self.resource_manager.get_current_profile()
+
+    async def run(self) -> None:
+        """Run forever, spacing passes by the interval for the current power profile."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Maintenance pass failed: {e}", exc_info=True)
+
+            # Skipped profiles are re-checked at the slowest running interval
+            backoff = BACKOFF[self._profile()] or BACKOFF[PowerProfile.POWER_SAVER]
+            await asyncio.sleep(self.interval * backoff)
+
+    async def run_once(self, jobs: Iterable[str] | None = None) -> list[MaintenanceReport]:
+        """
+        Run the jobs that are due.
+
+        Args:
+            jobs: Jobs to run now regardless of their interval (None = the
+                ones whose interval has elapsed)
+
+        Returns:
+            One report per job run or skipped on the current profile
+        """
+        profile = self._profile()
+        backoff = BACKOFF[profile]
+        now = time.monotonic()
+
+        if jobs is None:
+            due = [
+                job for job in JOBS
+                if job not in self._last_run
+                or now - self._last_run[job] >= self.intervals[job] * (backoff or 1.0)
+            ]
+        else:
+            due = list(jobs)
+
+        reports = []
+        for job in due:
+            report = MaintenanceReport(job=job, started_at=time.time(), profile=profile.value)
+            start = time.monotonic()
+
+            if backoff is None or profile not in JOB_PROFILES[job]:
+                report.skipped = True
+            else:
+                # A failing job is retried on its next interval, not every pass
+                try:
+                    report.effect = await getattr(self, f"_{job}")()
+                except Exception as e:
+                    logger.error(f"Maintenance {job} failed: {e}", exc_info=True)
+                    report.effect = {"error": str(e)}
+                self._last_run[job] = time.monotonic()
+
+            reports.append(self._record(report, start))
+        return reports
+
+    # --- Jobs ---
+
+    async def _checkpoint(self) -> dict[str, Any]:
+        """Checkpoint and truncate the WAL once it passes ``wal_threshold``."""
+        wal_path = Path(f"{self.database.sqlite_path}-wal")
+        before = wal_path.stat().st_size if wal_path.exists() else 0
+        if before < self.wal_threshold:
+            return {"wal_bytes": before, "checkpointed": False}
+
+        busy, _, frames = await self.database.run_write(
+            lambda conn: tuple(conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone())
+        )
+        after = wal_path.stat().st_size if wal_path.exists() else 0
+        return {
+            "wal_bytes": after,
+            "checkpointed": not busy,
+            "frames": frames,
+            "bytes_reclaimed": max(before - after, 0),
+        }
+
+    async def _optimize(self) -> dict[str, Any]:
+        """Refresh planner statistics, with a full ANALYZE the first time."""
+
+        def optimize(conn: sqlite3.Connection) -> dict[str, Any]:
+            conn.execute(f"PRAGMA analysis_limit={int(self.analysis_limit)}")
+            analyzed = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            # optimize only analyzes tables it considers stale, and on older
+            # SQLite only those this connection has queried
+            statement = "PRAGMA optimize(0x10002)" if analyzed else "ANALYZE"
+            conn.execute(statement)
+            stat_rows = conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0]
+            return {"statement": statement, "stat_rows": stat_rows}
+
+        return await self.database.run_write(optimize)
+
+    async def _vacuum(self) -> dict[str, Any]:
+        """Return up to ``vacuum_pages`` free pages to the filesystem."""
+        max_pages = int(self.vacuum_pages)
+
+        def vacuum(conn: sqlite3.Connection) -> dict[str, Any]:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # A NONE database is converted by retention, not here
+            incremental = conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+            if incremental and free_before and max_pages > 0:
+                # One page per step and no result columns: see EventStore.reclaim_space
+                conn.executescript(f"PRAGMA incremental_vacuum({max_pages});")
+
+            free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            return {
+                "incremental": incremental,
+                "bytes_reclaimed": (free_before - free_after) * page_size,
+                "free_bytes": free_after * page_size,
+            }
+
+        return await self.database.run_write(vacuum)
+
+    async def _integrity(self) -> dict[str, Any]:
+        """Check the next tables of the integrity cycle within the time budget."""
+        after = self._integrity_after
+        deadline = time.monotonic() + self.integrity_max_run_time
+
+        def check(conn: sqlite3.Connection) -> tuple[list[str], list[str], bool]:
+            tables = [
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "AND name NOT LIKE 'sqlite_%' AND name > ? ORDER BY name",
+                    (after,),
+                )
+            ]
+            checked: list[str] = []
+            errors: list[str] = []
+            for table in tables:
+                quoted = table.replace('"', '""')
+                # With a table argument only that table and its indexes are checked
+                rows = conn.execute(f'PRAGMA integrity_check("{quoted}")').fetchall()
+                errors.extend(f"{table}: {row[0]}" for row in rows if row[0] != "ok")
+                checked.append(table)
+                if time.monotonic() >= deadline:
+                    break
+            return checked, errors, len(checked) == len(tables)
+
+        checked, errors, cycle_complete = await self.database.run_read(check)
+
+        if cycle_complete:
+            self._integrity_after = ""
+            self.last_integrity_cycle = time.time()
+        else:
+            self._integrity_after = checked[-1]
+
+        if errors:
+            self.integrity_errors = (self.integrity_errors + errors)[-100:]
+            for error in errors:
+                logger.error(f"DATABASE INTEGRITY WARNING: {error}")
+
+        return {"tables": checked, "errors": errors, "cycle_complete": cycle_complete}
+
+    # --- Reporting ---
+
+    def _record(self, report: MaintenanceReport, start: float) -> MaintenanceReport:
+        report.duration = time.monotonic() - start
+        self.last_reports[report.job] = report
+
+        totals = self.totals[report.job]
+        if report.skipped:
+            totals["skipped"] += 1
+        else:
+            totals["runs"] += 1
+            totals["duration"] += report.duration
+            logger.info(f"Maintenance {report.job} in {report.duration:.2f}s: {report.effect}")
+        return report
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-job totals and last reports, plus the integrity cycle state."""
+        return {
+            "totals": {job: dict(totals) for job, totals in self.totals.items()},
+            "last_run": {job: asdict(report) for job, report in self.last_reports.items()},
+            "integrity": {
+                "last_cycle_completed_at": self.last_integrity_cycle,
+                "next_after": self._integrity_after or None,
+                "errors": list(self.integrity_errors),
+            },
+        }
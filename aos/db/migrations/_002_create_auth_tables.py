@@ -40,6 +40,19 @@ def apply(conn: sqlite3.Connection) -> None:
     )
     """)
 
+    seed(conn)
+    conn.commit()
+
+
+def seed(conn: sqlite3.Connection) -> None:
+    """
+    Bootstrap the admin role and root operator.
+
+    Kept out of the schema snapshot: the ids and the salted password hash
+    are generated on each node when it is provisioned.
+    """
+    cursor = conn.cursor()
+
     # 3. Bootstrap Admin
     # Check if admin role exists
     check = cursor.execute("SELECT id FROM roles WHERE name='admin'").fetchone()
@@ -60,5 +73,3 @@ def apply(conn: sqlite3.Connection) -> None:
             (admin_id, "admin", pw_hash, role_id, datetime.now(UTC).isoformat())
         )
         print("[Migration] Hardened 'admin' operator bootstrapped.")
-
-    conn.commit()
@@ -15,6 +15,14 @@ def apply(conn: sqlite3.Connection) -> None:
         # Column might already exist
         pass
 
+    seed(conn)
+    conn.commit()
+
+
+def seed(conn: sqlite3.Connection) -> None:
+    """Create the community_admin and super_admin roles."""
+    cursor = conn.cursor()
+
     # 2. Add community_admin role
     check = cursor.execute("SELECT id FROM roles WHERE name='community_admin'").fetchone()
     if not check:
@@ -49,5 +57,3 @@ def apply(conn: sqlite3.Connection) -> None:
             )
         )
         print(f"[Migration] 'super_admin' role created with ID: {role_id}")
-    
-    conn.commit()
@@ -4,6 +4,12 @@ from datetime import UTC, datetime
 import uuid
 
 def apply(conn: sqlite3.Connection) -> None:
+    seed(conn)
+    conn.commit()
+
+
+def seed(conn: sqlite3.Connection) -> None:
+    """Create the operator and viewer roles."""
     cursor = conn.cursor()
 
     # 1. Ensure 'operator' role exists
@@ -35,5 +41,3 @@ def apply(conn: sqlite3.Connection) -> None:
             )
         )
         print(f"[Migration] 'viewer' role created with ID: {role_id}")
-    
-    conn.commit()
@@ -0,0 +1,50 @@
+"""
+Migration 022: Indexes for hot-path queries.
+
+Covers the lookups that the broadcast worker, transport intelligence,
+community code registration and agri reports run on every request or
+cycle. Where a composite index starts with the column of an older
+single-column index, the older one is dropped.
+"""
+import sqlite3
+
+
+def up(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+
+    # Broadcast worker: pending deliveries, completion counts, recipient de-duplication
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bd_broadcast_status ON broadcast_deliveries(broadcast_id, status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bd_broadcast_member ON broadcast_deliveries(broadcast_id, member_id)")
+    cursor.execute("DROP INDEX IF EXISTS idx_bd_broadcast")
+
+    # Zone intelligence: live signals per zone
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ts_zone_expiry ON traffic_signals(zone_id, expires_at)")
+    cursor.execute("DROP INDEX IF EXISTS idx_ts_zone")
+
+    # Self-registration: case-insensitive lookup of an active community code
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cg_code_upper ON community_groups(UPPER(community_code)) WHERE code_active = 1"
+    )
+
+    # Farmer harvest history and the regional harvest window
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_h_farmer ON harvests(farmer_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_h_created ON harvests(created_at)")
+
+    # Already created by earlier migrations; kept here so every hot-path index is declared together
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_cm_active ON community_members(community_id, active)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mvm_identity ON member_vehicle_maps(vehicle_type, vehicle_identity)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_retry_next ON message_retry_queue(next_retry_at)")
+
+    conn.commit()
+
+
+def down(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_bd_broadcast ON broadcast_deliveries(broadcast_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ts_zone ON traffic_signals(zone_id)")
+    for index in (
+        "idx_bd_broadcast_status", "idx_bd_broadcast_member", "idx_ts_zone_expiry",
+        "idx_cg_code_upper", "idx_h_farmer", "idx_h_created",
+    ):
+        cursor.execute(f"DROP INDEX IF EXISTS {index}")
+    conn.commit()
@@ -0,0 +1,27 @@
+"""
+Migration 023: Blind index for farmer contacts.
+
+Farmer contacts are stored encrypted with a random nonce, so an exact
+lookup had to decrypt every row. contact_bidx holds a keyed HMAC of the
+normalized contact and is indexed. Existing rows are filled by
+FarmerRepository.backfill_blind_index, which has the key; a migration
+does not.
+"""
+import sqlite3
+
+
+def up(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(farmers)")}
+    if "contact_bidx" not in columns:
+        cursor.execute("ALTER TABLE farmers ADD COLUMN contact_bidx BLOB")
+    # Not unique: farmers of one household may share a phone
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_farmers_contact_bidx ON farmers(contact_bidx)")
+    conn.commit()
+
+
+def down(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+    cursor.execute("DROP INDEX IF EXISTS idx_farmers_contact_bidx")
+    cursor.execute("ALTER TABLE farmers DROP COLUMN contact_bidx")
+    conn.commit()
@@ -2,7 +2,24 @@ from __future__ import annotations
 
 import hashlib
 import sqlite3
-from typing import List
+import types
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from aos.db.migrations.snapshot import SchemaSnapshot
+
+
+def migration_hash(migration: Any) -> str:
+    """Hash recorded in schema_migrations for a migration."""
+    if isinstance(migration, types.ModuleType) or hasattr(migration, 'apply'):
+        # The module name: str(module) embeds the install path, so the hash
+        # would differ between checkouts and never match the snapshot's
+        content = getattr(migration, '__name__', str(migration))
+    else:
+        # SQL String
+        content = str(migration)
+    return hashlib.sha256(content.encode()).hexdigest()
 
 
 class MigrationManager:
@@ -30,28 +47,29 @@ class MigrationManager:
         cursor = self.conn.execute("SELECT version_id FROM schema_migrations ORDER BY version_id")
         return [row[0] for row in cursor.fetchall()]
 
-    def apply_migrations(self, migrations: list[Any]) -> None:
+    def apply_migrations(self, migrations: list[Any], snapshot: SchemaSnapshot | None = None) -> None:
         """
         Apply a list of migrations (SQL strings or Python modules).
         Skips already applied versions.
+
+        An empty database is provisioned from ``snapshot`` in one
+        transaction when the snapshot was generated from the leading
+        migrations of the list; any migrations after it are then applied
+        one by one as usual.
         """
         self.ensure_migration_table()
         applied = self.get_applied_versions()
 
+        if snapshot is not None and not applied and self._is_empty() and self._snapshot_matches(snapshot, migrations):
+            self.apply_snapshot(snapshot, migrations[:len(snapshot.versions)])
+            applied = self.get_applied_versions()
+
         for idx, migration in enumerate(migrations):
             version_id = idx + 1
             if version_id in applied:
                 continue
 
-            # Determine content for hashing
-            if hasattr(migration, 'apply'):
-                # Use module name as content for hashing - more stable than str(module)
-                content = getattr(migration, '__name__', str(migration))
-            else:
-                # SQL String
-                content = str(migration)
-
-            m_hash = hashlib.sha256(content.encode()).hexdigest()
+            m_hash = migration_hash(migration)
 
             try:
                 # Use a single transaction per migration
@@ -84,3 +102,47 @@ class MigrationManager:
             except Exception as e:
                 self.conn.rollback()
                 raise RuntimeError(f"Failed to apply migration version {version_id}: {str(e)}")
+
+    def _is_empty(self) -> bool:
+        """True if the database holds no tables besides schema_migrations."""
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND name != 'schema_migrations' LIMIT 1"
+        ).fetchone()
+        return row is None
+
+    @staticmethod
+    def _snapshot_matches(snapshot: SchemaSnapshot, migrations: list[Any]) -> bool:
+        """True if the snapshot was generated from the leading migrations of the list."""
+        if len(snapshot.versions) > len(migrations):
+            return False
+        expected = [(idx + 1, migration_hash(m)) for idx, m in enumerate(migrations[:len(snapshot.versions)])]
+        return [tuple(v) for v in snapshot.versions] == expected
+
+    def apply_snapshot(self, snapshot: SchemaSnapshot, migrations: Sequence[Any] = ()) -> None:
+        """
+        Create the snapshot's schema, seed rows and version set in one transaction.
+        The database must be empty; see apply_migrations.
+
+        The ``seed`` hooks of ``migrations`` (those the snapshot was
+        generated from) then create the node's own roles and operators.
+        """
+        try:
+            self.conn.execute("BEGIN")
+            for sql in snapshot.schema:
+                self.conn.execute(sql)
+            for table, (columns, rows) in snapshot.rows.items():
+                column_list = ", ".join(f'"{c}"' for c in columns)
+                placeholders = ", ".join("?" * len(columns))
+                self.conn.executemany(f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders})', rows)
+            for migration in migrations:
+                if hasattr(migration, 'seed'):
+                    migration.seed(self.conn)
+            self.conn.executemany(
+                "INSERT INTO schema_migrations (version_id, migration_hash) VALUES (?, ?)",
+                snapshot.versions
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise RuntimeError(f"Failed to apply schema snapshot: {str(e)}")
@@ -0,0 +1,434 @@
+"""
+Generated by python -m aos.db.migrations.snapshot - do not edit.
+"""
+from aos.db.migrations.snapshot import SchemaSnapshot
+
+SNAPSHOT = SchemaSnapshot(
+    versions=[
+        (1, '2330d1e97797ee6b9e341d922cdb535d69d78516f5a4306428ee49116317f62b'),
+        (2, '41f8ef8a5894ad444b7d56a978ce69e7a95a5980abf4a206d94b4c70d31727ca'),
+        (3, '063f935ca7bf929c089ff03a69a7d6019d58efd30a4d475a8d03c4a8cf1cd777'),
+        (4, '23c171c0ecb302c0a2d28e706591686c530ecd031722a745b28150f601f2e05b'),
+        (5, 'fb3c9f91411463aa149728f68aedb49118c1bd2a00e9abbca4bc235ce9df5ed1'),
+        (6, 'a15470996f7692abdfdc794e2b225c47dcd565bed903f879fd924a7ad0743601'),
+        (7, 'e9fc36c0555a759b1353bf9c5b1e1b586956bedd16cc5cdc66e5608549f63003'),
+        (8, '83b0a708b727a5ff35897209dfc245f331b97e96e6feda497b903f688a5e81dd'),
+        (9, 'e7045f01543e5e8bbb6d269d65c2e7b4e9a4ad172c5f0f5f15289c9948aaea2e'),
+        (10, 'dc3c866385247fe4205db63510c7b3a4ebd5e006b4ac9299cdbc377eeba6631c'),
+        (11, '3c0bbc6761b883d854a653fa8db62167e4fcddc571093d71178af7e7f343ca07'),
+        (12, '22a9a89f35016288dbffb8d7dcb8e3d8d1bed79c03e0a50e6e4ba3925a988d00'),
+        (13, 'a4b811c2f9be30caa5b442fbf43176eb5caf2825412ecce096467e9141ddfcdd'),
+        (14, '2b5d290fb8428b7906ca4410ebb351d224f062a9c943466a6301c97a39e9914c'),
+        (15, '90c603be98ee9c413ce3579c2a17cf4388d834a3de42d863f71dd6c58c2e2802'),
+        (16, '69cdd6f18cb32b249f2c290dd6d260a7b6b3c2da1d5a1e06aa3cc9d779659d5f'),
+        (17, '0f9b2f60f8b9b19aed93d16a5d8df55d3b4f1371ed9ad3b9b09b5ce821248053'),
+        (18, '1928f20014f93907a5167c810955afea1d0632a5126007d54ea99f20d6e1dd7f'),
+        (19, 'ca03b4fc23c67d6d8de9b8b2675adbc1eeb15b9227fe7fde229f2bc54a516c04'),
+        (20, '46302ecf8ae9a49f777ba87d4f696afd2d429f8d22b5572c6ba1e52daeb41269'),
+        (21, '8692eb577121d9f095a2dfccb80599b290d52bcc9dee4c579db99cb864e78884'),
+        (22, 'bf33f6a65f1ed8b7ce83559673649a52f2b19dbfe489ff0255f163ac20706b44'),
+        (23, 'c94f8b1897e193191e33f48495190d420687fc7267de133ceda8a35662c529fa'),
+    ],
+    schema=[
+        """CREATE TABLE nodes (
+        id TEXT PRIMARY KEY,
+        public_key BLOB NOT NULL,
+        alias TEXT,
+        status TEXT DEFAULT 'active',
+        last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )""",
+        """CREATE TABLE node_config (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )""",
+        """CREATE TABLE roles (
+        id TEXT PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL,
+        permissions TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )""",
+        """CREATE TABLE operators (
+        id TEXT PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        role_id TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        last_login TEXT, community_id TEXT,
+        FOREIGN KEY(role_id) REFERENCES roles(id)
+    )""",
+        """CREATE TABLE farmers (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            location TEXT NOT NULL,
+            contact TEXT NOT NULL,
+            metadata TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        , contact_bidx BLOB)""",
+        """CREATE TABLE crops (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            crop_type TEXT NOT NULL,
+            growing_season TEXT NOT NULL
+        )""",
+        """CREATE TABLE harvests (
+            id TEXT PRIMARY KEY,
+            farmer_id TEXT NOT NULL,
+            crop_id TEXT NOT NULL,
+            quantity REAL NOT NULL,
+            unit TEXT DEFAULT 'kg',
+            quality_grade TEXT NOT NULL,
+            harvest_date TIMESTAMP NOT NULL,
+            status TEXT DEFAULT 'stored',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (farmer_id) REFERENCES farmers(id),
+            FOREIGN KEY (crop_id) REFERENCES crops(id)
+        )""",
+        """CREATE TABLE routes (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        start_point TEXT,
+        end_point TEXT,
+        base_price REAL,
+        metadata TEXT
+    )""",
+        """CREATE TABLE vehicles (
+        id TEXT PRIMARY KEY,
+        plate_number TEXT UNIQUE NOT NULL,
+        type TEXT NOT NULL, -- Matatu, Boda Boda, Truck
+        capacity INTEGER,
+        current_route_id TEXT,
+        current_status TEXT, -- AVAILABLE, FULL, EN_ROUTE, OFF_DUTY
+        last_seen TIMESTAMP,
+        metadata TEXT,
+        FOREIGN KEY (current_route_id) REFERENCES routes (id)
+    )""",
+        """CREATE TABLE bookings (
+        id TEXT PRIMARY KEY,
+        vehicle_id TEXT,
+        route_id TEXT,
+        customer_phone TEXT,
+        status TEXT, -- PENDING, CONFIRMED, CANCELLED
+        seats INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (vehicle_id) REFERENCES vehicles (id),
+        FOREIGN KEY (route_id) REFERENCES routes (id)
+    )""",
+        """CREATE TABLE community_groups (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        group_type TEXT,
+        tags TEXT DEFAULT '[]', -- JSON list
+        location TEXT,
+        admin_id TEXT,
+        trust_level TEXT DEFAULT 'local',
+        preferred_channels TEXT DEFAULT 'ussd,sms',
+        active BOOLEAN DEFAULT 1,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    , invite_slug TEXT, community_code TEXT, code_active BOOLEAN DEFAULT 0)""",
+        """CREATE TABLE community_events (
+        id TEXT PRIMARY KEY,
+        group_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        event_type TEXT,
+        start_time DATETIME NOT NULL,
+        end_time DATETIME,
+        recurrence TEXT,
+        visibility TEXT DEFAULT 'public',
+        language TEXT DEFAULT 'en',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (group_id) REFERENCES community_groups (id)
+    )""",
+        """CREATE TABLE community_announcements (
+        id TEXT PRIMARY KEY,
+        group_id TEXT NOT NULL,
+        message TEXT NOT NULL,
+        urgency TEXT DEFAULT 'normal',
+        expires_at DATETIME,
+        target_audience TEXT DEFAULT 'public',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (group_id) REFERENCES community_groups (id)
+    )""",
+        """CREATE TABLE community_inquiry_cache (
+        id TEXT PRIMARY KEY,
+        group_id TEXT NOT NULL,
+        normalized_question TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        hit_count INTEGER DEFAULT 0,
+        last_updated DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (group_id) REFERENCES community_groups (id)
+    )""",
+        """CREATE TABLE telegram_users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            chat_id INTEGER UNIQUE NOT NULL,
+            phone TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            town TEXT,
+            roles TEXT DEFAULT '[]',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        , active_domain TEXT)""",
+        """CREATE TABLE transport_zones (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL, -- road, area, stage, junction
+        location_scope TEXT,
+        active BOOLEAN DEFAULT 1,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )""",
+        """CREATE TABLE traffic_signals (
+        id TEXT PRIMARY KEY,
+        zone_id TEXT NOT NULL,
+        state TEXT NOT NULL, -- flowing, slow, blocked
+        source TEXT NOT NULL, -- user, agent, authority
+        confidence_score REAL DEFAULT 1.0,
+        reported_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        expires_at DATETIME,
+        FOREIGN KEY (zone_id) REFERENCES transport_zones (id)
+    )""",
+        """CREATE TABLE transport_availability (
+        id TEXT PRIMARY KEY,
+        zone_id TEXT NOT NULL,
+        destination TEXT NOT NULL,
+        availability_state TEXT NOT NULL, -- available, limited, none
+        reported_by TEXT NOT NULL,
+        reported_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        expires_at DATETIME,
+        FOREIGN KEY (zone_id) REFERENCES transport_zones (id)
+    )""",
+        """CREATE TABLE community_members (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        channel TEXT NOT NULL,
+        joined_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        active BOOLEAN DEFAULT 1,
+        FOREIGN KEY (community_id) REFERENCES community_groups(id),
+        UNIQUE(community_id, user_id, channel)
+    )""",
+        """CREATE TABLE broadcasts (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        message TEXT NOT NULL,
+        channels TEXT NOT NULL,  -- JSON array
+        status TEXT NOT NULL DEFAULT 'draft',
+        idempotency_key TEXT UNIQUE,
+        scheduled_at DATETIME,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        locked_at DATETIME,
+        lock_owner TEXT,
+        sent_count INTEGER DEFAULT 0,
+        failed_count INTEGER DEFAULT 0,
+        FOREIGN KEY (community_id) REFERENCES community_groups(id)
+    )""",
+        """CREATE TABLE broadcast_audit_logs (
+        id TEXT PRIMARY KEY,
+        actor_id TEXT NOT NULL,
+        action TEXT NOT NULL, -- 'create', 'approve', 'send', 'cancel', 'retry'
+        broadcast_id TEXT NOT NULL,
+        metadata TEXT, -- JSON
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (broadcast_id) REFERENCES broadcasts(id)
+    )""",
+        """CREATE TABLE broadcast_deliveries (
+        id TEXT PRIMARY KEY,
+        broadcast_id TEXT NOT NULL,
+        member_id TEXT NOT NULL,
+        channel TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        error TEXT,
+        sent_at DATETIME,
+        FOREIGN KEY (broadcast_id) REFERENCES broadcasts(id),
+        FOREIGN KEY (member_id) REFERENCES community_members(id)
+    )""",
+        """CREATE TABLE community_activity_logs (
+        id TEXT PRIMARY KEY,
+        actor_id TEXT NOT NULL,
+        action TEXT NOT NULL, -- 'group_create', 'group_update', 'group_deactivate', 'member_add', 'member_remove', 'member_update'
+        target_id TEXT NOT NULL, -- ID of the group or member being acted upon
+        community_id TEXT, -- Associated group ID (if applicable)
+        metadata TEXT, -- JSON payload of the change/details
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )""",
+        """CREATE TABLE institution_members (
+        id TEXT PRIMARY KEY, -- Member UUID
+        community_id TEXT NOT NULL,
+        full_name TEXT NOT NULL,
+        role_id TEXT DEFAULT 'MEMBER', -- ADMIN, SECRETARY, TREASURER, MEMBER
+        joined_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        active BOOLEAN DEFAULT 1, institution_type TEXT DEFAULT 'faith' NOT NULL,
+        FOREIGN KEY (community_id) REFERENCES community_groups (id)
+    )""",
+        """CREATE TABLE institution_groups (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        description TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP, institution_type TEXT DEFAULT 'faith' NOT NULL,
+        FOREIGN KEY (community_id) REFERENCES community_groups (id)
+    )""",
+        """CREATE TABLE member_vehicle_maps (
+        id TEXT PRIMARY KEY,
+        member_id TEXT NOT NULL,
+        vehicle_type TEXT NOT NULL, -- 'telegram', 'sms', 'whatsapp'
+        vehicle_identity TEXT NOT NULL, -- e.g. Telegram User ID
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (member_id) REFERENCES institution_members (id),
+        UNIQUE(vehicle_type, vehicle_identity)
+    )""",
+        """CREATE TABLE institution_message_logs (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        sender_id TEXT NOT NULL,
+        recipient_type TEXT NOT NULL, -- 'individual', 'group', 'broadcast'
+        recipient_id TEXT NOT NULL,
+        vehicle_type TEXT NOT NULL,
+        message_type TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        sent_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (community_id) REFERENCES community_groups (id),
+        FOREIGN KEY (sender_id) REFERENCES institution_members (id)
+    )""",
+        """CREATE TABLE prayer_requests (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        member_id TEXT NOT NULL,
+        request_text TEXT NOT NULL,
+        is_anonymous BOOLEAN DEFAULT 0,
+        status TEXT DEFAULT 'pending',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (community_id) REFERENCES community_groups (id),
+        FOREIGN KEY (member_id) REFERENCES institution_members (id)
+    )""",
+        """CREATE TABLE institution_group_members (
+        id TEXT PRIMARY KEY, -- Mapping UUID
+        group_id TEXT NOT NULL,
+        member_id TEXT NOT NULL,
+        joined_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (group_id) REFERENCES institution_groups (id),
+        FOREIGN KEY (member_id) REFERENCES institution_members (id),
+        UNIQUE(group_id, member_id)
+    )""",
+        """CREATE TABLE institutional_attendance (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        member_id TEXT NOT NULL,
+        service_date DATETIME NOT NULL,
+        service_type TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'present',
+        recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (community_id) REFERENCES community_groups (id),
+        FOREIGN KEY (member_id) REFERENCES institution_members (id)
+    )""",
+        """CREATE TABLE institutional_finances (
+        id TEXT PRIMARY KEY,
+        community_id TEXT NOT NULL,
+        member_id TEXT,
+        amount REAL NOT NULL,
+        category TEXT NOT NULL, -- tithe, offering, pledge
+        is_pledge BOOLEAN DEFAULT 0,
+        entry_date DATETIME NOT NULL,
+        notes TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (community_id) REFERENCES community_groups (id),
+        FOREIGN KEY (member_id) REFERENCES institution_members (id)
+    )""",
+        """CREATE TABLE institution_audit_logs (
+            id TEXT PRIMARY KEY,
+            community_id TEXT NOT NULL,
+            operator_id TEXT NOT NULL,
+            action_type TEXT NOT NULL, -- e.g., 'MEMBER_JOIN', 'FINANCE_LOG', 'BROADCAST'
+            target_id TEXT,             -- ID of the entity affected
+            details TEXT,              -- JSON or string details
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (community_id) REFERENCES communities(id)
+        )""",
+        """CREATE TABLE message_retry_queue (
+            id TEXT PRIMARY KEY,
+            community_id TEXT NOT NULL,
+            vehicle_type TEXT NOT NULL,
+            vehicle_identity TEXT NOT NULL,
+            content TEXT NOT NULL,
+            metadata TEXT,            -- JSON metadata
+            retry_count INTEGER DEFAULT 0,
+            next_retry_at DATETIMEDEFAULT CURRENT_TIMESTAMP,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (community_id) REFERENCES communities(id)
+        )""",
+        """CREATE INDEX idx_cg_location ON community_groups(location)""",
+        'CREATE INDEX idx_telegram_users_phone \n        ON telegram_users(phone)\n    ',
+        'CREATE INDEX idx_telegram_users_chat_id \n        ON telegram_users(chat_id)\n    ',
+        """CREATE INDEX idx_tz_location ON transport_zones(location_scope)""",
+        """CREATE INDEX idx_ts_expiry ON traffic_signals(expires_at)""",
+        """CREATE INDEX idx_ta_zone_dest ON transport_availability(zone_id, destination)""",
+        'CREATE INDEX idx_cm_community \n        ON community_members(community_id)\n    ',
+        'CREATE INDEX idx_cm_user \n        ON community_members(user_id)\n    ',
+        'CREATE INDEX idx_cm_active \n        ON community_members(community_id, active)\n    ',
+        """CREATE INDEX idx_b_status ON broadcasts(status)""",
+        """CREATE INDEX idx_b_community ON broadcasts(community_id)""",
+        """CREATE INDEX idx_bd_status ON broadcast_deliveries(status)""",
+        """CREATE INDEX idx_bal_broadcast ON broadcast_audit_logs(broadcast_id)""",
+        """CREATE INDEX idx_cal_action ON community_activity_logs(action)""",
+        """CREATE INDEX idx_cal_target ON community_activity_logs(target_id)""",
+        """CREATE INDEX idx_cal_actor ON community_activity_logs(actor_id)""",
+        """CREATE INDEX idx_cal_community ON community_activity_logs(community_id)""",
+        """CREATE UNIQUE INDEX idx_cg_slug ON community_groups(invite_slug)""",
+        'CREATE UNIQUE INDEX idx_cg_active_code \n            ON community_groups(community_code) \n            WHERE code_active = 1 AND community_code IS NOT NULL\n        ',
+        """CREATE INDEX idx_im_community ON institution_members(community_id)""",
+        """CREATE INDEX idx_im_role ON institution_members(role_id)""",
+        """CREATE INDEX idx_ig_community ON institution_groups(community_id)""",
+        """CREATE INDEX idx_mvm_member ON member_vehicle_maps(member_id)""",
+        """CREATE INDEX idx_mvm_identity ON member_vehicle_maps(vehicle_type, vehicle_identity)""",
+        """CREATE INDEX idx_iml_community ON institution_message_logs(community_id)""",
+        """CREATE INDEX idx_pr_community ON prayer_requests(community_id)""",
+        """CREATE INDEX idx_pr_member ON prayer_requests(member_id)""",
+        """CREATE INDEX idx_igm_group ON institution_group_members(group_id)""",
+        """CREATE INDEX idx_igm_member ON institution_group_members(member_id)""",
+        """CREATE INDEX idx_ia_community_date ON institutional_attendance(community_id, service_date)""",
+        """CREATE INDEX idx_ia_member ON institutional_attendance(member_id)""",
+        """CREATE INDEX idx_if_community_cat ON institutional_finances(community_id, category)""",
+        """CREATE INDEX idx_if_member ON institutional_finances(member_id)""",
+        """CREATE INDEX idx_if_date ON institutional_finances(entry_date)""",
+        """CREATE INDEX idx_audit_community ON institution_audit_logs(community_id)""",
+        """CREATE INDEX idx_audit_timestamp ON institution_audit_logs(timestamp)""",
+        """CREATE INDEX idx_retry_next ON message_retry_queue(next_retry_at)""",
+        'CREATE INDEX idx_institution_members_type \n        ON institution_members(institution_type)\n    ',
+        'CREATE INDEX idx_institution_groups_type \n        ON institution_groups(institution_type)\n    ',
+        'CREATE INDEX idx_institution_members_community_type \n        ON institution_members(community_id, institution_type)\n    ',
+        'CREATE INDEX idx_institution_groups_community_type \n        ON institution_groups(community_id, institution_type)\n    ',
+        """CREATE INDEX idx_bd_broadcast_status ON broadcast_deliveries(broadcast_id, status)""",
+        """CREATE INDEX idx_bd_broadcast_member ON broadcast_deliveries(broadcast_id, member_id)""",
+        """CREATE INDEX idx_ts_zone_expiry ON traffic_signals(zone_id, expires_at)""",
+        """CREATE INDEX idx_cg_code_upper ON community_groups(UPPER(community_code)) WHERE code_active = 1""",
+        """CREATE INDEX idx_h_farmer ON harvests(farmer_id)""",
+        """CREATE INDEX idx_h_created ON harvests(created_at)""",
+        """CREATE INDEX idx_farmers_contact_bidx ON farmers(contact_bidx)""",
+    ],
+    rows={
+        'crops': (
+            ('id', 'name', 'crop_type', 'growing_season'),
+            [
+                ('maize-01', 'Yellow Maize', 'Cereal', 'Long Rains'),
+                ('beans-01', 'Rosecoco Beans', 'Legume', 'Short Rains'),
+                ('coffee-01', 'Arabica Coffee', 'Cash Crop', 'Perennial'),
+            ],
+        ),
+        'routes': (
+            ('id', 'name', 'start_point', 'end_point', 'base_price', 'metadata'),
+            [
+                ('r-46', 'Route 46 (Town - Kawangware)', 'Town', 'Kawangware', 50.0, None),
+                ('r-23', 'Route 23 (Town - Rongai)', 'Town', 'Rongai', 100.0, None),
+                ('r-1', 'Route 1 (Town - Kibera)', 'Town', 'Kibera', 30.0, None),
+            ],
+        ),
+        'transport_zones': (
+            ('id', 'name', 'type', 'location_scope', 'active'),
+            [
+                ('r-46', 'Route 46 (Town - Kawangware)', 'road', 'Town-Kawangware', 1),
+                ('r-23', 'Route 23 (Town - Rongai)', 'road', 'Town-Rongai', 1),
+                ('r-1', 'Route 1 (Town - Kibera)', 'road', 'Town-Kibera', 1),
+            ],
+        ),
+    },
+)
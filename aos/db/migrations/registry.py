@@ -20,8 +20,15 @@ from aos.db.migrations import (
     _019_audit_logs,
     _020_retry_queue,
     _021_institution_types,
+    _022_hot_path_indexes,
+    _023_farmer_blind_index,
 )
 
+# Generated from MIGRATIONS by python -m aos.db.migrations.snapshot
+from aos.db.migrations._snapshot import SNAPSHOT
+
+__all__ = ["MIGRATIONS", "SNAPSHOT"]
+
 # Strict migration registry
 MIGRATIONS = [
     _001_initial_schema,
@@ -45,4 +52,6 @@ MIGRATIONS = [
     _019_audit_logs,
     _020_retry_queue,
     _021_institution_types,
+    _022_hot_path_indexes,
+    _023_farmer_blind_index,
 ]
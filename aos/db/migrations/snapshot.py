@@ -0,0 +1,144 @@
+"""
+Schema Snapshot - provisions an empty database in one transaction.
+
+Replaying every migration on a new node costs one transaction per version
+and rebuilds tables that later versions alter again. The snapshot records
+the schema those migrations end up with, the reference rows they seed and
+the version set they leave in ``schema_migrations``, so ``MigrationManager``
+can create the same database in a single transaction. Roles and operators
+are not recorded: their ids and password hashes belong to each node, so
+provisioning runs the ``seed`` hooks of the migrations that create them.
+Upgrades still go through the migrations.
+
+Regenerate after adding or changing a migration:
+    python -m aos.db.migrations.snapshot
+
+Verify the committed snapshot is current (CI):
+    python -m aos.db.migrations.snapshot --check
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import re
+import sqlite3
+import sys
+from dataclasses import astuple, dataclass
+from pathlib import Path
+from typing import Any
+
+from aos.db.migrations import MigrationManager
+
+SNAPSHOT_PATH = Path(__file__).with_name("_snapshot.py")
+
+# Tables filled by the migrations' seed() hooks rather than from the snapshot
+SEEDED = ("roles", "operators")
+# Column defaults evaluated at insert time, left for provisioning to fill
+_TIME_DEFAULT = re.compile(r"CURRENT_(TIMESTAMP|DATE|TIME)|'now'", re.I)
+
+
+@dataclass(frozen=True)
+class SchemaSnapshot:
+    """Schema, seed rows and version set produced by a list of migrations."""
+    versions: list[tuple[int, str]]
+    schema: list[str]
+    rows: dict[str, tuple[tuple[str, ...], list[tuple[Any, ...]]]]
+
+
+def build_snapshot(migrations: list[Any]) -> SchemaSnapshot:
+    """Apply migrations to a scratch database and capture the result."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        # Migrations announce what they do; a build is not a deployment
+        with contextlib.redirect_stdout(io.StringIO()):
+            MigrationManager(conn).apply_migrations(migrations)
+
+        versions = [tuple(r) for r in conn.execute(
+            "SELECT version_id, migration_hash FROM schema_migrations ORDER BY version_id"
+        )]
+        # Tables before the indexes, views and triggers that depend on them
+        objects = conn.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' AND name != 'schema_migrations' "
+            "ORDER BY CASE type WHEN 'table' THEN 0 WHEN 'index' THEN 1 WHEN 'view' THEN 2 ELSE 3 END, rowid"
+        ).fetchall()
+
+        rows: dict[str, tuple[tuple[str, ...], list[tuple[Any, ...]]]] = {}
+        for kind, table, _ in objects:
+            if kind != "table" or table in SEEDED:
+                continue
+            columns = tuple(
+                name for _, name, _, _, default, _ in conn.execute(f'PRAGMA table_info("{table}")')
+                if not (default and _TIME_DEFAULT.search(default))
+            )
+            column_list = ", ".join(f'"{c}"' for c in columns)
+            table_rows = conn.execute(f'SELECT {column_list} FROM "{table}" ORDER BY rowid').fetchall()
+            if not table_rows:
+                continue
+            rows[table] = (columns, [tuple(r) for r in table_rows])
+
+        return SchemaSnapshot(versions=versions, schema=[sql for _, _, sql in objects], rows=rows)
+    finally:
+        conn.close()
+
+
+def render_snapshot(snapshot: SchemaSnapshot) -> str:
+    """Python source of the generated snapshot module."""
+    lines = [
+        '"""',
+        "Generated by python -m aos.db.migrations.snapshot - do not edit.",
+        '"""',
+        "from aos.db.migrations.snapshot import SchemaSnapshot",
+        "",
+        "SNAPSHOT = SchemaSnapshot(",
+        "    versions=[",
+        *(f"        {tuple(v)!r}," for v in snapshot.versions),
+        "    ],",
+        "    schema=[",
+        *(f"        {_sql_literal(sql)}," for sql in snapshot.schema),
+        "    ],",
+        "    rows={",
+    ]
+    for table, (columns, rows) in snapshot.rows.items():
+        lines += [f"        {table!r}: (", f"            {columns!r},", "            ["]
+        lines += [f"                {row!r}," for row in rows]
+        lines += ["            ],", "        ),"]
+    lines += ["    },", ")", ""]
+    return "\n".join(lines)
+
+
+def _sql_literal(sql: str) -> str:
+    # Triple quotes keep the DDL reviewable in diffs; SQLite keeps the text
+    # verbatim, so DDL with trailing whitespace is escaped instead
+    if '"""' in sql or "\\" in sql or sql.endswith('"') or re.search(r"[ \t]$", sql, re.M):
+        return repr(sql)
+    return f'"""{sql}"""'
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the schema snapshot from the migrations.")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the committed snapshot is stale")
+    args = parser.parse_args(argv)
+
+    from aos.db.migrations.registry import MIGRATIONS
+
+    snapshot = build_snapshot(MIGRATIONS)
+    if args.check:
+        from aos.db.migrations._snapshot import SNAPSHOT
+
+        # Run as __main__, this module's SchemaSnapshot is not the one
+        # _snapshot imports: compare the contents
+        if astuple(SNAPSHOT) != astuple(snapshot):
+            print(f"{SNAPSHOT_PATH} is stale; run python -m aos.db.migrations.snapshot")
+            return 1
+        print(f"{SNAPSHOT_PATH.name} is current ({len(snapshot.versions)} versions)")
+        return 0
+
+    SNAPSHOT_PATH.write_text(render_snapshot(snapshot), encoding="utf-8")
+    print(f"Wrote {SNAPSHOT_PATH} ({len(snapshot.versions)} versions, {len(snapshot.schema)} objects)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
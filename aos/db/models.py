@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from aos.core.security.encryption import SealedValue
 
 
 class NodeDTO(BaseModel):
@@ -37,13 +41,20 @@ class ConfigDTO(BaseModel):
 
 class FarmerDTO(BaseModel):
     """Represents a farmer registered in the mesh."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: str
     name: str
-    location: str
-    contact: str
+    # SealedValue only when read through FarmerRepository.sealed_reads()
+    location: str | SealedValue
+    contact: str | SealedValue
     metadata: dict = {}
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @field_serializer("location", "contact")
+    def _reveal(self, value: Any) -> str | None:
+        return None if value is None else str(value)
+
 class CropDTO(BaseModel):
     """Represents a crop type."""
     id: str
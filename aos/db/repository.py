@@ -1,20 +1,257 @@
 from __future__ import annotations
 
+import copy
 import json
+import logging
+import operator
+import re
 import sqlite3
-from typing import Any, Generic, TypeVar
+import types
+import typing
+from collections import namedtuple
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
-from aos.core.security.encryption import SymmetricEncryption
-from aos.core.config import settings
+from aos.core.security.encryption import SealedValue, SymmetricEncryption, reveal_all
+from aos.db.engine import write_transaction
+
+if TYPE_CHECKING:
+    from aos.db.async_engine import AsyncDatabase
+    from aos.db.cache import RepositoryCache
+
+logger = logging.getLogger("aos.db.repository")
 
 T = TypeVar("T", bound=BaseModel)
 
+# find()/count() filter operators: "column__op" keys, "column" alone means eq
+_OPERATORS = {
+    "eq": "=", "ne": "!=", "lt": "<", "lte": "<=", "gt": ">", "gte": ">=",
+    "like": "LIKE", "contains": "LIKE", "in": "IN",
+}
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _column(name: str) -> str:
+    """Validate a column name before it is placed in SQL."""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid column name: {name!r}")
+    return name
+
+
+def _where_sql(where: Mapping[str, Any] | None) -> tuple[list[str], list[Any]]:
+    """
+    Build parameterized WHERE clauses from a filter mapping.
+
+    Keys are "column" (equality; None matches NULL) or "column__op" with
+    op one of eq, ne, lt, lte, gt, gte, like, contains (case-insensitive
+    substring) or in (a None among the values also matches NULL).
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    for key, value in (where or {}).items():
+        name, _, op = key.partition("__")
+        column = _column(name)
+        op = op or "eq"
+        if op not in _OPERATORS:
+            raise ValueError(f"Unknown filter operator: {op!r}")
+
+        if op in ("eq", "ne") and value is None:
+            clauses.append(f"{column} IS {'NOT ' if op == 'ne' else ''}NULL")
+        elif op == "in":
+            values = [v for v in value if v is not None]
+            terms = [f"{column} IN ({', '.join('?' * len(values))})"] if values else []
+            if len(values) < len(value):
+                terms.append(f"{column} IS NULL")
+            clauses.append(f"({' OR '.join(terms)})" if terms else "0")
+            params.extend(values)
+        elif op == "contains":
+            escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        else:
+            clauses.append(f"{column} {_OPERATORS[op]} ?")
+            params.append(value)
+    return clauses, params
+
+
+def _order_keys(order_by: str | Sequence[str]) -> list[tuple[str, bool]]:
+    """Parse order_by ("col" or "-col" for descending) into (column, descending) keys."""
+    names = [order_by] if isinstance(order_by, str) else list(order_by)
+    keys = [(_column(n.lstrip("-")), n.startswith("-")) for n in names]
+    # Keyset pagination needs a unique key: break ties on rowid
+    if not any(c in ("rowid", "id") for c, _ in keys):
+        keys.append(("rowid", keys[-1][1] if keys else False))
+    return keys
+
+
+def _keyset_sql(keys: list[tuple[str, bool]], values: Sequence[Any]) -> tuple[str, list[Any]]:
+    """Condition selecting the rows that sort after ``values``."""
+    if len({desc for _, desc in keys}) == 1:
+        # Uniform direction: a row-value comparison SQLite can seek on
+        columns = ", ".join(c for c, _ in keys)
+        op = "<" if keys[0][1] else ">"
+        return f"({columns}) {op} ({', '.join('?' * len(keys))})", list(values)
+
+    terms, params = [], []
+    for i, (column, desc) in enumerate(keys):
+        parts = [f"{c} = ?" for c, _ in keys[:i]] + [f"{column} {'<' if desc else '>'} ?"]
+        terms.append(f"({' AND '.join(parts)})")
+        params.extend(values[:i + 1])
+    return f"({' OR '.join(terms)})", params
+
+
+# --- Trusted reads: hydrating DTOs from rows this node wrote itself ---
+
+def _to_bool(value: int) -> bool:
+    # SQLite stores booleans as 0/1
+    if value in (0, 1):
+        return bool(value)
+    raise ValueError("expected 0 or 1")
+
+
+def _to_datetime(value: str | datetime) -> datetime:
+    return datetime.fromisoformat(value) if type(value) is str else value
+
+
+# Field annotation -> (exact types a stored value may have, conversion to
+# the field value, None to use it as is) for the annotations a trusted
+# read handles. Any other annotation (dict, list, nested models...) keeps
+# full validation, and so does a row holding any other type, e.g. an int
+# in a str column, which validation would reject.
+_CONVERTERS: dict[Any, tuple[tuple[type, ...], Callable[[Any], Any] | None]] = {
+    str: ((str,), None),
+    bytes: ((bytes,), None),
+    int: ((int,), None),
+    float: ((int, float), float),
+    bool: ((int,), _to_bool),
+    datetime: ((str, datetime), _to_datetime),
+}
+
+
+def _optional(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else convert(value)
+
+
+class _ReadPlan:
+    """How to turn rows of one query shape into field values without validation."""
+
+    __slots__ = ("names", "fields", "getter", "kinds", "signatures", "conversions")
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        indexes: list[int],
+        kinds: list[tuple[type, ...]],
+        conversions: list[tuple[str, Callable]],
+    ):
+        self.names = names
+        self.fields = frozenset(names)
+        # itemgetter and zip keep the per-row work in C
+        getter = operator.itemgetter(*indexes)
+        self.getter = (lambda row: (getter(row),)) if len(indexes) == 1 else getter
+        self.kinds = kinds
+        # Row type signatures already checked against kinds
+        self.signatures: set[tuple[type, ...]] = set()
+        self.conversions = conversions
+
+    def values(self, row: tuple) -> dict[str, Any]:
+        """Field values for a row; TypeError when a stored type needs validation."""
+        stored = self.getter(row)
+        signature = tuple(map(type, stored))
+        if signature not in self.signatures:
+            if not all(kind in kinds for kind, kinds in zip(signature, self.kinds)):
+                raise TypeError("stored value does not have the field's type")
+            self.signatures.add(signature)
+        values = dict(zip(self.names, stored))
+        for name, convert in self.conversions:
+            values[name] = convert(values[name])
+        return values
+
+
+_READ_PLANS: dict[tuple[type[BaseModel], tuple[str, ...]], _ReadPlan | None] = {}
+
+
+def _read_plan(model_class: type[BaseModel], columns: tuple[str, ...]) -> _ReadPlan | None:
+    """
+    Column-order map for hydrating ``model_class`` from rows of one query
+    shape, computed once per shape.
+
+    None when a trusted read would differ from validation: a field is not
+    selected, its type is not a plain column type, or the model has
+    validators, private attributes or extra fields.
+    """
+    key = (model_class, columns)
+    if key in _READ_PLANS:
+        return _READ_PLANS[key]
+
+    plan = None
+    decorators = model_class.__pydantic_decorators__
+    if not (
+        decorators.validators or decorators.field_validators or decorators.model_validators
+        or model_class.__private_attributes__ or model_class.model_config.get("extra") == "allow"
+    ):
+        names, indexes, kinds, conversions = [], [], [], []
+        for name, field in model_class.model_fields.items():
+            annotation, optional = field.annotation, False
+            if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+                args = [a for a in typing.get_args(annotation) if a is not type(None)]
+                annotation, optional = (args[0] if len(args) == 1 else None), True
+            if annotation not in _CONVERTERS or name not in columns:
+                break
+            names.append(name)
+            indexes.append(columns.index(name))
+            accepted, convert = _CONVERTERS[annotation]
+            kinds.append((*accepted, type(None)) if optional else accepted)
+            if convert is not None:
+                conversions.append((name, _optional(convert) if optional else convert))
+        else:
+            plan = _ReadPlan(tuple(names), indexes, kinds, conversions)
+    _READ_PLANS[key] = plan
+    return plan
+
+
+_set = object.__setattr__
+
+
+def _construct(model_class: type[T], values: dict[str, Any], fields_set: frozenset[str]) -> T:
+    """
+    Instance with ``values`` set and no validation, as model_construct
+    builds one (without its per-field default and alias handling, which
+    costs more than validating). Only used for shapes _read_plan accepts.
+    """
+    model = object.__new__(model_class)
+    _set(model, "__dict__", values)
+    _set(model, "__pydantic_fields_set__", set(fields_set))
+    _set(model, "__pydantic_extra__", None)
+    _set(model, "__pydantic_private__", None)
+    return model
+
+
+_ROW_VIEWS: dict[tuple[type[BaseModel], tuple[str, ...]], type[tuple]] = {}
+
+
+def _row_view(model_class: type[BaseModel], columns: tuple[str, ...]) -> type[tuple]:
+    """Named tuple type for rows of one query shape, e.g. ``InstitutionMemberDTORow``."""
+    key = (model_class, columns)
+    if key not in _ROW_VIEWS:
+        _ROW_VIEWS[key] = namedtuple(f"{model_class.__name__}Row", columns, rename=True)
+    return _ROW_VIEWS[key]
+
+
 class SecureRepositoryMixin:
     """
     Mixin to provide transparent encryption/decryption for specific fields.
+
+    Reads decrypt the fields, so a bad ciphertext fails in the repository.
+    A repository from ``sealed_reads`` leaves them sealed instead (see
+    SealedValue) for listings that show few of them; ``reveal`` opens the
+    ones a listing shows for many records at once.
     """
+    sealed = False
+
     def __init__(self, master_encryption: SymmetricEncryption, encrypted_fields: list[str]):
         self.encryptor = master_encryption
         self.encrypted_fields = encrypted_fields
@@ -40,15 +277,99 @@ class SecureRepositoryMixin:
                     print(f"[Security] Decryption warning for {field}: {e}")
         return data
 
+    def _seal_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Wrap the ciphertext of configured fields, to be decrypted on first use."""
+        for field in self.encrypted_fields:
+            if isinstance(data.get(field), bytes) and data[field]:
+                data[field] = SealedValue(data[field], self.encryptor)
+        return data
+
+    def sealed_reads(self) -> Any:
+        """Shallow copy of this repository whose reads leave the encrypted fields sealed."""
+        clone = copy.copy(self)
+        clone.sealed = True
+        # Sealed records must never be served to plaintext reads
+        clone.cache = None
+        return clone
+
+    def reveal(self, models: Iterable[Any], fields: Iterable[str] | None = None, batch_size: int = 512) -> None:
+        """
+        Decrypt the sealed fields of many records ahead of use, in batches
+        on a thread pool (see reveal_all).
+
+        Args:
+            models: Records (or find_rows views) read from this repository
+            fields: Fields that will be shown (None = every encrypted field)
+            batch_size: Values decrypted per pool task
+        """
+        fields = list(self.encrypted_fields if fields is None else fields)
+        reveal_all(
+            (value for model in models for field in fields
+             if isinstance(value := getattr(model, field, None), SealedValue)),
+            batch_size,
+        )
+
 class BaseRepository(Generic[T]):
     """
     Base Repository using Pydantic DTOs for type safety.
+
+    Writable repositories set ``_save_sql`` (one parameterized upsert) and
+    ``_save_params`` (the model as its parameter tuple); save and save_many
+    are built on them.
+
+    get_by_id, list_all, find and iter_find hydrate DTOs with trusted reads:
+    the rows were validated as DTOs when they were written, so they are
+    converted column by column instead of re-validated. A row that does not
+    convert cleanly is validated as usual. Set ``trusted_reads = False`` on
+    a repository to validate every row.
+
+    With a RepositoryCache attached, get_by_id, find and the key lookups of
+    subclasses (through ``_cached``) are served from it; every write through
+    the repository flushes the table's entries.
     """
 
+    _save_sql: str | None = None
+    trusted_reads: bool = True
+    cache: RepositoryCache | None = None
+
     def __init__(self, connection: sqlite3.Connection, model_class: type[T], table_name: str):
         self.conn = connection
         self.model_class = model_class
         self.table_name = table_name
+        self.database: AsyncDatabase | None = None
+
+    def attach_database(self, database: AsyncDatabase) -> None:
+        """
+        Route the *_async methods through an AsyncDatabase.
+        The synchronous API keeps using the shared connection.
+        """
+        self.database = database
+
+    def attach_cache(self, cache: RepositoryCache) -> None:
+        """
+        Serve reads from a cache shared by every repository of the table,
+        so that a write through any of them flushes it.
+        """
+        self.cache = cache
+
+    def _cached(self, kind: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        """load(), or its cached result; callers get their own copies of DTOs."""
+        if self.cache is None:
+            return load()
+        value = self.cache.get_or_load(self.table_name, (kind, key), load)
+        if isinstance(value, list):
+            return [copy.copy(m) for m in value]
+        return copy.copy(value)
+
+    def _invalidate(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self.table_name)
+
+    def _with_connection(self, conn: sqlite3.Connection) -> BaseRepository[T]:
+        """Shallow copy of this repository bound to another connection."""
+        clone = copy.copy(self)
+        clone.conn = conn
+        return clone
 
     def _row_to_model(self, row: sqlite3.Row) -> T:
         data = dict(row)
@@ -59,29 +380,293 @@ class BaseRepository(Generic[T]):
         """Hook to preprocess database row dict before Pydantic validation."""
         return data
 
+    def _fetch(self, sql: str, params: Sequence[Any] = ()) -> tuple[tuple[str, ...], list[tuple]]:
+        """Run a SELECT, returning its column names and plain tuple rows."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        return tuple(d[0] for d in cursor.description), cursor.fetchall()
+
+    def _hydrate(self, columns: tuple[str, ...], rows: list[tuple]) -> list[T]:
+        """DTOs for rows of one query shape; trusted reads where the shape allows."""
+        plan = _read_plan(self.model_class, columns) if self._reads_trusted() else None
+        if plan is None:
+            return [self._row_to_model(dict(zip(columns, row))) for row in rows]
+
+        models = []
+        for row in rows:
+            try:
+                models.append(_construct(self.model_class, plan.values(row), plan.fields))
+            except (TypeError, ValueError):
+                models.append(self._row_to_model(dict(zip(columns, row))))
+        return models
+
+    def _reads_trusted(self) -> bool:
+        # Repositories that reshape rows before validation keep validating
+        cls = type(self)
+        return (
+            self.trusted_reads
+            and cls._row_to_model is BaseRepository._row_to_model
+            and cls._preprocess_data is BaseRepository._preprocess_data
+        )
+
+    def _first(self, sql: str, params: Sequence[Any] = ()) -> T | None:
+        """The first record a SELECT returns, or None."""
+        columns, rows = self._fetch(sql, params)
+        return self._hydrate(columns, rows[:1])[0] if rows else None
+
     def get_by_id(self, id: Any) -> T | None:
         """Fetch a single record by its primary key."""
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.execute(f"SELECT * FROM {self.table_name} WHERE id = ?", (id,))
-        row = cursor.fetchone()
-        return self._row_to_model(row) if row else None
+        return self._cached("id", id, lambda: self._first(f"SELECT * FROM {self.table_name} WHERE id = ?", (id,)))
 
     def list_all(self) -> list[T]:
         """Fetch all records from the table."""
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.execute(f"SELECT * FROM {self.table_name}")
-        return [self._row_to_model(row) for row in cursor.fetchall()]
+        return self._hydrate(*self._fetch(f"SELECT * FROM {self.table_name}"))
+
+    def find(
+        self,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | Sequence[str] = "rowid",
+        limit: int | None = None,
+        after: T | str | None = None,
+    ) -> list[T]:
+        """
+        Fetch the records matching ``where``, filtered and ordered in SQL.
+
+        Pages are keyset-based: pass the last record of the previous page
+        (or its id) as ``after`` and the next page is found with an index
+        seek, however deep it is.
+
+        Args:
+            where: Filters, e.g. {"community_id": cid, "status__in": ["new", "open"]}
+            order_by: Column or columns, "-" prefix for descending
+                (default: insertion order, as list_all)
+            limit: Maximum number of records (None = all)
+            after: Record, or record id, the page starts after
+
+        Returns:
+            Matching records in order
+        """
+        keys = _order_keys(order_by)
+
+        def load() -> list[T]:
+            start = self._keyset_values(keys, after) if after is not None else None
+            return self._hydrate(*self._select(where, keys, limit, start))
+
+        if self.cache is None:
+            return load()
+        filters = tuple(sorted((k, repr(v)) for k, v in where.items())) if where else ()
+        return self._cached("find", (filters, tuple(keys), limit, getattr(after, "id", after)), load)
+
+    def find_rows(
+        self,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | Sequence[str] = "rowid",
+        limit: int | None = None,
+        after: T | str | None = None,
+    ) -> list[tuple]:
+        """
+        ``find`` for read-only listings: named tuples (``<DTO>Row``) of the
+        stored values instead of DTOs. Nothing is converted, so timestamps
+        are ISO strings and booleans 0/1, as in the table.
+        """
+        keys = _order_keys(order_by)
+        start = self._keyset_values(keys, after) if after is not None else None
+        columns, rows = self._select(where, keys, limit, start)
+        view = _row_view(self.model_class, columns)
+        if type(self)._preprocess_data is BaseRepository._preprocess_data:
+            return [view._make(row) for row in rows]
+        return [view._make(self._preprocess_data(dict(zip(columns, row))).values()) for row in rows]
+
+    def iter_find(
+        self,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | Sequence[str] = "rowid",
+        batch_size: int = 500,
+    ) -> Iterator[T]:
+        """Stream the records ``find`` would return, reading one keyset page at a time."""
+        keys = _order_keys(order_by)
+        start = None
+        while True:
+            columns, rows = self._select(where, keys, batch_size, start, with_keys=True)
+            yield from self._hydrate(columns, rows)
+            if len(rows) < batch_size:
+                return
+            # The _key columns come last
+            start = list(rows[-1][-len(keys):])
+
+    def count(self, where: Mapping[str, Any] | None = None) -> int:
+        """Count the records matching ``where`` (same filters as find)."""
+        clauses, params = _where_sql(where)
+        sql = f"SELECT COUNT(*) FROM {self.table_name}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def _select(
+        self,
+        where: Mapping[str, Any] | None,
+        keys: list[tuple[str, bool]],
+        limit: int | None,
+        start: Sequence[Any] | None,
+        with_keys: bool = False,
+    ) -> tuple[tuple[str, ...], list[tuple]]:
+        """Run one filtered, ordered, keyset-positioned SELECT."""
+        clauses, params = _where_sql(where)
+        if start is not None:
+            keyset, keyset_params = _keyset_sql(keys, start)
+            clauses.append(keyset)
+            params.extend(keyset_params)
+
+        columns = "*"
+        if with_keys:
+            columns += "".join(f", {c} AS _key{i}" for i, (c, _) in enumerate(keys))
+        sql = f"SELECT {columns} FROM {self.table_name}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY " + ", ".join(f"{c} DESC" if desc else c for c, desc in keys)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._fetch(sql, params)
+
+    def _keyset_values(self, keys: list[tuple[str, bool]], after: T | str) -> list[Any]:
+        """Sort-key values of the record a page starts after."""
+        record_id = getattr(after, "id", after)
+        columns = ", ".join(c for c, _ in keys)
+        row = self.conn.execute(
+            f"SELECT {columns} FROM {self.table_name} WHERE id = ?", (record_id,)
+        ).fetchone()
+        if row is None:
+            raise LookupError(f"No {self.table_name} record {record_id!r} to page after")
+        return list(row)
+
+    def _save_params(self, model: T) -> tuple:
+        """Parameters of ``_save_sql`` for one model."""
+        raise NotImplementedError(f"{type(self).__name__} does not support save")
+
+    def save(self, model: T) -> None:
+        """Insert or replace one record."""
+        if self._save_sql is None:
+            raise NotImplementedError(f"{type(self).__name__} does not support save")
+        with write_transaction(self.conn):
+            self.conn.execute(self._save_sql, self._save_params(model))
+        self._invalidate()
+
+    def save_many(self, models: Iterable[T], chunk_size: int = 500) -> int:
+        """
+        Insert or replace many records with one executemany and one commit
+        per chunk, instead of a commit (and fsync) per record.
+
+        Each chunk is all-or-nothing: if a row fails, that chunk is rolled
+        back and the error is raised; earlier chunks stay committed.
+
+        Args:
+            models: Records to save; any iterable, consumed chunk by chunk
+            chunk_size: Records per transaction
+
+        Returns:
+            Number of records saved
+        """
+        if self._save_sql is None:
+            raise NotImplementedError(f"{type(self).__name__} does not support save")
+        saved = 0
+        chunk: list[tuple] = []
+        for model in models:
+            chunk.append(self._save_params(model))
+            if len(chunk) >= chunk_size:
+                saved += self._write_chunk(chunk)
+                chunk = []
+        if chunk:
+            saved += self._write_chunk(chunk)
+        return saved
+
+    def _write_chunk(self, rows: list[tuple]) -> int:
+        with write_transaction(self.conn):
+            self.conn.executemany(self._save_sql, rows)
+        self._invalidate()
+        return len(rows)
 
     def delete(self, id: Any) -> bool:
         """Delete a record by its primary key."""
-        cursor = self.conn.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (id,))
-        self.conn.commit()
+        with write_transaction(self.conn):
+            cursor = self.conn.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (id,))
+        self._invalidate()
         return cursor.rowcount > 0
 
+    # --- Coroutine API (runs on AsyncDatabase threads when attached) ---
+
+    async def get_by_id_async(self, id: Any) -> T | None:
+        """Async get_by_id; the query runs on a reader thread."""
+        if self.database is None:
+            return self.get_by_id(id)
+        return await self.database.run_read(lambda conn: self._with_connection(conn).get_by_id(id))
+
+    async def list_all_async(self) -> list[T]:
+        """Async list_all; the query runs on a reader thread."""
+        if self.database is None:
+            return self.list_all()
+        return await self.database.run_read(lambda conn: self._with_connection(conn).list_all())
+
+    async def find_async(
+        self,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | Sequence[str] = "rowid",
+        limit: int | None = None,
+        after: T | str | None = None,
+    ) -> list[T]:
+        """Async find; the query runs on a reader thread."""
+        if self.database is None:
+            return self.find(where, order_by, limit, after)
+        return await self.database.run_read(
+            lambda conn: self._with_connection(conn).find(where, order_by, limit, after)
+        )
+
+    async def find_rows_async(
+        self,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | Sequence[str] = "rowid",
+        limit: int | None = None,
+        after: T | str | None = None,
+    ) -> list[tuple]:
+        """Async find_rows; the query runs on a reader thread."""
+        if self.database is None:
+            return self.find_rows(where, order_by, limit, after)
+        return await self.database.run_read(
+            lambda conn: self._with_connection(conn).find_rows(where, order_by, limit, after)
+        )
+
+    async def count_async(self, where: Mapping[str, Any] | None = None) -> int:
+        """Async count; the query runs on a reader thread."""
+        if self.database is None:
+            return self.count(where)
+        return await self.database.run_read(lambda conn: self._with_connection(conn).count(where))
+
+    async def save_async(self, model: T) -> None:
+        """Async save; the write is queued on the writer thread."""
+        if self.database is None:
+            return self.save(model)
+        return await self.database.run_write(lambda conn: self._with_connection(conn).save(model))
+
+    async def save_many_async(self, models: Iterable[T], chunk_size: int = 500) -> int:
+        """Async save_many; the chunks are written on the writer thread."""
+        if self.database is None:
+            return self.save_many(models, chunk_size)
+        models = list(models)
+        return await self.database.run_write(
+            lambda conn: self._with_connection(conn).save_many(models, chunk_size)
+        )
+
+    async def delete_async(self, id: Any) -> bool:
+        """Async delete; the write is queued on the writer thread."""
+        if self.database is None:
+            return self.delete(id)
+        return await self.database.run_write(lambda conn: self._with_connection(conn).delete(id))
+
 from aos.db.models import (
     OperatorDTO, NodeDTO, FarmerDTO, HarvestDTO, CropDTO,
     CommunityGroupDTO, CommunityEventDTO, CommunityAnnouncementDTO, CommunityInquiryDTO,
-    TransportZoneDTO, TrafficSignalDTO, TransportAvailabilityDTO,
+    CommunityMemberDTO, TransportZoneDTO, TrafficSignalDTO, TransportAvailabilityDTO,
     InstitutionMemberDTO, InstitutionGroupDTO, MemberVehicleMapDTO,
     InstitutionMessageLogDTO, PrayerRequestDTO, InstitutionGroupMemberDTO,
     AttendanceRecordDTO, FinancialLedgerDTO, InstitutionAuditLogDTO, MessageRetryDTO
@@ -92,42 +677,73 @@ class NodeRepository(BaseRepository[NodeDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, NodeDTO, "nodes")
 
+    _save_sql = """
+        INSERT INTO nodes (id, public_key, alias, status, last_seen)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            public_key=excluded.public_key,
+            alias=excluded.alias,
+            status=excluded.status,
+            last_seen=excluded.last_seen
+    """
+
+    def _save_params(self, node: NodeDTO) -> tuple:
+        return (node.id, node.public_key, node.alias, node.status, node.last_seen)
+
     def upsert(self, node: NodeDTO) -> None:
         """Insert or update a node record."""
-        self.conn.execute("""
-            INSERT INTO nodes (id, public_key, alias, status, last_seen)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                public_key=excluded.public_key,
-                alias=excluded.alias,
-                status=excluded.status,
-                last_seen=excluded.last_seen
-        """, (node.id, node.public_key, node.alias, node.status, node.last_seen))
-        self.conn.commit()
+        self.save(node)
+
+    def upsert_many(self, nodes: Iterable[NodeDTO], chunk_size: int = 500) -> int:
+        """Insert or update many node records; see save_many."""
+        return self.save_many(nodes, chunk_size)
 
 class OperatorRepository(BaseRepository[OperatorDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, OperatorDTO, "operators")
 
-    def save(self, operator: OperatorDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO operators (id, username, password_hash, role_id, created_at, last_login)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (operator.id, operator.username, operator.password_hash, operator.role_id, operator.created_at, operator.last_login))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO operators (id, username, password_hash, role_id, created_at, last_login)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, operator: OperatorDTO) -> tuple:
+        return (operator.id, operator.username, operator.password_hash, operator.role_id, operator.created_at, operator.last_login)
+
+def normalize_contact(contact: str) -> str:
+    """
+    Canonical form of a contact for blind indexing: phone numbers as
+    digits with their leading "+" ("+254 712-345 678" -> "+254712345678"),
+    anything else trimmed and case-folded.
+    """
+    contact = contact.strip()
+    if re.fullmatch(r"[\d\s().+-]+", contact):
+        digits = re.sub(r"\D", "", contact)
+        return f"+{digits}" if contact.startswith("+") else digits
+    return contact.casefold()
+
 
 class FarmerRepository(BaseRepository[FarmerDTO], SecureRepositoryMixin):
+    """
+    Farmers, with location and contact encrypted at rest.
+
+    contact_bidx holds a blind index of the contact (a keyed HMAC of its
+    normalized form), so find_by_contact is one indexed query. Rows saved
+    before the column existed are filled by backfill_blind_index.
+    """
+
     def __init__(self, connection: sqlite3.Connection, encryptor: SymmetricEncryption):
         BaseRepository.__init__(self, connection, FarmerDTO, "farmers")
         SecureRepositoryMixin.__init__(self, encryptor, ["location", "contact"])
+        self.contact_index = encryptor.blind_index("farmers.contact") if encryptor else None
 
-    def _row_to_model(self, row: sqlite3.Row) -> FarmerDTO:
-        data = dict(row)
-        data = self._decrypt_dict(data)
-        data = self._preprocess_data(data)
-        return self.model_class.model_validate(data)
+    def _contact_digest(self, contact: str | None) -> bytes | None:
+        if self.contact_index is None or not contact:
+            return None
+        return self.contact_index.digest(normalize_contact(contact))
 
     def _preprocess_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        data = self._seal_dict(data) if self.sealed else self._decrypt_dict(data)
         if data.get("metadata") and isinstance(data["metadata"], str):
             try:
                 data["metadata"] = json.loads(data["metadata"])
@@ -135,22 +751,84 @@ class FarmerRepository(BaseRepository[FarmerDTO], SecureRepositoryMixin):
                 data["metadata"] = {}
         return data
 
-    def save(self, farmer: FarmerDTO) -> None:
+    _save_sql = """
+        INSERT OR REPLACE INTO farmers (id, name, location, contact, metadata, created_at, contact_bidx)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, farmer: FarmerDTO) -> tuple:
+        # Encrypted here, so save_many has a whole chunk encrypted before it writes
         data = farmer.model_dump()
         data = self._encrypt_dict(data)
-        
-        self.conn.execute("""
-            INSERT OR REPLACE INTO farmers (id, name, location, contact, metadata, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             data["id"],
             data["name"],
             data["location"],
             data["contact"],
             json.dumps(data["metadata"]),
-            data["created_at"]
+            data["created_at"],
+            self._contact_digest(
+                farmer.contact.reveal() if isinstance(farmer.contact, SealedValue) else farmer.contact
+            ),
+        )
+
+    def find_by_contact(self, contact: str) -> list[FarmerDTO]:
+        """
+        Farmers with this contact (in any formatting normalize_contact
+        accepts). Only the matching rows are read and decrypted.
+        """
+        digest = self._contact_digest(contact)
+        if digest is None:
+            return []
+        farmers = self._hydrate(*self._fetch(
+            f"SELECT * FROM {self.table_name} WHERE contact_bidx = ?", (digest,)
         ))
-        self.conn.commit()
+        # Digests are truncated; the decrypted contact has the final say
+        wanted = normalize_contact(contact)
+        return [f for f in farmers if normalize_contact(f.contact) == wanted]
+
+    def backfill_blind_index(self, batch_size: int = 1000) -> int:
+        """
+        Fill contact_bidx of rows that have none, one transaction per batch.
+        Rows whose contact does not decrypt are left empty and skipped.
+
+        Returns:
+            Number of rows filled
+        """
+        if self.contact_index is None:
+            return 0
+        filled = 0
+        after = 0
+        while True:
+            rows = self.conn.execute(
+                f"SELECT rowid, contact FROM {self.table_name} "
+                "WHERE contact_bidx IS NULL AND rowid > ? ORDER BY rowid LIMIT ?",
+                (after, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            after = rows[-1][0]
+
+            updates = []
+            for rowid, contact in rows:
+                if isinstance(contact, bytes):
+                    try:
+                        contact = self.encryptor.decrypt(contact).decode()
+                    except ValueError as e:
+                        logger.warning(f"Blind index skipped farmer row {rowid}: {e}")
+                        continue
+                digest = self._contact_digest(contact)
+                if digest is not None:
+                    updates.append((digest, rowid))
+
+            with write_transaction(self.conn):
+                self.conn.executemany(
+                    f"UPDATE {self.table_name} SET contact_bidx = ? WHERE rowid = ?", updates
+                )
+            filled += len(updates)
+        if filled:
+            self._invalidate()
+        return filled
 
 class CropRepository(BaseRepository[CropDTO]):
     def __init__(self, connection: sqlite3.Connection):
@@ -160,11 +838,13 @@ class HarvestRepository(BaseRepository[HarvestDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, HarvestDTO, "harvests")
 
-    def save(self, harvest: HarvestDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO harvests (id, farmer_id, crop_id, quantity, unit, quality_grade, harvest_date, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    _save_sql = """
+        INSERT OR REPLACE INTO harvests (id, farmer_id, crop_id, quantity, unit, quality_grade, harvest_date, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, harvest: HarvestDTO) -> tuple:
+        return (
             harvest.id,
             harvest.farmer_id,
             harvest.crop_id,
@@ -174,129 +854,130 @@ class HarvestRepository(BaseRepository[HarvestDTO]):
             harvest.harvest_date,
             harvest.status,
             harvest.created_at
-        ))
-        self.conn.commit()
+        )
 
 class CommunityGroupRepository(BaseRepository[CommunityGroupDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, CommunityGroupDTO, "community_groups")
 
-    def save(self, group: CommunityGroupDTO) -> None:
-        import logging
-        logger = logging.getLogger("aos.db.repository")
-        
-        # Check if group exists
-        cursor = self.conn.execute("SELECT id FROM community_groups WHERE id = ?", (group.id,))
-        exists = cursor.fetchone() is not None
-        
-        logger.info(f"Saving group {group.id}: exists={exists}, code={group.community_code}, active={group.code_active}")
-        
-        if exists:
-            # Update existing group
-            logger.info(f"Updating existing group {group.id}")
-            self.conn.execute("""
-                UPDATE community_groups 
-                SET name = ?, description = ?, group_type = ?, tags = ?, location = ?, 
-                    admin_id = ?, trust_level = ?, preferred_channels = ?, invite_slug = ?, 
-                    community_code = ?, code_active = ?, active = ?
-                WHERE id = ?
-            """, (group.name, group.description, group.group_type, group.tags, group.location, 
-                  group.admin_id, group.trust_level, group.preferred_channels, group.invite_slug, 
-                  group.community_code, group.code_active, group.active, group.id))
-        else:
-            # Insert new group
-            logger.info(f"Inserting new group {group.id}")
-            self.conn.execute("""
-                INSERT INTO community_groups (id, name, description, group_type, tags, location, admin_id, trust_level, preferred_channels, invite_slug, community_code, code_active, active, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (group.id, group.name, group.description, group.group_type, group.tags, group.location, group.admin_id, group.trust_level, group.preferred_channels, group.invite_slug, group.community_code, group.code_active, group.active, group.created_at))
-        
-        self.conn.commit()
-        logger.info(f"Successfully saved group {group.id}")
+    # An upsert rather than INSERT OR REPLACE: replacing deletes the row first,
+    # which the foreign keys of members and events forbid. created_at is kept.
+    _save_sql = """
+        INSERT INTO community_groups (id, name, description, group_type, tags, location, admin_id, trust_level, preferred_channels, invite_slug, community_code, code_active, active, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name=excluded.name, description=excluded.description, group_type=excluded.group_type,
+            tags=excluded.tags, location=excluded.location, admin_id=excluded.admin_id,
+            trust_level=excluded.trust_level, preferred_channels=excluded.preferred_channels,
+            invite_slug=excluded.invite_slug, community_code=excluded.community_code,
+            code_active=excluded.code_active, active=excluded.active
+    """
+
+    def _save_params(self, group: CommunityGroupDTO) -> tuple:
+        return (group.id, group.name, group.description, group.group_type, group.tags, group.location, group.admin_id, group.trust_level, group.preferred_channels, group.invite_slug, group.community_code, group.code_active, group.active, group.created_at)
 
     def get_by_slug(self, slug: str) -> CommunityGroupDTO | None:
         """Fetch a single record by its invite slug."""
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.execute(f"SELECT * FROM {self.table_name} WHERE invite_slug = ?", (slug,))
-        row = cursor.fetchone()
-        return self._row_to_model(row) if row else None
+        return self._cached("slug", slug, lambda: self._first(
+            f"SELECT * FROM {self.table_name} WHERE invite_slug = ?", (slug,)
+        ))
 
     def get_by_code(self, code: str) -> CommunityGroupDTO | None:
         """Fetch a single active community by its code."""
-        self.conn.row_factory = sqlite3.Row
+        code = code.strip()
         # Case-insensitive lookup using UPPER
-        cursor = self.conn.execute(
+        return self._cached("code", code.upper(), lambda: self._first(
             f"SELECT * FROM {self.table_name} WHERE UPPER(community_code) = UPPER(?) AND code_active = 1",
-            (code.strip(),)
-        )
-        row = cursor.fetchone()
-        return self._row_to_model(row) if row else None
+            (code,)
+        ))
 
 class CommunityEventRepository(BaseRepository[CommunityEventDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, CommunityEventDTO, "community_events")
 
-    def save(self, event: CommunityEventDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO community_events (id, group_id, title, event_type, start_time, end_time, recurrence, visibility, language, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (event.id, event.group_id, event.title, event.event_type, event.start_time, event.end_time, event.recurrence, event.visibility, event.language, event.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO community_events (id, group_id, title, event_type, start_time, end_time, recurrence, visibility, language, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, event: CommunityEventDTO) -> tuple:
+        return (event.id, event.group_id, event.title, event.event_type, event.start_time, event.end_time, event.recurrence, event.visibility, event.language, event.created_at)
 
 class CommunityAnnouncementRepository(BaseRepository[CommunityAnnouncementDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, CommunityAnnouncementDTO, "community_announcements")
 
-    def save(self, announcement: CommunityAnnouncementDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO community_announcements (id, group_id, message, urgency, expires_at, target_audience, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (announcement.id, announcement.group_id, announcement.message, announcement.urgency, announcement.expires_at, announcement.target_audience, announcement.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO community_announcements (id, group_id, message, urgency, expires_at, target_audience, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, announcement: CommunityAnnouncementDTO) -> tuple:
+        return (announcement.id, announcement.group_id, announcement.message, announcement.urgency, announcement.expires_at, announcement.target_audience, announcement.created_at)
 
 class CommunityInquiryRepository(BaseRepository[CommunityInquiryDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, CommunityInquiryDTO, "community_inquiry_cache")
 
-    def save(self, inquiry: CommunityInquiryDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO community_inquiry_cache (id, group_id, normalized_question, answer, hit_count, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (inquiry.id, inquiry.group_id, inquiry.normalized_question, inquiry.answer, inquiry.hit_count, inquiry.last_updated))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO community_inquiry_cache (id, group_id, normalized_question, answer, hit_count, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, inquiry: CommunityInquiryDTO) -> tuple:
+        return (inquiry.id, inquiry.group_id, inquiry.normalized_question, inquiry.answer, inquiry.hit_count, inquiry.last_updated)
+
+class CommunityMemberRepository(BaseRepository[CommunityMemberDTO]):
+    def __init__(self, connection: sqlite3.Connection):
+        super().__init__(connection, CommunityMemberDTO, "community_members")
+
+    # An upsert: broadcast deliveries reference members, so rows are never replaced
+    _save_sql = """
+        INSERT INTO community_members (id, community_id, user_id, channel, active, joined_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            community_id=excluded.community_id, user_id=excluded.user_id,
+            channel=excluded.channel, active=excluded.active
+    """
+
+    def _save_params(self, member: CommunityMemberDTO) -> tuple:
+        return (member.id, member.community_id, member.user_id, member.channel, member.active, member.joined_at)
 
 class TransportZoneRepository(BaseRepository[TransportZoneDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, TransportZoneDTO, "transport_zones")
 
-    def save(self, zone: TransportZoneDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO transport_zones (id, name, type, location_scope, active, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (zone.id, zone.name, zone.type, zone.location_scope, zone.active, zone.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO transport_zones (id, name, type, location_scope, active, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, zone: TransportZoneDTO) -> tuple:
+        return (zone.id, zone.name, zone.type, zone.location_scope, zone.active, zone.created_at)
 
 class TrafficSignalRepository(BaseRepository[TrafficSignalDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, TrafficSignalDTO, "traffic_signals")
 
-    def save(self, signal: TrafficSignalDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO traffic_signals (id, zone_id, state, source, confidence_score, reported_at, expires_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (signal.id, signal.zone_id, signal.state, signal.source, signal.confidence_score, signal.reported_at, signal.expires_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO traffic_signals (id, zone_id, state, source, confidence_score, reported_at, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, signal: TrafficSignalDTO) -> tuple:
+        return (signal.id, signal.zone_id, signal.state, signal.source, signal.confidence_score, signal.reported_at, signal.expires_at)
 
 class TransportAvailabilityRepository(BaseRepository[TransportAvailabilityDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, TransportAvailabilityDTO, "transport_availability")
 
-    def save(self, availability: TransportAvailabilityDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO transport_availability (id, zone_id, destination, availability_state, reported_by, reported_at, expires_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (availability.id, availability.zone_id, availability.destination, availability.availability_state, availability.reported_by, availability.reported_at, availability.expires_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO transport_availability (id, zone_id, destination, availability_state, reported_by, reported_at, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, availability: TransportAvailabilityDTO) -> tuple:
+        return (availability.id, availability.zone_id, availability.destination, availability.availability_state, availability.reported_by, availability.reported_at, availability.expires_at)
 
 # --- Institutional Core Repositories (Section 1) ---
 
@@ -304,43 +985,43 @@ class InstitutionMemberRepository(BaseRepository[InstitutionMemberDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, InstitutionMemberDTO, "institution_members")
 
-    def save(self, member: InstitutionMemberDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO institution_members (id, community_id, institution_type, full_name, role_id, joined_at, active)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (member.id, member.community_id, member.institution_type, member.full_name, member.role_id, member.joined_at, member.active))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO institution_members (id, community_id, institution_type, full_name, role_id, joined_at, active)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, member: InstitutionMemberDTO) -> tuple:
+        return (member.id, member.community_id, member.institution_type, member.full_name, member.role_id, member.joined_at, member.active)
 
 class InstitutionGroupRepository(BaseRepository[InstitutionGroupDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, InstitutionGroupDTO, "institution_groups")
 
-    def save(self, group: InstitutionGroupDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO institution_groups (id, community_id, institution_type, name, description, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (group.id, group.community_id, group.institution_type, group.name, group.description, group.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO institution_groups (id, community_id, institution_type, name, description, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, group: InstitutionGroupDTO) -> tuple:
+        return (group.id, group.community_id, group.institution_type, group.name, group.description, group.created_at)
 
 class MemberVehicleMapRepository(BaseRepository[MemberVehicleMapDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, MemberVehicleMapDTO, "member_vehicle_maps")
 
-    def save(self, vmap: MemberVehicleMapDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO member_vehicle_maps (id, member_id, vehicle_type, vehicle_identity, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (vmap.id, vmap.member_id, vmap.vehicle_type, vmap.vehicle_identity, vmap.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO member_vehicle_maps (id, member_id, vehicle_type, vehicle_identity, created_at)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, vmap: MemberVehicleMapDTO) -> tuple:
+        return (vmap.id, vmap.member_id, vmap.vehicle_type, vmap.vehicle_identity, vmap.created_at)
 
     def get_by_vehicle(self, vehicle_type: str, vehicle_identity: str) -> MemberVehicleMapDTO | None:
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.execute(
+        return self._cached("vehicle", (vehicle_type, vehicle_identity), lambda: self._first(
             f"SELECT * FROM {self.table_name} WHERE vehicle_type = ? AND vehicle_identity = ?",
             (vehicle_type, vehicle_identity)
-        )
-        row = cursor.fetchone()
-        return self._row_to_model(row) if row else None
+        ))
 
     def list_by_member(self, member_id: str) -> list[MemberVehicleMapDTO]:
         """Fetch all vehicle identities for a specific member."""
@@ -355,34 +1036,37 @@ class InstitutionMessageLogRepository(BaseRepository[InstitutionMessageLogDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, InstitutionMessageLogDTO, "institution_message_logs")
 
-    def save(self, log: InstitutionMessageLogDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO institution_message_logs (id, community_id, sender_id, recipient_type, recipient_id, vehicle_type, message_type, content_hash, sent_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (log.id, log.community_id, log.sender_id, log.recipient_type, log.recipient_id, log.vehicle_type, log.message_type, log.content_hash, log.sent_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO institution_message_logs (id, community_id, sender_id, recipient_type, recipient_id, vehicle_type, message_type, content_hash, sent_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, log: InstitutionMessageLogDTO) -> tuple:
+        return (log.id, log.community_id, log.sender_id, log.recipient_type, log.recipient_id, log.vehicle_type, log.message_type, log.content_hash, log.sent_at)
 
 class PrayerRequestRepository(BaseRepository[PrayerRequestDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, PrayerRequestDTO, "prayer_requests")
 
-    def save(self, request: PrayerRequestDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO prayer_requests (id, community_id, member_id, request_text, is_anonymous, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (request.id, request.community_id, request.member_id, request.request_text, request.is_anonymous, request.status, request.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO prayer_requests (id, community_id, member_id, request_text, is_anonymous, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, request: PrayerRequestDTO) -> tuple:
+        return (request.id, request.community_id, request.member_id, request.request_text, request.is_anonymous, request.status, request.created_at)
 
 class InstitutionGroupMemberRepository(BaseRepository[InstitutionGroupMemberDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, InstitutionGroupMemberDTO, "institution_group_members")
 
-    def save(self, igm: InstitutionGroupMemberDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO institution_group_members (id, group_id, member_id, joined_at)
-            VALUES (?, ?, ?, ?)
-        """, (igm.id, igm.group_id, igm.member_id, igm.joined_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO institution_group_members (id, group_id, member_id, joined_at)
+        VALUES (?, ?, ?, ?)
+    """
+
+    def _save_params(self, igm: InstitutionGroupMemberDTO) -> tuple:
+        return (igm.id, igm.group_id, igm.member_id, igm.joined_at)
 
     def list_by_member(self, member_id: str) -> list[InstitutionGroupMemberDTO]:
         self.conn.row_factory = sqlite3.Row
@@ -401,23 +1085,25 @@ class InstitutionGroupMemberRepository(BaseRepository[InstitutionGroupMemberDTO]
         return [self._row_to_model(row) for row in cursor.fetchall()]
 
     def delete_membership(self, group_id: str, member_id: str) -> bool:
-        cursor = self.conn.execute(
-            f"DELETE FROM {self.table_name} WHERE group_id = ? AND member_id = ?",
-            (group_id, member_id)
-        )
-        self.conn.commit()
+        with write_transaction(self.conn):
+            cursor = self.conn.execute(
+                f"DELETE FROM {self.table_name} WHERE group_id = ? AND member_id = ?",
+                (group_id, member_id)
+            )
+        self._invalidate()
         return cursor.rowcount > 0
 
 class InstitutionalAttendanceRepository(BaseRepository[AttendanceRecordDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, AttendanceRecordDTO, "institutional_attendance")
 
-    def save(self, record: AttendanceRecordDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO institutional_attendance (id, community_id, member_id, service_date, service_type, status, recorded_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (record.id, record.community_id, record.member_id, record.service_date, record.service_type, record.status, record.recorded_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO institutional_attendance (id, community_id, member_id, service_date, service_type, status, recorded_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, record: AttendanceRecordDTO) -> tuple:
+        return (record.id, record.community_id, record.member_id, record.service_date, record.service_type, record.status, record.recorded_at)
 
     def get_weekly_trends(self, community_id: str) -> list[dict]:
         """Aggregate attendance by week."""
@@ -434,12 +1120,13 @@ class InstitutionalFinanceRepository(BaseRepository[FinancialLedgerDTO]):
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection, FinancialLedgerDTO, "institutional_finances")
 
-    def save(self, entry: FinancialLedgerDTO) -> None:
-        self.conn.execute("""
-            INSERT OR REPLACE INTO institutional_finances (id, community_id, member_id, amount, category, is_pledge, entry_date, notes, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (entry.id, entry.community_id, entry.member_id, entry.amount, entry.category, entry.is_pledge, entry.entry_date, entry.notes, entry.created_at))
-        self.conn.commit()
+    _save_sql = """
+        INSERT OR REPLACE INTO institutional_finances (id, community_id, member_id, amount, category, is_pledge, entry_date, notes, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _save_params(self, entry: FinancialLedgerDTO) -> tuple:
+        return (entry.id, entry.community_id, entry.member_id, entry.amount, entry.category, entry.is_pledge, entry.entry_date, entry.notes, entry.created_at)
 
     def get_category_report(self, community_id: str) -> list[dict]:
         """Sum totals by category."""
@@ -481,11 +1168,12 @@ class InstitutionalAuditRepository(BaseRepository[InstitutionAuditLogDTO]):
         """Append-only logging hook."""
         import uuid
         log_id = str(uuid.uuid4())
-        self.conn.execute(
-            f"INSERT INTO {self.table_name} (id, community_id, operator_id, action_type, target_id, details) VALUES (?, ?, ?, ?, ?, ?)",
-            (log_id, community_id, operator_id, action, target_id, details)
-        )
-        self.conn.commit()
+        with write_transaction(self.conn):
+            self.conn.execute(
+                f"INSERT INTO {self.table_name} (id, community_id, operator_id, action_type, target_id, details) VALUES (?, ?, ?, ?, ?, ?)",
+                (log_id, community_id, operator_id, action, target_id, details)
+            )
+        self._invalidate()
 
 class MessageRetryRepository(BaseRepository[MessageRetryDTO]):
     """Repository for managing the outbound message retry queue."""
@@ -503,8 +1191,9 @@ class MessageRetryRepository(BaseRepository[MessageRetryDTO]):
 
     def increment_retry(self, id: str, next_retry_seconds: int = 300) -> None:
         """Update retry count and push back next retry time."""
-        self.conn.execute(
-            f"UPDATE {self.table_name} SET retry_count = retry_count + 1, next_retry_at = datetime('now', '+{next_retry_seconds} seconds') WHERE id = ?",
-            (id,)
-        )
-        self.conn.commit()
+        with write_transaction(self.conn):
+            self.conn.execute(
+                f"UPDATE {self.table_name} SET retry_count = retry_count + 1, next_retry_at = datetime('now', '+{next_retry_seconds} seconds') WHERE id = ?",
+                (id,)
+            )
+        self._invalidate()
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Sequence
 
 from aos.bus.dispatcher import EventDispatcher
 from aos.bus.events import Event
@@ -41,6 +42,9 @@ class AgriModule(Module):
         """Register the module with the event bus."""
         # The module is primarily active (produces events)
         # But it could listen for mesh-syndicated agri events in the future
+        filled = self._farmers.backfill_blind_index()
+        if filled:
+            logger.info(f"Blind-indexed contacts of {filled} existing farmers")
         logger.info("AgriModule initialized")
 
     async def shutdown(self) -> None:
@@ -75,14 +79,27 @@ class AgriModule(Module):
 
     def get_farmer_harvests(self, farmer_id: str) -> list[HarvestDTO]:
         """Retrieve all harvests for a specific farmer."""
-        # This is a bit inefficient if we have millions of harvests,
-        # but suitable for an A-OS Edge Node.
-        all_harvests = self._harvests.list_all()
-        return [h for h in all_harvests if h.farmer_id == farmer_id]
-
-    def list_all_farmers(self) -> list[FarmerDTO]:
-        """List all farmers registered on this node."""
-        return self._farmers.list_all()
+        return self._harvests.find({"farmer_id": farmer_id})
+
+    def find_farmers_by_contact(self, contact: str) -> list[FarmerDTO]:
+        """Farmers registered with a phone number or other contact."""
+        return self._farmers.find_by_contact(contact)
+
+    def list_all_farmers(self, reveal: Sequence[str] | None = None) -> list[FarmerDTO]:
+        """
+        List all farmers registered on this node.
+
+        By default location and contact are decrypted. A caller that shows
+        only some of them names those in ``reveal``: they are decrypted in
+        batches and the rest are left as SealedValues.
+        """
+        if reveal is None:
+            return self._farmers.list_all()
+        sealed = self._farmers.sealed_reads()
+        farmers = sealed.list_all()
+        if reveal:
+            sealed.reveal(farmers, reveal)
+        return farmers
 
     def list_crops(self) -> list[CropDTO]:
         """List supported crop types."""
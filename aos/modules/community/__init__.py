@@ -13,6 +13,7 @@ Design Principles:
 """
 from __future__ import annotations
 
+import copy
 import json
 import sqlite3
 import re
@@ -21,6 +22,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from aos.bus.events import Event
+from aos.db.engine import write_transaction
 from aos.db.models import (
     CommunityAnnouncementDTO,
     CommunityEventDTO,
@@ -39,6 +41,7 @@ from .broadcast import BroadcastManager, BroadcastWorker
 
 if TYPE_CHECKING:
     from aos.bus.dispatcher import EventDispatcher
+    from aos.db.cache import RepositoryCache
 
 
 class CommunityModule:
@@ -67,6 +70,26 @@ class CommunityModule:
         """Gracefully stop background workers."""
         await self._worker.stop()
 
+    def with_connection(self, connection: sqlite3.Connection) -> CommunityModule:
+        """
+        Shallow copy of this module whose queries run on another connection.
+
+        Used by read-only routes to query through a pool reader; the copy
+        shares the dispatcher and broadcast worker with the original.
+        """
+        view = copy.copy(self)
+        view._db = connection
+        view._groups = self._groups._with_connection(connection)
+        view._events = self._events._with_connection(connection)
+        view._announcements = self._announcements._with_connection(connection)
+        view._inquiries = self._inquiries._with_connection(connection)
+        return view
+
+    def attach_cache(self, cache: RepositoryCache) -> None:
+        """Serve group lookups (codes, slugs) and the USSD listings from a cache."""
+        for repo in (self._groups, self._events, self._announcements):
+            repo.attach_cache(cache)
+
     def _log_activity(
         self,
         actor_id: str,
@@ -77,11 +100,11 @@ class CommunityModule:
     ):
         """Internal helper to record audit logs."""
         log_id = f"LOG-{uuid.uuid4().hex[:8].upper()}"
-        self._db.execute("""
-            INSERT INTO community_activity_logs (id, actor_id, action, target_id, community_id, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (log_id, actor_id, action, target_id, community_id, json.dumps(metadata) if metadata else None))
-        self._db.commit()
+        with write_transaction(self._db):
+            self._db.execute("""
+                INSERT INTO community_activity_logs (id, actor_id, action, target_id, community_id, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (log_id, actor_id, action, target_id, community_id, json.dumps(metadata) if metadata else None))
 
     # --- Group Management ---
 
@@ -217,8 +240,13 @@ class CommunityModule:
         Returns:
             Dict with 'groups', 'total', 'page', 'per_page', 'total_pages'
         """
-        # Get all groups
-        groups = [g for g in self._groups.list_all() if g.active]
+        where = {"active": True}
+        if group_type:
+            # We treat the first tag or the explicit group_type field as the type
+            where["group_type"] = group_type
+        if trust_level:
+            where["trust_level"] = trust_level
+        groups = self._groups.find(where)
 
         # Apply filters
         if search_query:
@@ -230,13 +258,6 @@ class CommunityModule:
                    q in g.location.lower()
             ]
 
-        if group_type:
-            # We treat the first tag or the explicit group_type field as the type
-            groups = [g for g in groups if g.group_type == group_type]
-
-        if trust_level:
-            groups = [g for g in groups if g.trust_level == trust_level]
-
         total = len(groups)
         total_pages = (total + per_page - 1) // per_page if total > 0 else 0
 
@@ -257,12 +278,8 @@ class CommunityModule:
 
     def get_group_types(self) -> list[str]:
         """Get unique active group types for filter dropdowns."""
-        groups = self._groups.list_all()
-        types = set()
-        for g in groups:
-            if g.active and g.group_type:
-                types.add(g.group_type)
-        return sorted(list(types))
+        groups = self._groups.find({"active": True, "group_type__ne": None})
+        return sorted({g.group_type for g in groups if g.group_type})
 
     def discover_groups(
         self,
@@ -279,13 +296,9 @@ class CommunityModule:
         Returns:
             List of matching groups
         """
-        all_groups = self._groups.list_all()
         results = []
 
-        for group in all_groups:
-            if not group.active:
-                continue
-
+        for group in self._groups.find({"active": True}):
             # Location filter
             if location and group.location:
                 if location.lower() not in group.location.lower():
@@ -521,12 +534,12 @@ class CommunityModule:
             raise ValueError(f"Invalid community_id: {community_id}")
 
         member_id = f"MEM-{uuid.uuid4().hex[:8].upper()}"
-        self._db.execute("""
-            INSERT OR IGNORE INTO community_members 
-            (id, community_id, user_id, channel, active)
-            VALUES (?, ?, ?, ?, 1)
-        """, (member_id, community_id, user_id, channel))
-        self._db.commit()
+        with write_transaction(self._db):
+            self._db.execute("""
+                INSERT OR IGNORE INTO community_members 
+                (id, community_id, user_id, channel, active)
+                VALUES (?, ?, ?, ?, 1)
+            """, (member_id, community_id, user_id, channel))
 
         self._log_activity(
             actor_id=actor_id,
@@ -537,6 +550,50 @@ class CommunityModule:
         )
         return True
 
+    def add_members_to_community(
+        self,
+        community_id: str,
+        members: list[tuple[str, str]],
+        actor_id: str = "system"
+    ) -> int:
+        """
+        Add many users to a community in one transaction (imports, seeding).
+
+        Args:
+            community_id: Community ID (REQUIRED)
+            members: (user_id, channel) pairs
+            actor_id: Operator recorded in the activity log
+
+        Returns:
+            Number of members submitted
+
+        Raises:
+            ValueError: If the community does not exist or a pair is incomplete
+        """
+        if not community_id:
+            raise ValueError("community_id is required")
+        if not self._groups.get_by_id(community_id):
+            raise ValueError(f"Invalid community_id: {community_id}")
+        if any(not user_id or not channel for user_id, channel in members):
+            raise ValueError("user_id and channel are required for every member")
+
+        rows = [(f"MEM-{uuid.uuid4().hex[:8].upper()}", user_id, channel) for user_id, channel in members]
+        with write_transaction(self._db):
+            self._db.executemany("""
+                INSERT OR IGNORE INTO community_members
+                (id, community_id, user_id, channel, active)
+                VALUES (?, ?, ?, ?, 1)
+            """, [(member_id, community_id, user_id, channel) for member_id, user_id, channel in rows])
+            self._db.executemany("""
+                INSERT INTO community_activity_logs (id, actor_id, action, target_id, community_id, metadata)
+                VALUES (?, ?, 'member_add', ?, ?, ?)
+            """, [
+                (f"LOG-{uuid.uuid4().hex[:8].upper()}", actor_id, member_id, community_id,
+                 json.dumps({"user_id": user_id, "channel": channel}))
+                for member_id, user_id, channel in rows
+            ])
+        return len(rows)
+
     def remove_member_from_community(
         self,
         community_id: str,
@@ -555,12 +612,12 @@ class CommunityModule:
         Returns:
             True if removed successfully
         """
-        self._db.execute("""
-            UPDATE community_members 
-            SET active = 0 
-            WHERE community_id = ? AND user_id = ? AND channel = ?
-        """, (community_id, user_id, channel))
-        self._db.commit()
+        with write_transaction(self._db):
+            self._db.execute("""
+                UPDATE community_members 
+                SET active = 0 
+                WHERE community_id = ? AND user_id = ? AND channel = ?
+            """, (community_id, user_id, channel))
 
         self._log_activity(
             actor_id=actor_id,
@@ -589,12 +646,12 @@ class CommunityModule:
         Returns:
             True if updated successfully
         """
-        self._db.execute("""
-            UPDATE community_members 
-            SET user_id = ?, channel = ? 
-            WHERE id = ?
-        """, (user_id, channel, member_id))
-        self._db.commit()
+        with write_transaction(self._db):
+            self._db.execute("""
+                UPDATE community_members 
+                SET user_id = ?, channel = ? 
+                WHERE id = ?
+            """, (user_id, channel, member_id))
 
         self._log_activity(
             actor_id=actor_id,
@@ -7,6 +7,10 @@ import asyncio
 from datetime import datetime
 from typing import List, Optional, Dict, TYPE_CHECKING
 
+from aos.bus.durability import Durability
+from aos.core.resource.scheduler import TaskPriority
+from aos.db.engine import write_transaction
+
 if TYPE_CHECKING:
     from aos.bus.dispatcher import EventDispatcher
 
@@ -43,25 +47,24 @@ class BroadcastManager:
         actual_key = idempotency_key or broadcast_id
 
         try:
-            self._db.execute("""
-                INSERT INTO broadcasts (id, community_id, message, channels, status, idempotency_key, scheduled_at)
-                VALUES (?, ?, ?, ?, 'draft', ?, ?)
-            """, (
-                broadcast_id,
-                community_id,
-                message,
-                json.dumps(channels),
-                actual_key,
-                scheduled_at.isoformat() if scheduled_at else None
-            ))
-            
-            # Audit log
-            self._log_audit(actor_id, "create", broadcast_id, {
-                "community_id": community_id,
-                "idempotency_key": actual_key
-            })
-            
-            self._db.commit()
+            with write_transaction(self._db):
+                self._db.execute("""
+                    INSERT INTO broadcasts (id, community_id, message, channels, status, idempotency_key, scheduled_at)
+                    VALUES (?, ?, ?, ?, 'draft', ?, ?)
+                """, (
+                    broadcast_id,
+                    community_id,
+                    message,
+                    json.dumps(channels),
+                    actual_key,
+                    scheduled_at.isoformat() if scheduled_at else None
+                ))
+
+                # Audit log
+                self._log_audit(actor_id, "create", broadcast_id, {
+                    "community_id": community_id,
+                    "idempotency_key": actual_key
+                })
             return broadcast_id
         except sqlite3.IntegrityError as e:
             if "UNIQUE constraint failed: broadcasts.idempotency_key" in str(e):
@@ -73,38 +76,39 @@ class BroadcastManager:
 
     def approve_broadcast(self, broadcast_id: str, actor_id: str):
         """Transition from draft to approved/queued."""
-        self._db.execute("""
-            UPDATE broadcasts 
-            SET status = 'approved' 
-            WHERE id = ? AND status = 'draft'
-        """, (broadcast_id,))
-        
-        if self._db.total_changes > 0:
+        with write_transaction(self._db):
+            self._db.execute("""
+                UPDATE broadcasts 
+                SET status = 'approved' 
+                WHERE id = ? AND status = 'draft'
+            """, (broadcast_id,))
+
+            if self._db.total_changes == 0:
+                return False
             self._log_audit(actor_id, "approve", broadcast_id)
-            self._db.commit()
-            return True
-        return False
+        return True
 
     def queue_broadcast(self, broadcast_id: str, actor_id: str):
         """Move to queued state for workers to pick up."""
-        self._db.execute("""
-            UPDATE broadcasts 
-            SET status = 'queued' 
-            WHERE id = ? AND status = 'approved'
-        """, (broadcast_id,))
-        
-        if self._db.total_changes > 0:
+        with write_transaction(self._db):
+            self._db.execute("""
+                UPDATE broadcasts 
+                SET status = 'queued' 
+                WHERE id = ? AND status = 'approved'
+            """, (broadcast_id,))
+
+            if self._db.total_changes == 0:
+                return False
             self._log_audit(actor_id, "queue", broadcast_id)
-            self._db.commit()
-            return True
-        return False
+        return True
 
     def get_broadcast(self, broadcast_id: str) -> Optional[Dict]:
         """Fetch broadcast details."""
-        res = self._db.execute("SELECT * FROM broadcasts WHERE id = ?", (broadcast_id,)).fetchone()
+        cursor = self._db.execute("SELECT * FROM broadcasts WHERE id = ?", (broadcast_id,))
+        res = cursor.fetchone()
         if res:
             # Simple row-to-dict mapping (schema known from Migration 010)
-            columns = [column[0] for column in self._db.execute("SELECT * FROM broadcasts LIMIT 0").description]
+            columns = [column[0] for column in cursor.description]
             return dict(zip(columns, res))
         return None
 
@@ -113,30 +117,30 @@ class BroadcastManager:
         Atomically lease the next queued broadcast.
         Uses a lock_owner and locked_at for worker safety.
         """
-        # 1. Find an eligible broadcast (either queued or expired lease)
-        res = self._db.execute("""
-            SELECT id FROM broadcasts 
-            WHERE status = 'queued' 
-            AND (locked_at IS NULL OR locked_at < datetime('now', ?))
-            LIMIT 1
-        """, (f"-{lease_duration_seconds} seconds",)).fetchone()
-        
-        if not res:
-            return None
-            
-        broadcast_id = res[0]
-        
-        # 2. Try to lock it
-        self._db.execute("""
-            UPDATE broadcasts 
-            SET lock_owner = ?, locked_at = CURRENT_TIMESTAMP, status = 'processing'
-            WHERE id = ? AND (locked_at IS NULL OR locked_at < datetime('now', ?) OR status = 'queued')
-        """, (owner_id, broadcast_id, f"-{lease_duration_seconds} seconds"))
-        
-        if self._db.total_changes > 0:
-            self._db.commit()
-            return broadcast_id
-        return None
+        with write_transaction(self._db):
+            # 1. Find an eligible broadcast (either queued or expired lease)
+            res = self._db.execute("""
+                SELECT id FROM broadcasts 
+                WHERE status = 'queued' 
+                AND (locked_at IS NULL OR locked_at < datetime('now', ?))
+                LIMIT 1
+            """, (f"-{lease_duration_seconds} seconds",)).fetchone()
+
+            if not res:
+                return None
+
+            broadcast_id = res[0]
+
+            # 2. Try to lock it
+            self._db.execute("""
+                UPDATE broadcasts 
+                SET lock_owner = ?, locked_at = CURRENT_TIMESTAMP, status = 'processing'
+                WHERE id = ? AND (locked_at IS NULL OR locked_at < datetime('now', ?) OR status = 'queued')
+            """, (owner_id, broadcast_id, f"-{lease_duration_seconds} seconds"))
+
+            if self._db.total_changes == 0:
+                return None
+        return broadcast_id
 
     def resolve_recipients(self, broadcast_id: str):
         """
@@ -151,18 +155,17 @@ class BroadcastManager:
         
         # 1. Insert deliveries for all active members (idempotent via status check or primary key if we had one)
         # We use a subquery to avoid loading 1M+ members into memory
-        self._db.execute("""
-            INSERT INTO broadcast_deliveries (id, broadcast_id, member_id, channel, status)
-            SELECT ('BDEL-' || SUBSTR(HEX(RANDOMBLOB(4)), 1, 8)), ?, id, channel, 'pending'
-            FROM community_members
-            WHERE community_id = ? AND active = 1
-            AND NOT EXISTS (
-                SELECT 1 FROM broadcast_deliveries 
-                WHERE broadcast_id = ? AND member_id = community_members.id
-            )
-        """, (broadcast_id, community_id, broadcast_id))
-        
-        self._db.commit()
+        with write_transaction(self._db):
+            self._db.execute("""
+                INSERT INTO broadcast_deliveries (id, broadcast_id, member_id, channel, status)
+                SELECT ('BDEL-' || SUBSTR(HEX(RANDOMBLOB(4)), 1, 8)), ?, id, channel, 'pending'
+                FROM community_members
+                WHERE community_id = ? AND active = 1
+                AND NOT EXISTS (
+                    SELECT 1 FROM broadcast_deliveries 
+                    WHERE broadcast_id = ? AND member_id = community_members.id
+                )
+            """, (broadcast_id, community_id, broadcast_id))
 
     def fetch_pending_deliveries(self, broadcast_id: str, limit: int = 100) -> List[Dict]:
         """Fetch a batch of pending deliveries."""
@@ -179,39 +182,39 @@ class BroadcastManager:
 
     def update_delivery_status(self, delivery_id: str, status: str, error: Optional[str] = None):
         """Update individual delivery status."""
-        self._db.execute("""
-            UPDATE broadcast_deliveries 
-            SET status = ?, error = ?, sent_at = CASE WHEN ? = 'sent' THEN CURRENT_TIMESTAMP ELSE sent_at END
-            WHERE id = ?
-        """, (status, error, status, delivery_id))
-        self._db.commit()
+        with write_transaction(self._db):
+            self._db.execute("""
+                UPDATE broadcast_deliveries 
+                SET status = ?, error = ?, sent_at = CASE WHEN ? = 'sent' THEN CURRENT_TIMESTAMP ELSE sent_at END
+                WHERE id = ?
+            """, (status, error, status, delivery_id))
 
     def complete_broadcast(self, broadcast_id: str, actor_id: str):
         """Mark broadcast as completed and release lock."""
-        # Calculate summary statistics
-        stats = self._db.execute("""
-            SELECT 
-                COUNT(CASE WHEN status = 'sent' THEN 1 END) as sent,
-                COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed
-            FROM broadcast_deliveries 
-            WHERE broadcast_id = ?
-        """, (broadcast_id,)).fetchone()
-        
-        self._db.execute("""
-            UPDATE broadcasts 
-            SET status = 'completed', 
-                sent_count = ?, 
-                failed_count = ?,
-                lock_owner = NULL,
-                locked_at = NULL
-            WHERE id = ?
-        """, (stats[0], stats[1], broadcast_id))
-        
-        self._log_audit(actor_id, "complete", broadcast_id, {
-            "sent": stats[0],
-            "failed": stats[1]
-        })
-        self._db.commit()
+        with write_transaction(self._db):
+            # Calculate summary statistics
+            stats = self._db.execute("""
+                SELECT 
+                    COUNT(CASE WHEN status = 'sent' THEN 1 END) as sent,
+                    COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed
+                FROM broadcast_deliveries 
+                WHERE broadcast_id = ?
+            """, (broadcast_id,)).fetchone()
+
+            self._db.execute("""
+                UPDATE broadcasts 
+                SET status = 'completed', 
+                    sent_count = ?, 
+                    failed_count = ?,
+                    lock_owner = NULL,
+                    locked_at = NULL
+                WHERE id = ?
+            """, (stats[0], stats[1], broadcast_id))
+
+            self._log_audit(actor_id, "complete", broadcast_id, {
+                "sent": stats[0],
+                "failed": stats[1]
+            })
 
     def _log_audit(self, actor_id: str, action: str, broadcast_id: str, metadata: Optional[Dict] = None):
         """Internal audit logger."""
@@ -242,8 +245,11 @@ class BroadcastWorker:
         self._worker_id = f"WRK-{uuid.uuid4().hex[:4].upper()}"
         
         # Register event listeners for delivery confirmations
-        self._dispatcher.subscribe("MESSAGE_SENT", self._handle_message_sent)
-        self._dispatcher.subscribe("MESSAGE_FAILED", self._handle_message_failed)
+        self._dispatcher.subscribe("MESSAGE_SENT", self._handle_message_sent, priority=TaskPriority.LOW)
+        self._dispatcher.subscribe("MESSAGE_FAILED", self._handle_message_failed, priority=TaskPriority.LOW)
+        # Confirmations only update delivery rows that are persisted anyway
+        self._dispatcher.set_durability("MESSAGE_SENT", Durability.BEST_EFFORT)
+        self._dispatcher.set_durability("MESSAGE_FAILED", Durability.BEST_EFFORT)
 
     async def _handle_message_sent(self, event):
         """Handle successful message delivery confirmation."""
@@ -327,7 +333,7 @@ class BroadcastWorker:
                             "content": broadcast['message'],
                             "correlation_id": delivery['id']
                         }
-                    ))
+                    ), priority=TaskPriority.LOW)  # Fan-out must not delay interactive sessions
                     # NOTE: Status update happens via MESSAGE_SENT/MESSAGE_FAILED events
                     # This ensures accurate tracking based on adapter confirmation
                 except Exception as e:
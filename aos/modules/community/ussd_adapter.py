@@ -106,9 +106,7 @@ class CommunityUSSDHandler:
     async def _show_announcements(self, session: USSDSession, group_id: str | None = None) -> ChannelResponse:
         # For demo, list all recent ones if no group_id
         if not self.community: return ChannelResponse("Offline", False)
-        anns = self.community._announcements.list_all()
-        if group_id:
-            anns = [a for a in anns if a.group_id == group_id]
+        anns = self.community._announcements.find({"group_id": group_id} if group_id else None, limit=1)
         
         if not anns:
             return ChannelResponse("No recent announcements.", False)
@@ -118,9 +116,7 @@ class CommunityUSSDHandler:
 
     async def _show_events(self, session: USSDSession, group_id: str | None = None) -> ChannelResponse:
         if not self.community: return ChannelResponse("Offline", False)
-        evts = self.community._events.list_all()
-        if group_id:
-            evts = [e for e in evts if e.group_id == group_id]
+        evts = self.community._events.find({"group_id": group_id} if group_id else None, limit=1)
         
         if not evts:
             return ChannelResponse("No upcoming events.", False)
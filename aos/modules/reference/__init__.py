@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 
 from aos.bus.dispatcher import EventDispatcher
+from aos.bus.durability import Durability
 from aos.bus.events import Event
 from aos.core.module import Module
 
@@ -24,6 +25,8 @@ class ReferenceModule(Module):
         """Register listeners."""
         # Subscribe to ping events
         self.dispatcher.subscribe("system.ping", self.handle_event)
+        # Pongs are answers to a live caller; nothing to recover after a crash
+        self.dispatcher.set_durability("system.pong", Durability.EPHEMERAL)
 
     async def shutdown(self) -> None:
         """Cleanup resources."""
@@ -73,6 +73,28 @@ class TransportModule(Module):
         self._zones.save(zone)
         return zone_id
 
+    def register_zones(self, zones: List[Dict]) -> List[str]:
+        """
+        Register many zones in one batch write (seeding, imports).
+
+        Args:
+            zones: Dicts with the register_zone arguments (name, type, location_scope)
+
+        Returns:
+            The new zone ids, in input order
+        """
+        dtos = [
+            TransportZoneDTO(
+                id=str(uuid.uuid4()),
+                name=z["name"],
+                type=z["type"],
+                location_scope=z.get("location_scope")
+            )
+            for z in zones
+        ]
+        self._zones.save_many(dtos)
+        return [z.id for z in dtos]
+
     def report_traffic_signal(
         self,
         zone_id: str,
@@ -141,17 +163,15 @@ class TransportModule(Module):
         now = datetime.utcnow()
         
         # 1. Fetch active signals
-        all_signals = self._signals.list_all()
         active_signals = [
-            s for s in all_signals 
-            if s.zone_id == zone_id and (s.expires_at is None or s.expires_at > now)
+            s for s in self._signals.find({"zone_id": zone_id})
+            if s.expires_at is None or s.expires_at > now
         ]
         
         # 2. Fetch active availabilities
-        all_avail = self._availabilities.list_all()
         active_avail = [
-            a for a in all_avail 
-            if a.zone_id == zone_id and (a.expires_at is None or a.expires_at > now)
+            a for a in self._availabilities.find({"zone_id": zone_id})
+            if a.expires_at is None or a.expires_at > now
         ]
         
         # Aggregate signal consensus
@@ -178,16 +198,12 @@ class TransportModule(Module):
         type_filter: Optional[str] = None
     ) -> List[TransportZoneDTO]:
         """Find transport zones by location or type."""
-        all_zones = self._zones.list_all()
-        filtered = all_zones
-        
+        where = {}
         if location_scope:
-            filtered = [z for z in filtered if z.location_scope and location_scope.lower() in z.location_scope.lower()]
-            
+            where["location_scope__contains"] = location_scope
         if type_filter:
-            filtered = [z for z in filtered if z.type == type_filter]
-            
-        return filtered
+            where["type"] = type_filter
+        return self._zones.find(where)
 
     def get_avoidance_summary(self, location_scope: Optional[str] = None) -> List[Dict]:
         """
@@ -209,10 +225,9 @@ class TransportModule(Module):
         
         for zone in zones:
             # Get active signals for this zone
-            all_signals = self._signals.list_all()
             active_signals = [
-                s for s in all_signals 
-                if s.zone_id == zone.id and (s.expires_at is None or s.expires_at > now)
+                s for s in self._signals.find({"zone_id": zone.id})
+                if s.expires_at is None or s.expires_at > now
             ]
             
             if not active_signals:
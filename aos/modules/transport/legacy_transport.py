@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from aos.bus.dispatcher import EventDispatcher
 from aos.bus.events import Event
 from aos.core.module import Module
+from aos.db.engine import write_transaction
 
 if TYPE_CHECKING:
     from aos.core.resource import ResourceManager
@@ -49,12 +50,12 @@ class TransportModule(Module):
 
     def update_vehicle_status(self, plate: str, status: str, route_id: str | None = None) -> bool:
         """Update vehicle availability or route."""
-        cursor = self._db.cursor()
-        cursor.execute(
-            "UPDATE vehicles SET current_status = ?, current_route_id = ?, last_seen = CURRENT_TIMESTAMP WHERE plate_number = ?",
-            (status.upper(), route_id, plate.upper())
-        )
-        self._db.commit()
+        with write_transaction(self._db):
+            cursor = self._db.cursor()
+            cursor.execute(
+                "UPDATE vehicles SET current_status = ?, current_route_id = ?, last_seen = CURRENT_TIMESTAMP WHERE plate_number = ?",
+                (status.upper(), route_id, plate.upper())
+            )
 
         if cursor.rowcount > 0:
             # Dispatch event
@@ -31,16 +31,17 @@ async def seed_simulation():
     # 2. Seed Zones (The Skeleton)
     logger.info("  ...Creating Zones")
     
-    # Major Roads
-    waiyaki_id = module.register_zone("Waiyaki Way", "road", "Westlands")
-    thika_id = module.register_zone("Thika Road", "road", "Nairobi")
-    mombasa_id = module.register_zone("Mombasa Road", "road", "Nairobi")
-    langata_id = module.register_zone("Langata Road", "road", "Nairobi")
-    
-    # Key Hubs
-    cdb_id = module.register_zone("CBD", "area", "Nairobi")
-    westlands_id = module.register_zone("Westlands", "area", "Nairobi")
-    railways_id = module.register_zone("Railways Station", "stage", "CBD")
+    waiyaki_id, thika_id, mombasa_id, langata_id, cdb_id, westlands_id, railways_id = module.register_zones([
+        # Major Roads
+        {"name": "Waiyaki Way", "type": "road", "location_scope": "Westlands"},
+        {"name": "Thika Road", "type": "road", "location_scope": "Nairobi"},
+        {"name": "Mombasa Road", "type": "road", "location_scope": "Nairobi"},
+        {"name": "Langata Road", "type": "road", "location_scope": "Nairobi"},
+        # Key Hubs
+        {"name": "CBD", "type": "area", "location_scope": "Nairobi"},
+        {"name": "Westlands", "type": "area", "location_scope": "Nairobi"},
+        {"name": "Railways Station", "type": "stage", "location_scope": "CBD"},
+    ])
     
     logger.info(f"    - Created 7 zones (Waiyaki, Thika, Mombasa, Langata, CBD, Westlands, Railways)")
 
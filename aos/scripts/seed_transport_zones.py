@@ -5,7 +5,7 @@ Populates the database with real Nairobi transport zones for testing Transport M
 """
 from aos.db.engine import connect
 from aos.db.migrations import MigrationManager
-from aos.db.migrations.registry import MIGRATIONS
+from aos.db.migrations.registry import MIGRATIONS, SNAPSHOT
 from aos.core.config import Settings
 from aos.bus.dispatcher import EventDispatcher
 from aos.modules.transport import TransportModule
@@ -20,7 +20,7 @@ def seed_nairobi_zones():
     
     # Run migrations
     mgr = MigrationManager(db_conn)
-    mgr.apply_migrations(MIGRATIONS)
+    mgr.apply_migrations(MIGRATIONS, snapshot=SNAPSHOT)
     
     # Initialize Transport Module
     dispatcher = EventDispatcher()
@@ -127,14 +127,10 @@ def seed_nairobi_zones():
         }
     ]
     
-    # Register zones
+    # Register zones (one batch write)
     registered_zones = []
-    for zone_data in zones:
-        zone_id = transport.register_zone(
-            name=zone_data["name"],
-            type=zone_data["type"],
-            location_scope=zone_data["location_scope"]
-        )
+    zone_ids = transport.register_zones(zones)
+    for zone_id, zone_data in zip(zone_ids, zones):
         registered_zones.append({
             "id": zone_id,
             "name": zone_data["name"],
@@ -46,7 +46,7 @@ def main():
     # Initialize components
     from aos.db.engine import connect
     from aos.db.migrations import MigrationManager
-    from aos.db.migrations.registry import MIGRATIONS
+    from aos.db.migrations.registry import MIGRATIONS, SNAPSHOT
     from aos.core.config import Settings
     
     settings = Settings()
@@ -54,7 +54,7 @@ def main():
     
     # Run migrations
     mgr = MigrationManager(db_conn)
-    mgr.apply_migrations(MIGRATIONS)
+    mgr.apply_migrations(MIGRATIONS, snapshot=SNAPSHOT)
     
     # Initialize event bus
     event_bus = EventDispatcher()
@@ -0,0 +1,60 @@
+"""
+Shared helpers for the benchmark scripts: a migrated scratch database,
+best-of-N timing and the report printed when a script is run directly.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from aos.db.engine import connect
+from aos.db.migrations import MigrationManager
+from aos.db.migrations.registry import MIGRATIONS
+
+if TYPE_CHECKING:
+    from aos.db.migrations.snapshot import SchemaSnapshot
+
+R = TypeVar("R")
+
+
+def migrated_db(db_path: Path, snapshot: SchemaSnapshot | None = None) -> sqlite3.Connection:
+    """Connection to ``db_path`` brought to the current schema, without the migrations' output."""
+    conn = connect(str(db_path))
+    with contextlib.redirect_stdout(io.StringIO()):
+        MigrationManager(conn).apply_migrations(MIGRATIONS, snapshot=snapshot)
+    return conn
+
+
+def timed(fn: Callable[[], R], repeat: int = 5) -> tuple[float, R]:
+    """Best wall time of fn() in milliseconds, and its last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+@contextlib.contextmanager
+def scratch_dir() -> Iterator[Path]:
+    """Temporary directory for a run's database files."""
+    with tempfile.TemporaryDirectory() as td:
+        yield Path(td)
+
+
+def report(title: str, *lines: str) -> None:
+    """Write one benchmark's results under a header."""
+    sys.stdout.write("\n".join((f"--- {title} ---", *lines)) + "\n")
+
+
+def environment() -> str:
+    """SQLite version and CPU count, for the last line of a report."""
+    return f"SQLite {sqlite3.sqlite_version}, {os.cpu_count()} CPU"
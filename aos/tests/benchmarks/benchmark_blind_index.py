@@ -0,0 +1,65 @@
+import os
+import time
+import uuid
+from pathlib import Path
+
+from aos.core.security.encryption import SymmetricEncryption
+from aos.db.models import FarmerDTO
+from aos.db.repository import FarmerRepository, normalize_contact
+from aos.tests.benchmarks._harness import environment, migrated_db, report, scratch_dir, timed
+
+
+def run_lookup_by_contact(db_path: Path, row_count: int = 200_000) -> dict[str, float]:
+    """
+    Compare finding a farmer by phone by decrypting every row (the only
+    option before the blind index) with one indexed query on contact_bidx,
+    and time the backfill of a table written before the column existed.
+
+    Returns milliseconds per lookup and for the backfill.
+    """
+    conn = migrated_db(db_path)
+    farmers = FarmerRepository(conn, SymmetricEncryption(os.urandom(32)))
+
+    results = {"rows": row_count}
+    start = time.perf_counter()
+    farmers.save_many(
+        (
+            FarmerDTO(id=str(uuid.uuid4()), name=f"Farmer {i}", location=f"Ward {i % 500}",
+                      contact=f"+2547{i:08d}")
+            for i in range(row_count)
+        ),
+        chunk_size=5000,
+    )
+    results["seed_s"] = time.perf_counter() - start
+
+    wanted = f"+254 7{row_count // 2 + 1:08d}"
+
+    def decrypt_all() -> list[FarmerDTO]:
+        return [f for f in farmers.list_all() if normalize_contact(f.contact) == normalize_contact(wanted)]
+
+    results["decrypt_all_ms"], old = timed(decrypt_all, 1)
+    results["blind_index_ms"], new = timed(lambda: farmers.find_by_contact(wanted), 50)
+    assert [f.id for f in old] == [f.id for f in new] and len(new) == 1
+
+    conn.execute("UPDATE farmers SET contact_bidx = NULL")
+    conn.commit()
+    start = time.perf_counter()
+    assert farmers.backfill_blind_index(batch_size=5000) == row_count
+    results["backfill_s"] = time.perf_counter() - start
+
+    conn.close()
+    return results
+
+
+if __name__ == "__main__":
+    # To run: python -m aos.tests.benchmarks.benchmark_blind_index
+    with scratch_dir() as td:
+        r = run_lookup_by_contact(td / "farmers.db")
+    report(
+        f"BLIND INDEX BENCHMARK ({r['rows']:,} encrypted farmers)",
+        f"Seeding with save_many: {r['seed_s']:.1f} s",
+        f"Lookup by phone: decrypt all {r['decrypt_all_ms']:.0f} ms, "
+        f"blind index {r['blind_index_ms']:.3f} ms ({r['decrypt_all_ms'] / r['blind_index_ms']:,.0f}x)",
+        f"Backfill of every row: {r['backfill_s']:.1f} s",
+        environment(),
+    )
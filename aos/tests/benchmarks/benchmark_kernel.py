@@ -1,28 +1,48 @@
 import asyncio
+import gc
 import time
+import tracemalloc
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
 
+from aos.bus.codec import BinaryCodec, EventCodec, JsonCodec
 from aos.bus.dispatcher import EventDispatcher
 from aos.bus.event_store import EventStore
 from aos.bus.events import Event
-from aos.db.engine import connect
-from aos.db.migrations import MigrationManager
-from aos.db.migrations.registry import MIGRATIONS
+from aos.bus.journal import JournalStore
+from aos.tests.benchmarks._harness import environment, migrated_db, report, scratch_dir
 
 
 class NoOpHandler:
-    async def handle(self, event: Event):
+    async def handle(self, event: Event) -> None:
         pass
 
-async def run_throughput_test(tmp_path, event_count=1000):
+async def run_throughput_test(
+    tmp_path: Path,
+    event_count: int = 1000,
+    group_commit: bool = False,
+    concurrency: int = 1,
+    backend: str = "sqlite",
+) -> tuple[float, float]:
     """
     Measure how many events per second the kernel can ingest and persist.
-    """
-    db_path = tmp_path / "bench.db"
-    conn = connect(str(db_path))
-    MigrationManager(conn).apply_migrations(MIGRATIONS)
-    conn.close()
 
-    store = EventStore(str(db_path))
+    With concurrency > 1, events are dispatched in waves of concurrent
+    publishers (as during a broadcast fan-out), which is what lets
+    group commit amortise one fsync over many writes.
+
+    ``backend`` selects the SQLite EventStore or the segmented JournalStore.
+    Both sync on the event loop thread, so the numbers are comparable.
+    """
+    if backend == "journal":
+        store = JournalStore(str(tmp_path / f"bench_journal_{concurrency}"), sync_in_thread=False)
+    else:
+        db_path = tmp_path / f"bench_{'group' if group_commit else 'single'}_{concurrency}.db"
+        migrated_db(db_path).close()
+        store = EventStore(str(db_path), group_commit=group_commit)
     await store.initialize()
     dispatcher = EventDispatcher(store)
     handler = NoOpHandler()
@@ -30,10 +50,18 @@ async def run_throughput_test(tmp_path, event_count=1000):
 
     start_time = time.time()
 
-    # Burst 1000 events
-    for i in range(event_count):
-        event = Event(name="bench.event", payload={"i": i})
-        await dispatcher.dispatch(event)
+    # Burst events, `concurrency` publishers at a time
+    for offset in range(0, event_count, concurrency):
+        wave = range(offset, min(offset + concurrency, event_count))
+        await asyncio.gather(*[
+            dispatcher.dispatch(Event(name="bench.event", payload={"i": i}))
+            for i in wave
+        ])
+
+    # Include the trailing completion writes in the measurement
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    await asyncio.gather(*pending)
+    await store.flush()
 
     duration = time.time() - start_time
     rate = event_count / duration
@@ -41,17 +69,185 @@ async def run_throughput_test(tmp_path, event_count=1000):
     await store.shutdown()
     return rate, duration
 
+async def run_group_commit_comparison(
+    tmp_path: Path, event_count: int = 1000, concurrency: int = 50
+) -> tuple[float, float]:
+    """Compare events/sec with group commit off and on."""
+    single_rate, _ = await run_throughput_test(tmp_path, event_count, False, concurrency)
+    group_rate, _ = await run_throughput_test(tmp_path, event_count, True, concurrency)
+    return single_rate, group_rate
+
+async def run_backend_comparison(
+    tmp_path: Path, event_count: int = 1000, concurrency: int = 50
+) -> dict[str, float]:
+    """Compare events/sec of the SQLite store (with and without group commit) and the journal."""
+    return {
+        "sqlite": (await run_throughput_test(tmp_path, event_count, False, concurrency))[0],
+        "sqlite_group": (await run_throughput_test(tmp_path, event_count, True, concurrency))[0],
+        "journal": (await run_throughput_test(tmp_path, event_count, concurrency=concurrency, backend="journal"))[0],
+    }
+
+def _bench_event(i: int) -> Event:
+    """A typical broadcast event: short strings, a few numbers, small metadata."""
+    return Event(
+        name="message.sent",
+        payload={
+            "to": f"+2547{i:08d}",
+            "channel": "sms",
+            "content": "Mkutano wa wakulima kesho saa tatu asubuhi",
+            "broadcast_id": f"bc-{i // 100}",
+            "attempt": 1,
+            "cost": 0.8,
+            "delivered": True,
+        },
+        correlation_id=f"corr-{i}",
+        metadata={"community_id": "c-17", "lane": "low"},
+    )
+
+async def run_codec_comparison(
+    tmp_path: Path, event_count: int = 5000, codecs: Sequence[EventCodec] | None = None
+) -> dict[str, dict[str, float]]:
+    """
+    Compare event codecs: encode and decode cost per event, and on-disk
+    bytes per event (payload, metadata and timestamp columns).
+
+    Decode goes through EventStore._row_to_event, i.e. the full path a
+    recovered or replayed event takes.
+    """
+    events = [_bench_event(i) for i in range(event_count)]
+    results = {}
+
+    for codec in codecs or (JsonCodec(), BinaryCodec()):
+        start = time.perf_counter()
+        rows = [
+            (e.id, e.name, codec.encode(e.payload), e.correlation_id,
+             codec.encode_event_timestamp(e), e.source_node, codec.encode(e.metadata))
+            for e in events
+        ]
+        encode_us = (time.perf_counter() - start) / event_count * 1e6
+
+        start = time.perf_counter()
+        for row in rows:
+            EventStore._row_to_event(row)
+        decode_us = (time.perf_counter() - start) / event_count * 1e6
+
+        store = EventStore(str(tmp_path / f"codec_{codec.name}.db"), codec=codec)
+        await store.initialize()
+        for event in events:
+            await store.enqueue(event)
+        stored = store._conn.execute(
+            "SELECT SUM(LENGTH(CAST(payload AS BLOB)) + LENGTH(CAST(metadata AS BLOB)) "
+            "+ LENGTH(CAST(timestamp AS BLOB))) FROM events"
+        ).fetchone()[0]
+        await store.shutdown()
+
+        results[codec.name] = {
+            "encode_us": encode_us,
+            "decode_us": decode_us,
+            "bytes_per_event": stored / event_count,
+        }
+
+    return results
+
+@dataclass(frozen=True)
+class _DataclassEvent:
+    """The previous Event definition, kept as the footprint baseline."""
+    name: str
+    payload: dict
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    correlation_id: str | None = None
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    source_node: str | None = None
+    metadata: dict = field(default_factory=dict)
+
+def run_event_footprint(event_count: int = 100_000) -> dict[str, dict[str, float]]:
+    """
+    Compare Event with the frozen dataclass it replaced: bytes held per
+    event (including its id, timestamp and metadata, excluding the shared
+    payload) and construction time.
+
+    Events are measured as created on publish, and again once journaled
+    with the binary codec, which formats the id and reads the integer clock.
+    """
+    payload = {"farmer_id": "f-1", "crop": "maize"}
+    results = {}
+
+    for label, cls in (("dataclass", _DataclassEvent), ("slotted", Event)):
+        start = time.perf_counter()
+        for _ in range(event_count):
+            cls("bench.event", payload)
+        construct_us = (time.perf_counter() - start) / event_count * 1e6
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        events = [cls("bench.event", payload) for _ in range(event_count)]
+        created = tracemalloc.get_traced_memory()[0] - before
+        for e in events:
+            e.id, getattr(e, "timestamp_ns", None)  # noqa: B018 - as read by a binary-codec store
+        read = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        # The list holding the events is not part of their footprint
+        list_bytes = 8 * event_count
+        results[label] = {
+            "construct_us": construct_us,
+            "bytes_per_event": (created - list_bytes) / event_count,
+            "bytes_per_event_journaled": (read - list_bytes) / event_count,
+        }
+        del events
+
+    return results
+
 if __name__ == "__main__":
     # To run: python -m aos.tests.benchmarks.benchmark_kernel
-    import tempfile
-    from pathlib import Path
-
-    with tempfile.TemporaryDirectory() as td:
-        rate, duration = asyncio.run(run_throughput_test(Path(td), 5000))
-        print("--- KERNEL BENCHMARK ---")
-        print("Events: 5000")
-        print(f"Time:   {duration:.4f}s")
-        print(f"Rate:   {rate:.2f} events/sec")
-        print("Target: >1000 events/sec")
-        print(f"Result: {'PASS' if rate > 1000 else 'FAIL'}")
-        print("------------------------")
+    with scratch_dir() as td:
+        rate, duration = asyncio.run(run_throughput_test(td, 5000))
+        report(
+            "KERNEL BENCHMARK",
+            "Events: 5000",
+            f"Time:   {duration:.4f}s",
+            f"Rate:   {rate:.2f} events/sec",
+            "Target: >1000 events/sec",
+            f"Result: {'PASS' if rate > 1000 else 'FAIL'}",
+        )
+
+        single_rate, group_rate = asyncio.run(run_group_commit_comparison(td, 5000, 50))
+        report(
+            "GROUP COMMIT (50 concurrent publishers)",
+            f"Batching off: {single_rate:.2f} events/sec",
+            f"Batching on:  {group_rate:.2f} events/sec",
+            f"Speedup:      {group_rate / single_rate:.2f}x",
+        )
+
+        results = asyncio.run(run_codec_comparison(td, 5000))
+        report(
+            "EVENT CODECS (payload + metadata + timestamp)",
+            *(
+                f"{name:<7} encode {r['encode_us']:6.2f} us  decode {r['decode_us']:6.2f} us  "
+                f"{r['bytes_per_event']:7.1f} bytes/event"
+                for name, r in results.items()
+            ),
+        )
+
+        for concurrency in (1, 50):
+            rates = asyncio.run(run_backend_comparison(td, 5000, concurrency))
+            report(
+                f"STORE BACKENDS ({concurrency} concurrent publishers)",
+                *(
+                    f"{name:<13} {rate:10.2f} events/sec  ({rate / rates['sqlite']:.2f}x)"
+                    for name, rate in rates.items()
+                ),
+            )
+
+    results = run_event_footprint(100_000)
+    report(
+        "EVENT FOOTPRINT (100000 events)",
+        *(
+            f"{name:<10} construct {r['construct_us']:5.2f} us  "
+            f"{r['bytes_per_event']:6.1f} bytes/event  "
+            f"({r['bytes_per_event_journaled']:6.1f} once journaled)"
+            for name, r in results.items()
+        ),
+        environment(),
+    )
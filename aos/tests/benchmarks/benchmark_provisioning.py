@@ -0,0 +1,42 @@
+import time
+from pathlib import Path
+
+from aos.db.migrations.registry import MIGRATIONS, SNAPSHOT
+from aos.db.migrations.snapshot import SchemaSnapshot
+from aos.tests.benchmarks._harness import environment, migrated_db, report, scratch_dir
+
+
+def _provision(db_path: Path, snapshot: SchemaSnapshot | None) -> float:
+    """Milliseconds to bring a new database file to the current schema."""
+    start = time.perf_counter()
+    conn = migrated_db(db_path, snapshot)
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed * 1000
+
+
+def run_snapshot_vs_migrations(tmp_dir: Path, repeat: int = 5) -> dict[str, float]:
+    """
+    Compare provisioning a fresh node by replaying every migration with
+    creating it from the schema snapshot in one transaction.
+
+    Returns the best of ``repeat`` runs for each path, in milliseconds.
+    """
+    results = {"migrations_ms": float("inf"), "snapshot_ms": float("inf")}
+    for i in range(repeat):
+        results["migrations_ms"] = min(results["migrations_ms"], _provision(tmp_dir / f"migrated_{i}.db", None))
+        results["snapshot_ms"] = min(results["snapshot_ms"], _provision(tmp_dir / f"snapshot_{i}.db", SNAPSHOT))
+    results["versions"] = len(MIGRATIONS)
+    return results
+
+
+if __name__ == "__main__":
+    # To run: python -m aos.tests.benchmarks.benchmark_provisioning
+    with scratch_dir() as td:
+        r = run_snapshot_vs_migrations(td)
+    report(
+        f"PROVISIONING BENCHMARK ({r['versions']} migrations, new database file)",
+        f"Replay migrations: {r['migrations_ms']:.1f} ms",
+        f"Schema snapshot:   {r['snapshot_ms']:.1f} ms ({r['migrations_ms'] / r['snapshot_ms']:.1f}x)",
+        environment(),
+    )
@@ -0,0 +1,212 @@
+import sqlite3
+import uuid
+from functools import partial
+from pathlib import Path
+
+from aos.db.models import InstitutionMemberDTO, TransportZoneDTO
+from aos.db.repository import (
+    BaseRepository,
+    CommunityMemberRepository,
+    InstitutionMemberRepository,
+    TransportZoneRepository,
+)
+from aos.tests.benchmarks._harness import environment, migrated_db, report, scratch_dir, timed
+
+
+def _seed(db_path: Path, row_count: int, communities: int) -> tuple[sqlite3.Connection, list[str]]:
+    """Migrated database with row_count members spread over the communities and row_count zones."""
+    conn = migrated_db(db_path)
+
+    community_ids = [str(uuid.uuid4()) for _ in range(communities)]
+    conn.executemany(
+        "INSERT INTO community_groups (id, name) VALUES (?, ?)",
+        [(cid, f"Community {i}") for i, cid in enumerate(community_ids)],
+    )
+    conn.executemany(
+        "INSERT INTO institution_members (id, community_id, institution_type, full_name, role_id, active)"
+        " VALUES (?, ?, 'faith', ?, ?, ?)",
+        [
+            (str(uuid.uuid4()), community_ids[i % communities], f"Member {i}",
+             "ADMIN" if i % 50 == 0 else "MEMBER", i % 10 != 0)
+            for i in range(row_count)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO transport_zones (id, name, type, location_scope) VALUES (?, ?, ?, ?)",
+        [
+            (str(uuid.uuid4()), f"Zone {i}", "stage" if i % 4 else "road", f"Ward {i % 500} / Sub-county {i % 20}")
+            for i in range(row_count)
+        ],
+    )
+    conn.commit()
+    return conn, community_ids
+
+
+def run_find_vs_list_all(
+    db_path: Path, row_count: int = 100_000, communities: int = 100, page_size: int = 50
+) -> dict[str, float]:
+    """
+    Compare loading a whole table and filtering in Python (the old
+    call-site pattern) with filtering, counting and paging in SQL.
+
+    Returns milliseconds per operation for each pair, with the matching
+    row counts so the two sides can be checked against each other.
+    """
+    conn, community_ids = _seed(db_path, row_count, communities)
+    members = InstitutionMemberRepository(conn)
+    zones = TransportZoneRepository(conn)
+    cid = community_ids[communities // 2 + 1]
+    results = {}
+
+    ms, rows = timed(lambda: [m for m in members.list_all() if m.community_id == cid and m.active], 1)
+    results["members_list_all_ms"], results["members_matched"] = ms, len(rows)
+    ms, rows = timed(lambda: members.find({"community_id": cid, "active": True}))
+    results["members_find_ms"] = ms
+    assert len(rows) == results["members_matched"]
+
+    results["count_list_all_ms"], _ = timed(lambda: len([m for m in members.list_all() if m.active]), 1)
+    results["count_sql_ms"], _ = timed(lambda: members.count({"active": True}))
+
+    # A page deep into the table: OFFSET scans the skipped rows, the keyset seeks
+    offset = row_count - page_size * 2
+    results["page_offset_ms"], page = timed(lambda: conn.execute(
+        "SELECT * FROM institution_members ORDER BY rowid LIMIT ? OFFSET ?", (page_size, offset)
+    ).fetchall())
+    cursor_id = conn.execute(
+        "SELECT id FROM institution_members ORDER BY rowid LIMIT 1 OFFSET ?", (offset - 1,)
+    ).fetchone()[0]
+    results["page_keyset_ms"], keyset_page = timed(lambda: members.find(limit=page_size, after=cursor_id))
+    assert [r["id"] for r in page] == [m.id for m in keyset_page]
+
+    def discover_old() -> list[TransportZoneDTO]:
+        return [z for z in zones.list_all() if "ward 42 /" in z.location_scope.lower() and z.type == "stage"]
+
+    ms, rows = timed(discover_old, 1)
+    results["zones_list_all_ms"], results["zones_matched"] = ms, len(rows)
+    ms, rows = timed(lambda: zones.find({"location_scope__contains": "ward 42 /", "type": "stage"}))
+    results["zones_find_ms"] = ms
+    assert len(rows) == results["zones_matched"]
+
+    # Streaming keeps one batch of models alive instead of the whole table
+    results["iter_find_ms"], streamed = timed(lambda: sum(1 for _ in members.iter_find(batch_size=1000)), 1)
+    assert streamed == row_count
+
+    conn.close()
+    return results
+
+
+def run_save_vs_save_many(db_path: Path, row_count: int = 5_000, chunk_size: int = 500) -> dict[str, float]:
+    """
+    Compare saving rows one at a time (a commit per row) with save_many
+    (one executemany and one commit per chunk).
+
+    Returns rows per second for each repository and write path.
+    """
+    conn = migrated_db(db_path)
+    community_id = str(uuid.uuid4())
+    conn.execute("INSERT INTO community_groups (id, name) VALUES (?, 'Bench')", (community_id,))
+    conn.commit()
+    zones = TransportZoneRepository(conn)
+    members = InstitutionMemberRepository(conn)
+    results = {}
+
+    def zone_batch() -> list[TransportZoneDTO]:
+        return [TransportZoneDTO(id=str(uuid.uuid4()), name=f"Zone {i}", type="stage") for i in range(row_count)]
+
+    def member_batch() -> list[InstitutionMemberDTO]:
+        return [
+            InstitutionMemberDTO(
+                id=str(uuid.uuid4()), community_id=community_id, institution_type="faith",
+                full_name=f"Member {i}", role_id="MEMBER",
+            )
+            for i in range(row_count)
+        ]
+
+    def save_each(repo: BaseRepository, rows: list) -> None:
+        for row in rows:
+            repo.save(row)
+
+    for name, repo, batch in (("zones", zones, zone_batch), ("members", members, member_batch)):
+        ms, _ = timed(partial(save_each, repo, batch()), 1)
+        results[f"{name}_save_rows_per_s"] = row_count / (ms / 1000)
+        ms, saved = timed(partial(repo.save_many, batch(), chunk_size), 1)
+        assert saved == row_count
+        results[f"{name}_save_many_rows_per_s"] = row_count / (ms / 1000)
+
+    conn.close()
+    return results
+
+
+def run_trusted_vs_validated_reads(
+    db_path: Path, row_count: int = 50_000, communities: int = 100
+) -> dict[str, float]:
+    """
+    Compare list_all with full validation of every row (the old read path)
+    against trusted reads, and against find_rows views.
+
+    Returns milliseconds per list_all for each table and read path.
+    """
+    conn, community_ids = _seed(db_path, row_count, communities)
+    conn.executemany(
+        "INSERT INTO community_members (id, community_id, user_id, channel, active) VALUES (?, ?, ?, ?, ?)",
+        [
+            (str(uuid.uuid4()), community_ids[i % communities], f"+2547{i:08d}",
+             "sms" if i % 3 else "telegram", i % 10 != 0)
+            for i in range(row_count)
+        ],
+    )
+    conn.commit()
+    results = {}
+
+    for name, repo in (
+        ("community_members", CommunityMemberRepository(conn)),
+        ("institution_members", InstitutionMemberRepository(conn)),
+    ):
+        # Results are dropped before the next run so GC work stays comparable
+        repo.trusted_reads = False
+        results[f"{name}_validated_ms"], _ = timed(repo.list_all, 3)
+        validated = repo.find(limit=1000)
+        repo.trusted_reads = True
+        results[f"{name}_trusted_ms"], _ = timed(repo.list_all, 3)
+        assert repo.find(limit=1000) == validated
+        results[f"{name}_rows_ms"], _ = timed(repo.find_rows, 3)
+
+    conn.close()
+    return results
+
+
+if __name__ == "__main__":
+    # To run: python -m aos.tests.benchmarks.benchmark_repository
+    with scratch_dir() as td:
+        r = run_find_vs_list_all(td / "bench.db")
+        report(
+            "REPOSITORY FIND BENCHMARK (100k rows per table)",
+            f"Members of one community ({r['members_matched']} rows): "
+            f"list_all+filter {r['members_list_all_ms']:.1f} ms, find {r['members_find_ms']:.2f} ms",
+            f"Active member count: list_all+len {r['count_list_all_ms']:.1f} ms, count {r['count_sql_ms']:.2f} ms",
+            f"Deep page of 50: OFFSET {r['page_offset_ms']:.2f} ms, keyset {r['page_keyset_ms']:.2f} ms",
+            f"Zone discovery ({r['zones_matched']} rows): "
+            f"list_all+filter {r['zones_list_all_ms']:.1f} ms, find {r['zones_find_ms']:.2f} ms",
+            f"Streaming all members with iter_find: {r['iter_find_ms']:.1f} ms",
+        )
+
+        r = run_save_vs_save_many(td / "bench_write.db")
+        report(
+            "REPOSITORY WRITE BENCHMARK (5k rows, chunks of 500)",
+            *(
+                f"{name.capitalize()}: save {r[f'{name}_save_rows_per_s']:,.0f} rows/s, "
+                f"save_many {r[f'{name}_save_many_rows_per_s']:,.0f} rows/s"
+                for name in ("zones", "members")
+            ),
+        )
+
+        r = run_trusted_vs_validated_reads(td / "bench_read.db")
+        report(
+            "REPOSITORY READ BENCHMARK (list_all, 50k rows)",
+            *(
+                f"{name}: validated {r[f'{name}_validated_ms']:.1f} ms, "
+                f"trusted {r[f'{name}_trusted_ms']:.1f} ms, find_rows {r[f'{name}_rows_ms']:.1f} ms"
+                for name in ("community_members", "institution_members")
+            ),
+            environment(),
+        )
@@ -0,0 +1,260 @@
+"""
+Bounded Dispatch Tests.
+Verifies per-subscriber queues, worker pools and overflow policies.
+"""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.durability import Durability
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+from aos.bus.subscription import OverflowPolicy
+
+
+@pytest.mark.asyncio
+async def test_workers_cap_concurrency():
+    """A subscription must never run more handlers at once than its workers."""
+    dispatcher = EventDispatcher(queue_size=10, workers=2)
+    active = 0
+    peak = 0
+    handled = 0
+
+    async def handler(event: Event):
+        nonlocal active, peak, handled
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.005)
+        active -= 1
+        handled += 1
+
+    dispatcher.subscribe("load.event", handler)
+    for i in range(50):
+        await dispatcher.dispatch(Event(name="load.event", payload={"i": i}))
+    await dispatcher.drain()
+
+    assert handled == 50
+    assert peak <= 2
+    await dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_mode_does_not_spawn_task_per_event():
+    """Publishing a burst must not create a task per event."""
+    dispatcher = EventDispatcher(queue_size=1000, workers=1)
+    release = asyncio.Event()
+
+    async def handler(event: Event):
+        await release.wait()
+
+    dispatcher.subscribe("burst.event", handler)
+    before = len(asyncio.all_tasks())
+    for i in range(500):
+        await dispatcher.dispatch(Event(name="burst.event", payload={"i": i}))
+
+    assert len(asyncio.all_tasks()) - before <= 1, "Only the worker task may be added"
+    assert dispatcher.get_queue_stats()[0]["depth"] >= 499
+
+    release.set()
+    await dispatcher.drain()
+    await dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    """With BLOCK, the publisher must wait until the queue has room."""
+    dispatcher = EventDispatcher(queue_size=1, overflow=OverflowPolicy.BLOCK)
+    release = asyncio.Event()
+
+    async def handler(event: Event):
+        await release.wait()
+
+    dispatcher.subscribe("slow.event", handler)
+    await dispatcher.dispatch(Event(name="slow.event", payload={}))  # taken by worker
+    await asyncio.sleep(0)
+    await dispatcher.dispatch(Event(name="slow.event", payload={}))  # fills queue
+
+    blocked = asyncio.create_task(dispatcher.dispatch(Event(name="slow.event", payload={})))
+    await asyncio.sleep(0.05)
+    assert not blocked.done(), "Publisher must be blocked by a full queue"
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=1.0)
+    await dispatcher.drain()
+    await dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_records_failure(tmp_path: Path):
+    """DROP_OLDEST must evict the oldest event and mark it failed in the store."""
+    store = EventStore(str(tmp_path / "drop.db"))
+    await store.initialize()
+    dispatcher = EventDispatcher(store, queue_size=1, overflow=OverflowPolicy.DROP_OLDEST)
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(event: Event):
+        await release.wait()
+        handled.append(event.payload["i"])
+
+    dispatcher.subscribe("drop.event", handler)
+    for i in range(3):
+        await dispatcher.dispatch(Event(name="drop.event", payload={"i": i}))
+        await asyncio.sleep(0)
+
+    release.set()
+    await dispatcher.drain()
+    await asyncio.sleep(0.01)
+
+    stats = dispatcher.get_queue_stats()[0]
+    assert stats["dropped"] == 1
+    assert handled == [0, 2]
+    assert await store.get_failed_count() == 1
+
+    await dispatcher.shutdown()
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_spill_redrives_only_the_overflowing_subscription(tmp_path: Path):
+    """A spilled event stays pending and is redriven to the full subscription alone."""
+    store = EventStore(str(tmp_path / "spill.db"))
+    await store.initialize()
+    dispatcher = EventDispatcher(store, queue_size=1, overflow=OverflowPolicy.SPILL)
+    release = asyncio.Event()
+    slow, fast = [], []
+
+    async def slow_handler(event: Event):
+        await release.wait()
+        slow.append(event.payload["i"])
+
+    async def fast_handler(event: Event):
+        fast.append(event.payload["i"])
+
+    dispatcher.subscribe("spill.event", slow_handler)
+    dispatcher.subscribe("spill.event", fast_handler, queue_size=10)
+    for i in range(3):
+        await dispatcher.dispatch(Event(name="spill.event", payload={"i": i}))
+        await asyncio.sleep(0)
+
+    stats = {s["subscription"].split(":")[1]: s for s in dispatcher.get_queue_stats()}
+    assert stats["test_spill_redrives_only_the_overflowing_subscription.<locals>.slow_handler"]["spill_backlog"] == 1
+    assert fast == [0, 1, 2]
+    # Pending until the slow subscription has handled them too
+    assert [e.payload["i"] for e in await store.get_pending_events()] == [0, 1, 2]
+
+    release.set()
+    await dispatcher.drain()
+    await asyncio.sleep(0.01)
+
+    assert slow == [0, 1, 2] and fast == [0, 1, 2]
+    assert sum(s["redriven"] for s in dispatcher.get_queue_stats()) == 1
+    assert await store.get_queue_depth() == 0
+    assert await dispatcher.recover_pending_events() == 0
+
+    await dispatcher.shutdown()
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_spill_is_bounded_and_then_blocks(tmp_path: Path):
+    """Once max_spill events are parked, publishers wait instead of growing the spill."""
+    store = EventStore(str(tmp_path / "spill.db"))
+    await store.initialize()
+    dispatcher = EventDispatcher(store, queue_size=1, overflow=OverflowPolicy.SPILL, max_spill=2)
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(event: Event):
+        await release.wait()
+        handled.append(event.payload["i"])
+
+    dispatcher.subscribe("spill.event", handler)
+    # One in the handler, one queued, two spilled
+    for i in range(4):
+        await dispatcher.dispatch(Event(name="spill.event", payload={"i": i}))
+        await asyncio.sleep(0)
+
+    fifth = asyncio.create_task(dispatcher.dispatch(Event(name="spill.event", payload={"i": 4})))
+    await asyncio.sleep(0.01)
+    assert not fifth.done()
+    stats = dispatcher.get_queue_stats()[0]
+    assert stats["spill_backlog"] == stats["spill_capacity"] == 2
+
+    release.set()
+    await fifth
+    await dispatcher.drain()
+    assert handled == [0, 1, 2, 3, 4]
+    assert dispatcher.get_queue_stats()[0]["spill_backlog"] == 0
+
+    await dispatcher.shutdown()
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_spill_blocks_events_that_are_not_journaled(tmp_path: Path):
+    """An ephemeral event has no store copy to fall back on: it waits for room."""
+    store = EventStore(str(tmp_path / "spill.db"))
+    await store.initialize()
+    dispatcher = EventDispatcher(store, queue_size=1, overflow=OverflowPolicy.SPILL)
+    dispatcher.set_durability("tick", Durability.EPHEMERAL)
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(event: Event):
+        await release.wait()
+        handled.append(event.payload["i"])
+
+    dispatcher.subscribe("tick", handler)
+    for i in range(2):
+        await dispatcher.dispatch(Event(name="tick", payload={"i": i}))
+        await asyncio.sleep(0)
+
+    third = asyncio.create_task(dispatcher.dispatch(Event(name="tick", payload={"i": 2})))
+    await asyncio.sleep(0.01)
+    assert not third.done()  # Publisher held back instead of spilling
+
+    release.set()
+    await third
+    await dispatcher.drain()
+    assert handled == [0, 1, 2]
+    assert dispatcher.get_queue_stats()[0]["spilled"] == 0
+
+    await dispatcher.shutdown()
+    await store.shutdown()
+
+
+def test_spill_requires_store():
+    """SPILL without a store would silently lose events and must be rejected."""
+    with pytest.raises(ValueError):
+        EventDispatcher(queue_size=10, overflow=OverflowPolicy.SPILL)
+
+
+@pytest.mark.asyncio
+async def test_per_subscription_override():
+    """A single subscription can be bounded on an otherwise unbounded dispatcher."""
+    dispatcher = EventDispatcher()
+    received = []
+
+    async def fast(event: Event):
+        received.append(("fast", event.id))
+
+    async def bounded(event: Event):
+        received.append(("bounded", event.id))
+
+    dispatcher.subscribe("mixed.event", fast)
+    dispatcher.subscribe("mixed.event", bounded, queue_size=5, workers=1)
+
+    await dispatcher.dispatch(Event(name="mixed.event", payload={}))
+    await dispatcher.drain()
+    await asyncio.sleep(0.01)
+
+    assert {kind for kind, _ in received} == {"fast", "bounded"}
+    stats = dispatcher.get_queue_stats()
+    assert len(stats) == 1
+    assert stats[0]["capacity"] == 5
+    await dispatcher.shutdown()
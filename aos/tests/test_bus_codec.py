@@ -0,0 +1,158 @@
+"""
+Event Codec Tests.
+Verifies JSON and binary round trips, compression, and mixed-format stores.
+"""
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from aos.bus.codec import (
+    MAGIC,
+    SCHEMA_VERSION,
+    BinaryCodec,
+    CodecError,
+    EventCodec,
+    JsonCodec,
+    get_codec,
+)
+from aos.bus.durability import Durability
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+
+PAYLOAD = {
+    "to": "+254712345678",
+    "content": "Mkutano wa wakulima kesho",
+    "attempt": 3,
+    "cost": 0.8,
+    "delivered": True,
+    "error": None,
+    "tags": ["agri", "broadcast"],
+    "nested": {"region": "Nyeri", "big": 2**70},
+}
+
+
+def _same(a: Event, b: Event) -> bool:
+    return (a.id, a.name, dict(a.payload), a.correlation_id, a.timestamp, a.source_node, dict(a.metadata)) == (
+        b.id, b.name, dict(b.payload), b.correlation_id, b.timestamp, b.source_node, dict(b.metadata)
+    )
+
+
+class TestCodecs:
+    """Codecs round-trip payloads and timestamps."""
+
+    @pytest.mark.parametrize("codec", [JsonCodec(), BinaryCodec()], ids=["json", "binary"])
+    def test_round_trip(self, codec: EventCodec) -> None:
+        assert EventCodec.decode(codec.encode(PAYLOAD)) == PAYLOAD
+        assert EventCodec.decode(codec.encode({})) == {}
+
+        now = datetime.now(UTC)
+        assert EventCodec.decode_timestamp(codec.encode_timestamp(now)) == now
+
+    def test_binary_is_smaller(self) -> None:
+        binary = BinaryCodec().encode(PAYLOAD)
+        assert binary[:2] == bytes((MAGIC, SCHEMA_VERSION))
+        assert len(binary) < len(JsonCodec().encode(PAYLOAD))
+
+        now = datetime.now(UTC)
+        assert len(str(BinaryCodec().encode_timestamp(now))) < len(JsonCodec().encode_timestamp(now))
+
+    def test_large_values_are_compressed(self) -> None:
+        payload = {"rows": [{"farmer": f"F-{i}", "crop": "maize"} for i in range(200)]}
+        compressed = BinaryCodec().encode(payload)
+        plain = BinaryCodec(compress_threshold=0).encode(payload)
+
+        assert compressed[2] == 1 and plain[2] == 0
+        assert len(compressed) < len(plain) // 4
+        assert EventCodec.decode(compressed) == payload
+
+    @pytest.mark.parametrize("payload", [
+        {"tier": Durability.DURABLE},
+        {"point": (1, 2), "ids": [(3, "a")]},
+        {1: "one", 2.5: "x", None: 0, False: "no"},
+        {"small": -1, "edge": 2**63, "neg": -(2**70), "inf": float("inf"), "text": "ß" * 200},
+    ], ids=["str-enum", "tuples", "non-str-keys", "numbers"])
+    def test_binary_matches_json(self, payload: dict) -> None:
+        """Binary decodes every payload to what a JSON round trip gives."""
+        expected = json.loads(JsonCodec().encode(payload))
+        assert EventCodec.decode(BinaryCodec().encode(payload)) == expected
+
+    @pytest.mark.parametrize("value", [datetime.now(UTC), {1, 2}, b"raw"], ids=["datetime", "set", "bytes"])
+    def test_binary_rejects_what_json_rejects(self, value: object) -> None:
+        with pytest.raises(TypeError):
+            JsonCodec().encode({"v": value})
+        with pytest.raises(TypeError):
+            BinaryCodec().encode({"v": value})
+
+    def test_rejects_unknown_schema(self) -> None:
+        body = BinaryCodec().encode(PAYLOAD)[3:]
+        for version in (0, 1, SCHEMA_VERSION + 1):
+            with pytest.raises(CodecError, match=f"schema version {version} "):
+                EventCodec.decode(bytes((MAGIC, version, 0)) + body)
+
+    def test_timestamp_forms(self) -> None:
+        expected = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=UTC)
+        micros = BinaryCodec().encode_timestamp(expected)
+
+        assert EventCodec.decode_timestamp(micros) == expected
+        assert EventCodec.decode_timestamp(str(micros)) == expected  # From a TEXT column
+        assert BinaryCodec().encode_timestamp(expected.replace(tzinfo=None)) == micros
+
+    def test_rejects_bad_values(self) -> None:
+        with pytest.raises(CodecError):
+            EventCodec.decode(b"\x00\x01\x00")
+        with pytest.raises(CodecError):
+            EventCodec.decode(bytes((MAGIC, SCHEMA_VERSION + 1, 0)) + b"\x00")
+        with pytest.raises(CodecError):
+            EventCodec.decode(bytes((MAGIC, SCHEMA_VERSION, 0)) + b"\xff\x00")
+        valid = BinaryCodec(compress_threshold=0).encode(PAYLOAD)
+        for corrupt in (valid[:-3], valid + b"\x00", bytes((MAGIC, SCHEMA_VERSION, 0)) + b"\x06\x00"):
+            with pytest.raises(CodecError):
+                EventCodec.decode(corrupt)
+        with pytest.raises(CodecError):
+            get_codec("xml")
+
+
+class TestStoreCodec:
+    """EventStore writes with its codec and reads rows from any codec."""
+
+    @pytest.mark.asyncio
+    async def test_binary_store_round_trip(self, tmp_path: Path) -> None:
+        store = EventStore(str(tmp_path / "binary.db"), codec=BinaryCodec())
+        await store.initialize()
+        durable = Event(name="farmer.registered", payload=PAYLOAD, correlation_id="c-1", metadata={"lane": "high"})
+        deferred = Event(name="message.sent", payload={"to": "+254700000000"})
+        await store.enqueue(durable)
+        store.enqueue_deferred(deferred)
+
+        events = await store.get_pending_events()
+        await store.shutdown()
+
+        assert [e.id for e in events] == [durable.id, deferred.id]
+        assert _same(events[0], durable) and _same(events[1], deferred)
+
+    @pytest.mark.asyncio
+    async def test_reads_existing_json_rows(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "mixed.db")
+
+        legacy = EventStore(db_path)
+        await legacy.initialize()
+        old = Event(name="farmer.registered", payload=PAYLOAD)
+        await legacy.enqueue(old)
+        await legacy.shutdown()
+
+        store = EventStore(db_path, codec=BinaryCodec())
+        await store.initialize()
+        new = Event(name="farmer.registered", payload=PAYLOAD)
+        await store.enqueue(new)
+
+        types = store._conn.execute("SELECT typeof(payload) FROM events ORDER BY created_at").fetchall()
+        recovered = [e async for e in store.iter_pending_events()]
+        await store.shutdown()
+
+        assert types == [("text",), ("blob",)]
+        assert len(recovered) == 2
+        assert _same(recovered[0], old) and _same(recovered[1], new)
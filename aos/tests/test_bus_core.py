@@ -70,10 +70,20 @@ async def test_error_isolation():
 
 @pytest.mark.asyncio
 async def test_wildcard_subscription():
-    """Verify subscribers can listen to event patterns (Future proofing)."""
-    # This might be an enhancement, but let's start with exact matches for Batch 1
-    # unless requirements specify globbing.
-    pass
+    """Verify subscribers can listen to event patterns."""
+    dispatcher = EventDispatcher()
+    received = []
+
+    async def handler(event: Event):
+        received.append(event.name)
+
+    dispatcher.subscribe("agri.*", handler)
+
+    await dispatcher.dispatch(Event(name="agri.harvest_recorded", payload={}))
+    await dispatcher.dispatch(Event(name="community.broadcast.sent", payload={}))
+    await asyncio.sleep(0.01)
+
+    assert received == ["agri.harvest_recorded"]
 
 @pytest.mark.asyncio
 async def test_high_concurrency_dispatch():
@@ -0,0 +1,196 @@
+"""
+Durability Tier Tests.
+Verifies that ephemeral events skip the journal and best-effort events are batched.
+"""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.durability import Durability
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+
+
+async def _store_with_trace(tmp_path: Path, **kwargs) -> tuple[EventStore, list[str]]:
+    """EventStore whose connection records every write statement and commit."""
+    store = EventStore(str(tmp_path / "events.db"), **kwargs)
+    await store.initialize()
+    statements: list[str] = []
+    store._conn.set_trace_callback(
+        lambda sql: statements.append(sql)
+        if sql.lstrip().upper().startswith(("INSERT", "UPDATE", "COMMIT")) else None
+    )
+    return store, statements
+
+
+async def _status(store: EventStore, event_id: str) -> str | None:
+    await store.flush()
+    row = store._conn.execute("SELECT status FROM events WHERE id = ?", (event_id,)).fetchone()
+    return row[0] if row else None
+
+
+@pytest.mark.asyncio
+async def test_unregistered_events_are_durable(tmp_path):
+    store, _ = await _store_with_trace(tmp_path)
+    dispatcher = EventDispatcher(store)
+
+    assert dispatcher.get_durability("agri.harvest_recorded") == Durability.DURABLE
+    event = Event(name="agri.harvest_recorded", payload={})
+    await dispatcher.dispatch(event)
+
+    assert await _status(store, event.id) == "completed"
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ephemeral_never_touches_sqlite(tmp_path):
+    store, statements = await _store_with_trace(tmp_path)
+    dispatcher = EventDispatcher(store)
+    dispatcher.set_durability("system.pong", Durability.EPHEMERAL)
+    received = []
+
+    async def handler(event: Event):
+        received.append(event)
+
+    dispatcher.subscribe("system.pong", handler)
+    event = Event(name="system.pong", payload={"status": "ok"})
+    await dispatcher.dispatch(event)
+    await asyncio.sleep(0.01)
+
+    assert received == [event]
+    assert statements == []
+    assert await _status(store, event.id) is None
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ephemeral_bounded_subscription_skips_store(tmp_path):
+    store, statements = await _store_with_trace(tmp_path)
+    dispatcher = EventDispatcher(store, queue_size=4)
+    dispatcher.set_durability("telemetry.*", Durability.EPHEMERAL)
+    received = []
+
+    async def handler(event: Event):
+        received.append(event)
+
+    dispatcher.subscribe("telemetry.cpu", handler)
+    await dispatcher.dispatch(Event(name="telemetry.cpu", payload={"load": 0.4}))
+    await dispatcher.drain()
+
+    assert len(received) == 1
+    assert statements == []
+    await dispatcher.shutdown()
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_best_effort_is_batched_into_one_insert(tmp_path):
+    store, statements = await _store_with_trace(tmp_path, best_effort_window=60)
+    dispatcher = EventDispatcher(store)
+    dispatcher.set_durability("MESSAGE_SENT", Durability.BEST_EFFORT)
+
+    async def handler(event: Event):
+        pass
+
+    dispatcher.subscribe("MESSAGE_SENT", handler)
+    events = [Event(name="MESSAGE_SENT", payload={"i": i}) for i in range(20)]
+    for event in events:
+        await dispatcher.dispatch(event)
+    await asyncio.sleep(0.01)
+
+    # Nothing written yet; handler completions were applied to the buffer
+    assert statements == []
+
+    await store.flush()
+    assert statements.count("COMMIT") == 1
+    assert not any(sql.lstrip().startswith("UPDATE") for sql in statements)
+    for event in events:
+        assert await _status(store, event.id) == "completed"
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_best_effort_failure_recorded_in_buffer(tmp_path):
+    store, _ = await _store_with_trace(tmp_path, best_effort_window=60)
+    dispatcher = EventDispatcher(store)
+    dispatcher.set_durability("MESSAGE_FAILED", Durability.BEST_EFFORT)
+
+    async def handler(event: Event):
+        raise RuntimeError("boom")
+
+    dispatcher.subscribe("MESSAGE_FAILED", handler)
+    event = Event(name="MESSAGE_FAILED", payload={})
+    await dispatcher.dispatch(event)
+    await asyncio.sleep(0.01)
+
+    assert await _status(store, event.id) == "failed"
+    assert await store.get_failed_count() == 1
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_best_effort_flushed_after_window(tmp_path):
+    store, _ = await _store_with_trace(tmp_path, best_effort_window=0.01)
+    dispatcher = EventDispatcher(store)
+    dispatcher.set_durability("MESSAGE_SENT", Durability.BEST_EFFORT)
+
+    event = Event(name="MESSAGE_SENT", payload={})
+    await dispatcher.dispatch(event)
+    await asyncio.sleep(0.05)
+
+    row = store._conn.execute("SELECT status FROM events WHERE id = ?", (event.id,)).fetchone()
+    assert row[0] == "completed"
+    await store.shutdown()
+
+
+def test_exact_name_overrides_pattern():
+    dispatcher = EventDispatcher()
+    dispatcher.set_durability("community.*", Durability.EPHEMERAL)
+    dispatcher.set_durability("community.broadcast.sent", "best_effort")
+
+    assert dispatcher.get_durability("community.group.created") == Durability.EPHEMERAL
+    assert dispatcher.get_durability("community.broadcast.sent") == Durability.BEST_EFFORT
+    assert dispatcher.get_durability("agri.harvest_recorded") == Durability.DURABLE
+
+    with pytest.raises(ValueError):
+        dispatcher.set_durability("agri.*", "sometimes")
+
+
+@pytest.mark.asyncio
+async def test_tiers_halve_write_volume(tmp_path):
+    """A ping/pong + delivery-confirmation mix writes less than half as much."""
+
+    async def run(tiers: bool, path: Path) -> int:
+        path.mkdir()
+        store, statements = await _store_with_trace(path, best_effort_window=60)
+        dispatcher = EventDispatcher(store)
+        if tiers:
+            dispatcher.set_durability("system.pong", Durability.EPHEMERAL)
+            dispatcher.set_durability("MESSAGE_SENT", Durability.BEST_EFFORT)
+
+        async def handler(event: Event):
+            pass
+
+        for name in ("system.ping", "system.pong", "MESSAGE_SENT"):
+            dispatcher.subscribe(name, handler)
+
+        for _ in range(50):
+            for name in ("system.ping", "system.pong", "MESSAGE_SENT", "MESSAGE_SENT"):
+                await dispatcher.dispatch(Event(name=name, payload={}))
+        await asyncio.sleep(0.01)
+        await store.shutdown()
+        return statements
+
+    baseline = await run(False, tmp_path / "baseline")
+    tiered = await run(True, tmp_path / "tiered")
+
+    def rows(statements: list[str]) -> int:
+        return sum(1 for sql in statements if sql != "COMMIT")
+
+    # Rows written at least halve; transactions (fsyncs) drop far more
+    assert rows(tiered) <= rows(baseline) / 2
+    assert tiered.count("COMMIT") < baseline.count("COMMIT") / 2
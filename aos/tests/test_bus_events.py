@@ -0,0 +1,101 @@
+"""
+Event Type Tests.
+Verifies the slotted Event keeps the frozen dataclass API: defaults,
+immutability, equality, lazy id and timestamp views, and store round trips.
+"""
+from __future__ import annotations
+
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from aos.bus.codec import BinaryCodec, JsonCodec
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+
+
+class TestEventApi:
+    """Same surface as the dataclass it replaced."""
+
+    def test_defaults(self) -> None:
+        before = datetime.now(UTC)
+        event = Event(name="farmer.registered", payload={"id": 1})
+
+        assert event.correlation_id is None and event.source_node is None
+        assert dict(event.metadata) == {}
+        assert before - timedelta(seconds=1) <= event.timestamp <= datetime.now(UTC)
+        assert event.timestamp.tzinfo is not None
+        assert not hasattr(event, "__dict__")
+
+    def test_ids_are_unique_and_ordered(self) -> None:
+        events = [Event(name="e", payload={}) for _ in range(1000)]
+        ids = [e.id for e in events]
+
+        assert len(set(ids)) == 1000
+        assert ids == sorted(ids)
+        assert events[0].id is events[0].id  # Formatted once
+
+    def test_explicit_fields_are_kept(self) -> None:
+        stamp = datetime(2024, 3, 1, 8, 30, tzinfo=timezone(timedelta(hours=3)))
+        event = Event("harvest.recorded", {"kg": 5}, "evt-1", "corr-1", stamp, "node-a", {"lane": "low"})
+
+        assert (event.id, event.correlation_id, event.source_node) == ("evt-1", "corr-1", "node-a")
+        assert event.timestamp is stamp
+        assert event.timestamp_ns == int(stamp.timestamp()) * 1_000_000_000
+        assert event.metadata == {"lane": "low"}
+
+    def test_nanosecond_timestamp(self) -> None:
+        event = Event(name="e", payload={}, timestamp=1_700_000_000_123_456_789)
+
+        assert event.timestamp == datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=UTC)
+        assert event.timestamp_ns == 1_700_000_000_123_456_789
+
+    def test_frozen(self) -> None:
+        event = Event(name="e", payload={})
+
+        with pytest.raises(FrozenInstanceError):
+            event.name = "other"
+        with pytest.raises(FrozenInstanceError):
+            del event.payload
+        with pytest.raises(FrozenInstanceError):
+            event.extra = 1
+
+    def test_default_metadata_is_writable_and_not_shared(self) -> None:
+        event, other = Event(name="e", payload={}), Event(name="e", payload={})
+
+        event.metadata["lane"] = "low"
+        assert event.metadata == {"lane": "low"}
+        assert other.metadata == {}
+
+    def test_equality_and_copies(self) -> None:
+        event = Event(name="e", payload={"a": 1}, metadata={"lane": "high"})
+
+        assert event == Event("e", {"a": 1}, event.id, timestamp=event.timestamp, metadata={"lane": "high"})
+        assert event != Event("e", {"a": 1}, metadata={"lane": "high"})
+        assert copy.copy(event) == event
+        assert pickle.loads(pickle.dumps(event)) == event
+        assert pickle.loads(pickle.dumps(Event("e", {}))).metadata == {}
+        assert repr(event).startswith("Event(name='e', payload={'a': 1}, id=")
+
+
+class TestEventStorage:
+    """Stored events come back equal, for both codecs."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("codec", [JsonCodec(), BinaryCodec()], ids=["json", "binary"])
+    async def test_round_trip(self, tmp_path: Path, codec: JsonCodec) -> None:
+        store = EventStore(str(tmp_path / "events.db"), codec=codec)
+        await store.initialize()
+        plain = Event(name="e", payload={"i": 1})
+        full = Event("e", {"i": 2}, correlation_id="c", source_node="n", metadata={"lane": "low"})
+        await store.enqueue(plain)
+        await store.enqueue(full)
+
+        restored = await store.get_pending_events()
+        await store.shutdown()
+
+        assert restored == [plain, full]
@@ -0,0 +1,228 @@
+"""
+Journal Store Tests.
+Verifies the segmented append-only backend: persistence, acknowledgements,
+segment deletion, torn writes and use behind the EventDispatcher.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aos.bus.codec import JsonCodec
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.events import Event
+from aos.bus.journal import JournalStore
+
+
+async def _journal(tmp_path: Path, **kwargs: Any) -> JournalStore:
+    journal = JournalStore(str(tmp_path / "journal"), **kwargs)
+    await journal.initialize()
+    return journal
+
+
+def _segments(tmp_path: Path) -> list[str]:
+    return sorted(p.name for p in (tmp_path / "journal").iterdir())
+
+
+class TestJournalStore:
+    """Core queue operations match EventStore."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_restart(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path)
+        first = Event(name="farmer.registered", payload={"id": 1, "tags": ["a"]}, correlation_id="c-1")
+        second = Event(name="harvest.recorded", payload={"kg": 12.5}, metadata={"lane": "low"})
+        await journal.enqueue(first)
+        await journal.enqueue(second)
+        await journal.mark_completed(first.id)
+        await journal.shutdown()
+
+        journal = await _journal(tmp_path)
+        pending = await journal.get_pending_events()
+        await journal.shutdown()
+
+        assert [e.id for e in pending] == [second.id]
+        restored = pending[0]
+        assert (restored.name, dict(restored.payload), restored.timestamp, dict(restored.metadata)) == (
+            second.name, dict(second.payload), second.timestamp, dict(second.metadata)
+        )
+
+    @pytest.mark.asyncio
+    async def test_dequeue_claims_oldest(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path, codec=JsonCodec())
+        events = [Event(name="q.event", payload={"i": i}) for i in range(3)]
+        for event in events:
+            await journal.enqueue(event)
+
+        assert (await journal.dequeue()).id == events[0].id
+        assert (await journal.dequeue()).id == events[1].id
+        assert await journal.get_queue_depth() == 1
+        await journal.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_events_retry_then_dead_letter(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path, max_attempts=2, retry_base_delay=10)
+        event = Event(name="flaky.event", payload={})
+        await journal.enqueue(event)
+
+        await journal.mark_failed(event.id, "boom")
+        assert await journal.get_failed_count() == 1
+        assert await journal.claim_due_retries() == []
+        assert [e.id for e in await journal.claim_due_retries(now=await journal.next_retry_at())] == [event.id]
+
+        await journal.mark_failed(event.id, "boom again")
+        await journal.shutdown()
+
+        journal = await _journal(tmp_path)
+        dead = await journal.list_dead_letters()
+        assert [d["event"].id for d in dead] == [event.id]
+        assert dead[0]["retry_count"] == 2 and dead[0]["error_message"] == "boom again"
+
+        assert await journal.redrive_dead_letters() == 1
+        assert await journal.get_failed_count() == 1
+        await journal.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_iter_pending_respects_watermark(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path)
+        for i in range(25):
+            await journal.enqueue(Event(name="bulk.event", payload={"i": i}))
+        until = time.time()
+        await asyncio.sleep(0.01)
+        await journal.enqueue(Event(name="bulk.event", payload={"i": "late"}))
+
+        streamed = [e.payload["i"] async for e in journal.iter_pending_events(batch_size=10, until=until)]
+        assert await journal.count_pending_events() == 26
+        await journal.shutdown()
+
+        assert streamed == list(range(25))
+
+
+class TestSegments:
+    """Segments rotate at a fixed size and are deleted once drained."""
+
+    @pytest.mark.asyncio
+    async def test_drained_segments_are_deleted(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path, segment_size=4096)
+        events = [Event(name="seg.event", payload={"pad": "x" * 200}) for _ in range(60)]
+        for event in events:
+            await journal.enqueue(event)
+        assert len(_segments(tmp_path)) > 3
+
+        for event in events[:-1]:
+            await journal.mark_completed(event.id)
+
+        # Only the segment holding the last event and the active one remain
+        assert len(_segments(tmp_path)) <= 2
+        assert (tmp_path / "journal" / _segments(tmp_path)[0]).stat().st_size == 4096
+        await journal.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_compaction_moves_stragglers(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path, segment_size=4096)
+        events = [Event(name="seg.event", payload={"pad": "x" * 200}) for _ in range(60)]
+        for event in events:
+            await journal.enqueue(event)
+        straggler = events[0]
+        for event in events[1:]:
+            await journal.mark_completed(event.id)
+        await journal.mark_failed(straggler.id, "slow")
+        first = _segments(tmp_path)[0]
+
+        assert await journal.cleanup_old_events() == 1
+        assert first not in _segments(tmp_path)
+        await journal.shutdown()
+
+        journal = await _journal(tmp_path)
+        assert await journal.get_failed_count() == 1
+        assert [e.id for e in await journal.claim_due_retries(now=float("inf"))] == [straggler.id]
+        await journal.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_dead_letter_state_survives_segment_deletion(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path, segment_size=512, max_attempts=2)
+        straggler = Event(name="seg.event", payload={})
+        await journal.enqueue(straggler)
+
+        async def churn() -> None:
+            for _ in range(20):
+                event = Event(name="seg.event", payload={"pad": "x" * 40})
+                await journal.enqueue(event)
+                await journal.mark_completed(event.id)
+
+        await churn()
+        for _ in range(2):
+            await journal.mark_failed(straggler.id, "boom")
+        # The segment holding the dead-letter ACK drains and is deleted
+        await churn()
+        await journal.shutdown()
+
+        journal = await _journal(tmp_path)
+        dead = await journal.list_dead_letters()
+        assert [d["event"].id for d in dead] == [straggler.id]
+        assert dead[0]["retry_count"] == 2 and dead[0]["error_message"] == "boom"
+        assert await journal.get_pending_events() == []
+        await journal.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_is_ignored(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path)
+        kept = Event(name="torn.event", payload={"ok": True})
+        await journal.enqueue(kept)
+        end = journal._offset
+        await journal.enqueue(Event(name="torn.event", payload={"ok": False}))
+        await journal.shutdown()
+
+        # Corrupt the second record, as a crash mid-write would
+        path = tmp_path / "journal" / _segments(tmp_path)[0]
+        with open(path, "r+b") as f:
+            f.seek(end + 12)
+            f.write(b"\xff\xff\xff\xff")
+
+        journal = await _journal(tmp_path)
+        assert [e.id for e in await journal.get_pending_events()] == [kept.id]
+
+        # New writes overwrite the torn record
+        after = Event(name="torn.event", payload={"ok": "again"})
+        await journal.enqueue(after)
+        await journal.shutdown()
+
+        journal = await _journal(tmp_path)
+        assert [e.id for e in await journal.get_pending_events()] == [kept.id, after.id]
+        await journal.shutdown()
+
+
+class TestJournalDispatch:
+    """EventDispatcher runs unchanged on the journal backend."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_and_recovery(self, tmp_path: Path) -> None:
+        journal = await _journal(tmp_path)
+        dispatcher = EventDispatcher(journal)
+        handled = []
+
+        async def handler(event: Event) -> None:
+            handled.append(event.payload["i"])
+
+        dispatcher.subscribe("work.event", handler)
+        await dispatcher.dispatch(Event(name="work.event", payload={"i": 1}))
+        await asyncio.sleep(0.05)
+        assert handled == [1]
+        assert await journal.get_pending_events() == []
+
+        # Journaled but never handled: a crash before dispatch completed
+        await journal.enqueue(Event(name="work.event", payload={"i": 2}))
+        await journal.shutdown()
+
+        journal = await _journal(tmp_path)
+        dispatcher = EventDispatcher(journal)
+        dispatcher.subscribe("work.event", handler)
+        assert await dispatcher.recover_pending_events() == 1
+        await asyncio.sleep(0.05)
+        await journal.shutdown()
+
+        assert handled == [1, 2]
@@ -0,0 +1,138 @@
+"""
+Event Replay Tests.
+Verifies filtering, ordering, throttling and checkpoint resume.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+from aos.bus.journal import JournalStore
+from aos.bus.replay import replay_events
+
+
+async def _history(tmp_path: Path, count: int = 30) -> EventStore:
+    """Completed farmer/harvest events interleaved, one second apart."""
+    store = EventStore(str(tmp_path / "history.db"))
+    await store.initialize()
+    for i in range(count):
+        name = "farmer.registered" if i % 3 else "harvest.recorded"
+        event = Event(name=name, payload={"i": i})
+        await store.enqueue(event)
+        await store.mark_completed(event.id)
+    store._conn.execute("UPDATE events SET created_at = 1000 + rowid")
+    store._conn.commit()
+    return store
+
+
+class TestReplay:
+    """Replays stream matching history in order."""
+
+    @pytest.mark.asyncio
+    async def test_filters_by_range_and_name(self, tmp_path: Path) -> None:
+        store = await _history(tmp_path)
+        seen = []
+
+        async def handler(event: Event) -> None:
+            seen.append(event.payload["i"])
+
+        result = await replay_events(
+            store, handler, "farmers", start=1005, end=1020,
+            event_names=["farmer.registered"], batch_size=4,
+        )
+
+        # rowid = i + 1, so created_at 1005..1019 covers i = 4..18
+        assert seen == [i for i in range(4, 19) if i % 3]
+        assert result.replayed == len(seen) and not result.resumed
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_replay(self, tmp_path: Path) -> None:
+        store = await _history(tmp_path, count=10)
+
+        async def handler(event: Event) -> None:
+            pass
+
+        start = time.monotonic()
+        await replay_events(store, handler, "slow", rate=50)
+        assert time.monotonic() - start >= 10 / 50 * 0.9
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_failure(self, tmp_path: Path) -> None:
+        store = await _history(tmp_path)
+        seen = []
+
+        async def flaky(event: Event) -> None:
+            if event.payload["i"] == 17:
+                raise RuntimeError("schema not migrated")
+            seen.append(event.payload["i"])
+
+        with pytest.raises(RuntimeError):
+            await replay_events(store, flaky, "rebuild", batch_size=5, checkpoint_every=5)
+        assert seen == list(range(17))
+
+        async def fixed(event: Event) -> None:
+            seen.append(event.payload["i"])
+
+        result = await replay_events(store, fixed, "rebuild", batch_size=5, checkpoint_every=5)
+
+        assert result.resumed
+        assert seen == list(range(30))
+        assert result.replayed == 13 and result.total == 30
+
+        # Finished replays are not repeated
+        again = await replay_events(store, fixed, "rebuild")
+        assert again.replayed == 0 and len(seen) == 30
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_cancellation(self, tmp_path: Path) -> None:
+        store = await _history(tmp_path)
+        seen = []
+
+        async def handler(event: Event) -> None:
+            seen.append(event.payload["i"])
+
+        task = asyncio.create_task(replay_events(store, handler, "cancelled", rate=100))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert 0 < len(seen) < 30
+
+        await replay_events(store, handler, "cancelled")
+        assert seen == list(range(30))
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_is_tied_to_selection(self, tmp_path: Path) -> None:
+        store = await _history(tmp_path, count=5)
+
+        async def handler(event: Event) -> None:
+            pass
+
+        await replay_events(store, handler, "projection", event_names=["harvest.recorded"])
+        with pytest.raises(ValueError):
+            await replay_events(store, handler, "projection", event_names=["farmer.registered"])
+
+        result = await replay_events(store, handler, "projection", event_names=["farmer.registered"], restart=True)
+        assert result.replayed == 3
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_journal_store(self, tmp_path: Path) -> None:
+        store = JournalStore(str(tmp_path / "journal"), sync_in_thread=False)
+        await store.initialize()
+
+        async def handler(event: Event) -> None:
+            pass
+
+        with pytest.raises(TypeError, match="JournalStore"):
+            await replay_events(store, handler, "projection")
+        await store.shutdown()
@@ -0,0 +1,89 @@
+"""
+Request/Reply Tests.
+Verifies EventDispatcher.request: replies resolve by correlation id,
+are still routed to subscribers and are never journaled.
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+
+
+def _ponger(dispatcher: EventDispatcher) -> None:
+    async def on_ping(event: Event) -> None:
+        await dispatcher.dispatch(Event(
+            name="system.pong", payload={"nonce": event.payload["nonce"]}, correlation_id=event.id,
+        ))
+
+    dispatcher.subscribe("system.ping", on_ping)
+
+
+def _journaled_names(db_path: Path) -> list[str]:
+    with sqlite3.connect(db_path) as conn:
+        return [row[0] for row in conn.execute("SELECT event_name FROM events ORDER BY rowid")]
+
+
+class TestRequest:
+    """Awaiting replies by correlation id."""
+
+    @pytest.mark.asyncio
+    async def test_reply_resolves_request(self) -> None:
+        dispatcher = EventDispatcher()
+        _ponger(dispatcher)
+
+        replies = await asyncio.gather(*[
+            dispatcher.request(Event(name="system.ping", payload={"nonce": i}), timeout=1.0)
+            for i in range(5)
+        ])
+
+        assert [r.payload["nonce"] for r in replies] == list(range(5))
+        assert dispatcher._pending_replies == {}
+
+    @pytest.mark.asyncio
+    async def test_timeout_clears_pending(self) -> None:
+        dispatcher = EventDispatcher()
+
+        with pytest.raises(TimeoutError):
+            await dispatcher.request(Event(name="system.ping", payload={}), timeout=0.05)
+        assert dispatcher._pending_replies == {}
+
+    @pytest.mark.asyncio
+    async def test_reply_still_reaches_subscribers(self) -> None:
+        dispatcher = EventDispatcher()
+        _ponger(dispatcher)
+        seen = []
+
+        async def watch(event: Event) -> None:
+            seen.append(event.name)
+
+        dispatcher.subscribe("system.pong", watch)
+        await dispatcher.request(Event(name="system.ping", payload={"nonce": 1}), timeout=1.0)
+        await asyncio.sleep(0.01)
+
+        assert seen == ["system.pong"]
+
+
+class TestReplyJournaling:
+    """Replies skip the store; everything else is journaled as before."""
+
+    @pytest.mark.asyncio
+    async def test_replies_are_not_journaled(self, tmp_path: Path) -> None:
+        store = EventStore(str(tmp_path / "events.db"))
+        await store.initialize()
+        dispatcher = EventDispatcher(store)
+        _ponger(dispatcher)
+
+        await dispatcher.request(Event(name="system.ping", payload={"nonce": 1}), timeout=1.0)
+        # A pong nobody is waiting for is an ordinary event
+        await dispatcher.dispatch(Event(name="system.pong", payload={}, correlation_id="stale"))
+        await asyncio.sleep(0.05)
+        await store.shutdown()
+
+        assert _journaled_names(tmp_path / "events.db") == ["system.ping", "system.pong"]
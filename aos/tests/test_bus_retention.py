@@ -0,0 +1,148 @@
+"""
+Retention Service Tests.
+Verifies batched deletes, dead-letter archiving, space reclamation and
+power-profile backoff.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+from aos.bus.retention import RetentionService
+from aos.core.resource.profiles import PowerProfile
+
+
+class FakeResourceManager:
+    def __init__(self, profile: PowerProfile) -> None:
+        self.profile = profile
+
+    def get_current_profile(self) -> PowerProfile:
+        return self.profile
+
+
+async def _store_with_history(db_path: Path, completed: int, pending: int = 0) -> EventStore:
+    """A store whose completed events are all past the TTL."""
+    store = EventStore(str(db_path), ttl_seconds=3600)
+    await store.initialize()
+    for _ in range(completed):
+        event = Event(name="old.event", payload={"pad": "x" * 500})
+        await store.enqueue(event)
+        await store.mark_completed(event.id)
+    for _ in range(pending):
+        await store.enqueue(Event(name="open.event", payload={}))
+    store._conn.execute("UPDATE events SET created_at = created_at - 7200")
+    store._conn.commit()
+    return store
+
+
+def _count(store: EventStore, sql: str) -> int:
+    return store._conn.execute(sql).fetchone()[0]
+
+
+class TestRetention:
+    """A run deletes, archives and reclaims within its budget."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_expired_completed_events(self, tmp_path: Path) -> None:
+        store = await _store_with_history(tmp_path / "ret.db", completed=1200, pending=3)
+        recent = Event(name="recent.event", payload={})
+        await store.enqueue(recent)
+        await store.mark_completed(recent.id)
+
+        report = await RetentionService(store, batch_size=500).run_once()
+
+        assert report.rows_deleted == 1200
+        assert report.bytes_reclaimed > 0
+        assert not report.budget_exhausted
+        # Pending and recently completed events are untouched
+        assert _count(store, "SELECT COUNT(*) FROM events") == 4
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_time_budget_bounds_a_run(self, tmp_path: Path) -> None:
+        store = await _store_with_history(tmp_path / "budget.db", completed=300)
+        service = RetentionService(store, batch_size=10, max_run_time=0.0)
+
+        first = await service.run_once()
+        assert first.budget_exhausted and first.rows_deleted == 10
+
+        while (await service.run_once()).budget_exhausted:
+            pass
+        assert service.get_stats()["totals"]["rows_deleted"] == 300
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_archives_old_dead_letters(self, tmp_path: Path) -> None:
+        store = EventStore(str(tmp_path / "dead.db"), max_attempts=1)
+        await store.initialize()
+        events = [Event(name="bad.event", payload={"i": i}) for i in range(3)]
+        for event in events:
+            await store.enqueue(event)
+            await store.mark_failed(event.id, "boom")
+        store._conn.execute("UPDATE dead_letter_events SET dead_at = dead_at - 86400 WHERE id != ?", (events[2].id,))
+        store._conn.commit()
+
+        archive_dir = tmp_path / "archive"
+        service = RetentionService(store, archive_after=3600, archive_dir=str(archive_dir))
+        report = await service.run_once()
+
+        assert report.rows_archived == 2
+        assert await store.count_dead_letters() == 1
+        [archive] = archive_dir.iterdir()
+        with gzip.open(archive, "rt", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert sorted(r["payload"]["i"] for r in records) == [0, 1]
+        assert records[0]["error_message"] == "boom"
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_converts_non_incremental_database(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "legacy.db"
+        # A database created before auto_vacuum=INCREMENTAL was set
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE legacy (id INTEGER)")
+        conn.close()
+
+        store = await _store_with_history(db_path, completed=600)
+        assert _count(store, "PRAGMA auto_vacuum") == 0
+        size_before = db_path.stat().st_size
+
+        report = await RetentionService(store).run_once()
+
+        assert _count(store, "PRAGMA auto_vacuum") == 2
+        assert db_path.stat().st_size < size_before / 2
+        assert report.bytes_reclaimed > 0
+        await store.shutdown()
+
+
+class TestPowerBackoff:
+    """Low power profiles trim or skip runs."""
+
+    @pytest.mark.asyncio
+    async def test_critical_skips_run(self, tmp_path: Path) -> None:
+        store = await _store_with_history(tmp_path / "critical.db", completed=50)
+        service = RetentionService(store, FakeResourceManager(PowerProfile.CRITICAL))
+
+        report = await service.run_once()
+
+        assert report.skipped and report.rows_deleted == 0
+        assert _count(store, "SELECT COUNT(*) FROM events") == 50
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_power_saver_deletes_without_vacuum(self, tmp_path: Path) -> None:
+        store = await _store_with_history(tmp_path / "saver.db", completed=200)
+        service = RetentionService(store, FakeResourceManager(PowerProfile.POWER_SAVER))
+
+        report = await service.run_once()
+
+        assert report.rows_deleted == 200
+        assert report.bytes_reclaimed == 0
+        assert _count(store, "PRAGMA freelist_count") > 0
+        await store.shutdown()
@@ -0,0 +1,200 @@
+"""
+Retry and Dead-Letter Tests.
+Verifies backoff scheduling, the retry worker and dead-letter management.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+
+
+async def _store(tmp_path: Path, **kwargs) -> EventStore:
+    store = EventStore(str(tmp_path / "retry.db"), **kwargs)
+    await store.initialize()
+    return store
+
+
+def _row(store: EventStore, event_id: str) -> tuple | None:
+    return store._conn.execute(
+        "SELECT status, retry_count, next_attempt_at FROM events WHERE id = ?", (event_id,)
+    ).fetchone()
+
+
+class TestBackoff:
+    """mark_failed schedules retries with exponential backoff and jitter."""
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_per_attempt(self, tmp_path: Path) -> None:
+        store = await _store(tmp_path, retry_base_delay=10, retry_max_delay=1000)
+        event = Event(name="flaky.event", payload={})
+        await store.enqueue(event)
+
+        delays = []
+        for _ in range(3):
+            before = time.time()
+            await store.mark_failed(event.id, "boom")
+            delays.append(_row(store, event.id)[2] - before)
+
+        # Jitter keeps each delay within [0.5, 1.0] of 10, 20, 40 seconds
+        for attempt, delay in enumerate(delays):
+            full = 10 * 2 ** attempt
+            assert full * 0.5 - 0.1 <= delay <= full + 0.1
+        assert _row(store, event.id)[:2] == ("failed", 3)
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_capped(self, tmp_path: Path) -> None:
+        store = await _store(tmp_path, retry_base_delay=10, retry_max_delay=15, max_attempts=10)
+        event = Event(name="flaky.event", payload={})
+        await store.enqueue(event)
+
+        for _ in range(5):
+            await store.mark_failed(event.id, "boom")
+
+        assert _row(store, event.id)[2] - time.time() <= 15
+        await store.shutdown()
+
+
+class TestRetryClaims:
+    """Only due retries are claimed, via the partial retry index."""
+
+    @pytest.mark.asyncio
+    async def test_claims_only_due_rows(self, tmp_path: Path) -> None:
+        store = await _store(tmp_path, retry_base_delay=60)
+        due, later = Event(name="a.event", payload={}), Event(name="b.event", payload={})
+        for event in (due, later):
+            await store.enqueue(event)
+            await store.mark_failed(event.id, "boom")
+        store._conn.execute("UPDATE events SET next_attempt_at = 0 WHERE id = ?", (due.id,))
+        store._conn.commit()
+
+        claimed = await store.claim_due_retries()
+
+        assert [e.id for e in claimed] == [due.id]
+        assert _row(store, due.id)[0] == "processing"
+        assert await store.claim_due_retries() == []
+        assert await store.next_retry_at() == _row(store, later.id)[2]
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_retry_scan_uses_index(self, tmp_path: Path) -> None:
+        store = await _store(tmp_path)
+        statements = []
+        store._conn.set_trace_callback(statements.append)
+        await store.claim_due_retries()
+        store._conn.set_trace_callback(None)
+
+        select = next(sql for sql in statements if "SELECT" in sql)
+        plan = " ".join(row[3] for row in store._conn.execute("EXPLAIN QUERY PLAN " + select))
+
+        assert "USING INDEX idx_events_retry" in plan
+        assert "SCAN events" not in plan
+        await store.shutdown()
+
+
+class TestDeadLetters:
+    """Events that exhaust their attempts move to the dead-letter table."""
+
+    async def _dead(self, tmp_path: Path, count: int = 1, name: str = "dead.event") -> tuple[EventStore, list[Event]]:
+        store = await _store(tmp_path, max_attempts=2)
+        events = [Event(name=name, payload={"i": i}) for i in range(count)]
+        for event in events:
+            await store.enqueue(event)
+            await store.mark_failed(event.id, "first")
+            await store.mark_failed(event.id, "second")
+        return store, events
+
+    @pytest.mark.asyncio
+    async def test_moved_after_max_attempts(self, tmp_path: Path) -> None:
+        store, (event,) = await self._dead(tmp_path)
+
+        assert _row(store, event.id) is None
+        entries = await store.list_dead_letters()
+        assert len(entries) == 1
+        assert entries[0]["event"].id == event.id
+        assert entries[0]["event"].payload == {"i": 0}
+        assert entries[0]["retry_count"] == 2
+        assert entries[0]["error_message"] == "second"
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_redrive_resets_attempts(self, tmp_path: Path) -> None:
+        store, events = await self._dead(tmp_path, count=3)
+
+        assert await store.redrive_dead_letters(ids=[events[0].id]) == 1
+        assert await store.count_dead_letters() == 2
+        assert _row(store, events[0].id)[:2] == ("failed", 0)
+        assert [e.id for e in await store.claim_due_retries()] == [events[0].id]
+
+        assert await store.redrive_dead_letters() == 2
+        assert await store.count_dead_letters() == 0
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_purge_in_bulk(self, tmp_path: Path) -> None:
+        store, _ = await self._dead(tmp_path, count=3, name="old.event")
+        for event in [Event(name="new.event", payload={}) for _ in range(2)]:
+            await store.enqueue(event)
+            await store.mark_failed(event.id, "x")
+            await store.mark_failed(event.id, "y")
+
+        assert await store.purge_dead_letters(event_name="old.event") == 3
+        assert await store.count_dead_letters() == 2
+        assert await store.purge_dead_letters(before=time.time() + 1) == 2
+        await store.shutdown()
+
+
+class TestRetryWorker:
+    """The dispatcher re-drives due events until they succeed or die."""
+
+    @pytest.mark.asyncio
+    async def test_flaky_handler_eventually_completes(self, tmp_path: Path) -> None:
+        store = await _store(tmp_path, retry_base_delay=0.01, retry_max_delay=0.02)
+        dispatcher = EventDispatcher(store)
+        attempts = 0
+
+        async def flaky(event: Event):
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise RuntimeError("not yet")
+
+        dispatcher.subscribe("flaky.event", flaky)
+        event = Event(name="flaky.event", payload={})
+        await dispatcher.dispatch(event)
+
+        worker = asyncio.create_task(dispatcher.run_retry_worker(max_sleep=0.01))
+        try:
+            await asyncio.sleep(0.3)
+        finally:
+            worker.cancel()
+
+        assert attempts == 3
+        assert _row(store, event.id)[0] == "completed"
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_persistent_failure_is_dead_lettered(self, tmp_path: Path) -> None:
+        store = await _store(tmp_path, max_attempts=3, retry_base_delay=0)
+        dispatcher = EventDispatcher(store)
+
+        async def broken(event: Event):
+            raise RuntimeError("always")
+
+        dispatcher.subscribe("broken.event", broken)
+        await dispatcher.dispatch(Event(name="broken.event", payload={}))
+
+        for _ in range(5):
+            await asyncio.sleep(0.02)
+            await dispatcher.process_retries()
+
+        assert await store.count_dead_letters("broken.event") == 1
+        assert await store.get_failed_count() == 0
+        await store.shutdown()
@@ -0,0 +1,140 @@
+import asyncio
+import gc
+import time
+
+import pytest
+
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.events import Event
+from aos.bus.routing import RoutingTable
+
+
+async def _noop(event: Event) -> None:
+    pass
+
+
+async def _other(event: Event) -> None:
+    pass
+
+
+def _handlers(routes):
+    return [handler for _, handler in routes]
+
+
+class TestRoutingTable:
+    """Pattern matching on the compiled trie."""
+
+    def test_exact_match(self):
+        table = RoutingTable([("agri.harvest_recorded", _noop)])
+        assert _handlers(table.match("agri.harvest_recorded")) == [_noop]
+        assert table.match("agri.harvest") == ()
+
+    def test_trailing_wildcard_matches_any_suffix(self):
+        table = RoutingTable([("community.broadcast.*", _noop)])
+        assert table.match("community.broadcast.sent")
+        assert table.match("community.broadcast.sms.delivered")
+        assert table.match("community.broadcast") == ()
+        assert table.match("community.group.created") == ()
+
+    def test_middle_wildcard_matches_one_segment(self):
+        table = RoutingTable([("community.*.created", _noop)])
+        assert table.match("community.group.created")
+        assert table.match("community.group.member.created") == ()
+
+    def test_globals_come_last_in_registration_order(self):
+        table = RoutingTable([
+            ("all", _other),
+            ("agri.*", _noop),
+            ("agri.harvest_recorded", _other),
+        ])
+        routes = table.match("agri.harvest_recorded")
+        assert routes == (
+            ("agri.*", _noop),
+            ("agri.harvest_recorded", _other),
+            ("all", _other),
+        )
+
+    def test_match_cache_is_bounded(self):
+        table = RoutingTable([("agri.*", _noop)], cache_size=8)
+        for i in range(100):
+            table.match(f"agri.event_{i}")
+        assert len(table._cache) <= 8
+
+    def test_is_pattern(self):
+        assert RoutingTable.is_pattern("agri.*")
+        assert RoutingTable.is_pattern("all")
+        assert not RoutingTable.is_pattern("agri.harvest_recorded")
+
+
+class TestDispatcherRouting:
+    """Dispatcher integration with the routing table."""
+
+    def test_subscribe_swaps_table(self):
+        dispatcher = EventDispatcher()
+        before = dispatcher._routes
+        dispatcher.subscribe("agri.*", _noop)
+        assert dispatcher._routes is not before
+        assert len(dispatcher._routes) == 1
+        # Old table is untouched (copy-on-write)
+        assert len(before) == 0
+
+    @pytest.mark.asyncio
+    async def test_dispatch_does_not_grow_subscriber_lists(self):
+        """Global handlers used to be appended onto the per-event list."""
+        dispatcher = EventDispatcher()
+        calls = []
+
+        async def handler(event: Event):
+            calls.append(event.id)
+
+        dispatcher.subscribe("agri.harvest_recorded", handler)
+        dispatcher.subscribe_all(_noop)
+
+        for _ in range(10):
+            await dispatcher.dispatch(Event(name="agri.harvest_recorded", payload={}))
+        await asyncio.sleep(0.01)
+
+        assert len(calls) == 10
+        assert dispatcher._subscribers["agri.harvest_recorded"] == [handler]
+        assert len(dispatcher._routes.match("agri.harvest_recorded")) == 2
+
+    @pytest.mark.asyncio
+    async def test_million_dispatches_stay_flat(self):
+        """Lookup time and memory do not drift across 1M dispatches."""
+        dispatcher = EventDispatcher()
+        received = 0
+
+        async def handler(event: Event):
+            nonlocal received
+            received += 1
+
+        for i in range(1000):
+            dispatcher.subscribe(f"module_{i}.event", _noop)
+        dispatcher.subscribe("agri.*", handler)
+
+        event = Event(name="agri.harvest_recorded", payload={})
+        total, chunk = 1_000_000, 100_000
+        timings = []
+
+        gc.collect()
+        objects_before = len(gc.get_objects())
+
+        for _ in range(total // chunk):
+            start = time.perf_counter()
+            for i in range(chunk):
+                await dispatcher.dispatch(event)
+                if i % 1000 == 0:
+                    await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            timings.append(time.perf_counter() - start)
+
+        await asyncio.sleep(0)
+        gc.collect()
+        objects_after = len(gc.get_objects())
+
+        assert received == total
+        # Flat cost: the last chunk is not meaningfully slower than the fastest
+        assert timings[-1] < min(timings) * 3
+        # Flat memory: no per-dispatch state is retained
+        assert objects_after - objects_before < 1000
+        assert dispatcher._subscribers["agri.*"] == [handler]
@@ -115,3 +115,104 @@ class TestCrashRecovery:
         assert await store.get_failed_count() == 1
 
         await store.shutdown()
+
+
+async def _journal(db_path: str, count: int, name: str = "backlog.event") -> list[Event]:
+    """Simulate a crash that leaves ``count`` events pending."""
+    store = EventStore(db_path)
+    await store.initialize()
+    events = [Event(name=name, payload={"i": i}) for i in range(count)]
+    for event in events:
+        await store.enqueue(event)
+    await store.shutdown()
+    return events
+
+
+class TestStreamingRecovery:
+    """Recovery must replay the whole backlog, not just the first page."""
+
+    @pytest.mark.asyncio
+    async def test_recovers_backlog_larger_than_a_page(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "backlog.db")
+        await _journal(db_path, 350)
+
+        store = EventStore(db_path)
+        await store.initialize()
+        dispatcher = EventDispatcher(store=store)
+        handled = []
+
+        async def handler(e: Event):
+            handled.append(e.payload["i"])
+
+        dispatcher.subscribe("backlog.event", handler)
+        progress = []
+
+        recovered = await dispatcher.recover_pending_events(
+            batch_size=50, progress=lambda done, total: progress.append((done, total))
+        )
+        await asyncio.sleep(0.1)
+
+        assert recovered == 350
+        assert sorted(handled) == list(range(350))
+        assert progress[0] == (50, 350)
+        assert progress[-1] == (350, 350)
+        assert await store.count_pending_events() == 0
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_keyset_cursor_breaks_created_at_ties(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "ties.db")
+        events = await _journal(db_path, 25)
+
+        store = EventStore(db_path)
+        await store.initialize()
+        # Every event shares one created_at, so only the id orders them
+        store._conn.execute("UPDATE events SET created_at = 1000.0")
+        store._conn.commit()
+
+        streamed = [e.id async for e in store.iter_pending_events(batch_size=4)]
+
+        assert streamed == sorted(e.id for e in events)
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_events_after_watermark_are_not_replayed(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "watermark.db")
+        await _journal(db_path, 3)
+
+        store = EventStore(db_path)
+        await store.initialize()
+        cutoff = store._conn.execute("SELECT MAX(created_at) FROM events").fetchone()[0]
+        late = Event(name="backlog.event", payload={"late": True})
+        await store.enqueue(late)
+
+        streamed = [e async for e in store.iter_pending_events(until=cutoff)]
+
+        assert len(streamed) == 3
+        assert late.id not in {e.id for e in streamed}
+        assert await store.count_pending_events(until=cutoff) == 3
+        await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_replay_rate_is_throttled(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "throttle.db")
+        await _journal(db_path, 20)
+
+        store = EventStore(db_path)
+        await store.initialize()
+        dispatcher = EventDispatcher(store=store)
+
+        async def handler(e: Event):
+            pass
+
+        dispatcher.subscribe("backlog.event", handler)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        recovered = await dispatcher.recover_pending_events(rate=200)
+        elapsed = loop.time() - started
+
+        assert recovered == 20
+        # 20 events at 200/s cannot finish in under ~0.1s
+        assert elapsed >= 0.09
+        await store.shutdown()
@@ -0,0 +1,137 @@
+"""
+Async Database Facade Tests.
+Verifies that SQLite work is moved off the event loop onto a dedicated
+writer thread and a reader pool, and that EventStore/BaseRepository adopt it.
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from aos.bus.event_store import EventStore
+from aos.bus.events import Event
+from aos.db.async_engine import AsyncDatabase
+from aos.db.engine import connect
+from aos.db.migrations import MigrationManager
+from aos.db.migrations.registry import MIGRATIONS
+from aos.db.models import NodeDTO
+from aos.db.repository import NodeRepository
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = AsyncDatabase(str(tmp_path / "async.db"), readers=2)
+    db.start()
+    yield db
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_run_on_writer_thread(database):
+    """Writes must execute on the single dedicated writer thread."""
+    await database.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    names = await asyncio.gather(*[
+        database.run_write(lambda conn: threading.current_thread().name)
+        for _ in range(5)
+    ])
+    assert set(names) == {"aos-db-writer"}
+
+
+@pytest.mark.asyncio
+async def test_reads_run_on_reader_pool_and_see_commits(database):
+    """Reads must run on reader threads and observe committed writes."""
+    await database.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    await database.executemany("INSERT INTO t (v) VALUES (?)", [("a",), ("b",)])
+
+    rows = await database.fetchall("SELECT v FROM t ORDER BY id")
+    assert [r["v"] for r in rows] == ["a", "b"]
+
+    name = await database.run_read(lambda conn: threading.current_thread().name)
+    assert name.startswith("aos-db-reader")
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back(database):
+    """An exception inside a write must roll back the whole request."""
+    await database.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+
+    def bad_write(conn: sqlite3.Connection) -> None:
+        conn.execute("INSERT INTO t (v) VALUES ('partial')")
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await database.run_write(bad_write)
+
+    row = await database.fetchone("SELECT COUNT(*) FROM t")
+    assert row[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_write_does_not_block_event_loop(database):
+    """A slow write must not stall other coroutines on the loop."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await database.run_write(lambda conn: time.sleep(0.3))
+    task.cancel()
+
+    assert ticks >= 10, "Event loop must keep running during the write"
+
+
+@pytest.mark.asyncio
+async def test_event_store_adopts_facade(tmp_path):
+    """EventStore must journal and recover through the facade."""
+    db_path = str(tmp_path / "bus.db")
+    database = AsyncDatabase(db_path)
+    store = EventStore(db_path, database=database)
+    await store.initialize()
+
+    try:
+        event = Event(name="facade.event", payload={"id": 1})
+        await store.enqueue(event)
+
+        pending = await store.get_pending_events()
+        assert [e.id for e in pending] == [event.id]
+
+        dequeued = await store.dequeue()
+        await store.mark_completed(dequeued.id)
+        assert await store.get_queue_depth() == 0
+    finally:
+        await store.shutdown()
+        database.close()
+
+
+@pytest.mark.asyncio
+async def test_repository_async_api(tmp_path):
+    """BaseRepository coroutine methods must work with and without a facade."""
+    db_path = str(tmp_path / "repo.db")
+    conn = connect(db_path)
+    MigrationManager(conn).apply_migrations(MIGRATIONS)
+
+    repo = NodeRepository(conn)
+    repo.upsert(NodeDTO(id="n1", public_key=b"pk1"))
+
+    # Without a facade the async API falls back to the shared connection
+    assert (await repo.get_by_id_async("n1")).id == "n1"
+
+    database = AsyncDatabase(db_path)
+    database.start()
+    try:
+        repo.attach_database(database)
+        assert (await repo.get_by_id_async("n1")).public_key == b"pk1"
+        assert len(await repo.list_all_async()) == 1
+        assert await repo.delete_async("n1") is True
+        assert repo.get_by_id("n1") is None
+    finally:
+        database.close()
+        conn.close()
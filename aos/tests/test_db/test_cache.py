@@ -0,0 +1,250 @@
+"""
+Repository Cache Tests.
+Verifies read-through hits, invalidation on writes and bus events, TTL and
+memory limits, and that the /join path stops reaching SQLite once warm.
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from aos.bus.dispatcher import EventDispatcher
+from aos.bus.events import Event
+from aos.core.institution.service import InstitutionService
+from aos.core.vehicles.router import CommandRouter
+from aos.db.cache import INVALIDATE_EVENT, RepositoryCache
+from aos.db.migrations import MigrationManager
+from aos.db.migrations.registry import MIGRATIONS
+from aos.db.models import CommunityGroupDTO
+from aos.db.repository import (
+    CommunityGroupRepository,
+    InstitutionalAttendanceRepository,
+    InstitutionalAuditRepository,
+    InstitutionalFinanceRepository,
+    InstitutionGroupMemberRepository,
+    InstitutionGroupRepository,
+    InstitutionMemberRepository,
+    InstitutionMessageLogRepository,
+    MemberVehicleMapRepository,
+    PrayerRequestRepository,
+)
+
+
+@pytest.fixture
+def db_conn():
+    conn = sqlite3.connect(":memory:")
+    MigrationManager(conn).apply_migrations(MIGRATIONS)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def cache() -> RepositoryCache:
+    return RepositoryCache()
+
+
+@pytest.fixture
+def groups(db_conn, cache) -> CommunityGroupRepository:
+    repo = CommunityGroupRepository(db_conn)
+    repo.attach_cache(cache)
+    repo.save(CommunityGroupDTO(id="g1", name="Chapel", community_code="CHAPEL", code_active=True))
+    return repo
+
+
+def _count_selects(conn: sqlite3.Connection) -> list[str]:
+    statements: list[str] = []
+    conn.set_trace_callback(lambda sql: statements.append(sql) if sql.lstrip().upper().startswith("SELECT") else None)
+    return statements
+
+
+class TestReadThrough:
+    """Lookups are served from memory until the table is written."""
+
+    def test_repeated_lookups_hit(self, db_conn, groups, cache) -> None:
+        selects = _count_selects(db_conn)
+
+        for code in ("chapel", "CHAPEL", " Chapel "):
+            assert groups.get_by_code(code).id == "g1"
+        assert groups.get_by_id("g1").name == "Chapel"
+        assert groups.get_by_id("g1").name == "Chapel"
+
+        assert len(selects) == 2
+        stats = cache.get_stats()
+        assert stats["tables"]["community_groups"]["hits"] == 3
+        assert stats["misses"] == 2
+
+    def test_save_and_delete_invalidate(self, groups) -> None:
+        group = groups.get_by_code("CHAPEL")
+        group.name = "Cathedral"
+        groups.save(group)
+        assert groups.get_by_code("CHAPEL").name == "Cathedral"
+
+        groups.delete("g1")
+        assert groups.get_by_code("CHAPEL") is None
+        assert groups.get_by_id("g1") is None
+
+    def test_negative_lookup_flushed_by_save(self, groups) -> None:
+        assert groups.get_by_code("MOSQUE") is None
+        groups.save(CommunityGroupDTO(id="g2", name="Mosque", community_code="MOSQUE", code_active=True))
+        assert groups.get_by_code("MOSQUE").id == "g2"
+
+    def test_find_cached_per_filter(self, db_conn, groups) -> None:
+        selects = _count_selects(db_conn)
+        assert [g.id for g in groups.find({"active": True})] == ["g1"]
+        assert [g.id for g in groups.find({"active": True})] == ["g1"]
+        assert groups.find({"active": False}) == []
+        assert len(selects) == 2
+
+    def test_callers_get_copies(self, groups) -> None:
+        groups.get_by_code("CHAPEL").name = "Changed"
+        groups.find({"active": True})[0].name = "Changed"
+        assert groups.get_by_code("CHAPEL").name == "Chapel"
+        assert groups.find({"active": True})[0].name == "Chapel"
+
+    def test_uncached_repository_unaffected(self, db_conn, groups) -> None:
+        assert groups.get_by_code("CHAPEL").name == "Chapel"
+        # A second instance writes without the cache; its writer announces it
+        CommunityGroupRepository(db_conn).save(
+            CommunityGroupDTO(id="g1", name="Renamed", community_code="CHAPEL", code_active=True)
+        )
+        assert groups.get_by_code("CHAPEL").name == "Chapel"
+        groups.cache.invalidate("community_groups")
+        assert groups.get_by_code("CHAPEL").name == "Renamed"
+
+
+class TestLimits:
+    """Entries expire after the TTL and tables stay within their memory limit."""
+
+    def test_ttl_expiry(self) -> None:
+        cache = RepositoryCache(ttl=0.0)
+        loads = []
+        for _ in range(3):
+            cache.get_or_load("t", "k", lambda: loads.append(1) or "v")
+        assert len(loads) == 3
+
+    def test_misses_expire_sooner(self) -> None:
+        cache = RepositoryCache(ttl=300.0, miss_ttl=0.0)
+        loads = []
+        for _ in range(2):
+            cache.get_or_load("t", "missing", lambda: loads.append("missing"))
+            cache.get_or_load("t", "empty", lambda: loads.append("empty") or [])
+            cache.get_or_load("t", "hit", lambda: loads.append("hit") or "v")
+        assert loads == ["missing", "empty", "hit", "missing", "empty"]
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = RepositoryCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.get_or_load("t", key, lambda key=key: key)
+        cache.get_or_load("t", "a", lambda: "reloaded")
+        cache.get_or_load("t", "c", lambda: "c")
+
+        assert cache.get_or_load("t", "a", lambda: "reloaded") == "a"
+        assert cache.get_or_load("t", "b", lambda: "reloaded") == "reloaded"
+        assert cache.get_stats()["tables"]["t"]["evictions"] == 2
+
+    def test_byte_limit(self) -> None:
+        cache = RepositoryCache(max_bytes=4096, limits={"big": 64})
+        value = "x" * 1000
+        for key in range(10):
+            cache.get_or_load("t", key, lambda: value)
+
+        tables = cache.get_stats()["tables"]
+        assert tables["t"]["bytes"] <= 4096
+        assert tables["t"]["entries"] < 10
+        # Too large for its table: returned, never stored
+        assert cache.get_or_load("big", "k", lambda: value) == value
+        assert cache.get_stats()["tables"]["big"]["entries"] == 0
+
+    def test_load_straddling_invalidation_not_stored(self) -> None:
+        cache = RepositoryCache()
+
+        def load():
+            cache.invalidate("t")
+            return "stale"
+
+        assert cache.get_or_load("t", "k", load) == "stale"
+        assert cache.get_or_load("t", "k", lambda: "fresh") == "fresh"
+
+
+class TestEvents:
+    """Writes made outside the cached repositories arrive over the bus."""
+
+    @pytest.mark.asyncio
+    async def test_domain_and_generic_events(self, cache) -> None:
+        dispatcher = EventDispatcher()
+        cache.subscribe(dispatcher)
+        for table in ("community_groups", "community_events"):
+            cache.get_or_load(table, "k", lambda: "v")
+
+        await dispatcher.dispatch(Event(name="COMMUNITY_GROUP_REGISTERED", payload={"group_id": "g9"}))
+        await asyncio.sleep(0.01)
+        tables = cache.get_stats()["tables"]
+        assert tables["community_groups"]["entries"] == 0
+        assert tables["community_events"]["entries"] == 1
+
+        await dispatcher.dispatch(Event(name=INVALIDATE_EVENT, payload={}))
+        await asyncio.sleep(0.01)
+        assert cache.get_stats()["tables"]["community_events"]["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_member_written_elsewhere_is_announced(
+        self, db_conn: sqlite3.Connection, cache: RepositoryCache
+    ) -> None:
+        dispatcher = EventDispatcher()
+        cache.subscribe(dispatcher)
+        service = _service(db_conn, dispatcher)
+        service.attach_cache(cache)
+        assert service.get_member_by_vehicle("sms", "555") is None
+
+        # Another node's service writes the member and announces it
+        other = _service(db_conn, dispatcher)
+        member = other.register_member("c1", "Ann", "sms", "555")
+        await other.publish_member_event("INSTITUTION_MEMBER_REGISTERED", member)
+        await asyncio.sleep(0.01)
+        assert service.get_member_by_vehicle("sms", "555").id == member.id
+
+        member.role_id = "ADMIN"
+        other.members.save(member)
+        await other.publish_member_event("INSTITUTION_MEMBER_UPDATED", member)
+        await asyncio.sleep(0.01)
+        assert service.can_broadcast(member.id)
+
+
+def _service(db_conn: sqlite3.Connection, dispatcher: EventDispatcher | None = None) -> InstitutionService:
+    return InstitutionService(
+        member_repo=InstitutionMemberRepository(db_conn),
+        group_repo=InstitutionGroupRepository(db_conn),
+        msg_log_repo=InstitutionMessageLogRepository(db_conn),
+        prayer_repo=PrayerRequestRepository(db_conn),
+        vmap_repo=MemberVehicleMapRepository(db_conn),
+        community_repo=CommunityGroupRepository(db_conn),
+        group_member_repo=InstitutionGroupMemberRepository(db_conn),
+        attendance_repo=InstitutionalAttendanceRepository(db_conn),
+        finance_repo=InstitutionalFinanceRepository(db_conn),
+        audit_repo=InstitutionalAuditRepository(db_conn),
+        dispatcher=dispatcher,
+    )
+
+
+class TestJoinPath:
+    """The per-message /join lookups stop reaching SQLite once warm."""
+
+    @pytest.mark.asyncio
+    async def test_steady_state_join_is_served_from_cache(self, db_conn, cache) -> None:
+        service = _service(db_conn)
+        service.attach_cache(cache)
+        service.communities.save(CommunityGroupDTO(id="c1", name="Chapel", community_code="CHAPEL", code_active=True))
+        router = CommandRouter(service)
+
+        reply = await router.handle_join("555", "chapel", vehicle_type="sms", user_name="Ann")
+        assert reply.startswith("Successfully joined")
+        await router.handle_join("555", "chapel", vehicle_type="sms")
+
+        selects = _count_selects(db_conn)
+        for _ in range(20):
+            reply = await router.handle_join("555", "chapel", vehicle_type="sms")
+            assert reply == "You are already a member of Chapel."
+        assert selects == []
+        assert cache.get_stats()["hit_rate"] > 0.5
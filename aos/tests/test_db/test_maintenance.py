@@ -0,0 +1,147 @@
+"""
+Maintenance Service Tests.
+Verifies the incremental integrity cycle, statistics refresh, WAL
+truncation, page reclamation and power-profile gating.
+"""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from aos.core.resource.profiles import PowerProfile
+from aos.db.async_engine import AsyncDatabase
+from aos.db.maintenance import JOBS, MaintenanceService
+
+
+class FakeResourceManager:
+    def __init__(self, profile: PowerProfile) -> None:
+        self.profile = profile
+
+    def get_current_profile(self) -> PowerProfile:
+        return self.profile
+
+
+@pytest.fixture
+def database(tmp_path: Path):
+    db_path = str(tmp_path / "maint.db")
+    db = AsyncDatabase(db_path, readers=1)
+    db.start()
+
+    conn = sqlite3.connect(db_path)
+    for name in ("alpha", "beta", "gamma"):
+        conn.execute(f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, body TEXT)")
+        conn.execute(f"CREATE INDEX idx_{name}_body ON {name} (body)")
+        conn.executemany(f"INSERT INTO {name} (body) VALUES (?)", [(f"row {i}",) for i in range(200)])
+    conn.commit()
+    conn.close()
+
+    yield db
+    db.close()
+
+
+class TestIntegrity:
+    """The full check is spread over runs, one cycle through all tables."""
+
+    @pytest.mark.asyncio
+    async def test_cycle_covers_every_table(self, database) -> None:
+        service = MaintenanceService(database, integrity_max_run_time=0.0)
+
+        checked = []
+        for _ in range(3):
+            [report] = await service.run_once(["integrity"])
+            assert len(report.effect["tables"]) == 1
+            assert report.effect["errors"] == []
+            checked += report.effect["tables"]
+
+        assert checked == ["alpha", "beta", "gamma"]
+        assert report.effect["cycle_complete"]
+        assert service.last_integrity_cycle is not None
+
+        # The next cycle starts over
+        [report] = await service.run_once(["integrity"])
+        assert report.effect["tables"] == ["alpha"]
+
+    @pytest.mark.asyncio
+    async def test_budget_allows_whole_cycle(self, database) -> None:
+        [report] = await MaintenanceService(database, integrity_max_run_time=10.0).run_once(["integrity"])
+
+        assert report.effect["tables"] == ["alpha", "beta", "gamma"]
+        assert report.effect["cycle_complete"]
+
+
+class TestSpaceAndStatistics:
+    """optimize, checkpoint and vacuum report what they changed."""
+
+    @pytest.mark.asyncio
+    async def test_first_optimize_analyzes_everything(self, database) -> None:
+        service = MaintenanceService(database)
+
+        [first] = await service.run_once(["optimize"])
+        assert first.effect["statement"] == "ANALYZE"
+        assert first.effect["stat_rows"] >= 3
+
+        [second] = await service.run_once(["optimize"])
+        assert second.effect["statement"].startswith("PRAGMA optimize")
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_waits_for_threshold(self, database) -> None:
+        wal = Path(f"{database.sqlite_path}-wal")
+        await database.execute("UPDATE alpha SET body = body || 'x'")
+        size = wal.stat().st_size
+        assert size > 0
+
+        [below] = await MaintenanceService(database, wal_threshold=size + 1).run_once(["checkpoint"])
+        assert not below.effect["checkpointed"]
+
+        [above] = await MaintenanceService(database, wal_threshold=1).run_once(["checkpoint"])
+        assert above.effect["checkpointed"]
+        assert above.effect["bytes_reclaimed"] == size
+        assert wal.stat().st_size == 0
+
+    @pytest.mark.asyncio
+    async def test_vacuum_returns_free_pages(self, database) -> None:
+        await database.run_write(lambda conn: conn.execute("DROP TABLE gamma"))
+
+        [report] = await MaintenanceService(database).run_once(["vacuum"])
+
+        assert report.effect["incremental"]
+        assert report.effect["bytes_reclaimed"] > 0
+        assert report.effect["free_bytes"] == 0
+
+
+class TestScheduling:
+    """Jobs run on their own intervals and only on their power profiles."""
+
+    @pytest.mark.asyncio
+    async def test_due_jobs_follow_intervals(self, database) -> None:
+        service = MaintenanceService(database)
+
+        first = await service.run_once()
+        assert [r.job for r in first] == list(JOBS)
+        assert not any(r.skipped for r in first)
+
+        # Nothing is due again straight away
+        assert await service.run_once() == []
+
+    @pytest.mark.asyncio
+    async def test_profile_gates_jobs(self, database) -> None:
+        manager = FakeResourceManager(PowerProfile.POWER_SAVER)
+        service = MaintenanceService(database, resource_manager=manager)
+
+        reports = {r.job: r for r in await service.run_once()}
+        assert not reports["checkpoint"].skipped
+        assert reports["integrity"].skipped and reports["vacuum"].skipped
+
+        manager.profile = PowerProfile.CRITICAL
+        assert all(r.skipped for r in await service.run_once())
+
+        # Skipped jobs run as soon as the profile recovers
+        manager.profile = PowerProfile.FULL_POWER
+        assert {r.job for r in await service.run_once()} == {"optimize", "vacuum", "integrity"}
+
+        stats = service.get_stats()
+        assert stats["totals"]["integrity"]["runs"] == 1
+        assert stats["totals"]["integrity"]["skipped"] == 2
+        assert stats["last_run"]["integrity"]["profile"] == "FULL_POWER"
@@ -1,8 +1,19 @@
 
+import dataclasses
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
+from aos.core.security.password import verify_password
 from aos.db.engine import connect
 from aos.db.migrations import MigrationManager
+from aos.db.migrations.registry import MIGRATIONS, SNAPSHOT
+from aos.db.migrations.snapshot import build_snapshot
 
 
 @pytest.fixture
@@ -65,3 +76,95 @@ def test_migration_idempotency(temp_db):
 
     cursor = conn.execute("SELECT COUNT(*) FROM schema_migrations")
     assert cursor.fetchone()[0] == 1
+
+
+def _master(conn):
+    rows = conn.execute("SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY type, name")
+    return [tuple(r) for r in rows]
+
+
+def _versions(conn):
+    return [tuple(r) for r in conn.execute("SELECT version_id, migration_hash FROM schema_migrations ORDER BY version_id")]
+
+
+def test_snapshot_provisioning_matches_migrations(tmp_path):
+    """A snapshot-provisioned database is the one the migrations produce."""
+    migrated = connect(str(tmp_path / "migrated.db"))
+    provisioned = connect(str(tmp_path / "provisioned.db"))
+    MigrationManager(migrated).apply_migrations(MIGRATIONS)
+    MigrationManager(provisioned).apply_migrations(MIGRATIONS, snapshot=SNAPSHOT)
+
+    assert _master(provisioned) == _master(migrated)
+    assert _versions(provisioned) == _versions(migrated)
+
+    # Same seed rows; account ids are the node's own
+    for table in ("crops", "routes"):
+        query = f"SELECT * FROM {table} ORDER BY id"
+        assert [tuple(r) for r in provisioned.execute(query)] == [tuple(r) for r in migrated.execute(query)]
+    query = "SELECT id, name, permissions FROM roles ORDER BY name"
+    roles = [tuple(r) for r in provisioned.execute(query)]
+    assert [r[1:] for r in roles] == [tuple(r)[1:] for r in migrated.execute(query)]
+    assert not {r[0] for r in roles} & {r[0] for r in migrated.execute(query)}
+    admin = provisioned.execute(
+        "SELECT r.name, o.password_hash FROM operators o JOIN roles r ON r.id = o.role_id WHERE o.username = 'admin'"
+    ).fetchone()
+    assert admin[0] == "admin"
+    # Hashed on this node, never copied from the snapshot
+    assert "operators" not in SNAPSHOT.rows
+    assert admin[1] != migrated.execute("SELECT password_hash FROM operators").fetchone()[0]
+    assert verify_password("aos_root_2025", admin[1])
+
+    # Already provisioned: nothing left to apply
+    MigrationManager(provisioned).apply_migrations(MIGRATIONS, snapshot=SNAPSHOT)
+    assert len(_versions(provisioned)) == len(MIGRATIONS)
+    migrated.close()
+    provisioned.close()
+
+
+def test_snapshot_is_current():
+    """The committed snapshot matches the migrations (regenerate with python -m aos.db.migrations.snapshot)."""
+    assert SNAPSHOT == build_snapshot(MIGRATIONS)
+
+
+def test_snapshot_matches_from_another_checkout(tmp_path):
+    """Migration hashes do not depend on where the code is installed (e.g. /app in the image)."""
+    package = Path(__file__).resolve().parents[2]
+    shutil.copytree(package, tmp_path / "aos", ignore=shutil.ignore_patterns("__pycache__", "*.db*"))
+    result = subprocess.run(
+        [sys.executable, "-m", "aos.db.migrations.snapshot", "--check"],
+        cwd=tmp_path, env={**os.environ, "PYTHONPATH": str(tmp_path)},
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert str(tmp_path) in subprocess.run(
+        [sys.executable, "-c", "import aos; print(aos.__file__)"],
+        cwd=tmp_path, env={**os.environ, "PYTHONPATH": str(tmp_path)},
+        capture_output=True, text=True,
+    ).stdout
+
+
+def test_migrations_after_snapshot_are_applied():
+    """Migrations newer than the snapshot run incrementally on top of it."""
+    migrated = sqlite3.connect(":memory:")
+    provisioned = sqlite3.connect(":memory:")
+    MigrationManager(migrated).apply_migrations(MIGRATIONS)
+    MigrationManager(provisioned).apply_migrations(MIGRATIONS, snapshot=build_snapshot(MIGRATIONS[:-1]))
+
+    assert _master(provisioned) == _master(migrated)
+    assert _versions(provisioned) == _versions(migrated)
+
+
+def test_snapshot_only_provisions_empty_databases():
+    """Upgrades and stale snapshots go through the migrations."""
+    upgraded = sqlite3.connect(":memory:")
+    MigrationManager(upgraded).apply_migrations(MIGRATIONS[:5])
+    MigrationManager(upgraded).apply_migrations(MIGRATIONS, snapshot=SNAPSHOT)
+
+    stale = dataclasses.replace(SNAPSHOT, versions=[(v, "0" * 64) for v, _ in SNAPSHOT.versions], schema=[])
+    fresh = sqlite3.connect(":memory:")
+    MigrationManager(fresh).apply_migrations(MIGRATIONS, snapshot=stale)
+
+    migrated = sqlite3.connect(":memory:")
+    MigrationManager(migrated).apply_migrations(MIGRATIONS)
+    assert _master(upgraded) == _master(migrated)
+    assert _master(fresh) == _master(migrated)
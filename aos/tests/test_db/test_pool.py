@@ -0,0 +1,165 @@
+"""
+Connection Pool Tests.
+Verifies the single serialized writer, read-only WAL readers that run
+alongside an open write transaction, repository writes sharing the writer
+lock, and the FastAPI dependency.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from aos.api.dependencies import get_read_db
+from aos.api.state import core_state
+from aos.db.engine import ConnectionPool
+from aos.db.migrations import MigrationManager
+from aos.db.migrations.registry import MIGRATIONS
+from aos.db.models import CommunityGroupDTO
+from aos.db.repository import CommunityGroupRepository
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), readers=2, timeout=0.2)
+    with pool.writer() as conn:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    yield pool
+    pool.close()
+
+
+def test_writer_commits_or_rolls_back(pool):
+    with pool.writer() as conn:
+        conn.execute("INSERT INTO t (v) VALUES ('kept')")
+
+    with pytest.raises(RuntimeError):
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO t (v) VALUES ('dropped')")
+            raise RuntimeError("handler failed")
+
+    with pool.reader() as conn:
+        assert [r["v"] for r in conn.execute("SELECT v FROM t")] == ["kept"]
+
+
+def test_readers_are_read_only(pool):
+    with pool.reader() as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO t (v) VALUES ('x')")
+
+
+def test_reader_runs_while_write_is_open(pool):
+    with pool.writer() as conn:
+        conn.execute("INSERT INTO t (v) VALUES ('committed')")
+
+    with pool.writer() as conn:
+        conn.execute("INSERT INTO t (v) VALUES ('in progress')")
+        # A reader sees the last committed snapshot without waiting for the writer
+        with pool.reader() as reader:
+            assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+
+def test_writer_is_serialized(pool):
+    entered = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def hold() -> None:
+        with pool.writer():
+            entered.set()
+            release.wait()
+            order.append("first")
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    entered.wait()
+
+    def second() -> None:
+        with pool.writer():
+            order.append("second")
+
+    waiter = threading.Thread(target=second)
+    waiter.start()
+    waiter.join(0.05)
+    assert order == []  # Blocked behind the first writer
+
+    release.set()
+    thread.join()
+    waiter.join()
+    assert order == ["first", "second"]
+
+
+def test_repository_writes_wait_for_the_writer(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "repo.db"), readers=1)
+    MigrationManager(pool.conn).apply_migrations(MIGRATIONS)
+    groups = CommunityGroupRepository(pool.conn)
+    saved = threading.Event()
+
+    def save() -> None:
+        groups.save(CommunityGroupDTO(id="g1", name="Chapel", community_code="CHAPEL"))
+        saved.set()
+
+    with pytest.raises(RuntimeError):
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO community_groups (id, name) VALUES ('g0', 'Half done')")
+            thread = threading.Thread(target=save)
+            thread.start()
+            # The save cannot commit the open block's insert on its behalf
+            assert not saved.wait(0.05)
+            raise RuntimeError("handler failed")
+    thread.join()
+
+    assert [g.id for g in groups.list_all()] == ["g1"]
+    pool.close()
+
+
+def test_readers_are_reused_and_bounded(pool):
+    with pool.reader() as a, pool.reader() as b:
+        assert a is not b
+        with pytest.raises(TimeoutError):
+            with pool.reader():
+                pass
+
+    with pool.reader() as c:
+        assert c in (a, b)
+    assert pool.get_stats() == {"readers_max": 2, "readers_open": 2, "readers_idle": 2}
+
+
+def test_memory_database_lends_the_writer():
+    pool = ConnectionPool(":memory:", readers=4)
+    with pool.reader() as conn:
+        assert conn is pool.conn
+    pool.close()
+
+
+def test_read_dependency(pool, monkeypatch):
+    monkeypatch.setattr(core_state, "db_pool", pool)
+    with pool.writer() as conn:
+        conn.execute("INSERT INTO t (v) VALUES ('via dependency')")
+
+    reads = get_read_db()
+    assert next(reads).execute("SELECT v FROM t").fetchone()["v"] == "via dependency"
+    reads.close()
+    assert pool.get_stats()["readers_idle"] == 1
+
+
+def test_read_dependency_without_readers_leaves_writer_free(tmp_path, monkeypatch):
+    pool = ConnectionPool(str(tmp_path / "no_readers.db"), readers=0)
+    monkeypatch.setattr(core_state, "db_pool", pool)
+    with pool.writer() as conn:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+
+    reads = get_read_db()
+    assert next(reads) is pool.conn
+
+    # A write from another thread is not blocked by the open request
+    def write():
+        with pool.writer() as conn:
+            conn.execute("INSERT INTO t (v) VALUES ('during request')")
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    writer.join(timeout=2)
+    assert not writer.is_alive()
+
+    reads.close()
+    pool.close()
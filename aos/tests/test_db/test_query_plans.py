@@ -0,0 +1,157 @@
+"""
+Query Plan Regression Tests.
+Runs EXPLAIN QUERY PLAN on every hot statement the repositories and
+modules issue and fails if one of them scans a whole table.
+
+Statements are captured from real calls through the connection's trace
+callback, so a query edited in the code is checked as it now reads.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from aos.core.aggregation.aggregator import RegionalAggregator
+from aos.core.security.encryption import SymmetricEncryption
+from aos.db.migrations import MigrationManager
+from aos.db.migrations.registry import MIGRATIONS
+from aos.db.repository import (
+    CommunityGroupRepository,
+    InstitutionalAttendanceRepository,
+    InstitutionalAuditRepository,
+    InstitutionalFinanceRepository,
+    InstitutionGroupMemberRepository,
+    InstitutionMemberRepository,
+    MemberVehicleMapRepository,
+    MessageRetryRepository,
+)
+from aos.modules.agri import AgriModule
+from aos.modules.community import CommunityModule
+from aos.modules.transport import TransportModule
+
+# Statements that read rows: plain INSERT ... VALUES never needs a plan
+_PLANNED = re.compile(r"^\s*(SELECT|UPDATE|DELETE|INSERT\s+INTO\s+\w+\s*\([^)]*\)\s*SELECT)", re.I)
+# "SCAN t" and "SCAN t USING [COVERING] INDEX" both visit every row
+_FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)")
+
+
+@pytest.fixture
+def db_conn():
+    conn = sqlite3.connect(":memory:")
+    MigrationManager(conn).apply_migrations(MIGRATIONS)
+    conn.execute(
+        "INSERT INTO community_groups (id, name, community_code, code_active) VALUES ('g1', 'Chapel', 'CHAPEL', 1)"
+    )
+    conn.execute("INSERT INTO community_members (id, community_id, user_id, channel) VALUES ('m1', 'g1', '+254700000001', 'sms')")
+    conn.execute("INSERT INTO transport_zones (id, name, type) VALUES ('z1', 'Thika Road', 'road')")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _broadcast_cycle(conn):
+    manager = CommunityModule(MagicMock(), conn)._broadcasts
+    broadcast_id = manager.create_broadcast("g1", "Service at 10", ["sms"], "op1")
+    manager.approve_broadcast(broadcast_id, "op1")
+    manager.queue_broadcast(broadcast_id, "op1")
+    manager.lease_next_queued("worker-1")
+    manager.resolve_recipients(broadcast_id)
+    for delivery in manager.fetch_pending_deliveries(broadcast_id):
+        manager.update_delivery_status(delivery["id"], "sent")
+    manager.complete_broadcast(broadcast_id, "op1")
+
+
+def _community_members(conn):
+    community = CommunityModule(MagicMock(), conn)
+    community.get_community_members("g1")
+    community.get_community_members("g1", channel="sms")
+    community.get_group_by_code("chapel")
+    community.remove_member_from_community("g1", "+254700000001", "sms")
+
+
+def _zone_intelligence(conn):
+    TransportModule(MagicMock(), conn).get_zone_intelligence("z1")
+
+
+def _farmer_harvests(conn):
+    agri = AgriModule(MagicMock(), conn, encryptor=SymmetricEncryption(bytes(32)))
+    agri.get_farmer_harvests("f1")
+    agri.find_farmers_by_contact("+254 700 000 001")
+    agri._farmers.backfill_blind_index()
+    RegionalAggregator(conn).aggregate_harvests(days=30)
+
+
+def _vehicle_routing(conn):
+    maps = MemberVehicleMapRepository(conn)
+    maps.get_by_vehicle("telegram", "12345")
+    maps.list_by_member("m1")
+
+
+def _retry_queue(conn):
+    retries = MessageRetryRepository(conn)
+    retries.list_pending()
+    retries.increment_retry("r1")
+    retries.delete("r1")
+
+
+def _institution_reads(conn):
+    InstitutionMemberRepository(conn).find({"community_id": "g1", "active": True})
+    memberships = InstitutionGroupMemberRepository(conn)
+    memberships.list_by_member("m1")
+    memberships.list_by_group("ig1")
+    memberships.delete_membership("ig1", "m1")
+    InstitutionalAttendanceRepository(conn).get_weekly_trends("g1")
+    InstitutionalFinanceRepository(conn).get_category_report("g1")
+    InstitutionalAuditRepository(conn).list_by_community("g1")
+    CommunityGroupRepository(conn).get_by_slug("chapel")
+
+
+HOT_PATHS = [
+    _broadcast_cycle,
+    _community_members,
+    _zone_intelligence,
+    _farmer_harvests,
+    _vehicle_routing,
+    _retry_queue,
+    _institution_reads,
+]
+
+
+def _capture(conn, operation) -> list[str]:
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    try:
+        operation(conn)
+    finally:
+        conn.set_trace_callback(None)
+    return [s for s in statements if _PLANNED.match(s)]
+
+
+@pytest.mark.parametrize("operation", HOT_PATHS, ids=lambda op: op.__name__.lstrip("_"))
+def test_hot_statements_use_indexes(db_conn, operation):
+    statements = _capture(db_conn, operation)
+    assert statements, "operation issued no statements to check"
+
+    scans = []
+    for sql in statements:
+        plan = [row[3] for row in db_conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+        scans.extend(f"{step}\n    in: {' '.join(sql.split())}" for step in plan if _FULL_SCAN.match(step))
+    assert not scans, "full table scans:\n" + "\n".join(scans)
+
+
+def test_hot_path_migration_round_trip(db_conn):
+    from aos.db.migrations import _022_hot_path_indexes as migration
+
+    def indexes():
+        return {r[0] for r in db_conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    migration.down(db_conn)
+    assert {"idx_bd_broadcast", "idx_ts_zone"} <= indexes()
+    assert "idx_bd_broadcast_status" not in indexes()
+
+    migration.up(db_conn)
+    assert {"idx_bd_broadcast_status", "idx_ts_zone_expiry", "idx_h_farmer", "idx_cg_code_upper"} <= indexes()
+    assert not {"idx_bd_broadcast", "idx_ts_zone"} & indexes()
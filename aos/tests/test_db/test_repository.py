@@ -1,11 +1,19 @@
 
+import sqlite3
+
 import pytest
 
+from aos.core.security.encryption import SymmetricEncryption
 from aos.db.engine import connect
 from aos.db.migrations import MigrationManager
 from aos.db.migrations.registry import MIGRATIONS
-from aos.db.models import NodeDTO, OperatorDTO
-from aos.db.repository import NodeRepository, OperatorRepository
+from aos.db.models import FarmerDTO, InstitutionMemberDTO, NodeDTO, OperatorDTO
+from aos.db.repository import (
+    FarmerRepository,
+    InstitutionMemberRepository,
+    NodeRepository,
+    OperatorRepository,
+)
 
 
 @pytest.fixture
@@ -61,3 +69,123 @@ def test_list_all_records(db_conn):
     ids = [n.id for n in all_nodes]
     assert "n1" in ids
     assert "n2" in ids
+
+@pytest.fixture
+def nodes(db_conn):
+    repo = NodeRepository(db_conn)
+    for i in range(10):
+        repo.upsert(NodeDTO(
+            id=f"n{i}", public_key=b"pk", alias=None if i == 9 else f"Node_{i % 3}",
+            status="active" if i % 2 == 0 else "offline",
+        ))
+    return repo
+
+def test_find_filters_in_sql(nodes):
+    assert [n.id for n in nodes.find({"status": "offline"})] == ["n1", "n3", "n5", "n7", "n9"]
+    assert [n.id for n in nodes.find({"alias": None})] == ["n9"]
+    assert [n.id for n in nodes.find({"alias__in": ["Node_0", None]})] == ["n0", "n3", "n6", "n9"]
+    assert nodes.find({"alias__in": []}) == []
+    # contains is a case-insensitive substring match; LIKE wildcards are literal
+    assert len(nodes.find({"alias__contains": "node_1"})) == 3
+    assert nodes.find({"alias__contains": "%"}) == []
+    assert nodes.count({"status__ne": "active", "alias__ne": None}) == 4
+    assert nodes.count() == 10
+
+def test_find_keyset_pages(nodes):
+    first = nodes.find(order_by=["-status", "id"], limit=4)
+    second = nodes.find(order_by=["-status", "id"], limit=4, after=first[-1])
+    rest = nodes.find(order_by=["-status", "id"], after=second[-1].id)
+
+    ids = [n.id for n in first + second + rest]
+    assert ids == ["n1", "n3", "n5", "n7", "n9", "n0", "n2", "n4", "n6", "n8"]
+    assert [n.id for n in nodes.iter_find({"status": "active"}, order_by="-id", batch_size=2)] == [
+        "n8", "n6", "n4", "n2", "n0",
+    ]
+    with pytest.raises(LookupError):
+        nodes.find(after="missing")
+
+def test_find_rejects_unsafe_columns(nodes):
+    with pytest.raises(ValueError):
+        nodes.find({"status; DROP TABLE nodes": 1})
+    with pytest.raises(ValueError):
+        nodes.find(order_by="id DESC")
+    with pytest.raises(ValueError):
+        nodes.count({"status__between": 1})
+
+def test_save_many_commits_per_chunk(db_conn):
+    repo = NodeRepository(db_conn)
+    saved = repo.upsert_many(
+        (NodeDTO(id=f"n{i}", public_key=b"pk", alias=f"Node {i}") for i in range(7)), chunk_size=3
+    )
+    assert saved == 7
+    assert repo.count() == 7
+
+    # Upserts replace existing rows rather than duplicating them
+    repo.save_many([NodeDTO(id="n0", public_key=b"pk", alias="Renamed")])
+    assert repo.count() == 7
+    assert repo.get_by_id("n0").alias == "Renamed"
+
+def test_save_many_rolls_back_failed_chunk(db_conn):
+    repo = OperatorRepository(db_conn)
+    role_id = db_conn.execute("SELECT id FROM roles WHERE name='admin'").fetchone()[0]
+    ops = [
+        OperatorDTO(id=f"op{i}", username=f"user{i}", role_id=role_id, password_hash="hash")
+        for i in range(4)
+    ]
+    # An unknown role in the second chunk violates the foreign key
+    ops.append(OperatorDTO(id="op9", username="user9", role_id="no-such-role", password_hash="hash"))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        repo.save_many(ops, chunk_size=3)
+    assert repo.count({"id__in": ["op0", "op1", "op2", "op3", "op9"]}) == 3
+
+def test_save_many_encrypts_farmers(db_conn):
+    encryptor = SymmetricEncryption(SymmetricEncryption.derive_key(b"0" * 16, "test-secret"))
+    repo = FarmerRepository(db_conn, encryptor)
+    repo.save_many([
+        FarmerDTO(id=f"f{i}", name=f"Farmer {i}", location="Nyeri", contact=f"+2547000000{i}")
+        for i in range(3)
+    ])
+
+    raw = db_conn.execute("SELECT contact FROM farmers WHERE id = 'f1'").fetchone()[0]
+    assert isinstance(raw, bytes) and b"+254" not in raw
+    assert repo.get_by_id("f1").contact == "+25470000001"
+    assert repo.find_rows({"id": "f2"})[0].contact == "+25470000002"
+
+@pytest.fixture
+def members(db_conn):
+    db_conn.execute("INSERT INTO community_groups (id, name) VALUES ('c1', 'Chapel')")
+    db_conn.commit()
+    repo = InstitutionMemberRepository(db_conn)
+    repo.save_many(
+        InstitutionMemberDTO(id=f"m{i}", community_id="c1", full_name=f"Member {i}", active=i % 2 == 0)
+        for i in range(4)
+    )
+    return repo
+
+def test_trusted_reads_match_validation(members, db_conn):
+    # Defaults written by SQLite, and values only validation can coerce
+    db_conn.execute("INSERT INTO institution_members (id, community_id, full_name) VALUES ('m4', 'c1', 'Default')")
+    db_conn.execute(
+        "INSERT INTO institution_members (id, community_id, full_name, joined_at, active)"
+        " VALUES ('m5', 'c1', 'Legacy', 1700000000, 'true')"
+    )
+    # A blob in a str column: validation decodes it
+    db_conn.execute("INSERT INTO institution_members (id, community_id, full_name) VALUES ('m6', 'c1', X'416E6E')")
+    db_conn.commit()
+
+    trusted = members.list_all()
+    members.trusted_reads = False
+    validated = members.list_all()
+
+    assert trusted == validated
+    assert [m.model_dump() for m in trusted] == [m.model_dump() for m in validated]
+    assert trusted[1].active is False
+    assert trusted[5].joined_at.year == 2023
+    assert trusted[6].full_name == "Ann"
+
+def test_find_rows_returns_stored_values(members):
+    rows = members.find_rows({"active": True}, order_by="-id")
+    assert [r.id for r in rows] == ["m2", "m0"]
+    assert type(rows[0]).__name__ == "InstitutionMemberDTORow"
+    assert rows[0].active == 1 and isinstance(rows[0].joined_at, str)
@@ -219,3 +219,105 @@ class TestEventStoreMetrics:
             assert failed_count == 1, "Must track failed events"
         finally:
             await store.shutdown()
+
+
+class TestEventStoreGroupCommit:
+    """Test group-commit batching of EventStore writes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_commit(self, tmp_path: Path) -> None:
+        """Concurrent enqueues must be flushed together and be durable on return."""
+        db_path = tmp_path / "events.db"
+        store = EventStore(str(db_path), group_commit=True, commit_window=0.05)
+        await store.initialize()
+
+        try:
+            commits = 0
+            real_conn = store._conn
+
+            class CountingConnection:
+                def __getattr__(self, name):
+                    return getattr(real_conn, name)
+
+                def commit(self):
+                    nonlocal commits
+                    commits += 1
+                    real_conn.commit()
+
+            store._conn = CountingConnection()
+
+            events = [Event(name="batch.event", payload={"i": i}) for i in range(20)]
+            await asyncio.gather(*[store.enqueue(e) for e in events])
+
+            assert commits == 1, "One transaction must cover the whole batch"
+
+            # Durable: visible to an independent connection once awaited
+            conn = sqlite3.connect(str(db_path))
+            count = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            conn.close()
+            assert count == 20
+        finally:
+            store._conn = real_conn
+            await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_before_window(self, tmp_path: Path) -> None:
+        """Reaching max_batch_size must commit without waiting for the window."""
+        db_path = tmp_path / "events.db"
+        store = EventStore(str(db_path), group_commit=True, commit_window=60, max_batch_size=5)
+        await store.initialize()
+
+        try:
+            events = [Event(name="batch.event", payload={"i": i}) for i in range(5)]
+            await asyncio.wait_for(
+                asyncio.gather(*[store.enqueue(e) for e in events]),
+                timeout=1.0
+            )
+            assert await store.get_queue_depth() == 5
+        finally:
+            await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_status_transitions_are_batched(self, tmp_path: Path) -> None:
+        """mark_completed and mark_failed must go through the batch too."""
+        db_path = tmp_path / "events.db"
+        store = EventStore(str(db_path), group_commit=True)
+        await store.initialize()
+
+        try:
+            ok = Event(name="ok.event", payload={})
+            bad = Event(name="bad.event", payload={})
+            await asyncio.gather(store.enqueue(ok), store.enqueue(bad))
+            await asyncio.gather(
+                store.mark_completed(ok.id),
+                store.mark_failed(bad.id, "boom")
+            )
+
+            assert await store.get_queue_depth() == 0
+            assert await store.get_failed_count() == 1
+        finally:
+            await store.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_does_not_poison_batch(self, tmp_path: Path) -> None:
+        """A duplicate insert must fail alone while the rest of the batch commits."""
+        db_path = tmp_path / "events.db"
+        store = EventStore(str(db_path), group_commit=True)
+        await store.initialize()
+
+        try:
+            dup = Event(name="dup.event", payload={})
+            await store.enqueue(dup)
+
+            other = Event(name="other.event", payload={})
+            results = await asyncio.gather(
+                store.enqueue(dup),
+                store.enqueue(other),
+                return_exceptions=True
+            )
+
+            assert isinstance(results[0], sqlite3.IntegrityError)
+            assert results[1] is None
+            assert await store.get_queue_depth() == 2
+        finally:
+            await store.shutdown()
@@ -1,11 +1,14 @@
 import pytest
 import sqlite3
 import os
+import json
 from aos.core.security.encryption import SymmetricEncryption
 from aos.db.repository import FarmerRepository
 from aos.db.models import FarmerDTO
 from datetime import datetime
 
+from aos.core.security.encryption import SealedValue, reveal_all
+
 def test_farmer_encryption_at_rest():
     # 1. Setup
     conn = sqlite3.connect(":memory:")
@@ -17,7 +20,8 @@ def test_farmer_encryption_at_rest():
             location TEXT,
             contact TEXT,
             metadata TEXT,
-            created_at TIMESTAMP
+            created_at TIMESTAMP,
+            contact_bidx BLOB
         )
     """)
     
@@ -53,3 +57,141 @@ def test_farmer_encryption_at_rest():
     assert loaded.location == "Nyeri, Kenya"
     assert loaded.contact == "+254712345678"
     assert loaded.name == "James Mwangi" # Name stays plaintext for indexing/display (by choice)
+
+
+@pytest.fixture
+def farmers():
+    from aos.db.migrations import MigrationManager
+    from aos.db.migrations.registry import MIGRATIONS
+
+    conn = sqlite3.connect(":memory:")
+    MigrationManager(conn).apply_migrations(MIGRATIONS)
+    repo = FarmerRepository(conn, SymmetricEncryption(os.urandom(32)))
+    yield repo
+    conn.close()
+
+
+def _farmer(id, contact):
+    return FarmerDTO(id=id, name=f"Farmer {id}", location="Nyeri", contact=contact)
+
+
+def test_find_by_contact_uses_blind_index(farmers):
+    farmers.save_many([
+        _farmer("f1", "+254712345678"),
+        _farmer("f2", "+254700000000"),
+        _farmer("f3", "+254 712 345-678"),  # same phone, other household member
+    ])
+
+    found = farmers.find_by_contact("+254 (712) 345 678")
+    assert sorted(f.id for f in found) == ["f1", "f3"]
+    assert farmers.find_by_contact("+254799999999") == []
+
+    # Equal digests for equal phones, never the plaintext; ciphertext still differs
+    rows = dict(farmers.conn.execute("SELECT id, contact_bidx FROM farmers").fetchall())
+    assert rows["f1"] == rows["f3"] != rows["f2"]
+    assert b"254" not in rows["f1"]
+    ciphertexts = farmers.conn.execute("SELECT contact FROM farmers WHERE id IN ('f1', 'f3')").fetchall()
+    assert ciphertexts[0] != ciphertexts[1]
+
+    plan = " ".join(r[3] for r in farmers.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM farmers WHERE contact_bidx = ?", (rows["f1"],)
+    ))
+    assert "idx_farmers_contact_bidx" in plan
+
+
+def test_farmer_without_contact_is_not_indexed(farmers):
+    farmers.save_many([_farmer("f1", ""), _farmer("f2", "")])
+    stored = farmers.conn.execute("SELECT contact_bidx FROM farmers").fetchall()
+    assert stored == [(None,), (None,)]
+    assert farmers.find_by_contact("None") == []
+    assert farmers.find_by_contact("") == []
+    # Not a valid DTO, but must never be indexed as the string "None"
+    unset = FarmerDTO.model_construct(id="f3", name="X", location="Nyeri", contact=None, metadata={})
+    assert farmers._save_params(unset)[-1] is None
+
+
+def test_backfill_fills_existing_rows(farmers, caplog):
+    farmers.save_many([_farmer(f"f{i}", f"+2547000000{i:02d}") for i in range(25)])
+    # As written before the column existed
+    farmers.conn.execute("UPDATE farmers SET contact_bidx = NULL")
+    farmers.conn.execute("INSERT INTO farmers (id, name, location, contact) VALUES ('bad', 'X', 'Y', x'00ff')")
+    farmers.conn.commit()
+    assert farmers.find_by_contact("+254700000007") == []
+
+    with caplog.at_level("WARNING", logger="aos.db.repository"):
+        assert farmers.backfill_blind_index(batch_size=10) == 25
+    assert "Blind index skipped farmer row 26" in caplog.text
+    assert [f.id for f in farmers.find_by_contact("+254700000007")] == ["f7"]
+    assert farmers.backfill_blind_index() == 0
+
+
+def test_blind_index_keys_are_separated():
+    encryptor = SymmetricEncryption(os.urandom(32))
+    contact = encryptor.blind_index("farmers.contact")
+    assert contact.digest("x") == encryptor.blind_index("farmers.contact").digest("x")
+    assert contact.digest("x") != encryptor.blind_index("farmers.national_id").digest("x")
+    assert contact.digest("x") != SymmetricEncryption(os.urandom(32)).blind_index("farmers.contact").digest("x")
+
+
+class CountingEncryption(SymmetricEncryption):
+    def __init__(self, key):
+        super().__init__(key)
+        self.decrypts = 0
+
+    def decrypt(self, data, associated_data=None):
+        self.decrypts += 1
+        return super().decrypt(data, associated_data)
+
+
+@pytest.fixture
+def counted(farmers):
+    farmers.encryptor = CountingEncryption(os.urandom(32))
+    farmers.save_many([_farmer(f"f{i}", f"+2547000000{i:02d}") for i in range(40)])
+    return farmers
+
+
+def test_reads_decrypt_by_default(counted):
+    farmer = counted.get_by_id("f1")
+    assert type(farmer.contact) is str and type(farmer.location) is str
+    assert json.dumps([farmer.contact, farmer.location]) == '["+254700000001", "Nyeri"]'
+    assert sorted(f.contact for f in counted.list_all())[:2] == ["+254700000000", "+254700000001"]
+
+
+def test_listing_decrypts_only_fields_read(counted):
+    sealed = counted.sealed_reads()
+    farmers = sealed.list_all()
+    assert counted.encryptor.decrypts == 0
+    assert isinstance(farmers[0].contact, SealedValue)
+    assert "+254" not in repr(farmers[0].contact)
+
+    assert farmers[0].location == "Nyeri"
+    assert f"{farmers[0].location}" == "Nyeri" and farmers[0].location.upper() == "NYERI"
+    assert counted.encryptor.decrypts == 1
+
+    sealed.reveal(farmers, ["location"])
+    assert counted.encryptor.decrypts == 40
+    assert not any(f.contact.is_open for f in farmers)
+
+    # Serialization opens what it writes out
+    assert farmers[1].model_dump()["contact"] == "+254700000001"
+
+
+def test_batched_reveal_on_pool(counted):
+    rows = counted.sealed_reads().find_rows()
+    values = [r.contact for r in rows] + [r.location for r in rows]
+    reveal_all(values, batch_size=7, workers=2)
+    assert counted.encryptor.decrypts == 80
+    assert [str(r.contact) for r in rows[:2]] == ["+254700000000", "+254700000001"]
+
+
+def test_tampered_field_fails_in_repository(counted):
+    counted.conn.execute("UPDATE farmers SET contact = x'00112233445566778899aabbccddeeff00' WHERE id = 'f3'")
+    counted.conn.commit()
+    with pytest.raises(ValueError):
+        counted.get_by_id("f3")
+
+    sealed = counted.sealed_reads()
+    farmer = sealed.get_by_id("f3")
+    assert farmer.location == "Nyeri"
+    with pytest.raises(ValueError):
+        sealed.reveal([farmer], ["contact"])
@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 import pytest
 
 from aos.bus.dispatcher import EventDispatcher
-from aos.db.migrations import _003_create_agri_tables
+from aos.db.migrations import _003_create_agri_tables, _023_farmer_blind_index
 from aos.db.models import FarmerDTO, HarvestDTO
 from aos.modules.agri import AgriModule
 from unittest.mock import MagicMock
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock
 def db_conn():
     conn = sqlite3.connect(":memory:")
     _003_create_agri_tables.up(conn)
+    _023_farmer_blind_index.up(conn)
     return conn
 
 @pytest.fixture
@@ -26,6 +27,7 @@ def encryptor():
     mock = MagicMock()
     mock.encrypt.side_effect = lambda x: x # Identity encryption for tests
     mock.decrypt.side_effect = lambda x: x
+    mock.blind_index.return_value.digest.side_effect = lambda x: x.encode()
     return mock
 
 @pytest.fixture
@@ -5,13 +5,15 @@ Verifies that the Event Scheduler can handle one-off and recurring events with p
 from __future__ import annotations
 
 import asyncio
+import time
 from pathlib import Path
 
 import pytest
 
 from aos.bus.dispatcher import EventDispatcher
 from aos.bus.events import Event
-from aos.bus.scheduler import EventScheduler
+from aos.bus.scheduler import RETRY_DELAY, CoalescePolicy, EventScheduler
+from aos.core.resource.scheduler import TaskPriority
 
 
 class TestEventScheduler:
@@ -135,3 +137,174 @@ class TestEventScheduler:
         finally:
             await scheduler.stop()
             task.cancel()
+
+
+class TestTimerHeap:
+    """The loop sleeps until the next due task instead of polling SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_does_not_query(self, tmp_path: Path) -> None:
+        dispatcher = EventDispatcher()
+        scheduler = EventScheduler(str(tmp_path / "idle.db"), dispatcher)
+        await scheduler.initialize()
+        await scheduler.schedule_after(60, Event(name="later.event", payload={}))
+
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)  # Let run() rebuild the heap
+
+        statements = []
+        scheduler._conn.set_trace_callback(statements.append)
+
+        try:
+            await asyncio.sleep(0.5)
+            # The old loop issued a SELECT every 100ms
+            assert statements == []
+        finally:
+            await scheduler.stop()
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_earlier_task_wakes_loop(self, tmp_path: Path) -> None:
+        dispatcher = EventDispatcher()
+        scheduler = EventScheduler(str(tmp_path / "wake.db"), dispatcher)
+        await scheduler.initialize()
+
+        handled = []
+        async def handler(e: Event):
+            handled.append(asyncio.get_running_loop().time())
+        dispatcher.subscribe("soon.event", handler)
+
+        await scheduler.schedule_after(60, Event(name="later.event", payload={}))
+        task = asyncio.create_task(scheduler.run())
+
+        try:
+            await asyncio.sleep(0.05)
+            scheduled = asyncio.get_running_loop().time()
+            await scheduler.schedule_after(0.05, Event(name="soon.event", payload={}))
+            await asyncio.sleep(0.3)
+            assert len(handled) == 1
+            assert handled[0] - scheduled < 0.2
+        finally:
+            await scheduler.stop()
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_leaves_heap(self, tmp_path: Path) -> None:
+        dispatcher = EventDispatcher()
+        scheduler = EventScheduler(str(tmp_path / "cancel_heap.db"), dispatcher)
+        await scheduler.initialize()
+
+        task_id = await scheduler.schedule_after(0.01, Event(name="gone.event", payload={}))
+        await scheduler.cancel_task(task_id)
+
+        assert scheduler._pop_due(time.time() + 1) == []
+        assert scheduler._next_delay() == scheduler.max_sleep
+
+
+class TestDispatchFailure:
+    """A task whose event cannot be dispatched stays scheduled and is retried."""
+
+    @staticmethod
+    def _fail_once(dispatcher: EventDispatcher) -> None:
+        dispatch = dispatcher.dispatch
+        calls = []
+        async def flaky(event: Event, priority: TaskPriority | None = None) -> None:
+            calls.append(event)
+            if len(calls) == 1:
+                raise RuntimeError("journal unavailable")
+            await dispatch(event, priority)
+        dispatcher.dispatch = flaky
+
+    @pytest.mark.asyncio
+    async def test_one_off_is_retried(self, tmp_path: Path) -> None:
+        dispatcher = EventDispatcher()
+        scheduler = EventScheduler(str(tmp_path / "retry.db"), dispatcher)
+        await scheduler.initialize()
+
+        handled = []
+        async def handler(e: Event):
+            handled.append(e)
+        dispatcher.subscribe("retry.event", handler)
+        self._fail_once(dispatcher)
+
+        await scheduler.schedule_after(0, Event(name="retry.event", payload={}))
+        now = time.time()
+        await scheduler._process_ready_tasks(now)
+        await asyncio.sleep(0.01)
+
+        assert handled == []
+        assert scheduler._conn.execute("SELECT COUNT(*) FROM scheduled_tasks").fetchone()[0] == 1
+        assert scheduler._pop_due(now + RETRY_DELAY / 2) == []
+
+        await scheduler._process_ready_tasks(now + RETRY_DELAY)
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+        assert len(handled) == 1
+
+    @pytest.mark.asyncio
+    async def test_recurring_keeps_its_cadence(self, tmp_path: Path) -> None:
+        dispatcher = EventDispatcher()
+        scheduler = EventScheduler(str(tmp_path / "retry_recurring.db"), dispatcher)
+        await scheduler.initialize()
+        self._fail_once(dispatcher)
+
+        await scheduler.schedule_recurring(60, Event(name="tick.event", payload={}))
+        scheduled_at = scheduler._conn.execute("SELECT scheduled_at FROM scheduled_tasks").fetchone()[0]
+        await scheduler._process_ready_tasks(scheduled_at)
+
+        row = scheduler._conn.execute("SELECT scheduled_at FROM scheduled_tasks").fetchone()
+        assert row[0] == scheduled_at  # Not advanced past the failed run
+
+        await scheduler._process_ready_tasks(scheduled_at + RETRY_DELAY)
+        row = scheduler._conn.execute("SELECT scheduled_at FROM scheduled_tasks").fetchone()
+        await scheduler.stop()
+        assert row[0] == scheduled_at + 60
+
+
+class TestCoalescing:
+    """Recurring runs missed during downtime follow the task's policy."""
+
+    async def _missed_runs(self, tmp_path: Path, policy: CoalescePolicy) -> tuple[list[Event], float]:
+        db_path = str(tmp_path / f"{policy.value}.db")
+
+        # Session 1: a 10s recurring task, then the node goes down for ~55s
+        scheduler1 = EventScheduler(db_path, EventDispatcher())
+        await scheduler1.initialize()
+        await scheduler1.schedule_recurring(10, Event(name="sync.event", payload={}), coalesce=policy)
+        scheduler1._conn.execute("UPDATE scheduled_tasks SET scheduled_at = scheduled_at - 65")
+        scheduler1._conn.commit()
+        await scheduler1.stop()
+
+        # Session 2: restart and process once
+        dispatcher = EventDispatcher()
+        handled = []
+        async def handler(e: Event):
+            handled.append(e)
+        dispatcher.subscribe("sync.event", handler)
+
+        scheduler2 = EventScheduler(db_path, dispatcher)
+        await scheduler2.initialize()
+        now = time.time()
+        await scheduler2._process_ready_tasks(now)
+        await asyncio.sleep(0.01)
+
+        next_at = scheduler2._conn.execute("SELECT scheduled_at FROM scheduled_tasks").fetchone()[0]
+        await scheduler2.stop()
+        assert now < next_at <= now + 10
+        return handled, next_at
+
+    @pytest.mark.asyncio
+    async def test_once_fires_single_catch_up(self, tmp_path: Path) -> None:
+        handled, _ = await self._missed_runs(tmp_path, CoalescePolicy.ONCE)
+        assert len(handled) == 1
+        assert handled[0].metadata["missed_runs"] == 6
+
+    @pytest.mark.asyncio
+    async def test_skip_drops_missed_runs(self, tmp_path: Path) -> None:
+        handled, _ = await self._missed_runs(tmp_path, CoalescePolicy.SKIP)
+        assert handled == []
+
+    @pytest.mark.asyncio
+    async def test_all_replays_each_missed_run(self, tmp_path: Path) -> None:
+        handled, _ = await self._missed_runs(tmp_path, CoalescePolicy.ALL)
+        assert len(handled) == 6
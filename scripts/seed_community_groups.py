@@ -166,6 +166,7 @@ async def seed_community_groups():
     
     for group_id in group_ids:
         # 15 members per group
+        members = []
         for i in range(15):
             # Mix of formats: some with 07..., some with +254...
             if i % 2 == 0:
@@ -173,13 +174,12 @@ async def seed_community_groups():
             else:
                 user_id = f"+254722{str(uuid.uuid4().int)[:6]}"
                 
-            channel = channels[i % len(channels)]
+            members.append((user_id, channels[i % len(channels)]))
             
-            try:
-                community_module.add_member_to_community(group_id, user_id, channel)
-                member_count += 1
-            except Exception as e:
-                print(f"[WARN] Failed to add member {user_id}: {e}")
+        try:
+            member_count += community_module.add_members_to_community(group_id, members)
+        except Exception as e:
+            print(f"[WARN] Failed to add members to {group_id}: {e}")
             
     print(f"[DONE] Seeded {member_count} members across {len(group_ids)} groups (~15 per group).")
     